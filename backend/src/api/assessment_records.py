@@ -16,9 +16,11 @@ from ..middleware.auth import get_current_user
 from ..middleware.permission import require_admin
 from ..models.fault_responsibility import CHECKLIST_KEYS, CHECKLIST_LABELS
 from ..services.assessment_record_service import AssessmentRecordService
+from ..services.assessment_standard_registry import get_assessment_standard_registry
 from ..services.annual_reset_service import AnnualResetService
 from ..services.fault_responsibility_service import FaultResponsibilityService
 from ..services.monthly_reward_calculator import MonthlyRewardCalculatorService
+from ..services.score_ledger_service import ScoreLedgerService
 
 router = APIRouter(prefix="/api/assessment-records", tags=["考核記錄"])
 
@@ -61,6 +63,31 @@ class AssessmentRecordCreate(BaseModel):
     )
 
 
+class AssessmentRecordBulkCreate(BaseModel):
+    """批次建立考核記錄請求"""
+    records: list[AssessmentRecordCreate] = Field(
+        ..., min_length=1, max_length=1000, description="考核記錄列表（依序指派累計次數）"
+    )
+
+
+class AssessmentRecordBulkItem(BaseModel):
+    """批次建立考核記錄結果"""
+    index: int
+    employee_id: int
+    standard_code: str
+    record_date: date
+    cumulative_count: Optional[int]
+    cumulative_multiplier: float
+    final_points: float
+
+
+class AssessmentRecordBulkResponse(BaseModel):
+    """批次建立考核記錄回應"""
+    created: int
+    monthly_reward_checks: int
+    records: list[AssessmentRecordBulkItem]
+
+
 class AssessmentRecordUpdate(BaseModel):
     """更新考核記錄請求"""
     description: Optional[str] = Field(None, description="事件描述")
@@ -107,7 +134,7 @@ class AnnualResetRequest(BaseModel):
 
 # API Endpoints
 @router.get("", response_model=list[AssessmentRecordResponse])
-async def list_records(
+def list_records(
     employee_id: Optional[int] = Query(None, description="員工 ID"),
     year: Optional[int] = Query(None, description="年度"),
     month: Optional[int] = Query(None, ge=1, le=12, description="月份"),
@@ -138,7 +165,7 @@ async def list_records(
 
 
 @router.get("/summary")
-async def get_employee_summary(
+def get_employee_summary(
     employee_id: int = Query(..., description="員工 ID"),
     year: int = Query(..., description="年度"),
     db: Session = Depends(get_db),
@@ -180,7 +207,7 @@ async def get_checklist_template(
 
 
 @router.get("/{record_id}", response_model=AssessmentRecordResponse)
-async def get_record(
+def get_record(
     record_id: int,
     include_deleted: bool = Query(False, description="是否包含已刪除記錄"),
     db: Session = Depends(get_db),
@@ -202,7 +229,7 @@ async def get_record(
 
 
 @router.post("", response_model=AssessmentRecordResponse, status_code=status.HTTP_201_CREATED)
-async def create_record(
+def create_record(
     data: AssessmentRecordCreate,
     db: Session = Depends(get_db),
     _: dict = Depends(get_current_user)
@@ -213,26 +240,13 @@ async def create_record(
     service = AssessmentRecordService(db)
 
     try:
-        fault_data = None
-        if data.fault_responsibility_data:
-            fault_data = {
-                "delay_seconds": data.fault_responsibility_data.delay_seconds,
-                "checklist_results": data.fault_responsibility_data.checklist_results.model_dump(),
-                "time_t0": data.fault_responsibility_data.time_t0,
-                "time_t1": data.fault_responsibility_data.time_t1,
-                "time_t2": data.fault_responsibility_data.time_t2,
-                "time_t3": data.fault_responsibility_data.time_t3,
-                "time_t4": data.fault_responsibility_data.time_t4,
-                "notes": data.fault_responsibility_data.notes
-            }
-
         record = service.create(
             employee_id=data.employee_id,
             standard_code=data.standard_code,
             record_date=data.record_date,
             description=data.description,
             profile_id=data.profile_id,
-            fault_responsibility_data=fault_data
+            fault_responsibility_data=_to_fault_data(data.fault_responsibility_data)
         )
         db.commit()
         db.refresh(record)
@@ -246,8 +260,45 @@ async def create_record(
         )
 
 
+@router.post("/bulk", response_model=AssessmentRecordBulkResponse, status_code=status.HTTP_201_CREATED)
+def create_records_bulk(
+    data: AssessmentRecordBulkCreate,
+    db: Session = Depends(get_db),
+    _: dict = Depends(get_current_user)
+):
+    """
+    批次建立考核記錄
+
+    累計次數依列表順序指派（與逐筆建立相同），
+    月度獎勵重算每位員工每月僅執行一次；任一筆驗證失敗則全部不寫入。
+    """
+    service = AssessmentRecordService(db)
+
+    try:
+        result = service.create_bulk([
+            {
+                "employee_id": item.employee_id,
+                "standard_code": item.standard_code,
+                "record_date": item.record_date,
+                "description": item.description,
+                "profile_id": item.profile_id,
+                "fault_responsibility_data": _to_fault_data(item.fault_responsibility_data),
+            }
+            for item in data.records
+        ])
+        db.commit()
+
+        return result
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
 @router.put("/{record_id}", response_model=AssessmentRecordResponse)
-async def update_record(
+def update_record(
     record_id: int,
     data: AssessmentRecordUpdate,
     db: Session = Depends(get_db),
@@ -290,7 +341,7 @@ async def update_record(
 
 
 @router.delete("/{record_id}", response_model=AssessmentRecordResponse)
-async def delete_record(
+def delete_record(
     record_id: int,
     db: Session = Depends(get_db),
     _: dict = Depends(get_current_user)
@@ -316,7 +367,7 @@ async def delete_record(
 
 
 @router.post("/{record_id}/restore", response_model=AssessmentRecordResponse)
-async def restore_record(
+def restore_record(
     record_id: int,
     db: Session = Depends(get_db),
     _: dict = Depends(get_current_user)
@@ -340,7 +391,7 @@ async def restore_record(
 
 
 @router.post("/{record_id}/fault-responsibility", response_model=AssessmentRecordResponse)
-async def update_fault_responsibility(
+def update_fault_responsibility(
     record_id: int,
     data: FaultResponsibilityData,
     db: Session = Depends(get_db),
@@ -386,7 +437,7 @@ async def update_fault_responsibility(
 
 
 @router.post("/preview-calculation")
-async def preview_calculation(
+def preview_calculation(
     base_points: float = Query(..., description="基本分數"),
     cumulative_count: int = Query(1, ge=1, description="累計次數"),
     checklist_results: Optional[str] = Query(None, description="查核結果 JSON"),
@@ -417,7 +468,7 @@ async def preview_calculation(
 
 
 @router.post("/monthly-rewards/calculate")
-async def calculate_monthly_rewards(
+def calculate_monthly_rewards(
     data: MonthlyRewardCalculateRequest,
     db: Session = Depends(get_db),
     _: dict = Depends(require_admin)
@@ -444,7 +495,7 @@ async def calculate_monthly_rewards(
 
 
 @router.post("/monthly-rewards/preview")
-async def preview_monthly_rewards(
+def preview_monthly_rewards(
     data: MonthlyRewardCalculateRequest,
     db: Session = Depends(get_db),
     _: dict = Depends(require_admin)
@@ -459,7 +510,7 @@ async def preview_monthly_rewards(
 
 
 @router.get("/monthly-rewards/list")
-async def list_monthly_rewards(
+def list_monthly_rewards(
     year: int = Query(..., description="年度"),
     month: int = Query(..., ge=1, le=12, description="月份"),
     db: Session = Depends(get_db),
@@ -487,7 +538,7 @@ async def list_monthly_rewards(
 
 
 @router.post("/annual-reset")
-async def execute_annual_reset(
+def execute_annual_reset(
     data: AnnualResetRequest,
     db: Session = Depends(get_db),
     _: dict = Depends(require_admin)
@@ -523,7 +574,7 @@ async def execute_annual_reset(
 
 
 @router.post("/annual-reset/preview")
-async def preview_annual_reset(
+def preview_annual_reset(
     year: Optional[int] = Query(None, description="年度"),
     db: Session = Depends(get_db),
     _: dict = Depends(require_admin)
@@ -538,7 +589,7 @@ async def preview_annual_reset(
 
 
 @router.get("/annual-reset/eligibility")
-async def check_reset_eligibility(
+def check_reset_eligibility(
     db: Session = Depends(get_db),
     _: dict = Depends(require_admin)
 ):
@@ -551,7 +602,63 @@ async def check_reset_eligibility(
     return service.check_reset_eligibility()
 
 
+@router.post("/score-ledger/reconcile")
+def reconcile_score_ledger(
+    year: Optional[int] = Query(None, description="年度（未指定則比對所有年度）"),
+    fix: bool = Query(False, description="是否以考核記錄為準修正帳本"),
+    db: Session = Depends(get_db),
+    _: dict = Depends(require_admin)
+):
+    """
+    比對員工分數帳本與考核記錄
+
+    **僅管理員可執行**
+
+    以一次分組查詢找出帳本 total_points / record_count 與考核記錄不一致的
+    (員工, 年度)，fix=true 時以考核記錄為準修正帳本。
+    """
+    service = ScoreLedgerService(db)
+
+    try:
+        result = service.reconcile(year=year, fix=fix)
+        if fix:
+            db.commit()
+        return result
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"帳本比對失敗：{str(e)}"
+        )
+
+
 # Helper functions
+def _to_fault_data(data: Optional[FaultResponsibilityData]) -> Optional[dict[str, Any]]:
+    """將責任判定請求轉換為服務層使用的字典"""
+    if not data:
+        return None
+
+    return {
+        "delay_seconds": data.delay_seconds,
+        "checklist_results": data.checklist_results.model_dump(),
+        "time_t0": data.time_t0,
+        "time_t1": data.time_t1,
+        "time_t2": data.time_t2,
+        "time_t3": data.time_t3,
+        "time_t4": data.time_t4,
+        "notes": data.notes
+    }
+
+
+def _standard_name(record) -> str:
+    """取得考核標準名稱（優先使用登錄表快照，避免延遲載入查詢）"""
+    snapshot = get_assessment_standard_registry().current()
+    standard = snapshot.get(record.standard_code) if snapshot else None
+    if standard:
+        return standard.name
+    return record.standard.name if record.standard else ""
+
+
 def _to_response(record) -> AssessmentRecordResponse:
     """轉換考核記錄為回應格式"""
     fault_responsibility = None
@@ -578,7 +685,7 @@ def _to_response(record) -> AssessmentRecordResponse:
         id=record.id,
         employee_id=record.employee_id,
         standard_code=record.standard_code,
-        standard_name=record.standard.name if record.standard else "",
+        standard_name=_standard_name(record),
         profile_id=record.profile_id,
         record_date=record.record_date.isoformat(),
         description=record.description,
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from ..config.database import get_db
 from ..middleware.auth import get_current_user
 from ..middleware.permission import require_admin
+from ..services.assessment_standard_registry import get_assessment_standard_registry
 from ..services.assessment_standard_service import AssessmentStandardService
 
 router = APIRouter(prefix="/api/assessment-standards", tags=["考核標準"])
@@ -68,7 +69,7 @@ class ImportResultResponse(BaseModel):
 
 # API Endpoints
 @router.get("", response_model=list[AssessmentStandardResponse])
-async def list_standards(
+def list_standards(
     is_active: Optional[bool] = Query(True, description="是否僅查詢啟用的標準"),
     category: Optional[str] = Query(None, description="類別篩選"),
     db: Session = Depends(get_db),
@@ -102,7 +103,7 @@ async def list_standards(
 
 
 @router.get("/search", response_model=list[AssessmentStandardResponse])
-async def search_standards(
+def search_standards(
     keyword: str = Query(..., min_length=1, description="搜尋關鍵字"),
     is_active: Optional[bool] = Query(True, description="是否僅查詢啟用的標準"),
     db: Session = Depends(get_db),
@@ -135,7 +136,7 @@ async def search_standards(
 
 
 @router.get("/categories")
-async def get_by_categories(
+def get_by_categories(
     db: Session = Depends(get_db),
     _: dict = Depends(get_current_user)
 ):
@@ -160,7 +161,7 @@ async def get_by_categories(
 
 
 @router.get("/r-type")
-async def get_r_type_standards(
+def get_r_type_standards(
     db: Session = Depends(get_db),
     _: dict = Depends(get_current_user)
 ):
@@ -183,7 +184,7 @@ async def get_r_type_standards(
 
 
 @router.get("/{standard_id}", response_model=AssessmentStandardResponse)
-async def get_standard(
+def get_standard(
     standard_id: int,
     db: Session = Depends(get_db),
     _: dict = Depends(get_current_user)
@@ -216,7 +217,7 @@ async def get_standard(
 
 
 @router.post("", response_model=AssessmentStandardResponse, status_code=status.HTTP_201_CREATED)
-async def create_standard(
+def create_standard(
     data: AssessmentStandardCreate,
     db: Session = Depends(get_db),
     _: dict = Depends(require_admin)
@@ -239,7 +240,7 @@ async def create_standard(
             description=data.description,
             is_active=data.is_active
         )
-        db.commit()
+        _commit(db)
         db.refresh(standard)
 
         return AssessmentStandardResponse(
@@ -264,7 +265,7 @@ async def create_standard(
 
 
 @router.put("/{standard_id}", response_model=AssessmentStandardResponse)
-async def update_standard(
+def update_standard(
     standard_id: int,
     data: AssessmentStandardUpdate,
     db: Session = Depends(get_db),
@@ -281,7 +282,7 @@ async def update_standard(
         # 只傳遞有值的欄位
         update_data = {k: v for k, v in data.model_dump().items() if v is not None}
         standard = service.update(standard_id, **update_data)
-        db.commit()
+        _commit(db)
         db.refresh(standard)
 
         return AssessmentStandardResponse(
@@ -306,7 +307,7 @@ async def update_standard(
 
 
 @router.delete("/{standard_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_standard(
+def delete_standard(
     standard_id: int,
     db: Session = Depends(get_db),
     _: dict = Depends(require_admin)
@@ -322,7 +323,7 @@ async def delete_standard(
 
     try:
         service.delete(standard_id)
-        db.commit()
+        _commit(db)
 
     except ValueError as e:
         raise HTTPException(
@@ -332,7 +333,7 @@ async def delete_standard(
 
 
 @router.post("/{standard_id}/toggle-active", response_model=AssessmentStandardResponse)
-async def toggle_standard_active(
+def toggle_standard_active(
     standard_id: int,
     db: Session = Depends(get_db),
     _: dict = Depends(require_admin)
@@ -346,7 +347,7 @@ async def toggle_standard_active(
 
     try:
         standard = service.toggle_active(standard_id)
-        db.commit()
+        _commit(db)
         db.refresh(standard)
 
         return AssessmentStandardResponse(
@@ -371,7 +372,7 @@ async def toggle_standard_active(
 
 
 @router.post("/import-excel", response_model=ImportResultResponse)
-async def import_from_excel(
+def import_from_excel(
     file: UploadFile = File(..., description="Excel 檔案"),
     update_existing: bool = Query(False, description="是否更新已存在的標準"),
     db: Session = Depends(get_db),
@@ -399,7 +400,7 @@ async def import_from_excel(
 
     try:
         # 讀取 Excel
-        contents = await file.read()
+        contents = file.file.read()
         workbook = openpyxl.load_workbook(io.BytesIO(contents))
         sheet = workbook.active
 
@@ -425,7 +426,7 @@ async def import_from_excel(
         # 匯入
         service = AssessmentStandardService(db)
         result = service.import_from_excel_data(data, update_existing=update_existing)
-        db.commit()
+        _commit(db)
 
         return ImportResultResponse(**result)
 
@@ -439,7 +440,7 @@ async def import_from_excel(
 
 
 @router.post("/initialize-defaults", response_model=dict)
-async def initialize_default_standards(
+def initialize_default_standards(
     db: Session = Depends(get_db),
     _: dict = Depends(require_admin)
 ):
@@ -452,9 +453,15 @@ async def initialize_default_standards(
     """
     service = AssessmentStandardService(db)
     count = service.initialize_default_standards()
-    db.commit()
+    _commit(db)
 
     return {
         "message": f"已初始化 {count} 項考核標準" if count > 0 else "考核標準已存在，無需初始化",
         "created_count": count
     }
+
+
+def _commit(db: Session) -> None:
+    """提交考核標準變更並使登錄表快照失效"""
+    db.commit()
+    get_assessment_standard_registry().invalidate()
@@ -22,6 +22,7 @@ from ..services.attendance_bonus_processor import (
     AttendanceBonusResult,
 )
 from ..services.schedule_sync_service import ScheduleSyncService, get_schedule_sync_service
+from ..utils.period_filter import in_period
 
 router = APIRouter(prefix="/api/attendance-bonus", tags=["差勤加分"])
 
@@ -163,7 +164,7 @@ def _convert_result_to_response(
     summary="執行差勤加分處理",
     description="從 Google Sheets 班表讀取資料，自動建立差勤加分記錄"
 )
-async def process_attendance_bonus(
+def process_attendance_bonus(
     request: AttendanceBonusProcessRequest,
     db: Session = Depends(get_db),
     _: dict = Depends(require_admin)
@@ -218,7 +219,7 @@ async def process_attendance_bonus(
     summary="預覽差勤加分處理",
     description="預覽將建立的記錄但不實際寫入"
 )
-async def preview_attendance_bonus(
+def preview_attendance_bonus(
     request: AttendanceBonusPreviewRequest,
     db: Session = Depends(get_db),
     _: dict = Depends(get_current_user)
@@ -271,7 +272,7 @@ async def preview_attendance_bonus(
     summary="查詢月度加分統計",
     description="查詢指定月份的加分記錄統計"
 )
-async def get_monthly_bonus_stats(
+def get_monthly_bonus_stats(
     year: int,
     month: int,
     department: Optional[str] = Query(None, description="部門篩選"),
@@ -295,8 +296,7 @@ async def get_monthly_bonus_stats(
             )
             .where(
                 and_(
-                    extract('year', AssessmentRecord.record_date) == year,
-                    extract('month', AssessmentRecord.record_date) == month,
+                    in_period(AssessmentRecord.record_date, year, month=month),
                     AssessmentRecord.is_deleted == False,
                     AssessmentRecord.standard_code.like('+%')
                 )
@@ -364,7 +364,7 @@ async def get_monthly_bonus_stats(
     summary="查詢處理歷史",
     description="查詢差勤加分處理歷史記錄"
 )
-async def get_process_history(
+def get_process_history(
     year: Optional[int] = Query(None, description="年度篩選"),
     department: Optional[str] = Query(None, description="部門篩選"),
     limit: int = Query(12, ge=1, le=100, description="回傳筆數上限"),
@@ -405,7 +405,7 @@ async def get_process_history(
 
         if year:
             stmt = stmt.where(
-                extract('year', AssessmentRecord.record_date) == year
+                in_period(AssessmentRecord.record_date, year)
             )
 
         results = db.execute(stmt).all()
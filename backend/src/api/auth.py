@@ -69,7 +69,7 @@ class UserInfoResponse(BaseModel):
 # ==================== API 端點 ====================
 
 @router.post("/login", response_model=LoginResponse, summary="使用者登入")
-async def login(
+def login(
     request: LoginRequest,
     db: Session = Depends(get_db)
 ):
@@ -114,7 +114,7 @@ async def login(
 
 
 @router.post("/refresh", response_model=RefreshResponse, summary="刷新 Token")
-async def refresh_token(
+def refresh_token(
     request: RefreshRequest,
     db: Session = Depends(get_db)
 ):
@@ -169,7 +169,7 @@ async def logout(
 
 
 @router.get("/me", response_model=UserInfoResponse, summary="取得當前使用者資訊")
-async def get_current_user_info(
+def get_current_user_info(
     current_user: TokenData = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -201,7 +201,7 @@ async def get_current_user_info(
 
 
 @router.post("/change-password", summary="變更密碼")
-async def change_password(
+def change_password(
     old_password: str,
     new_password: str,
     current_user: TokenData = Depends(get_current_user),
@@ -53,6 +53,22 @@ class AllStatusResponse(BaseModel):
     checked_at: str = Field(..., description="檢查時間 (ISO 格式)")
 
 
+class CacheStatsResponse(BaseModel):
+    """快取統計回應"""
+    sheets_content: Optional[dict] = Field(None, description="試算表內容快取（hits, misses, hit_rate 等；未啟用為 null）")
+    shift_codes: Optional[dict] = Field(None, description="班別代碼分類快取（hits, misses, hit_rate, size, maxsize）")
+    assessment_standards: Optional[dict] = Field(None, description="考核標準登錄表（version, loaded_version, size, loads, hits）")
+    schedule_statistics: Optional[dict] = Field(None, description="班表統計快取（hits, misses, hit_rate, size, ttl_seconds）")
+    route_minutes: Optional[dict] = Field(None, description="勤務分鐘數登錄表（version, departments, loads, hits, misses, hit_rate）")
+    system_settings: Optional[dict] = Field(None, description="系統設定快取（version, departments, loads, hits, misses, hit_rate, ttl_seconds）")
+
+
+class DbPoolStatsResponse(BaseModel):
+    """資料庫連線池統計回應"""
+    request: dict = Field(..., description="API 請求連線池（pool_size, checked_out, checkouts, timeouts, avg_wait_ms, max_wait_ms 等）")
+    background: dict = Field(..., description="排程與背景任務連線池（欄位同 request）")
+
+
 class CredentialTestResponse(BaseModel):
     """憑證測試結果回應"""
     credential_type: str = Field(..., description="憑證類型: service_account, oauth")
@@ -202,6 +218,45 @@ def get_all_status(
     )
 
 
+@router.get("/cache", response_model=CacheStatsResponse, summary="查詢快取統計")
+def get_cache_stats(
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    查詢快取命中統計
+
+    包括：
+    - 試算表內容快取（依 Drive 檔案版本略過重複下載）
+    - 班別代碼分類快取（班表解析與差勤判定共用）
+    - 考核標準登錄表（考核記錄建立時查詢考核標準）
+    - 班表統計快取
+    - 勤務分鐘數登錄表（勤務表同步查詢勤務標準時間）
+    - 系統設定快取（部門設定快照）
+
+    僅讀取記憶體中的計數，不會呼叫外部服務。
+    """
+    monitor = get_connection_monitor()
+    return CacheStatsResponse(**monitor.get_cache_stats())
+
+
+@router.get("/db-pool", response_model=DbPoolStatsResponse, summary="查詢資料庫連線池統計")
+def get_db_pool_stats(
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    查詢資料庫連線池狀態與取得連線的等待統計
+
+    API 請求與排程/背景任務使用不同的連線池，分別回傳：
+    - 目前使用中 / 閒置 / 超額連線數
+    - 累計取得次數、逾時次數、平均與最長等待時間（毫秒）
+    - 新建連線數、失效連線數（pre-ping 偵測到的斷線）
+
+    僅讀取記憶體中的計數，不會取用資料庫連線。
+    """
+    monitor = get_connection_monitor()
+    return DbPoolStatsResponse(**monitor.get_pool_stats())
+
+
 @router.get("/test-credential", response_model=CredentialTestResponse, summary="測試部門憑證")
 def test_department_credential(
     department: Literal["淡海", "安坑"] = Query(..., description="部門名稱"),
@@ -99,7 +99,7 @@ class CalculationResult(BaseModel):
 # ============================================================
 
 @router.get("/driving/competition", response_model=CompetitionRankingResponse)
-async def get_competition_ranking(
+def get_competition_ranking(
     year: int = Query(..., ge=2020, le=2100, description="年份"),
     quarter: int = Query(..., ge=1, le=4, description="季度 (1-4)"),
     department: Optional[str] = Query(None, description="篩選部門"),
@@ -136,7 +136,7 @@ async def get_competition_ranking(
 
 
 @router.get("/driving/competition/employee/{employee_id}", response_model=EmployeeHistoryResponse)
-async def get_employee_competition_history(
+def get_employee_competition_history(
     employee_id: int,
     limit: int = Query(8, ge=1, le=20, description="限制筆數"),
     db: Session = Depends(get_db),
@@ -158,7 +158,7 @@ async def get_employee_competition_history(
 
 
 @router.post("/driving/competition/calculate", response_model=CalculationResult)
-async def calculate_competition_ranking(
+def calculate_competition_ranking(
     year: int = Query(..., ge=2020, le=2100, description="年份"),
     quarter: int = Query(..., ge=1, le=4, description="季度 (1-4)"),
     db: Session = Depends(get_db),
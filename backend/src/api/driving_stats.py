@@ -77,7 +77,7 @@ class DepartmentQuarterStatsResponse(BaseModel):
 # ============================================================
 
 @router.get("/driving/stats", response_model=DailyStatsListResponse)
-async def list_daily_stats(
+def list_daily_stats(
     employee_id: Optional[int] = Query(None, description="篩選員工 ID"),
     department: Optional[str] = Query(None, description="篩選部門"),
     start_date: Optional[date] = Query(None, description="起始日期"),
@@ -147,7 +147,7 @@ async def list_daily_stats(
 
 
 @router.get("/driving/stats/quarter", response_model=QuarterStatsResponse)
-async def get_employee_quarter_stats(
+def get_employee_quarter_stats(
     employee_id: int = Query(..., description="員工 ID"),
     year: int = Query(..., ge=2020, le=2100, description="年份"),
     quarter: int = Query(..., ge=1, le=4, description="季度 (1-4)"),
@@ -175,7 +175,7 @@ async def get_employee_quarter_stats(
 
 
 @router.get("/driving/stats/quarter/department", response_model=DepartmentQuarterStatsResponse)
-async def get_department_quarter_stats(
+def get_department_quarter_stats(
     department: str = Query(..., description="部門"),
     year: int = Query(..., ge=2020, le=2100, description="年份"),
     quarter: int = Query(..., ge=1, le=4, description="季度 (1-4)"),
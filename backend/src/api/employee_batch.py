@@ -83,7 +83,7 @@ class TemplateColumnsResponse(BaseModel):
     summary="批次匯入員工",
     description="從 Excel 檔案批次匯入員工資料（需要管理員或主管權限）"
 )
-async def import_employees(
+def import_employees(
     file: UploadFile = File(..., description="Excel 檔案（.xlsx）"),
     skip_duplicates: bool = Query(True, description="是否跳過重複的員工編號"),
     db: Session = Depends(get_db),
@@ -108,7 +108,7 @@ async def import_employees(
 
     # 讀取檔案內容
     try:
-        contents = await file.read()
+        contents = file.file.read()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -144,7 +144,7 @@ async def import_employees(
     summary="驗證匯入檔案",
     description="驗證 Excel 檔案格式（不實際匯入）"
 )
-async def validate_import_file(
+def validate_import_file(
     file: UploadFile = File(..., description="Excel 檔案（.xlsx）"),
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
@@ -163,7 +163,7 @@ async def validate_import_file(
 
     # 讀取檔案內容
     try:
-        contents = await file.read()
+        contents = file.file.read()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -203,19 +203,19 @@ def export_employees(
     匯出員工資料
 
     支援 Excel (.xlsx) 和 CSV 格式。
+    以串流回應輸出：資料分批查詢並逐段寫出，記憶體用量不隨員工數增加。
+    串流期間持續使用請求的 Session（yield 依賴於回應送出後才關閉）。
     """
     service = EmployeeExportService(db)
 
     if format.lower() == "csv":
-        # 匯出 CSV
-        csv_content = service.export_to_csv(
-            department=department,
-            include_resigned=include_resigned,
-            search=search
-        )
-
+        # 匯出 CSV（標題行立即送出）
         return StreamingResponse(
-            iter([csv_content]),
+            service.stream_csv(
+                department=department,
+                include_resigned=include_resigned,
+                search=search
+            ),
             media_type="text/csv",
             headers={
                 "Content-Disposition": "attachment; filename=employees.csv"
@@ -223,14 +223,12 @@ def export_employees(
         )
     else:
         # 匯出 Excel
-        excel_stream = service.export_to_excel(
-            department=department,
-            include_resigned=include_resigned,
-            search=search
-        )
-
         return StreamingResponse(
-            excel_stream,
+            service.stream_excel(
+                department=department,
+                include_resigned=include_resigned,
+                search=search
+            ),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={
                 "Content-Disposition": "attachment; filename=employees.xlsx"
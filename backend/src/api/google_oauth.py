@@ -17,6 +17,7 @@ from typing import Optional
 from urllib.parse import urlencode
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, RedirectResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
@@ -29,6 +30,7 @@ from src.models.google_oauth_token import GoogleOAuthToken
 from src.models.oauth_state import OAuthState
 from src.models.user import User
 from src.utils.encryption import encrypt_token, decrypt_token
+from src.utils.route_inspector import offloads_blocking_io
 
 logger = logging.getLogger(__name__)
 
@@ -171,12 +173,58 @@ def _validate_state_token(state: str, db: Session) -> Optional[str]:
     return department
 
 
+def _get_token_record(db: Session, department: str) -> Optional[GoogleOAuthToken]:
+    """查詢部門的 OAuth Token 記錄"""
+    return db.query(GoogleOAuthToken).filter(
+        GoogleOAuthToken.department == department
+    ).first()
+
+
+def _save_token_record(
+    db: Session,
+    department: str,
+    encrypted_refresh: bytes,
+    encrypted_access: Optional[bytes],
+    expires_at: datetime,
+    user_email: Optional[str]
+) -> None:
+    """新增或更新部門的 OAuth Token 記錄並提交"""
+    existing_token = _get_token_record(db, department)
+
+    if existing_token:
+        # 更新
+        existing_token.encrypted_refresh_token = encrypted_refresh
+        existing_token.encrypted_access_token = encrypted_access
+        existing_token.access_token_expires_at = expires_at
+        existing_token.authorized_user_email = user_email
+    else:
+        # 新增
+        db.add(GoogleOAuthToken(
+            department=department,
+            encrypted_refresh_token=encrypted_refresh,
+            encrypted_access_token=encrypted_access,
+            access_token_expires_at=expires_at,
+            authorized_user_email=user_email
+        ))
+
+    db.commit()
+
+
+def _delete_token_record(db: Session, token_record: GoogleOAuthToken) -> None:
+    """刪除 OAuth Token 記錄並提交"""
+    db.delete(token_record)
+    db.commit()
+
+
 # ============================================================
 # API Endpoints
+#
+# 需 await 非同步 HTTP 呼叫的端點維持 async def，
+# 同步 Session 操作一律經 run_in_threadpool 執行，避免阻塞 Event Loop
 # ============================================================
 
 @router.get("/api/google/auth-url", response_model=AuthUrlResponse)
-async def get_auth_url(
+def get_auth_url(
     department: str = Query(..., description="部門名稱（淡海 或 安坑）"),
     current_user: User = Depends(require_role("admin")),
     db: Session = Depends(get_db)
@@ -227,6 +275,7 @@ async def get_auth_url(
 
 
 @router.get("/api/auth/google/callback")
+@offloads_blocking_io
 async def oauth_callback(
     request: Request,
     code: Optional[str] = Query(None, description="授權碼"),
@@ -271,7 +320,7 @@ async def oauth_callback(
         )
 
     # 驗證 state token
-    department = _validate_state_token(state, db)
+    department = await run_in_threadpool(_validate_state_token, state, db)
     if not department:
         raise HTTPException(
             status_code=400,
@@ -337,29 +386,11 @@ async def oauth_callback(
         encrypted_access = encrypt_token(access_token).encode('utf-8') if access_token else None
         expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
 
-        # 檢查是否已存在
-        existing_token = db.query(GoogleOAuthToken).filter(
-            GoogleOAuthToken.department == department
-        ).first()
-
-        if existing_token:
-            # 更新
-            existing_token.encrypted_refresh_token = encrypted_refresh
-            existing_token.encrypted_access_token = encrypted_access
-            existing_token.access_token_expires_at = expires_at
-            existing_token.authorized_user_email = user_email
-        else:
-            # 新增
-            new_token = GoogleOAuthToken(
-                department=department,
-                encrypted_refresh_token=encrypted_refresh,
-                encrypted_access_token=encrypted_access,
-                access_token_expires_at=expires_at,
-                authorized_user_email=user_email
-            )
-            db.add(new_token)
-
-        db.commit()
+        # 新增或更新（已存在時覆寫）
+        await run_in_threadpool(
+            _save_token_record, db, department,
+            encrypted_refresh, encrypted_access, expires_at, user_email
+        )
 
         logger.info(f"OAuth 授權成功: {department} by {user_email}")
 
@@ -385,7 +416,7 @@ async def oauth_callback(
         raise
     except Exception as e:
         logger.error(f"OAuth 回調處理失敗: {e}")
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(
             status_code=500,
             detail=f"OAuth 處理失敗: {str(e)}"
@@ -393,6 +424,7 @@ async def oauth_callback(
 
 
 @router.post("/api/google/get-access-token", response_model=AccessTokenResponse)
+@offloads_blocking_io
 async def get_access_token(
     department: str = Query(..., description="部門名稱"),
     current_user: User = Depends(get_current_user),
@@ -414,9 +446,7 @@ async def get_access_token(
         )
 
     # 查詢儲存的 token
-    token_record = db.query(GoogleOAuthToken).filter(
-        GoogleOAuthToken.department == department
-    ).first()
+    token_record = await run_in_threadpool(_get_token_record, db, department)
 
     if not token_record:
         return AccessTokenResponse(
@@ -475,7 +505,7 @@ async def get_access_token(
         # 更新快取
         token_record.encrypted_access_token = encrypt_token(new_access_token).encode('utf-8')
         token_record.access_token_expires_at = expires_at
-        db.commit()
+        await run_in_threadpool(db.commit)
 
         logger.info(f"已刷新 {department} 的 access_token")
 
@@ -496,7 +526,7 @@ async def get_access_token(
 
 
 @router.get("/api/google/oauth-status", response_model=list[OAuthStatusResponse])
-async def get_oauth_status(
+def get_oauth_status(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -534,6 +564,7 @@ async def get_oauth_status(
 
 
 @router.delete("/api/google/revoke", response_model=RevokeResponse)
+@offloads_blocking_io
 async def revoke_oauth(
     department: str = Query(..., description="部門名稱"),
     current_user: User = Depends(require_role("admin")),
@@ -552,9 +583,7 @@ async def revoke_oauth(
             detail=f"無效的部門: {department}"
         )
 
-    token_record = db.query(GoogleOAuthToken).filter(
-        GoogleOAuthToken.department == department
-    ).first()
+    token_record = await run_in_threadpool(_get_token_record, db, department)
 
     if not token_record:
         return RevokeResponse(
@@ -576,8 +605,7 @@ async def revoke_oauth(
                 # 忽略撤銷結果（可能已過期）
 
         # 刪除資料庫記錄
-        db.delete(token_record)
-        db.commit()
+        await run_in_threadpool(_delete_token_record, db, token_record)
 
         logger.info(f"已撤銷 {department} 的 OAuth 授權")
 
@@ -589,7 +617,7 @@ async def revoke_oauth(
 
     except Exception as e:
         logger.error(f"撤銷 OAuth 授權失敗: {e}")
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         return RevokeResponse(
             success=False,
             department=department,
@@ -326,7 +326,7 @@ class UploadParamsResponse(BaseModel):
 # ============================================================
 
 @router.get("", response_model=list[ProfileResponse])
-async def get_profiles(
+def get_profiles(
     department: Optional[str] = Query(None, description="部門篩選"),
     profile_type: Optional[str] = Query(None, description="類型篩選"),
     conversion_status: Optional[str] = Query(None, description="狀態篩選"),
@@ -365,7 +365,7 @@ async def get_profiles(
 
 
 @router.post("", response_model=ProfileResponse, status_code=status.HTTP_201_CREATED)
-async def create_profile(
+def create_profile(
     data: ProfileCreate,
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user),
@@ -400,7 +400,7 @@ async def create_profile(
 
 
 @router.get("/{profile_id}", response_model=ProfileResponse)
-async def get_profile(
+def get_profile(
     profile_id: int,
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user),
@@ -424,7 +424,7 @@ async def get_profile(
 
 
 @router.put("/{profile_id}", response_model=ProfileResponse)
-async def update_profile(
+def update_profile(
     profile_id: int,
     data: ProfileUpdate,
     db: Session = Depends(get_db),
@@ -456,7 +456,7 @@ async def update_profile(
 
 
 @router.delete("/{profile_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_profile(
+def delete_profile(
     profile_id: int,
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(require_role([Role.ADMIN, Role.MANAGER])),
@@ -477,7 +477,7 @@ async def delete_profile(
 # ============================================================
 
 @router.post("/{profile_id}/convert", response_model=ProfileResponse)
-async def convert_profile(
+def convert_profile(
     profile_id: int,
     data: ProfileConvert,
     db: Session = Depends(get_db),
@@ -531,7 +531,7 @@ async def convert_profile(
 # ============================================================
 
 @router.post("/{profile_id}/reset", response_model=ProfileResponse)
-async def reset_profile(
+def reset_profile(
     profile_id: int,
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user),
@@ -573,7 +573,7 @@ async def reset_profile(
 
 @router.post("/{profile_id}/generate-document")
 @limiter.limit("5/minute")
-async def generate_document(
+def generate_document(
     request: Request,
     profile_id: int,
     db: Session = Depends(get_db),
@@ -635,7 +635,7 @@ async def generate_document(
 # ============================================================
 
 @router.get("/schedule-lookup", response_model=ScheduleLookupResponse)
-async def schedule_lookup(
+def schedule_lookup(
     employee_id: int = Query(..., description="員工 ID"),
     event_date: date = Query(..., description="事件日期"),
     db: Session = Depends(get_db),
@@ -665,7 +665,7 @@ async def schedule_lookup(
 # ============================================================
 
 @router.get("/search", response_model=list[ProfileResponse])
-async def search_profiles(
+def search_profiles(
     keyword: Optional[str] = Query(None, description="關鍵字"),
     department: Optional[str] = Query(None, description="部門"),
     profile_type: Optional[str] = Query(None, description="類型"),
@@ -712,7 +712,7 @@ async def search_profiles(
 # ============================================================
 
 @router.get("/pending", response_model=list[ProfileResponse])
-async def get_pending_profiles(
+def get_pending_profiles(
     department: Optional[str] = Query(None, description="部門"),
     profile_type: Optional[str] = Query(None, description="類型"),
     skip: int = Query(0, ge=0),
@@ -743,7 +743,7 @@ async def get_pending_profiles(
 
 
 @router.get("/pending/statistics", response_model=PendingStatsResponse)
-async def get_pending_statistics(
+def get_pending_statistics(
     department: Optional[str] = Query(None, description="部門"),
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user),
@@ -776,7 +776,7 @@ async def get_pending_statistics(
 
 
 @router.get("/{profile_id}/upload-params", response_model=UploadParamsResponse)
-async def get_upload_params(
+def get_upload_params(
     profile_id: int,
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user),
@@ -815,7 +815,7 @@ async def get_upload_params(
 
 
 @router.post("/{profile_id}/complete", response_model=ProfileResponse)
-async def mark_profile_complete(
+def mark_profile_complete(
     profile_id: int,
     gdrive_link: str = Query(..., description="Google Drive 連結"),
     db: Session = Depends(get_db),
@@ -848,7 +848,7 @@ async def mark_profile_complete(
 # ============================================================
 
 @router.post("/with-assessment", response_model=ProfileWithAssessmentResponse, status_code=status.HTTP_201_CREATED)
-async def create_profile_with_assessment(
+def create_profile_with_assessment(
     data: ProfileCreateWithAssessment,
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user),
@@ -937,7 +937,7 @@ async def create_profile_with_assessment(
 
 
 @router.put("/{profile_id}/update-date")
-async def update_profile_date(
+def update_profile_date(
     profile_id: int,
     data: ProfileUpdateDate,
     db: Session = Depends(get_db),
@@ -986,7 +986,7 @@ async def update_profile_date(
 
 
 @router.get("/{profile_id}/date-change-preview")
-async def preview_date_change(
+def preview_date_change(
     profile_id: int,
     new_date: date = Query(..., description="新的事件日期"),
     db: Session = Depends(get_db),
@@ -1024,7 +1024,7 @@ async def preview_date_change(
 
 
 @router.get("/assessment-codes/responsibility-required")
-async def get_responsibility_required_codes(
+def get_responsibility_required_codes(
     db: Session = Depends(get_db),
     _: TokenData = Depends(get_current_user),
 ):
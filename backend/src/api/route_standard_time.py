@@ -82,6 +82,14 @@ class RouteStandardTimeListResponse(BaseModel):
     limit: int
 
 
+class ImportRowResult(BaseModel):
+    """單列匯入結果"""
+    row: int = Field(..., description="Excel 行號")
+    route_code: str
+    action: str = Field(..., description="created / updated / skipped")
+    reason: Optional[str] = Field(None, description="略過原因")
+
+
 class ImportResult(BaseModel):
     """匯入結果"""
     created: int
@@ -89,6 +97,7 @@ class ImportResult(BaseModel):
     skipped: int
     errors: List[str]
     total: int
+    results: List[ImportRowResult] = Field(default_factory=list, description="逐列結果")
 
 
 # ============================================================
@@ -96,7 +105,7 @@ class ImportResult(BaseModel):
 # ============================================================
 
 @router.get("/routes", response_model=RouteStandardTimeListResponse)
-async def list_routes(
+def list_routes(
     department: Optional[str] = Query(None, description="篩選部門"),
     search: Optional[str] = Query(None, description="搜尋關鍵字"),
     include_inactive: bool = Query(False, description="是否包含已刪除的"),
@@ -145,7 +154,7 @@ async def list_routes(
 
 
 @router.get("/routes/{route_id}", response_model=RouteStandardTimeResponse)
-async def get_route(
+def get_route(
     route_id: int,
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(get_current_user),
@@ -173,7 +182,7 @@ async def get_route(
 
 
 @router.post("/routes", response_model=RouteStandardTimeResponse, status_code=status.HTTP_201_CREATED)
-async def create_route(
+def create_route(
     data: RouteStandardTimeCreate,
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(require_admin),
@@ -218,7 +227,7 @@ async def create_route(
 
 
 @router.put("/routes/{route_id}", response_model=RouteStandardTimeResponse)
-async def update_route(
+def update_route(
     route_id: int,
     data: RouteStandardTimeUpdate,
     db: Session = Depends(get_db),
@@ -263,7 +272,7 @@ async def update_route(
 
 
 @router.delete("/routes/{route_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_route(
+def delete_route(
     route_id: int,
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(require_admin),
@@ -285,7 +294,7 @@ async def delete_route(
 
 
 @router.post("/routes/{route_id}/restore", response_model=RouteStandardTimeResponse)
-async def restore_route(
+def restore_route(
     route_id: int,
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(require_admin),
@@ -319,7 +328,7 @@ async def restore_route(
 
 
 @router.post("/routes/import-excel", response_model=ImportResult)
-async def import_routes_from_excel(
+def import_routes_from_excel(
     department: str = Query(..., description="目標部門"),
     update_existing: bool = Query(True, description="是否更新已存在的資料"),
     file: UploadFile = File(..., description="Excel 檔案"),
@@ -349,7 +358,7 @@ async def import_routes_from_excel(
         import openpyxl
 
         # 讀取 Excel
-        content = await file.read()
+        content = file.file.read()
         workbook = openpyxl.load_workbook(io.BytesIO(content))
         sheet = workbook.active
 
@@ -13,13 +13,14 @@ from typing import Optional, List, Literal
 
 from fastapi import APIRouter, Depends, Query, HTTPException
 from pydantic import BaseModel, Field
-from sqlalchemy import and_, func
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
 from src.config.database import get_db
 from src.models.schedule import Schedule
 from src.constants import Department
 from src.middleware.auth import get_current_user
+from src.services.schedule_statistics_service import ScheduleStatisticsService
 from src.utils.logger import logger
 
 
@@ -87,7 +88,7 @@ class ScheduleStatisticsResponse(BaseModel):
 # ===== API Endpoints =====
 
 @router.get("", response_model=ScheduleListResponse)
-async def get_schedules(
+def get_schedules(
     department: Optional[Literal["淡海", "安坑"]] = Query(None, description="部門篩選"),
     start_date: Optional[date] = Query(None, description="開始日期"),
     end_date: Optional[date] = Query(None, description="結束日期"),
@@ -135,7 +136,7 @@ async def get_schedules(
 
 
 @router.get("/employee/{employee_id}", response_model=EmployeeScheduleResponse)
-async def get_employee_schedule(
+def get_employee_schedule(
     employee_id: str,
     year: int = Query(..., description="年份"),
     month: int = Query(..., ge=1, le=12, description="月份"),
@@ -198,7 +199,7 @@ async def get_employee_schedule(
 
 
 @router.get("/daily/{schedule_date}", response_model=DailyScheduleResponse)
-async def get_daily_schedule(
+def get_daily_schedule(
     schedule_date: date,
     department: Optional[Literal["淡海", "安坑"]] = Query(None, description="部門篩選"),
     db: Session = Depends(get_db),
@@ -230,7 +231,7 @@ async def get_daily_schedule(
 
 
 @router.get("/statistics", response_model=ScheduleStatisticsResponse)
-async def get_schedule_statistics(
+def get_schedule_statistics(
     department: Literal["淡海", "安坑"] = Query(..., description="部門"),
     year: int = Query(..., description="年份"),
     month: int = Query(..., ge=1, le=12, description="月份"),
@@ -240,81 +241,16 @@ async def get_schedule_statistics(
     """
     查詢班表統計資訊
 
-    返回指定部門月份的班表統計。
+    返回指定部門月份的班表統計（單次掃描聚合，結果短效快取至新同步批次完成）。
+    使用同步 Session，宣告為 def 由執行緒池執行，避免阻塞事件迴圈。
     """
-    # 計算日期範圍
-    start_date = date(year, month, 1)
-    if month == 12:
-        end_date = date(year + 1, 1, 1)
-    else:
-        end_date = date(year, month + 1, 1)
-
-    # 基本查詢條件
-    base_filter = and_(
-        Schedule.department == department,
-        Schedule.schedule_date >= start_date,
-        Schedule.schedule_date < end_date
-    )
-
-    # 總記錄數
-    total_records = db.query(Schedule).filter(base_filter).count()
-
-    # 員工數量
-    employee_count = db.query(func.count(func.distinct(Schedule.employee_id))).filter(
-        base_filter
-    ).scalar()
-
-    # 班別類型分佈
-    shift_type_query = db.query(
-        Schedule.shift_type,
-        func.count(Schedule.id)
-    ).filter(base_filter).group_by(Schedule.shift_type).all()
-
-    shift_type_distribution = {
-        st or "未分類": count
-        for st, count in shift_type_query
-    }
-
-    # R班數量
-    r_shift_count = db.query(Schedule).filter(
-        and_(
-            base_filter,
-            Schedule.shift_code.like("R/%")
-        )
-    ).count()
-
-    # 休假數量
-    leave_count = db.query(Schedule).filter(
-        and_(
-            base_filter,
-            Schedule.shift_type == "休假"
-        )
-    ).count()
-
-    # 延長工時數量
-    overtime_count = db.query(Schedule).filter(
-        and_(
-            base_filter,
-            Schedule.overtime_hours.isnot(None),
-            Schedule.overtime_hours > 0
-        )
-    ).count()
-
     return ScheduleStatisticsResponse(
-        department=department,
-        year=year,
-        month=month,
-        total_records=total_records,
-        employee_count=employee_count,
-        shift_type_distribution=shift_type_distribution,
-        r_shift_count=r_shift_count,
-        leave_count=leave_count,
-        overtime_count=overtime_count
+        **ScheduleStatisticsService(db).get_month_statistics(department, year, month)
     )
 
 
 @router.get("/lookup")
-async def lookup_schedule(
+def lookup_schedule(
     employee_id: str = Query(..., description="員工編號"),
     target_date: date = Query(..., description="目標日期"),
     days_before: int = Query(2, ge=0, le=7, description="往前查詢天數"),
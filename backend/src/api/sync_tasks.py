@@ -7,6 +7,7 @@
 - 查詢同步狀態（GET /api/sync/status/{task_id}）
 - 查詢同步歷史（GET /api/sync/history）
 - 管理定時任務（GET/POST /api/sync/scheduler）
+- 月度獎勵重算佇列狀態與手動處理（GET/POST /api/sync/reward-recheck）
 
 Gemini Review Fix: 使用 BackgroundTasks 實作真正的背景執行
 """
@@ -19,6 +20,8 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from src.config.database import get_db
+from src.config.settings import get_settings
+from src.services.monthly_reward_recheck_queue import MonthlyRewardRecheckQueue
 from src.services.schedule_sync_service import get_schedule_sync_service
 from src.tasks.scheduler import get_task_scheduler
 from src.middleware.auth import get_current_user
@@ -39,6 +42,10 @@ class SyncScheduleRequest(BaseModel):
     )
     year: int = Field(..., description="年份")
     month: int = Field(..., ge=1, le=12, description="月份")
+    mode: Optional[Literal["full", "incremental"]] = Field(
+        None,
+        description="同步模式（full: 刪除後重寫, incremental: 僅寫入差異；空表示使用系統預設）"
+    )
 
 
 class SyncResponse(BaseModel):
@@ -63,6 +70,13 @@ class SyncStatusResponse(BaseModel):
     success_count: Optional[int]
     error_count: Optional[int]
     progress: float
+    rows_per_second: Optional[float] = None
+    sync_mode: Optional[str] = None
+    inserted_count: Optional[int] = None
+    updated_count: Optional[int] = None
+    deleted_count: Optional[int] = None
+    unchanged_count: Optional[int] = None
+    source_revision: Optional[str] = None
     started_at: Optional[str]
     completed_at: Optional[str]
     error_details: Optional[List[str]]
@@ -88,10 +102,28 @@ class SchedulerStatusResponse(BaseModel):
     jobs: List[SchedulerJobResponse]
 
 
+class RewardRecheckStatusResponse(BaseModel):
+    """月度獎勵重算佇列狀態回應"""
+    deferred: bool
+    pending: int
+    claimed: int
+    oldest_enqueued_at: Optional[str]
+    lag_seconds: float
+    next_run_time: Optional[str]
+    total_runs: int
+    total_drained: int
+    total_failures: int
+    last_run_at: Optional[str]
+    last_drained: int
+    last_duration_ms: Optional[float]
+    last_lag_seconds: Optional[float]
+    last_error: Optional[str]
+
+
 # ===== API Endpoints =====
 
 @router.post("/schedule", response_model=SyncResponse)
-async def sync_schedule(
+def sync_schedule(
     request: SyncScheduleRequest,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
@@ -135,7 +167,8 @@ async def sync_schedule(
             batch_id=batch_id,
             department=request.department,
             year=request.year,
-            month=request.month
+            month=request.month,
+            mode=request.mode
         )
 
         return SyncResponse(
@@ -174,7 +207,8 @@ async def sync_schedule(
                 batch_id=batch_id,
                 department=department,
                 year=request.year,
-                month=request.month
+                month=request.month,
+                mode=request.mode
             )
 
         return SyncResponse(
@@ -187,7 +221,7 @@ async def sync_schedule(
 
 
 @router.get("/status/{batch_id}", response_model=SyncStatusResponse)
-async def get_sync_status(
+def get_sync_status(
     batch_id: str,
     current_user: dict = Depends(get_current_user)
 ):
@@ -209,7 +243,7 @@ async def get_sync_status(
 
 
 @router.get("/history", response_model=SyncHistoryResponse)
-async def get_sync_history(
+def get_sync_history(
     task_type: Optional[str] = Query(None, description="任務類型篩選"),
     limit: int = Query(20, ge=1, le=100, description="限制數量"),
     current_user: dict = Depends(get_current_user)
@@ -376,3 +410,46 @@ async def resume_job(
             status_code=404,
             detail=f"找不到任務: {job_id}"
         )
+
+
+@router.get("/reward-recheck", response_model=RewardRecheckStatusResponse)
+def get_reward_recheck_status(
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(require_role("admin", "manager"))
+):
+    """
+    取得月度獎勵重算佇列狀態
+
+    包含待處理員工月份數、最舊項目等待秒數與本行程的處理統計。
+    僅管理員和主管可存取。
+    """
+    scheduler = get_task_scheduler()
+    job = next(
+        (job for job in scheduler.get_jobs() if job["id"] == "monthly_reward_recheck"),
+        None
+    )
+
+    return RewardRecheckStatusResponse(
+        deferred=get_settings().monthly_reward_recheck_deferred,
+        next_run_time=job["next_run_time"] if job else None,
+        **MonthlyRewardRecheckQueue(db).get_status()
+    )
+
+
+@router.post("/reward-recheck/drain")
+async def drain_reward_recheck(
+    background_tasks: BackgroundTasks,
+    current_user: dict = Depends(require_role("admin", "manager"))
+):
+    """
+    立即處理月度獎勵重算佇列
+
+    於背景執行，處理結果可透過 GET /api/sync/reward-recheck 查詢。
+    僅管理員和主管可操作。
+    """
+    scheduler = get_task_scheduler()
+    background_tasks.add_task(scheduler.run_monthly_reward_recheck)
+
+    logger.info("月度獎勵重算佇列已由使用者觸發", user=current_user.get("username"))
+
+    return {"success": True, "message": "月度獎勵重算佇列處理已啟動"}
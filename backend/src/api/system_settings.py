@@ -7,7 +7,7 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
@@ -105,6 +105,46 @@ class DepartmentConfigResponse(BaseModel):
     settings: dict
 
 
+class SettingsSnapshotResponse(BaseModel):
+    """設定快照回應"""
+    department: str = Field(..., description="部門範圍：淡海、安坑、global")
+    etag: str = Field(..., description="快照 ETag（同 ETag 回應標頭）")
+    settings: dict = Field(..., description="鍵名 -> {value, department, description}（部門設定優先於 global）")
+
+
+# ============================================================
+# 條件式 GET
+# ============================================================
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    檢查 If-None-Match 是否符合目前 ETag
+
+    Args:
+        if_none_match: If-None-Match 標頭（可含多個以逗號分隔的 ETag 或 *）
+        etag: 目前 ETag
+
+    Returns:
+        bool: 符合時回傳 True（應回應 304）
+    """
+    if not if_none_match:
+        return False
+
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in [
+        candidate[2:] if candidate.startswith("W/") else candidate
+        for candidate in candidates
+    ]
+
+
+def _not_modified(etag: str) -> Response:
+    """304 Not Modified 回應"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "private, no-cache"}
+    )
+
+
 # ============================================================
 # API 端點
 # ============================================================
@@ -140,6 +180,48 @@ def get_settings(
     )
 
 
+@router.get(
+    "/bulk",
+    response_model=SettingsSnapshotResponse,
+    summary="取得部門設定快照",
+    description="一次取得部門的所有設定（含 global），支援 ETag 條件式 GET（需要登入）",
+    responses={304: {"description": "設定未變更（If-None-Match 符合目前 ETag）"}}
+)
+def get_settings_snapshot(
+    response: Response,
+    department: str = DepartmentScope.GLOBAL.value,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    取得部門設定快照
+
+    - **department**: 部門範圍（淡海、安坑、global，預設 global）
+
+    回應帶有 ETag 標頭；用戶端以 If-None-Match 重新取得時，
+    設定未變更則回應 304 且不含內容。快照由系統設定快取提供。
+    """
+    valid_scopes = [scope.value for scope in DepartmentScope]
+    if department not in valid_scopes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"無效的部門範圍，有效值為：{valid_scopes}"
+        )
+
+    snapshot = SystemSettingService(db).get_snapshot(department)
+    if _etag_matches(if_none_match, snapshot.etag):
+        return _not_modified(snapshot.etag)
+
+    response.headers["ETag"] = snapshot.etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return SettingsSnapshotResponse(
+        department=department,
+        etag=snapshot.etag,
+        settings=snapshot.as_config()
+    )
+
+
 @router.get(
     "/{setting_id}",
     response_model=SettingResponse,
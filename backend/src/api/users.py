@@ -97,7 +97,7 @@ def user_to_response(user) -> UserResponse:
 # ==================== API 端點 ====================
 
 @router.get("", response_model=UserListResponse, summary="取得使用者列表")
-async def list_users(
+def list_users(
     role: Optional[str] = Query(None, description="角色篩選"),
     department: Optional[str] = Query(None, description="部門篩選"),
     is_active: Optional[bool] = Query(None, description="是否啟用篩選"),
@@ -140,7 +140,7 @@ async def list_users(
 
 
 @router.get("/{user_id}", response_model=UserResponse, summary="取得單一使用者")
-async def get_user(
+def get_user(
     user_id: int,
     current_user: TokenData = Depends(require_admin()),
     db: Session = Depends(get_db)
@@ -163,7 +163,7 @@ async def get_user(
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED, summary="建立使用者")
-async def create_user(
+def create_user(
     request: UserCreateRequest,
     current_user: TokenData = Depends(require_admin()),
     db: Session = Depends(get_db)
@@ -212,7 +212,7 @@ async def create_user(
 
 
 @router.put("/{user_id}", response_model=UserResponse, summary="更新使用者")
-async def update_user(
+def update_user(
     user_id: int,
     request: UserUpdateRequest,
     current_user: TokenData = Depends(require_admin()),
@@ -250,7 +250,7 @@ async def update_user(
 
 
 @router.post("/{user_id}/reset-password", summary="重設密碼")
-async def reset_password(
+def reset_password(
     user_id: int,
     request: ResetPasswordRequest,
     current_user: TokenData = Depends(require_admin()),
@@ -284,7 +284,7 @@ async def reset_password(
 
 
 @router.post("/{user_id}/activate", summary="啟用使用者")
-async def activate_user(
+def activate_user(
     user_id: int,
     current_user: TokenData = Depends(require_admin()),
     db: Session = Depends(get_db)
@@ -308,7 +308,7 @@ async def activate_user(
 
 
 @router.post("/{user_id}/deactivate", summary="停用使用者")
-async def deactivate_user(
+def deactivate_user(
     user_id: int,
     current_user: TokenData = Depends(require_admin()),
     db: Session = Depends(get_db)
@@ -339,7 +339,7 @@ async def deactivate_user(
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT, summary="刪除使用者")
-async def delete_user(
+def delete_user(
     user_id: int,
     current_user: TokenData = Depends(require_admin()),
     db: Session = Depends(get_db)
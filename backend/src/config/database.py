@@ -13,6 +13,7 @@ from typing import Generator
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
+from src.config.db_pool import InstrumentedQueuePool
 from src.config.settings import get_settings
 
 settings = get_settings()
@@ -23,14 +24,34 @@ settings = get_settings()
 # ============================================================
 # 說明：TiDB SSL 需要使用 pymysql，而 aiomysql 不完整支援 TiDB SSL
 # 因此使用同步引擎，透過 FastAPI ThreadPool 機制處理併發
-sync_engine = create_engine(
-    settings.database_url,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1800,
-    echo=not settings.is_production,
-)
+#
+# 連線池參數取自設定（DB_POOL_*）。排程與背景任務使用獨立的引擎，
+# 批次作業佔用連線時不會讓 API 請求等待連線逾時。
+def _create_sync_engine(pool_size: int, max_overflow: int):
+    """
+    建立具連線池統計的同步引擎
+
+    Args:
+        pool_size: 常駐連線數
+        max_overflow: 尖峰時可額外建立的連線數
+
+    Returns:
+        Engine: SQLAlchemy 引擎
+    """
+    return create_engine(
+        settings.database_url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        echo=settings.db_echo,
+    )
+
+
+# API 請求使用
+sync_engine = _create_sync_engine(settings.db_pool_size, settings.db_max_overflow)
 
 SyncSessionLocal = sessionmaker(
     bind=sync_engine,
@@ -38,6 +59,31 @@ SyncSessionLocal = sessionmaker(
     autoflush=False,
 )
 
+# 排程與背景任務使用
+background_engine = _create_sync_engine(
+    settings.db_background_pool_size,
+    settings.db_background_max_overflow
+)
+
+BackgroundSessionLocal = sessionmaker(
+    bind=background_engine,
+    autocommit=False,
+    autoflush=False,
+)
+
+
+def get_pool_stats() -> dict:
+    """
+    取得各引擎的連線池狀態與統計
+
+    Returns:
+        dict: request（API 請求）、background（排程與背景任務）
+    """
+    return {
+        "request": sync_engine.pool.get_stats(),
+        "background": background_engine.pool.get_stats(),
+    }
+
 
 # ============================================================
 # FastAPI 依賴注入
@@ -113,13 +159,17 @@ def init_database():
     """
     初始化資料庫（建立所有資料表並建立預設管理員帳號）
 
-    應在應用程式啟動時呼叫
+    應在應用程式啟動時呼叫。create_all 不會修改已存在的資料表，
+    既有資料表新增的欄位與資料回填由 scripts/migrate_database.py 處理。
     """
     from src.models.base import Base
 
     # 導入所有模型以註冊到 Base.metadata
     from src.models.system_setting import SystemSetting  # noqa: F401
     from src.models.google_oauth_token import GoogleOAuthToken  # noqa: F401
+    from src.models.sheet_content_cache import SheetContentCache  # noqa: F401
+    from src.models.employee_score_ledger import EmployeeScoreLedger  # noqa: F401
+    from src.models.monthly_reward_recheck import MonthlyRewardRecheck  # noqa: F401
 
     Base.metadata.create_all(bind=sync_engine)
 
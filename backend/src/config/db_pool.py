@@ -0,0 +1,83 @@
+"""
+資料庫連線池監控
+
+以 QueuePool 子類別記錄取得連線的等待時間與逾時次數，
+並透過連線池事件統計新建與失效（pre-ping 偵測到的斷線）的連線數，
+供連線狀態 API 查詢。
+"""
+
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    具取得連線統計的 QueuePool
+
+    等待時間包含連線池已滿時的排隊時間，以及需新建連線時的連線建立時間。
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._connects = 0
+        self._invalidations = 0
+
+        event.listen(self, "connect", self._on_connect)
+        event.listen(self, "invalidate", self._on_invalidate)
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            with self._metrics_lock:
+                self._timeouts += 1
+            raise
+
+        waited = time.perf_counter() - started
+        with self._metrics_lock:
+            self._checkouts += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        return connection
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._metrics_lock:
+            self._connects += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._metrics_lock:
+            self._invalidations += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        取得連線池狀態與統計
+
+        Returns:
+            dict: pool_size, max_overflow, checked_out, checked_in, overflow,
+                  checkouts, timeouts, avg_wait_ms, max_wait_ms, connects, invalidations
+        """
+        with self._metrics_lock:
+            checkouts = self._checkouts
+            return {
+                "pool_size": self.size(),
+                "max_overflow": self._max_overflow,
+                "checked_out": self.checkedout(),
+                "checked_in": self.checkedin(),
+                "overflow": max(self.overflow(), 0),
+                "checkouts": checkouts,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": round(self._wait_total / checkouts * 1000, 2) if checkouts else None,
+                "max_wait_ms": round(self._wait_max * 1000, 2) if checkouts else None,
+                "connects": self._connects,
+                "invalidations": self._invalidations,
+            }
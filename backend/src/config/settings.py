@@ -29,6 +29,19 @@ class Settings(BaseSettings):
     tidb_password: str = Field(default="")
     tidb_database: str = Field(default="test")
 
+    # 資料庫連線池（API 請求）
+    db_pool_size: int = Field(default=5, ge=1)
+    db_max_overflow: int = Field(default=10, ge=0)
+    db_pool_timeout: int = Field(default=30, ge=1)
+    # TiDB Serverless 會中斷閒置連線：定期回收，取出前先 ping 以排除已斷線的連線
+    db_pool_recycle: int = Field(default=300, ge=-1)
+    db_pool_pre_ping: bool = Field(default=True)
+    # 排程與背景任務的獨立連線池
+    db_background_pool_size: int = Field(default=2, ge=1)
+    db_background_max_overflow: int = Field(default=3, ge=0)
+    # 輸出所有 SQL 語句（僅供除錯）
+    db_echo: bool = Field(default=False)
+
     # FastAPI 設定
     api_secret_key: str = Field(default="development-secret-key-change-in-production")
     api_environment: Literal["development", "production", "test"] = Field(default="development")
@@ -100,6 +113,35 @@ class Settings(BaseSettings):
     # 加密金鑰（Fernet）
     encryption_key: str = Field(default="")
 
+    # 班表同步：多列 INSERT 每批列數
+    schedule_sync_chunk_size: int = Field(default=500, ge=1)
+    # 班表同步模式：full（刪除後重寫）或 incremental（僅寫入差異）
+    schedule_sync_mode: Literal["full", "incremental"] = Field(default="incremental")
+    # 班表統計快取存活秒數（0 表示停用；新同步批次完成時自動失效）
+    schedule_statistics_cache_ttl_seconds: int = Field(default=60, ge=0)
+    # 系統設定快取存活秒數（0 表示停用；本程序的設定變更會立即失效，
+    # 存活秒數僅影響其他程序直接寫入資料庫的變更）
+    system_settings_cache_ttl_seconds: int = Field(default=300, ge=0)
+
+    # Google Sheets 並行讀取執行緒數上限
+    google_sheets_max_workers: int = Field(default=4, ge=1)
+    # Google Sheets 儲存格值輸出格式（班表與差勤以儲存格顯示值判讀，
+    # UNFORMATTED_VALUE 會將「0905」等數字儲存格回傳為 905）
+    google_sheets_value_render_option: Literal[
+        "FORMATTED_VALUE", "UNFORMATTED_VALUE", "FORMULA"
+    ] = Field(default="FORMATTED_VALUE")
+    # 試算表內容快取（依 Drive 檔案版本判斷是否需重新下載）
+    google_sheets_content_cache_enabled: bool = Field(default=True)
+    google_sheets_content_cache_persist: bool = Field(default=True)
+
+    # 月度獎勵重算：考核記錄變更時登記佇列，由背景排程批次處理（False 時同步逐筆重算）
+    monthly_reward_recheck_deferred: bool = Field(default=True)
+    # 月度獎勵重算佇列處理間隔（秒）與每批員工月份數
+    monthly_reward_recheck_interval_seconds: int = Field(default=30, ge=1)
+    monthly_reward_recheck_batch_size: int = Field(default=500, ge=1)
+    # 已取出但超過此秒數仍未完成的佇列項目視為中斷（例如行程重啟），可再次取出
+    monthly_reward_recheck_claim_timeout_seconds: int = Field(default=600, ge=1)
+
     # CORS 允許來源（生產環境可透過環境變數擴充，以逗號分隔）
     cors_allowed_origins: str = Field(default="")
 
@@ -14,7 +14,7 @@ from fastapi.responses import JSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
-from src.config.database import check_database_connection, init_database
+from src.config.database import SyncSessionLocal, check_database_connection, init_database
 from src.config.settings import get_settings
 
 settings = get_settings()
@@ -66,6 +66,27 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[ERROR] 資料庫初始化失敗: {e}")
 
+    # 預先載入考核標準登錄表（考核記錄建立時不需查詢考核標準）
+    try:
+        from src.services.assessment_standard_registry import get_assessment_standard_registry
+
+        with SyncSessionLocal() as db:
+            snapshot = get_assessment_standard_registry().load(db)
+        print(f"[OK] 考核標準登錄表已載入: {len(snapshot.by_code)} 項")
+    except Exception as e:
+        print(f"[WARNING] 考核標準登錄表載入失敗: {e}")
+
+    # 預先載入勤務分鐘數登錄表（勤務表同步不需逐日查詢勤務標準時間）
+    try:
+        from src.services.route_minutes_registry import get_route_minutes_registry
+
+        with SyncSessionLocal() as db:
+            route_counts = get_route_minutes_registry().warm_up(db)
+        summary = ", ".join(f"{department} {count} 項" for department, count in route_counts.items())
+        print(f"[OK] 勤務分鐘數登錄表已載入: {summary}")
+    except Exception as e:
+        print(f"[WARNING] 勤務分鐘數登錄表載入失敗: {e}")
+
     # 啟動定時任務排程器 (Phase 7)
     try:
         from src.tasks.scheduler import start_scheduler
@@ -74,6 +95,17 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[WARNING] 定時任務排程器啟動失敗: {e}")
 
+    # 檢查 async 路由是否使用同步 Session（會阻塞 Event Loop）
+    from src.utils.route_inspector import report_blocking_async_routes
+
+    blocking_routes = report_blocking_async_routes(app)
+    if blocking_routes:
+        print(f"[WARNING] {len(blocking_routes)} 個 async 路由使用同步 Session，會阻塞 Event Loop:")
+        for route in blocking_routes:
+            print(f"     {route}")
+    else:
+        print("[OK] 路由 Event Loop 檢查通過")
+
     print("=" * 60)
     print(f"環境: {settings.api_environment}")
     print("=" * 60)
@@ -175,7 +207,7 @@ async def health_check():
 
 
 @app.get("/health/database", tags=["Health"])
-async def database_health_check():
+def database_health_check():
     """
     資料庫健康檢查端點
 
@@ -44,6 +44,8 @@ from .cumulative_counter import (
     get_cumulative_category,
 )
 from .monthly_reward import MonthlyReward
+from .monthly_reward_recheck import MonthlyRewardRecheck
+from .employee_score_ledger import EmployeeScoreLedger
 
 __all__ = [
     # Base
@@ -93,4 +95,6 @@ __all__ = [
     "R_CUMULATIVE_GROUP",
     "get_cumulative_category",
     "MonthlyReward",
+    "MonthlyRewardRecheck",
+    "EmployeeScoreLedger",
 ]
@@ -17,6 +17,7 @@ from src.constants import Department
 if TYPE_CHECKING:
     from .assessment_record import AssessmentRecord
     from .cumulative_counter import CumulativeCounter
+    from .employee_score_ledger import EmployeeScoreLedger
     from .monthly_reward import MonthlyReward
 
 
@@ -146,6 +147,12 @@ class Employee(Base, TimestampMixin):
         cascade="all, delete-orphan"
     )
 
+    score_ledgers: Mapped[list["EmployeeScoreLedger"]] = relationship(
+        "EmployeeScoreLedger",
+        back_populates="employee",
+        cascade="all, delete-orphan"
+    )
+
     monthly_rewards: Mapped[list["MonthlyReward"]] = relationship(
         "MonthlyReward",
         back_populates="employee",
@@ -0,0 +1,99 @@
+"""
+EmployeeScoreLedger 員工年度分數帳本模型
+對應 spec.md: User Story 9 - 考核系統
+
+保存每位員工每年度考核記錄 final_points 的累計總和，
+於考核記錄建立、修改、刪除、還原與重算時同步更新，
+讓總分查詢與驗證不必每次加總全部歷史考核記錄。
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from .base import Base
+
+if TYPE_CHECKING:
+    from .employee import Employee
+
+
+class EmployeeScoreLedger(Base):
+    """
+    員工年度分數帳本模型
+
+    Attributes:
+        id: 主鍵
+        employee_id: 員工 ID (FK)
+        year: 年度（考核記錄 record_date 所屬年度）
+        total_points: 該年度未刪除考核記錄的 final_points 總和
+        record_count: 該年度未刪除考核記錄筆數
+        last_updated: 最後更新時間
+
+    Relationships:
+        employee: 關聯的員工
+
+    Note:
+        員工總分 = 起始分數 80 + 所有年度 total_points 總和
+    """
+
+    __tablename__ = "employee_score_ledgers"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    # 關聯
+    employee_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("employees.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="員工 ID"
+    )
+
+    year: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="年度（如 2026）"
+    )
+
+    # 累計數據
+    total_points: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+        comment="該年度 final_points 總和"
+    )
+
+    record_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="該年度考核記錄筆數"
+    )
+
+    # 時間戳
+    last_updated: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        comment="最後更新時間"
+    )
+
+    # Relationships
+    employee: Mapped["Employee"] = relationship(
+        "Employee",
+        back_populates="score_ledgers"
+    )
+
+    __table_args__ = (
+        # 複合唯一約束：同一員工同一年度只能有一筆
+        UniqueConstraint(
+            'employee_id', 'year',
+            name='uq_score_ledger_employee_year'
+        ),
+        {"comment": "員工年度分數帳本"}
+    )
+
+    def __repr__(self) -> str:
+        return f"<EmployeeScoreLedger(employee_id={self.employee_id}, year={self.year}, total_points={self.total_points})>"
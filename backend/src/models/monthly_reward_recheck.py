@@ -0,0 +1,93 @@
+"""
+MonthlyRewardRecheck 月度獎勵待重算佇列模型
+對應 spec.md: User Story 9 - 考核系統
+
+考核記錄建立、刪除、還原時登記需重算月度獎勵的 (員工, 年, 月)，
+與考核記錄變更於同一 Transaction 寫入，同一員工月份只保留一筆，
+由背景排程批次取出並以月度獎勵集合式計算處理，重算成功後才刪除。
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class MonthlyRewardRecheck(Base):
+    """
+    月度獎勵待重算佇列模型
+
+    Attributes:
+        id: 主鍵
+        employee_id: 員工 ID (FK)
+        year: 年度
+        month: 月份（1-12）
+        enqueued_at: 首次登記時間（重複登記不更新，用於計算延遲）
+        claimed_at: 取出處理時間（NULL 表示待處理；處理中再次登記會清除）
+        updated_at: 最後登記時間
+    """
+
+    __tablename__ = "monthly_reward_rechecks"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    employee_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("employees.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="員工 ID"
+    )
+
+    year: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="年度"
+    )
+
+    month: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="月份（1-12）"
+    )
+
+    enqueued_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        comment="首次登記時間"
+    )
+
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+        comment="取出處理時間（NULL 表示待處理）"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        comment="最後登記時間"
+    )
+
+    __table_args__ = (
+        # 複合唯一約束：同一員工同一月份只保留一筆
+        UniqueConstraint(
+            'employee_id', 'year', 'month',
+            name='uq_monthly_reward_recheck_employee_month'
+        ),
+        # 索引：依登記時間先進先出
+        Index('ix_monthly_reward_rechecks_enqueued_at', 'enqueued_at'),
+        {"comment": "月度獎勵待重算佇列"}
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<MonthlyRewardRecheck("
+            f"employee_id={self.employee_id}, "
+            f"year={self.year}, month={self.month}"
+            f")>"
+        )
@@ -12,7 +12,7 @@ Schedule 班表資料模型
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import Date, DateTime, Enum as SQLEnum, ForeignKey, Index, String, Text
+from sqlalchemy import Boolean, Date, DateTime, Enum as SQLEnum, ForeignKey, Index, String, Text, false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -54,6 +54,10 @@ class Schedule(Base, TimestampMixin):
         shift_type: 班別分類 (早班/中班/晚班/R班/休假/其他)
         start_time: 開始時間 (如 '06:00')
         end_time: 結束時間 (如 '14:30')
+        is_r_shift: 是否為 R班出勤 (R/、R( 開頭或含「R班」，同步時由班別代碼推導)
+        is_national_holiday: 是否為國定假日 R班 (同步時推導)
+        is_leave: 是否為休假 (同步時推導)
+        driving_minutes_code: 查詢勤務標準時間用的勤務代碼 (同步時推導，NULL 表示尚未回填)
         notes: 備註
         sync_source: 同步來源 (Google Sheets ID)
         sync_batch_id: 同步批次 ID
@@ -62,6 +66,8 @@ class Schedule(Base, TimestampMixin):
     Indexes:
         - (department, schedule_date) 複合索引
         - (employee_id, schedule_date) 複合索引
+        - (department, is_r_shift, schedule_date) 複合索引
+        - (department, is_leave, schedule_date) 複合索引
     """
 
     __tablename__ = "schedules"
@@ -122,6 +128,38 @@ class Schedule(Base, TimestampMixin):
         comment="結束時間（格式 HH:MM）"
     )
 
+    # 班別旗標（同步時由班別代碼登錄表推導，讀取時不再解析 shift_code）
+    is_r_shift: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default=false(),
+        comment="是否為 R班出勤（R/、R( 開頭或含「R班」）"
+    )
+
+    is_national_holiday: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default=false(),
+        comment="是否為國定假日 R班（R(國)/）"
+    )
+
+    is_leave: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default=false(),
+        comment="是否為休假（(假)、(特)、(公) 等）"
+    )
+
+    driving_minutes_code: Mapped[Optional[str]] = mapped_column(
+        String(50),
+        nullable=True,
+        index=True,
+        comment="勤務代碼（移除 R 前綴與延長工時後綴，NULL 表示尚未回填）"
+    )
+
     # 延長工時標記
     overtime_hours: Mapped[Optional[int]] = mapped_column(
         nullable=True,
@@ -161,6 +199,9 @@ class Schedule(Base, TimestampMixin):
         Index("ix_schedules_dept_date", "department", "schedule_date"),
         # 複合索引：員工 + 日期（查詢特定員工班表）
         Index("ix_schedules_emp_date", "employee_id", "schedule_date"),
+        # 複合索引：部門 + 旗標 + 日期（統計與行車時數篩選）
+        Index("ix_schedules_dept_r_shift_date", "department", "is_r_shift", "schedule_date"),
+        Index("ix_schedules_dept_leave_date", "department", "is_leave", "schedule_date"),
         # 唯一約束：同一員工同一日期只能有一筆記錄
         Index(
             "uq_schedules_emp_date",
@@ -173,16 +214,6 @@ class Schedule(Base, TimestampMixin):
     def __repr__(self) -> str:
         return f"<Schedule(employee={self.employee_id!r}, date={self.schedule_date}, shift={self.shift_code!r})>"
 
-    @property
-    def is_r_shift(self) -> bool:
-        """是否為 R班（休息日支援出勤）"""
-        return self.shift_code.startswith("R/") or self.shift_code.startswith("R(")
-
-    @property
-    def is_leave(self) -> bool:
-        """是否為休假"""
-        return "(假)" in self.shift_code or "(特)" in self.shift_code or "(公)" in self.shift_code
-
     @property
     def has_overtime(self) -> bool:
         """是否有延長工時"""
@@ -207,6 +238,13 @@ class SyncTask(Base, TimestampMixin):
         success_count: 成功數量
         error_count: 錯誤數量
         error_details: 錯誤詳情（JSON）
+        rows_per_second: 寫入吞吐量（列/秒）
+        sync_mode: 同步模式（full: 刪除後重寫, incremental: 差異同步, skipped: 試算表未變動而略過）
+        inserted_count: 差異同步新增筆數
+        updated_count: 差異同步更新筆數
+        deleted_count: 差異同步刪除筆數
+        unchanged_count: 差異同步未變動（未寫入）筆數
+        source_revision: 同步時的試算表 Drive 版本（用於判斷試算表是否變動）
         started_at: 開始時間
         completed_at: 完成時間
         triggered_by: 觸發方式（auto, manual）
@@ -280,6 +318,48 @@ class SyncTask(Base, TimestampMixin):
         comment="錯誤詳情（JSON 格式）"
     )
 
+    rows_per_second: Mapped[Optional[float]] = mapped_column(
+        nullable=True,
+        default=None,
+        comment="寫入吞吐量（列/秒）"
+    )
+
+    sync_mode: Mapped[Optional[str]] = mapped_column(
+        String(20),
+        nullable=True,
+        comment="同步模式：full（刪除後重寫）, incremental（差異同步）, skipped（試算表未變動）"
+    )
+
+    inserted_count: Mapped[Optional[int]] = mapped_column(
+        nullable=True,
+        default=None,
+        comment="差異同步新增筆數"
+    )
+
+    updated_count: Mapped[Optional[int]] = mapped_column(
+        nullable=True,
+        default=None,
+        comment="差異同步更新筆數"
+    )
+
+    deleted_count: Mapped[Optional[int]] = mapped_column(
+        nullable=True,
+        default=None,
+        comment="差異同步刪除筆數"
+    )
+
+    unchanged_count: Mapped[Optional[int]] = mapped_column(
+        nullable=True,
+        default=None,
+        comment="差異同步未變動（未寫入）筆數"
+    )
+
+    source_revision: Mapped[Optional[str]] = mapped_column(
+        String(50),
+        nullable=True,
+        comment="同步時的試算表 Drive 版本"
+    )
+
     started_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
         nullable=True,
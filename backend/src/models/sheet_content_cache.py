@@ -0,0 +1,87 @@
+"""
+SheetContentCache 試算表內容快取模型
+
+功能：
+- 保存最近一次讀取的試算表範圍資料
+- 記錄讀取當下的 Drive 檔案版本（version / modifiedTime）
+- 伺服器重啟後仍可判斷試算表是否有變動，避免重複下載
+"""
+
+from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy import DateTime, Index, String
+from sqlalchemy.dialects.mysql import JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, TimestampMixin
+
+
+class SheetContentCache(Base, TimestampMixin):
+    """
+    試算表內容快取
+
+    Attributes:
+        id: 主鍵
+        spreadsheet_id: 試算表 ID
+        range_key: 讀取範圍（A1 表示法，如 "'2026-01'"）
+        revision: 讀取時的 Drive 檔案版本
+        modified_time: 讀取時的 Drive 檔案修改時間（RFC 3339）
+        cell_values: 範圍資料（二維陣列）
+        fetched_at: 下載時間
+
+    Indexes:
+        - (spreadsheet_id, range_key) 唯一索引
+    """
+
+    __tablename__ = "sheet_content_cache"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    spreadsheet_id: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="試算表 ID"
+    )
+
+    range_key: Mapped[str] = mapped_column(
+        String(200),
+        nullable=False,
+        comment="讀取範圍（A1 表示法）"
+    )
+
+    revision: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Drive 檔案版本"
+    )
+
+    modified_time: Mapped[Optional[str]] = mapped_column(
+        String(40),
+        nullable=True,
+        comment="Drive 檔案修改時間（RFC 3339）"
+    )
+
+    cell_values: Mapped[List[List[Any]]] = mapped_column(
+        JSON,
+        nullable=False,
+        comment="範圍資料（二維陣列）"
+    )
+
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="下載時間"
+    )
+
+    __table_args__ = (
+        Index(
+            "uq_sheet_content_cache_range",
+            "spreadsheet_id", "range_key",
+            unique=True
+        ),
+        {"comment": "試算表內容快取"}
+    )
+
+    def __repr__(self) -> str:
+        return f"<SheetContentCache(spreadsheet={self.spreadsheet_id!r}, range={self.range_key!r}, revision={self.revision!r})>"
@@ -39,7 +39,9 @@ from .assessment_record_service import AssessmentRecordService
 from .assessment_recalculator import AssessmentRecalculatorService
 from .profile_date_updater import ProfileDateUpdaterService
 from .monthly_reward_calculator import MonthlyRewardCalculatorService
+from .monthly_reward_recheck_queue import MonthlyRewardRecheckQueue
 from .annual_reset_service import AnnualResetService
+from .score_ledger_service import ScoreLedgerService
 
 __all__ = [
     # SystemSettingService
@@ -73,5 +75,7 @@ __all__ = [
     "AssessmentRecalculatorService",
     "ProfileDateUpdaterService",
     "MonthlyRewardCalculatorService",
+    "MonthlyRewardRecheckQueue",
     "AnnualResetService",
+    "ScoreLedgerService",
 ]
@@ -9,6 +9,7 @@
 使用 Transaction + FOR UPDATE 鎖定確保並發安全。
 """
 
+from collections import defaultdict
 from datetime import date
 from typing import Any, Optional
 
@@ -19,11 +20,17 @@ from ..models.assessment_record import AssessmentRecord
 from ..models.assessment_standard import AssessmentStandard
 from ..models.cumulative_counter import CumulativeCounter
 from ..models.employee import Employee
+from ..utils.db_bulk import insert_rows, update_rows
+from ..utils.period_filter import in_period
 from .cumulative_category import (
     R_CUMULATIVE_GROUP,
     calculate_cumulative_multiplier,
     get_cumulative_category,
 )
+from .score_ledger_service import ScoreLedgerService
+
+# 浮點數比較容許誤差（Float 欄位讀回可能有微小誤差）
+_EPSILON = 1e-9
 
 
 class AssessmentRecalculatorService:
@@ -70,6 +77,9 @@ class AssessmentRecalculatorService:
             category 應該是經過 get_cumulative_category() 處理後的值
             例如：R02/R03/R04/R05 應傳入 'R'
         """
+        # Session 未啟用 autoflush，先送出刪除 / 還原等變更再查詢
+        self.db.flush()
+
         # 查詢記錄（依類別不同處理）
         if category == 'R':
             # R 類特殊處理：查詢所有 R02-R05 的記錄
@@ -80,7 +90,7 @@ class AssessmentRecalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.is_deleted == False,
-                        extract('year', AssessmentRecord.record_date) == year,
+                        in_period(AssessmentRecord.record_date, year),
                         AssessmentStandard.code.in_(R_CUMULATIVE_GROUP),
                         AssessmentStandard.has_cumulative == True
                     )
@@ -97,7 +107,7 @@ class AssessmentRecalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.is_deleted == False,
-                        extract('year', AssessmentRecord.record_date) == year,
+                        in_period(AssessmentRecord.record_date, year),
                         AssessmentStandard.category == category,
                         AssessmentStandard.has_cumulative == True
                     )
@@ -109,6 +119,7 @@ class AssessmentRecalculatorService:
         records = list(self.db.execute(stmt).scalars().all())
 
         # 重新計算累計次數
+        points_change = 0.0
         for idx, record in enumerate(records, start=1):
             cumulative_count = idx
             cumulative_multiplier = calculate_cumulative_multiplier(cumulative_count)
@@ -119,11 +130,16 @@ class AssessmentRecalculatorService:
             final_points = actual_points * cumulative_multiplier
 
             # 更新記錄
+            points_change += final_points - record.final_points
             record.cumulative_count = cumulative_count
             record.cumulative_multiplier = cumulative_multiplier
             record.actual_points = actual_points
             record.final_points = final_points
 
+        # 同步員工年度帳本與總分（僅調整分數，記錄筆數不變）
+        if points_change:
+            ScoreLedgerService(self.db).add_points(employee_id, year, points_change)
+
         # 更新累計次數計數器
         counter = self.db.execute(
             select(CumulativeCounter).where(
@@ -152,7 +168,8 @@ class AssessmentRecalculatorService:
         """
         重新計算員工總分
 
-        總分 = 起始分數 80 + 所有考核記錄的 final_points 總和
+        總分 = 起始分數 80 + 員工所有年度帳本 total_points 總和
+        （帳本於考核記錄變動時同步更新，與所有考核記錄 final_points 總和相同）
 
         Args:
             employee_id: 員工 ID
@@ -167,18 +184,7 @@ class AssessmentRecalculatorService:
         if not employee:
             raise ValueError(f"員工 {employee_id} 不存在")
 
-        # 查詢所有未刪除的考核記錄
-        total = self.db.execute(
-            select(func.coalesce(func.sum(AssessmentRecord.final_points), 0)).where(
-                and_(
-                    AssessmentRecord.employee_id == employee_id,
-                    AssessmentRecord.is_deleted == False
-                )
-            )
-        ).scalar_one()
-
-        # 計算總分
-        total_score = 80.0 + float(total)
+        total_score = ScoreLedgerService(self.db).get_score(employee_id)
         employee.current_score = total_score
 
         return total_score
@@ -218,7 +224,7 @@ class AssessmentRecalculatorService:
         )
 
         if year:
-            stmt = stmt.where(extract('year', AssessmentRecord.record_date) == year)
+            stmt = stmt.where(in_period(AssessmentRecord.record_date, year))
 
         year_categories = self.db.execute(stmt).fetchall()
 
@@ -248,16 +254,32 @@ class AssessmentRecalculatorService:
 
         return result
 
-    def recalculate_year_for_all_employees(self, year: int) -> dict[str, int]:
+    def recalculate_year_for_all_employees(
+        self,
+        year: int,
+        bulk: bool = True,
+        dry_run: bool = False
+    ) -> dict[str, Any]:
         """
         重算指定年度所有員工的累計次數
 
         Args:
             year: 年度
+            bulk: 是否使用集合式批次重算（False 時逐人呼叫 recalculate_all_for_employee）
+            dry_run: 僅計算差異不寫入（僅支援集合式批次重算）
 
         Returns:
-            重算結果統計
+            重算結果統計（集合式批次重算另含 dry_run 與 changes 差異明細）
+
+        Raises:
+            ValueError: 逐人重算時指定 dry_run
         """
+        if bulk:
+            return self._recalculate_year_bulk(year, dry_run)
+
+        if dry_run:
+            raise ValueError("dry_run 僅支援集合式批次重算")
+
         result = {"employees_updated": 0, "categories_updated": 0, "records_updated": 0}
 
         # 取得該年度有考核記錄的員工
@@ -266,7 +288,7 @@ class AssessmentRecalculatorService:
             .distinct()
             .where(
                 and_(
-                    extract('year', AssessmentRecord.record_date) == year,
+                    in_period(AssessmentRecord.record_date, year),
                     AssessmentRecord.is_deleted == False
                 )
             )
@@ -280,9 +302,242 @@ class AssessmentRecalculatorService:
 
         return result
 
+    def _recalculate_year_bulk(self, year: int, dry_run: bool) -> dict[str, Any]:
+        """
+        集合式批次重算指定年度所有員工的累計次數與總分
+
+        該年度可累計的考核記錄以一次依 (員工, 日期) 排序的查詢載入，
+        於記憶體依 (員工, 累計類別) 編號並計算倍率與最終分數；
+        計數器與員工總分各以一次查詢載入後比對，
+        僅將有差異的資料以多列 UPDATE / INSERT 寫回。
+        計算規則同 recalculate_cumulative_counts；總分以全部考核記錄加總，
+        並依重算結果修正該年度的員工分數帳本。
+
+        Args:
+            year: 年度
+            dry_run: 僅計算差異不寫入
+
+        Returns:
+            重算結果統計與差異明細
+        """
+        # 送出尚未寫入的變更，確保以下查詢看得到
+        self.db.flush()
+
+        stmt = (
+            select(
+                AssessmentRecord.id,
+                AssessmentRecord.employee_id,
+                AssessmentRecord.standard_code,
+                AssessmentStandard.category,
+                AssessmentRecord.base_points,
+                AssessmentRecord.responsibility_coefficient,
+                AssessmentRecord.cumulative_count,
+                AssessmentRecord.cumulative_multiplier,
+                AssessmentRecord.actual_points,
+                AssessmentRecord.final_points
+            )
+            .join(AssessmentStandard)
+            .where(
+                and_(
+                    AssessmentRecord.is_deleted == False,
+                    in_period(AssessmentRecord.record_date, year),
+                    AssessmentStandard.has_cumulative == True
+                )
+            )
+            .order_by(
+                AssessmentRecord.employee_id,
+                AssessmentRecord.record_date,
+                AssessmentRecord.id
+            )
+        )
+        if not dry_run:
+            stmt = stmt.with_for_update()  # 鎖定記錄
+
+        counts: dict[tuple[int, str], int] = defaultdict(int)
+        record_changes: list[dict[str, Any]] = []
+        point_deltas: dict[int, float] = defaultdict(float)
+        records_scanned = 0
+
+        for row in self.db.execute(stmt):
+            records_scanned += 1
+            category = get_cumulative_category(row.standard_code, row.category)
+            key = (row.employee_id, category)
+            counts[key] += 1
+
+            cumulative_count = counts[key]
+            cumulative_multiplier = calculate_cumulative_multiplier(cumulative_count)
+            actual_points = row.base_points * (row.responsibility_coefficient or 1.0)
+            final_points = actual_points * cumulative_multiplier
+
+            before = {
+                "cumulative_count": row.cumulative_count,
+                "cumulative_multiplier": row.cumulative_multiplier,
+                "actual_points": row.actual_points,
+                "final_points": row.final_points,
+            }
+            after = {
+                "cumulative_count": cumulative_count,
+                "cumulative_multiplier": cumulative_multiplier,
+                "actual_points": actual_points,
+                "final_points": final_points,
+            }
+            if any(_differs(before[col], after[col]) for col in after):
+                record_changes.append({
+                    "record_id": row.id,
+                    "employee_id": row.employee_id,
+                    "category": category,
+                    "before": before,
+                    "after": after,
+                })
+                point_deltas[row.employee_id] += final_points - row.final_points
+
+        counter_changes = self._diff_year_counters(year, counts)
+        employee_count, score_changes = self._diff_year_scores(year, point_deltas)
+
+        if not dry_run:
+            update_rows(self.db, AssessmentRecord.__table__, [
+                {"id": change["record_id"], **change["after"]}
+                for change in record_changes
+            ])
+            insert_rows(self.db, CumulativeCounter.__table__, [
+                {
+                    "employee_id": change["employee_id"],
+                    "year": year,
+                    "category": change["category"],
+                    "count": change["after"],
+                }
+                for change in counter_changes if change["counter_id"] is None
+            ])
+            update_rows(self.db, CumulativeCounter.__table__, [
+                {"id": change["counter_id"], "count": change["after"]}
+                for change in counter_changes if change["counter_id"] is not None
+            ])
+            update_rows(self.db, Employee.__table__, [
+                {"id": change["employee_id"], "current_score": change["after"]}
+                for change in score_changes
+            ])
+            # 依重算後的記錄修正該年度帳本
+            ScoreLedgerService(self.db).reconcile(year, fix=True)
+            # 以 Core 語句寫入，已載入的 ORM 物件需重新讀取
+            self.db.expire_all()
+
+        return {
+            "employees_updated": employee_count,
+            "categories_updated": len(counts),
+            "records_updated": records_scanned,
+            "dry_run": dry_run,
+            "changes": {
+                "records": record_changes,
+                "counters": counter_changes,
+                "scores": score_changes,
+            },
+        }
+
+    def _diff_year_counters(
+        self,
+        year: int,
+        counts: dict[tuple[int, str], int]
+    ) -> list[dict[str, Any]]:
+        """
+        比對年度累計次數計數器
+
+        已無有效記錄的計數器歸零。
+
+        Args:
+            year: 年度
+            counts: (員工 ID, 累計類別) -> 重算後的累計次數
+
+        Returns:
+            計數器差異列表（counter_id 為 None 表示需新增）
+        """
+        existing = {
+            (counter.employee_id, counter.category): (counter.id, counter.count)
+            for counter in self.db.execute(
+                select(
+                    CumulativeCounter.id,
+                    CumulativeCounter.employee_id,
+                    CumulativeCounter.category,
+                    CumulativeCounter.count
+                ).where(CumulativeCounter.year == year)
+            )
+        }
+
+        changes = []
+        for key in sorted(counts.keys() | existing.keys()):
+            counter_id, before = existing.get(key, (None, None))
+            after = counts.get(key, 0)
+            if before != after and (counter_id is not None or after > 0):
+                changes.append({
+                    "employee_id": key[0],
+                    "category": key[1],
+                    "counter_id": counter_id,
+                    "before": before,
+                    "after": after,
+                })
+        return changes
+
+    def _diff_year_scores(
+        self,
+        year: int,
+        point_deltas: dict[int, float]
+    ) -> tuple[int, list[dict[str, Any]]]:
+        """
+        比對該年度有考核記錄員工的總分
+
+        總分 = 起始分數 80 + 所有未刪除考核記錄的 final_points 總和（含本次重算差額）
+
+        Args:
+            year: 年度
+            point_deltas: 員工 ID -> 本次重算造成的 final_points 差額
+
+        Returns:
+            (該年度有考核記錄的員工數, 總分差異列表)
+        """
+        year_employee_ids = (
+            select(AssessmentRecord.employee_id)
+            .where(
+                and_(
+                    in_period(AssessmentRecord.record_date, year),
+                    AssessmentRecord.is_deleted == False
+                )
+            )
+        )
+
+        rows = self.db.execute(
+            select(
+                Employee.id,
+                Employee.current_score,
+                func.coalesce(func.sum(AssessmentRecord.final_points), 0).label("total")
+            )
+            .outerjoin(
+                AssessmentRecord,
+                and_(
+                    AssessmentRecord.employee_id == Employee.id,
+                    AssessmentRecord.is_deleted == False
+                )
+            )
+            .where(Employee.id.in_(year_employee_ids))
+            .group_by(Employee.id, Employee.current_score)
+            .order_by(Employee.id)
+        ).all()
+
+        changes = []
+        for employee_id, current_score, total in rows:
+            expected = 80.0 + float(total) + point_deltas.get(employee_id, 0.0)
+            if _differs(current_score, expected):
+                changes.append({
+                    "employee_id": employee_id,
+                    "before": current_score,
+                    "after": expected,
+                })
+        return len(rows), changes
+
     def verify_employee_score(self, employee_id: int) -> dict[str, Any]:
         """
-        驗證員工分數是否正確
+        驗證員工分數是否與帳本一致
+
+        僅讀取員工年度帳本（O(1)，不掃描考核記錄）。帳本與員工總分由同一路徑維護，
+        兩者同時偏離考核記錄的情況由 ScoreLedgerService.reconcile 分組比對偵測。
 
         Args:
             employee_id: 員工 ID
@@ -297,17 +552,8 @@ class AssessmentRecalculatorService:
         if not employee:
             raise ValueError(f"員工 {employee_id} 不存在")
 
-        # 計算應有的總分
-        total = self.db.execute(
-            select(func.coalesce(func.sum(AssessmentRecord.final_points), 0)).where(
-                and_(
-                    AssessmentRecord.employee_id == employee_id,
-                    AssessmentRecord.is_deleted == False
-                )
-            )
-        ).scalar_one()
-
-        expected_score = 80.0 + float(total)
+        # 由員工年度帳本取得應有的總分
+        expected_score = ScoreLedgerService(self.db).get_score(employee_id)
         actual_score = employee.current_score
         is_correct = abs(expected_score - actual_score) < 0.001
 
@@ -318,3 +564,10 @@ class AssessmentRecalculatorService:
             "is_correct": is_correct,
             "difference": actual_score - expected_score
         }
+
+
+def _differs(before: Any, after: Any) -> bool:
+    """比較重算前後的值（數值容許浮點誤差）"""
+    if before is None or after is None:
+        return before is not after
+    return abs(before - after) > _EPSILON
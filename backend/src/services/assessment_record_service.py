@@ -8,20 +8,31 @@ AssessmentRecordService 考核記錄服務
 整合責任判定與累計倍率計算。
 """
 
+from collections import defaultdict
 from datetime import date, datetime
 from typing import Any, Optional
 
-from sqlalchemy import and_, extract, func, select
+from sqlalchemy import and_, extract, select
 from sqlalchemy.orm import Session, joinedload
 
+from ..config.settings import get_settings
 from ..models.assessment_record import AssessmentRecord
 from ..models.assessment_standard import AssessmentStandard
+from ..models.cumulative_counter import CumulativeCounter
 from ..models.employee import Employee
 from ..models.fault_responsibility import FaultResponsibilityAssessment
+from ..utils.db_bulk import chunked, insert_rows
+from ..utils.period_filter import in_period
 from .assessment_standard_service import AssessmentStandardService
 from .cumulative_calculator import CumulativeCalculatorService
-from .cumulative_category import get_cumulative_category
+from .cumulative_category import calculate_cumulative_multiplier, get_cumulative_category
 from .fault_responsibility_service import FaultResponsibilityService
+from .monthly_reward_recheck_queue import MonthlyRewardRecheckQueue
+from .score_ledger_service import ScoreLedgerService
+
+
+# 需要責任判定的標準代碼
+FAULT_RESPONSIBILITY_CODES = frozenset({'R02', 'R03', 'R04', 'R05'})
 
 
 class AssessmentRecordService:
@@ -43,6 +54,7 @@ class AssessmentRecordService:
         self.standard_service = AssessmentStandardService(db)
         self.cumulative_service = CumulativeCalculatorService(db)
         self.fault_service = FaultResponsibilityService(db)
+        self.score_ledger = ScoreLedgerService(db)
 
     def get_by_id(
         self,
@@ -100,9 +112,9 @@ class AssessmentRecordService:
             stmt = stmt.where(AssessmentRecord.is_deleted == False)
 
         if year:
-            stmt = stmt.where(extract('year', AssessmentRecord.record_date) == year)
-
-        if month:
+            # 指定年度時以日期範圍篩選（可使用 employee_id + record_date 索引）
+            stmt = stmt.where(in_period(AssessmentRecord.record_date, year, month=month))
+        elif month:
             stmt = stmt.where(extract('month', AssessmentRecord.record_date) == month)
 
         if category:
@@ -140,16 +152,16 @@ class AssessmentRecordService:
         Returns:
             建立的考核記錄
         """
-        # 1. 查詢考核標準
-        standard = self.standard_service.get_by_code(standard_code)
-        if not standard or not standard.is_active:
+        # 1. 查詢考核標準（登錄表快照）
+        standard = self.standard_service.get_snapshot().get_active(standard_code)
+        if not standard:
             raise ValueError(f"考核標準 '{standard_code}' 不存在或未啟用")
 
         # 2. 計算責任係數（R02-R05 專用）
         responsibility_coefficient = 1.0
         fault_count = 0
 
-        if standard_code in {'R02', 'R03', 'R04', 'R05'} and fault_responsibility_data:
+        if standard_code in FAULT_RESPONSIBILITY_CODES and fault_responsibility_data:
             checklist = fault_responsibility_data.get('checklist_results', {})
             fault_count = self.fault_service.calculate_fault_count(checklist)
             _, responsibility_coefficient = self.fault_service.determine_responsibility_level(fault_count)
@@ -189,18 +201,8 @@ class AssessmentRecordService:
         self.db.flush()  # 取得 ID
 
         # 7. 建立責任判定記錄（R02-R05 專用）
-        if standard_code in {'R02', 'R03', 'R04', 'R05'} and fault_responsibility_data:
-            self.fault_service.create_assessment(
-                record_id=record.id,
-                delay_seconds=fault_responsibility_data.get('delay_seconds', 0),
-                checklist_results=fault_responsibility_data.get('checklist_results', {}),
-                time_t0=fault_responsibility_data.get('time_t0'),
-                time_t1=fault_responsibility_data.get('time_t1'),
-                time_t2=fault_responsibility_data.get('time_t2'),
-                time_t3=fault_responsibility_data.get('time_t3'),
-                time_t4=fault_responsibility_data.get('time_t4'),
-                notes=fault_responsibility_data.get('notes')
-            )
+        if standard_code in FAULT_RESPONSIBILITY_CODES and fault_responsibility_data:
+            self._create_fault_assessment(record.id, fault_responsibility_data)
 
         # 8. 更新累計次數
         if standard.has_cumulative:
@@ -208,8 +210,8 @@ class AssessmentRecordService:
                 employee_id, year, standard_code, standard.category
             )
 
-        # 9. 更新員工總分
-        self._update_employee_score(employee_id, final_points)
+        # 9. 更新員工年度帳本與總分
+        self._update_employee_score(employee_id, year, final_points, records=1)
 
         # 10. P1 修正：觸發月度獎勵重算（處理回溯建檔導致的獎勵溢發）
         if standard.base_points < 0:  # 僅扣分項目影響月度獎勵
@@ -217,6 +219,169 @@ class AssessmentRecordService:
 
         return record
 
+    def create_bulk(self, items: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        批次建立考核記錄
+
+        考核標準取自登錄表快照，員工與累計計數器各以一次查詢載入，
+        依 (員工, 年度, 累計類別) 分組於記憶體中依輸入順序指派累計次數，
+        結果與逐筆呼叫 create 相同。考核記錄以多列 INSERT 分批寫入
+        （含責任判定資料者需取得 ID，改以 ORM 建立），
+        帳本以 apply_deltas 依年度合併更新，
+        月度獎勵重算依 (員工, 年, 月) 去重後各觸發一次。
+
+        Args:
+            items: 考核記錄資料列表，欄位同 create 參數
+                （employee_id, standard_code, record_date, description,
+                profile_id, fault_responsibility_data）
+
+        Returns:
+            建立結果（records 依輸入順序列出每筆的累計次數與最終分數）
+
+        Raises:
+            ValueError: 考核標準不存在或未啟用、員工不存在（不寫入任何記錄）
+        """
+        if not items:
+            return {"created": 0, "monthly_reward_checks": 0, "records": []}
+
+        # Session 未啟用 autoflush，先送出尚未寫入的計數器與帳本變更
+        self.db.flush()
+
+        # 1. 由登錄表快照取得考核標準並驗證
+        codes = {item["standard_code"] for item in items}
+        snapshot = self.standard_service.get_snapshot()
+        standards = {code: snapshot.get_active(code) for code in codes}
+        invalid_codes = sorted(code for code, standard in standards.items() if standard is None)
+        if invalid_codes:
+            raise ValueError(f"考核標準 {', '.join(invalid_codes)} 不存在或未啟用")
+
+        employee_ids = sorted({item["employee_id"] for item in items})
+        found_ids: set[int] = set()
+        for chunk in chunked(employee_ids):
+            found_ids.update(self.db.execute(
+                select(Employee.id).where(Employee.id.in_(chunk))
+            ).scalars())
+        missing_ids = [employee_id for employee_id in employee_ids if employee_id not in found_ids]
+        if missing_ids:
+            raise ValueError(f"找不到員工 ID: {', '.join(map(str, missing_ids))}")
+
+        # 2. 一次查詢載入涉及的累計計數器
+        years = {item["record_date"].year for item in items}
+        categories = {
+            get_cumulative_category(code, standards[code].category)
+            for code in codes if standards[code].has_cumulative
+        }
+        counters: dict[tuple[int, int, str], CumulativeCounter] = {}
+        if categories:
+            for chunk in chunked(employee_ids):
+                for counter in self.db.execute(
+                    select(CumulativeCounter).where(
+                        and_(
+                            CumulativeCounter.employee_id.in_(chunk),
+                            CumulativeCounter.year.in_(years),
+                            CumulativeCounter.category.in_(categories)
+                        )
+                    )
+                ).scalars():
+                    counters[(counter.employee_id, counter.year, counter.category)] = counter
+
+        # 3. 記憶體中計算責任係數、累計次數與最終分數
+        rows: list[dict[str, Any]] = []
+        fault_items: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        point_deltas: dict[int, dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        record_deltas: dict[int, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        reward_checks: set[tuple[int, int, int]] = set()
+        results = []
+
+        for index, item in enumerate(items):
+            employee_id = item["employee_id"]
+            standard_code = item["standard_code"]
+            record_date = item["record_date"]
+            fault_data = item.get("fault_responsibility_data")
+            standard = standards[standard_code]
+            year = record_date.year
+
+            responsibility_coefficient = 1.0
+            if standard_code in FAULT_RESPONSIBILITY_CODES and fault_data:
+                fault_count = self.fault_service.calculate_fault_count(
+                    fault_data.get('checklist_results', {})
+                )
+                _, responsibility_coefficient = self.fault_service.determine_responsibility_level(fault_count)
+
+            actual_points = standard.base_points * responsibility_coefficient
+
+            cumulative_count = None
+            cumulative_multiplier = 1.0
+            if standard.has_cumulative:
+                key = (employee_id, year, get_cumulative_category(standard_code, standard.category))
+                counter = counters.get(key)
+                if counter is None:
+                    counter = CumulativeCounter(
+                        employee_id=employee_id, year=year, category=key[2], count=0
+                    )
+                    self.db.add(counter)
+                    counters[key] = counter
+                counter.count += 1
+                cumulative_count = counter.count
+                cumulative_multiplier = calculate_cumulative_multiplier(cumulative_count)
+
+            final_points = actual_points * cumulative_multiplier
+
+            row = {
+                "employee_id": employee_id,
+                "standard_code": standard_code,
+                "profile_id": item.get("profile_id"),
+                "record_date": record_date,
+                "description": item.get("description"),
+                "base_points": standard.base_points,
+                "responsibility_coefficient": responsibility_coefficient,
+                "actual_points": actual_points,
+                "cumulative_count": cumulative_count,
+                "cumulative_multiplier": cumulative_multiplier,
+                "final_points": final_points,
+            }
+            if standard_code in FAULT_RESPONSIBILITY_CODES and fault_data:
+                fault_items.append((row, fault_data))
+            else:
+                rows.append(row)
+
+            point_deltas[year][employee_id] += final_points
+            record_deltas[year][employee_id] += 1
+            if standard.base_points < 0:  # 僅扣分項目影響月度獎勵
+                reward_checks.add((employee_id, year, record_date.month))
+
+            results.append({
+                "index": index,
+                "employee_id": employee_id,
+                "standard_code": standard_code,
+                "record_date": record_date,
+                "cumulative_count": cumulative_count,
+                "cumulative_multiplier": cumulative_multiplier,
+                "final_points": final_points,
+            })
+
+        # 4. 寫入考核記錄（多列 INSERT）與責任判定記錄
+        insert_rows(self.db, AssessmentRecord.__table__, rows)
+        for row, fault_data in fault_items:
+            record = AssessmentRecord(**row)
+            self.db.add(record)
+            self.db.flush()  # 取得 ID
+            self._create_fault_assessment(record.id, fault_data)
+
+        # 5. 計數器變更寫入後，依年度合併更新帳本與員工總分
+        self.db.flush()
+        for year in sorted(point_deltas):
+            self.score_ledger.apply_deltas(year, point_deltas[year], record_deltas[year])
+
+        # 6. 月度獎勵重算，每位員工每月僅一次
+        self._trigger_monthly_reward_checks(sorted(reward_checks))
+
+        return {
+            "created": len(items),
+            "monthly_reward_checks": len(reward_checks),
+            "records": results,
+        }
+
     def update(
         self,
         record_id: int,
@@ -246,7 +411,7 @@ class AssessmentRecordService:
             record.description = description
 
         # 更新責任判定（R02-R05 專用）
-        if fault_responsibility_data and record.standard_code in {'R02', 'R03', 'R04', 'R05'}:
+        if fault_responsibility_data and record.standard_code in FAULT_RESPONSIBILITY_CODES:
             old_final_points = record.final_points
 
             # 更新或建立責任判定
@@ -283,7 +448,9 @@ class AssessmentRecordService:
             # 更新員工總分（差額）
             score_diff = record.final_points - old_final_points
             if score_diff != 0:
-                self._update_employee_score(record.employee_id, score_diff)
+                self._update_employee_score(
+                    record.employee_id, record.record_date.year, score_diff
+                )
 
         return record
 
@@ -312,8 +479,8 @@ class AssessmentRecordService:
         # 軟刪除
         record.soft_delete()
 
-        # 從員工總分中扣除
-        self._update_employee_score(employee_id, -record.final_points)
+        # 從員工年度帳本與總分中扣除
+        self._update_employee_score(employee_id, year, -record.final_points, records=-1)
 
         # 重算累計次數（若適用累計加重）
         if standard.has_cumulative:
@@ -355,6 +522,9 @@ class AssessmentRecordService:
         # 還原
         record.restore()
 
+        # 加回員工年度帳本與總分
+        self._update_employee_score(employee_id, year, record.final_points, records=1)
+
         # 重算累計次數（若適用累計加重）
         if standard.has_cumulative:
             self.cumulative_service.recalculate_counts(employee_id, year, cumulative_category)
@@ -439,6 +609,30 @@ class AssessmentRecordService:
             "cumulative_counts": cumulative_counts
         }
 
+    def _create_fault_assessment(
+        self,
+        record_id: int,
+        fault_responsibility_data: dict[str, Any]
+    ) -> None:
+        """
+        建立責任判定記錄（R02-R05 專用）
+
+        Args:
+            record_id: 考核記錄 ID
+            fault_responsibility_data: 責任判定資料
+        """
+        self.fault_service.create_assessment(
+            record_id=record_id,
+            delay_seconds=fault_responsibility_data.get('delay_seconds', 0),
+            checklist_results=fault_responsibility_data.get('checklist_results', {}),
+            time_t0=fault_responsibility_data.get('time_t0'),
+            time_t1=fault_responsibility_data.get('time_t1'),
+            time_t2=fault_responsibility_data.get('time_t2'),
+            time_t3=fault_responsibility_data.get('time_t3'),
+            time_t4=fault_responsibility_data.get('time_t4'),
+            notes=fault_responsibility_data.get('notes')
+        )
+
     def _trigger_monthly_reward_check(self, employee_id: int, year: int, month: int) -> None:
         """
         觸發月度獎勵重算
@@ -450,31 +644,53 @@ class AssessmentRecordService:
             year: 年度
             month: 月份
         """
+        self._trigger_monthly_reward_checks([(employee_id, year, month)])
+
+    def _trigger_monthly_reward_checks(self, keys: list[tuple[int, int, int]]) -> None:
+        """
+        觸發多個員工月份的月度獎勵重算
+
+        預設登記至月度獎勵重算佇列，由背景排程合併處理；
+        monthly_reward_recheck_deferred 關閉時同步逐筆重算。
+
+        Args:
+            keys: (員工 ID, 年度, 月份) 列表
+        """
+        if get_settings().monthly_reward_recheck_deferred:
+            MonthlyRewardRecheckQueue(self.db).enqueue_many(keys)
+            return
+
         # 延遲 import 避免 circular import
         from .monthly_reward_calculator import MonthlyRewardCalculatorService
 
         reward_service = MonthlyRewardCalculatorService(self.db)
-        reward_service.calculate_employee_month(employee_id, year, month)
+        for employee_id, year, month in keys:
+            reward_service.calculate_employee_month(employee_id, year, month)
 
-    def _update_employee_score(self, employee_id: int, points_change: float) -> None:
+    def _update_employee_score(
+        self,
+        employee_id: int,
+        year: int,
+        points_change: float,
+        records: int = 0
+    ) -> None:
         """
-        更新員工分數（增量更新）
+        更新員工年度帳本與分數（增量更新）
 
         Args:
             employee_id: 員工 ID
+            year: 考核記錄所屬年度
             points_change: 分數變動
+            records: 考核記錄筆數變動
         """
-        employee = self.db.execute(
-            select(Employee).where(Employee.id == employee_id)
-        ).scalar_one_or_none()
-
-        if employee:
-            employee.current_score += points_change
+        self.score_ledger.add_points(employee_id, year, points_change, records=records)
 
     def _recalculate_employee_total_score(self, employee_id: int) -> float:
         """
         重新計算員工總分
 
+        由員工年度帳本加總，不需掃描全部考核記錄。
+
         Args:
             employee_id: 員工 ID
 
@@ -488,18 +704,8 @@ class AssessmentRecordService:
         if not employee:
             raise ValueError(f"找不到員工 ID: {employee_id}")
 
-        # 查詢所有未刪除的考核記錄
-        total = self.db.execute(
-            select(func.coalesce(func.sum(AssessmentRecord.final_points), 0)).where(
-                and_(
-                    AssessmentRecord.employee_id == employee_id,
-                    AssessmentRecord.is_deleted == False
-                )
-            )
-        ).scalar_one()
-
-        # 總分 = 起始分數 80 + 所有 final_points 總和
-        new_score = 80.0 + float(total)
+        # 總分 = 起始分數 80 + 所有年度帳本總和
+        new_score = self.score_ledger.get_score(employee_id)
         employee.current_score = new_score
 
         return new_score
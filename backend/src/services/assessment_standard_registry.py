@@ -0,0 +1,159 @@
+"""
+考核標準登錄表
+
+功能：
+- 一次載入所有考核標準為不可變快照，考核記錄建立等熱路徑不需查詢資料庫
+- 提供類別、累計加重、扣分項目的代碼集合
+- 以版本號失效：考核標準管理 API 提交變更後遞增版本，下次取用時重新載入
+
+快照包含已停用的標準（既有考核記錄仍引用其代碼），
+熱路徑需自行檢查 is_active。
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models.assessment_standard import AssessmentStandard
+from ..utils.versioned_cache import VersionedCache, singleton
+
+
+@dataclass(frozen=True)
+class StandardInfo:
+    """
+    考核標準快照（與 Session 無關，可跨執行緒共用）
+
+    Attributes:
+        id: 主鍵
+        code: 考核代碼
+        category: 類別
+        name: 項目名稱
+        base_points: 基本分數
+        has_cumulative: 是否適用累計加重
+        calculation_cycle: 計算週期
+        is_active: 是否啟用
+    """
+    id: int
+    code: str
+    category: str
+    name: str
+    base_points: float
+    has_cumulative: bool
+    calculation_cycle: str
+    is_active: bool
+
+
+@dataclass(frozen=True)
+class StandardSnapshot:
+    """
+    考核標準登錄表快照
+
+    Attributes:
+        by_code: 代碼 -> 考核標準
+        codes_by_category: 類別 -> 代碼集合
+        cumulative_codes: 適用累計加重的代碼
+        deduction_codes: 扣分項目代碼（base_points < 0）
+    """
+    by_code: dict[str, StandardInfo] = field(default_factory=dict)
+    codes_by_category: dict[str, frozenset[str]] = field(default_factory=dict)
+    cumulative_codes: frozenset[str] = frozenset()
+    deduction_codes: frozenset[str] = frozenset()
+
+    def get(self, code: str) -> Optional[StandardInfo]:
+        """取得考核標準（不存在時回傳 None）"""
+        return self.by_code.get(code)
+
+    def get_active(self, code: str) -> Optional[StandardInfo]:
+        """取得啟用中的考核標準（不存在或已停用時回傳 None）"""
+        info = self.by_code.get(code)
+        return info if info and info.is_active else None
+
+    def codes_in_category(self, category: str) -> frozenset[str]:
+        """取得類別下的所有代碼"""
+        return self.codes_by_category.get(category, frozenset())
+
+
+def build_snapshot(standards: list[StandardInfo]) -> StandardSnapshot:
+    """
+    由考核標準列表建立快照
+
+    Args:
+        standards: 考核標準列表
+
+    Returns:
+        StandardSnapshot: 快照
+    """
+    by_category: dict[str, set[str]] = {}
+    for info in standards:
+        by_category.setdefault(info.category, set()).add(info.code)
+
+    return StandardSnapshot(
+        by_code={info.code: info for info in standards},
+        codes_by_category={category: frozenset(codes) for category, codes in by_category.items()},
+        cumulative_codes=frozenset(info.code for info in standards if info.has_cumulative),
+        deduction_codes=frozenset(info.code for info in standards if info.base_points < 0),
+    )
+
+
+def _load_snapshot(db: Session, key: None) -> StandardSnapshot:
+    """由資料庫載入所有考核標準（一次查詢）"""
+    rows = db.execute(
+        select(
+            AssessmentStandard.id,
+            AssessmentStandard.code,
+            AssessmentStandard.category,
+            AssessmentStandard.name,
+            AssessmentStandard.base_points,
+            AssessmentStandard.has_cumulative,
+            AssessmentStandard.calculation_cycle,
+            AssessmentStandard.is_active
+        )
+    ).all()
+    return build_snapshot([StandardInfo(*row) for row in rows])
+
+
+class AssessmentStandardRegistry(VersionedCache[None, StandardSnapshot]):
+    """
+    考核標準登錄表
+
+    快照與版本號不一致時，以呼叫端的 Session 重新載入（一次查詢）。
+    """
+
+    def __init__(self):
+        super().__init__(_load_snapshot, size=lambda snapshot: len(snapshot.by_code))
+
+    def snapshot(self, db: Session) -> StandardSnapshot:
+        """
+        取得最新快照（過期時重新載入）
+
+        Args:
+            db: 資料庫 Session（僅在需要重新載入時使用）
+
+        Returns:
+            StandardSnapshot: 快照
+        """
+        return self.get(db)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        取得登錄表統計
+
+        Returns:
+            dict: version, loaded_version, size, loads, hits, misses, hit_rate
+        """
+        stats = super().get_stats()
+        entry = stats.pop("entries").get(None)
+        return {
+            "version": stats.pop("version"),
+            "loaded_version": entry["loaded_version"] if entry else None,
+            "size": entry["size"] if entry else 0,
+            **stats,
+        }
+
+
+@singleton
+def get_assessment_standard_registry() -> AssessmentStandardRegistry:
+    """取得考核標準登錄表實例（單例）"""
+    return AssessmentStandardRegistry()
@@ -16,6 +16,7 @@ from ..models.assessment_standard import (
     AssessmentStandard,
     CalculationCycle,
 )
+from .assessment_standard_registry import StandardSnapshot, get_assessment_standard_registry
 
 
 class AssessmentStandardService:
@@ -92,6 +93,17 @@ class AssessmentStandardService:
             select(AssessmentStandard).where(AssessmentStandard.code == code)
         ).scalar_one_or_none()
 
+    def get_snapshot(self) -> StandardSnapshot:
+        """
+        取得考核標準登錄表快照
+
+        供考核記錄建立等熱路徑查詢，快照有效時不查詢資料庫。
+
+        Returns:
+            StandardSnapshot: 所有考核標準的快照（含已停用）
+        """
+        return get_assessment_standard_registry().snapshot(self.db)
+
     def search(
         self,
         keyword: str,
@@ -31,6 +31,7 @@ from src.services.attendance_overtime_detector import (
     AttendanceOvertimeDetector
 )
 from src.services.monthly_reward_calculator import MonthlyRewardCalculatorService
+from src.services.score_ledger_service import ScoreLedgerService
 from src.utils.logger import logger
 
 
@@ -98,6 +99,7 @@ class AttendanceBonusProcessor:
         self.db = db
         self.parser = get_attendance_sheet_parser()
         self.monthly_calculator = MonthlyRewardCalculatorService(db)
+        self.score_ledger = ScoreLedgerService(db)
 
     def _get_employee_by_code(self, employee_code: str) -> Optional[Employee]:
         """
@@ -177,8 +179,8 @@ class AttendanceBonusProcessor:
         )
         self.db.add(record)
 
-        # 更新員工分數
-        employee.current_score += points
+        # 更新員工年度帳本與分數
+        self.score_ledger.add_points(employee.id, record_date.year, points, records=1)
 
         return record
 
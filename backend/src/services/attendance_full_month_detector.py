@@ -8,11 +8,10 @@
 - 判定整月全勤狀態
 """
 
-import re
 from typing import List, Any, Optional
 from dataclasses import dataclass
 
-from src.constants.attendance import LEAVE_PATTERNS
+from src.services.shift_code_registry import get_shift_code_info
 from src.utils.logger import logger
 
 
@@ -34,36 +33,6 @@ class AttendanceFullMonthDetector:
     全勤定義：整月無任何請假（不含「(假)」、「(特)」、「(公)」等）
     """
 
-    def __init__(self):
-        # 從常量模組載入請假模式並編譯
-        combined_pattern = "|".join(LEAVE_PATTERNS)
-        self.leave_regex = re.compile(combined_pattern)
-
-    def _normalize_text(self, text: str) -> str:
-        """
-        正規化文字
-
-        - 移除多餘空白
-        - 全形符號轉半形
-
-        Args:
-            text: 原始文字
-
-        Returns:
-            正規化後的文字
-        """
-        if not text:
-            return ""
-
-        # 移除多餘空白
-        text = text.strip()
-        text = re.sub(r"\s+", "", text)
-
-        # 全形轉半形（僅處理括號）
-        text = text.replace("（", "(").replace("）", ")")
-
-        return text
-
     def check_cell_has_leave(self, cell_value: Any) -> bool:
         """
         檢查單一儲存格是否包含請假標記
@@ -77,10 +46,8 @@ class AttendanceFullMonthDetector:
         if cell_value is None:
             return False
 
-        text = self._normalize_text(str(cell_value))
-
-        # 使用正則匹配
-        return bool(self.leave_regex.search(text))
+        # 正規化後以正則匹配（判定結果由班別代碼登錄表快取）
+        return get_shift_code_info(cell_value).has_attendance_leave
 
     def detect_full_month(
         self,
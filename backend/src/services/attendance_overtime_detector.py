@@ -8,16 +8,15 @@
 - 返回加班時數與日期
 """
 
-import re
 from typing import List, Any, Optional
 from datetime import date
 from dataclasses import dataclass
 
 from src.constants.attendance import (
-    OVERTIME_PATTERN,
     OVERTIME_CODE_MAP,
     OVERTIME_POINTS_MAP
 )
+from src.services.shift_code_registry import get_shift_code_info
 from src.utils.logger import logger
 
 
@@ -50,20 +49,6 @@ class AttendanceOvertimeDetector:
     對應考核項目：+A03~+A06
     """
 
-    def __init__(self):
-        # 從常量模組載入模式並編譯
-        self._overtime_pattern = re.compile(OVERTIME_PATTERN)
-
-    def _normalize_text(self, text: str) -> str:
-        """正規化文字"""
-        if not text:
-            return ""
-        text = text.strip()
-        # 全形轉半形
-        text = text.replace("（", "(").replace("）", ")")
-        text = text.replace("＋", "+")
-        return text
-
     def extract_overtime_hours(self, cell_value: Any) -> Optional[int]:
         """
         從儲存格提取延長工時時數
@@ -77,12 +62,8 @@ class AttendanceOvertimeDetector:
         if cell_value is None:
             return None
 
-        text = self._normalize_text(str(cell_value))
-        match = self._overtime_pattern.search(text)
-
-        if match:
-            return int(match.group(1))
-        return None
+        # 判定結果由班別代碼登錄表快取
+        return get_shift_code_info(cell_value).attendance_overtime_hours
 
     def detect_single(
         self,
@@ -103,19 +84,19 @@ class AttendanceOvertimeDetector:
         Returns:
             延長工時記錄或 None
         """
-        hours = self.extract_overtime_hours(cell_value)
-
-        if hours is None:
+        if cell_value is None:
             return None
 
-        text = self._normalize_text(str(cell_value))
+        info = get_shift_code_info(cell_value)
+        if info.attendance_overtime_hours is None:
+            return None
 
         return OvertimeRecord(
             employee_id=employee_id,
             employee_name=employee_name,
             record_date=record_date,
-            shift_code=text,
-            overtime_hours=hours
+            shift_code=info.overtime_text,
+            overtime_hours=info.attendance_overtime_hours
         )
 
     def detect_employee_month(
@@ -8,12 +8,11 @@ R班出勤判定服務
 - 返回出勤類型與日期
 """
 
-import re
 from typing import List, Any, Optional
 from datetime import date
 from dataclasses import dataclass
 
-from src.constants.attendance import R_SHIFT_PATTERN, NATIONAL_HOLIDAY_PATTERN
+from src.services.shift_code_registry import get_shift_code_info
 from src.utils.logger import logger
 
 
@@ -46,19 +45,6 @@ class AttendanceRShiftDetector:
     - R(國)/0905G：國定假日 R班（+A01 +3分 + +A02 +1分）
     """
 
-    def __init__(self):
-        # 從常量模組載入模式並編譯
-        self._r_shift_pattern = re.compile(R_SHIFT_PATTERN, re.IGNORECASE)
-        self._national_holiday_pattern = re.compile(NATIONAL_HOLIDAY_PATTERN, re.IGNORECASE)
-
-    def _normalize_text(self, text: str) -> str:
-        """正規化文字"""
-        if not text:
-            return ""
-        text = text.strip()
-        text = re.sub(r"\s+", "", text)
-        return text
-
     def check_is_r_shift(self, cell_value: Any) -> bool:
         """
         檢查儲存格是否為 R班
@@ -72,10 +58,8 @@ class AttendanceRShiftDetector:
         if cell_value is None:
             return False
 
-        text = self._normalize_text(str(cell_value))
-
-        # R班必須以 R/ 或 R(國)/ 開頭
-        return bool(self._r_shift_pattern.match(text))
+        # R班必須以 R/ 或 R(國)/ 開頭（判定結果由班別代碼登錄表快取）
+        return get_shift_code_info(cell_value).is_attendance_r_shift
 
     def check_is_national_holiday(self, cell_value: Any) -> bool:
         """
@@ -90,9 +74,7 @@ class AttendanceRShiftDetector:
         if cell_value is None:
             return False
 
-        text = self._normalize_text(str(cell_value))
-
-        return bool(self._national_holiday_pattern.match(text))
+        return get_shift_code_info(cell_value).is_national_holiday
 
     def detect_single(
         self,
@@ -113,18 +95,19 @@ class AttendanceRShiftDetector:
         Returns:
             R班記錄或 None
         """
-        if not self.check_is_r_shift(cell_value):
+        if cell_value is None:
             return None
 
-        text = self._normalize_text(str(cell_value))
-        is_national = self.check_is_national_holiday(cell_value)
+        info = get_shift_code_info(cell_value)
+        if not info.is_attendance_r_shift:
+            return None
 
         return RShiftRecord(
             employee_id=employee_id,
             employee_name=employee_name,
             record_date=record_date,
-            shift_code=text,
-            is_national_holiday=is_national
+            shift_code=info.attendance_text,
+            is_national_holiday=info.is_national_holiday
         )
 
     def detect_employee_month(
@@ -7,6 +7,7 @@
 - 檢查 Google Sheets API 連線
 - 檢查 Google Drive API 連線
 - 提供統一的連線狀態報告
+- 提供快取命中統計
 
 Gemini Review Fix: 使用 ThreadPoolExecutor 並行處理 Google API 檢查
 """
@@ -376,6 +377,40 @@ class ConnectionMonitor:
             checked_at=datetime.now()
         )
 
+    def get_cache_stats(self) -> dict:
+        """
+        取得快取命中統計
+
+        Returns:
+            dict: 各快取的統計（未啟用的快取為 None）
+        """
+        from src.services.assessment_standard_registry import get_assessment_standard_registry
+        from src.services.google_sheets_reader import get_google_sheets_reader
+        from src.services.route_minutes_registry import get_route_minutes_registry
+        from src.services.schedule_statistics_service import get_schedule_statistics_cache
+        from src.services.shift_code_registry import get_shift_code_registry
+        from src.services.system_setting_cache import get_system_setting_cache
+
+        return {
+            "sheets_content": get_google_sheets_reader().get_content_cache_stats(),
+            "shift_codes": get_shift_code_registry().get_stats(),
+            "assessment_standards": get_assessment_standard_registry().get_stats(),
+            "schedule_statistics": get_schedule_statistics_cache().get_stats(),
+            "route_minutes": get_route_minutes_registry().get_stats(),
+            "system_settings": get_system_setting_cache().get_stats(),
+        }
+
+    def get_pool_stats(self) -> dict:
+        """
+        取得資料庫連線池統計
+
+        Returns:
+            dict: request（API 請求）、background（排程與背景任務）的連線池統計
+        """
+        from src.config.database import get_pool_stats
+
+        return get_pool_stats()
+
     def check_all(self) -> dict:
         """
         檢查所有服務連線狀態
@@ -11,17 +11,19 @@
 from datetime import date
 from typing import Optional
 
-from sqlalchemy import and_, extract, select
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
 from ..models.assessment_record import AssessmentRecord
 from ..models.assessment_standard import AssessmentStandard
 from ..models.cumulative_counter import CumulativeCounter
+from ..utils.period_filter import in_period
 from .cumulative_category import (
     R_CUMULATIVE_GROUP,
     calculate_cumulative_multiplier,
     get_cumulative_category,
 )
+from .score_ledger_service import ScoreLedgerService
 
 
 class CumulativeCalculatorService:
@@ -166,6 +168,9 @@ class CumulativeCalculatorService:
             category 應該是經過 get_cumulative_category() 處理後的值
             例如：R02/R03/R04/R05 應傳入 'R'，而非原始 category
         """
+        # Session 未啟用 autoflush，先送出刪除 / 還原等變更再查詢
+        self.db.flush()
+
         # 查詢記錄（依類別不同處理）
         if category == 'R':
             # R 類特殊處理：查詢所有 R02-R05 的記錄
@@ -176,7 +181,7 @@ class CumulativeCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.is_deleted == False,
-                        extract('year', AssessmentRecord.record_date) == year,
+                        in_period(AssessmentRecord.record_date, year),
                         AssessmentStandard.code.in_(R_CUMULATIVE_GROUP),
                         AssessmentStandard.has_cumulative == True
                     )
@@ -193,7 +198,7 @@ class CumulativeCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.is_deleted == False,
-                        extract('year', AssessmentRecord.record_date) == year,
+                        in_period(AssessmentRecord.record_date, year),
                         AssessmentStandard.category == category,
                         AssessmentStandard.has_cumulative == True
                     )
@@ -205,6 +210,7 @@ class CumulativeCalculatorService:
         records = list(self.db.execute(stmt).scalars().all())
 
         # 重新計算累計次數
+        points_change = 0.0
         for idx, record in enumerate(records, start=1):
             cumulative_count = idx
             cumulative_multiplier = calculate_cumulative_multiplier(cumulative_count)
@@ -215,11 +221,16 @@ class CumulativeCalculatorService:
             final_points = actual_points * cumulative_multiplier
 
             # 更新記錄
+            points_change += final_points - record.final_points
             record.cumulative_count = cumulative_count
             record.cumulative_multiplier = cumulative_multiplier
             record.actual_points = actual_points
             record.final_points = final_points
 
+        # 同步員工年度帳本與總分（僅調整分數，記錄筆數不變）
+        if points_change:
+            ScoreLedgerService(self.db).add_points(employee_id, year, points_change)
+
         # 更新累計次數計數器
         counter = self.db.execute(
             select(CumulativeCounter).where(
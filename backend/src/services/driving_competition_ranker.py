@@ -8,7 +8,7 @@ DrivingCompetitionRanker 駕駛競賽排名服務
 from datetime import date, timedelta
 from typing import Optional
 
-from sqlalchemy import and_, func
+from sqlalchemy import and_, case, func
 from sqlalchemy.orm import Session, joinedload
 
 from src.models.driving_competition import DrivingCompetition
@@ -257,7 +257,7 @@ class DrivingCompetitionRanker:
             Employee.is_resigned,
             func.coalesce(func.sum(DrivingDailyStats.total_minutes), 0).label("total_minutes"),
             func.coalesce(func.sum(
-                func.case(
+                case(
                     (DrivingDailyStats.is_holiday_work == True, DrivingDailyStats.total_minutes),
                     else_=0
                 )
@@ -278,13 +278,15 @@ class DrivingCompetitionRanker:
             Employee.is_resigned
         ).all()
 
+        # 責任事件次數（單一分組查詢，查詢次數不隨部門人數增加）
+        incident_counts = self.stats_calculator.count_incidents_for_quarter_by_department(
+            department, year, quarter
+        )
+
         # 計算積分並排序
         rankings = []
         for stat in employee_stats:
-            # 責任事件次數（待 US8 整合）
-            incident_count = self.stats_calculator.count_incidents_for_quarter(
-                stat.employee_id, year, quarter
-            )
+            incident_count = incident_counts.get(stat.employee_id, 0)
 
             # 計算積分
             final_score = self.calculate_final_score(
@@ -317,6 +319,11 @@ class DrivingCompetitionRanker:
         # 排序：積分降序，員工編號升序（積分相同時）
         rankings.sort(key=lambda x: (-x["final_score"], x["employee_code"]))
 
+        # 一次載入既有排名記錄，避免逐人查詢
+        existing_records = self._load_competition_records(
+            year, quarter, [entry["employee_id"] for entry in rankings]
+        )
+
         # 分配排名與獎金
         processed = 0
         records_to_save = []
@@ -331,7 +338,8 @@ class DrivingCompetitionRanker:
                 year=year,
                 quarter=quarter,
                 department=department,
-                entry=entry
+                entry=entry,
+                existing_records=existing_records
             )
             records_to_save.append(record)
             processed += 1
@@ -354,12 +362,43 @@ class DrivingCompetitionRanker:
             "rankings": rankings
         }
 
+    def _load_competition_records(
+        self,
+        year: int,
+        quarter: int,
+        employee_ids: list[int]
+    ) -> dict[int, DrivingCompetition]:
+        """
+        載入指定員工的季度排名記錄
+
+        Args:
+            year: 年份
+            quarter: 季度
+            employee_ids: 員工 ID 列表
+
+        Returns:
+            dict[int, DrivingCompetition]: 員工 ID -> 既有記錄
+        """
+        if not employee_ids:
+            return {}
+
+        records = self.db.query(DrivingCompetition).filter(
+            and_(
+                DrivingCompetition.employee_id.in_(employee_ids),
+                DrivingCompetition.competition_year == year,
+                DrivingCompetition.competition_quarter == quarter
+            )
+        ).all()
+
+        return {record.employee_id: record for record in records}
+
     def _prepare_competition_record(
         self,
         year: int,
         quarter: int,
         department: str,
-        entry: dict
+        entry: dict,
+        existing_records: Optional[dict[int, DrivingCompetition]] = None
     ) -> DrivingCompetition:
         """
         準備競賽排名記錄（不立即提交）
@@ -369,18 +408,22 @@ class DrivingCompetitionRanker:
             quarter: 季度
             department: 部門
             entry: 排名資料
+            existing_records: 預先載入的既有記錄（未提供時逐筆查詢）
 
         Returns:
             DrivingCompetition: 競賽記錄
         """
         # 檢查是否已存在
-        existing = self.db.query(DrivingCompetition).filter(
-            and_(
-                DrivingCompetition.employee_id == entry["employee_id"],
-                DrivingCompetition.competition_year == year,
-                DrivingCompetition.competition_quarter == quarter
-            )
-        ).first()
+        if existing_records is not None:
+            existing = existing_records.get(entry["employee_id"])
+        else:
+            existing = self.db.query(DrivingCompetition).filter(
+                and_(
+                    DrivingCompetition.employee_id == entry["employee_id"],
+                    DrivingCompetition.competition_year == year,
+                    DrivingCompetition.competition_quarter == quarter
+                )
+            ).first()
 
         if existing:
             # 更新現有記錄
@@ -6,9 +6,9 @@ DrivingStatsCalculator 駕駛時數計算服務
 """
 
 from datetime import date, timedelta
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy import and_, func
+from sqlalchemy import and_, case, func, select
 from sqlalchemy.orm import Session
 
 from src.models.assessment_record import AssessmentRecord
@@ -17,6 +17,8 @@ from src.models.driving_daily_stats import DrivingDailyStats
 from src.models.employee import Employee
 from src.constants import Department
 from src.models.schedule import Schedule
+from src.services.shift_code_registry import get_shift_code_info
+from src.utils.period_filter import in_period
 
 
 class DrivingStatsCalculatorError(Exception):
@@ -68,17 +70,8 @@ class DrivingStatsCalculator:
         if not shift_type:
             return False
 
-        shift_upper = shift_type.strip().upper()
-
-        # R班開頭的格式
-        if shift_upper.startswith("R/") or shift_upper.startswith("R("):
-            return True
-
-        # 包含 R班 字樣
-        if "R班" in shift_type:
-            return True
-
-        return False
+        # R/、R( 開頭或包含「R班」字樣（判定結果由班別代碼登錄表快取）
+        return get_shift_code_info(shift_type).is_holiday_work
 
     # ============================================================
     # 責任事件統計（已整合 Phase 12 考核系統）
@@ -138,9 +131,6 @@ class DrivingStatsCalculator:
         Returns:
             int: 責任事件次數
         """
-        # 取得季度起止日期
-        start_date, end_date = self.get_quarter_dates(year, quarter)
-
         # 查詢該季度的責任事件（S類或R類且有實際扣分）
         count = self.db.query(func.count(AssessmentRecord.id)).join(
             AssessmentStandard,
@@ -148,8 +138,7 @@ class DrivingStatsCalculator:
         ).filter(
             and_(
                 AssessmentRecord.employee_id == employee_id,
-                AssessmentRecord.record_date >= start_date,
-                AssessmentRecord.record_date <= end_date,
+                in_period(AssessmentRecord.record_date, year, quarter=quarter),
                 AssessmentRecord.is_deleted == False,
                 AssessmentRecord.final_points < 0,  # 負分才算責任事件
                 AssessmentStandard.category.in_(['S', 'R'])  # S類或R類
@@ -158,13 +147,57 @@ class DrivingStatsCalculator:
 
         return count or 0
 
+    def count_incidents_for_quarter_by_department(
+        self,
+        department: str,
+        year: int,
+        quarter: int
+    ) -> dict[int, int]:
+        """
+        一次統計部門所有員工指定季度的責任事件次數
+
+        以單一 GROUP BY 查詢取代逐人呼叫 count_incidents_for_quarter，
+        查詢次數不隨部門人數增加。
+
+        Args:
+            department: 部門（依員工目前所屬部門）
+            year: 年份
+            quarter: 季度 (1-4)
+
+        Returns:
+            dict[int, int]: 員工 ID -> 責任事件次數（無事件的員工不在結果中）
+        """
+        department_employee_ids = select(Employee.id).where(
+            Employee.current_department == department
+        )
+
+        rows = self.db.query(
+            AssessmentRecord.employee_id,
+            func.count(AssessmentRecord.id)
+        ).join(
+            AssessmentStandard,
+            AssessmentRecord.standard_code == AssessmentStandard.code
+        ).filter(
+            and_(
+                AssessmentRecord.employee_id.in_(department_employee_ids),
+                in_period(AssessmentRecord.record_date, year, quarter=quarter),
+                AssessmentRecord.is_deleted == False,
+                AssessmentRecord.final_points < 0,  # 負分才算責任事件
+                AssessmentStandard.category.in_(['S', 'R'])  # S類或R類
+            )
+        ).group_by(
+            AssessmentRecord.employee_id
+        ).all()
+
+        return {employee_id: count for employee_id, count in rows}
+
     # ============================================================
     # 每日時數計算
     # ============================================================
 
     def calculate_daily_minutes(
         self,
-        employee_id: int,
+        employee_id: str,
         record_date: date,
         route_minutes_map: dict[str, int]
     ) -> tuple[int, bool]:
@@ -172,7 +205,7 @@ class DrivingStatsCalculator:
         計算員工指定日期的駕駛分鐘數
 
         Args:
-            employee_id: 員工 ID
+            employee_id: 員工編號（schedules.employee_id，如 1011M0095）
             record_date: 日期
             route_minutes_map: 勤務代碼到分鐘數映射
 
@@ -187,17 +220,59 @@ class DrivingStatsCalculator:
             )
         ).first()
 
-        if not schedule or not schedule.shift_type:
+        if not schedule:
             return 0, False
 
-        # 判斷是否為 R班
-        is_r_shift = self.is_holiday_work(schedule.shift_type)
+        return self.resolve_schedule_minutes(schedule, route_minutes_map)
+
+    def resolve_schedule_minutes(
+        self,
+        schedule: Any,
+        route_minutes_map: dict[str, int]
+    ) -> tuple[int, bool]:
+        """
+        由班表的預先推導欄位計算駕駛分鐘數（不查詢資料庫）
+
+        直接使用同步時寫入的 driving_minutes_code 與 is_r_shift；
+        尚未回填（driving_minutes_code 為 NULL）的班表改由 shift_code 推導。
+
+        Args:
+            schedule: 具 shift_code、is_r_shift、driving_minutes_code 屬性的班表（ORM 物件或查詢列）
+            route_minutes_map: 勤務代碼到分鐘數映射
+
+        Returns:
+            tuple: (總分鐘數, 是否為R班出勤)
+        """
+        if schedule.driving_minutes_code is None:
+            return self.resolve_shift_minutes(schedule.shift_code, route_minutes_map)
+
+        return route_minutes_map.get(schedule.driving_minutes_code, 0), bool(schedule.is_r_shift)
+
+    def resolve_shift_minutes(
+        self,
+        shift_code: Optional[str],
+        route_minutes_map: dict[str, int]
+    ) -> tuple[int, bool]:
+        """
+        由原始班別代碼計算駕駛分鐘數（不查詢資料庫）
 
-        # 提取勤務代碼（移除 R/ 等前綴）
-        shift_code = self._extract_shift_code(schedule.shift_type)
+        逐筆與批次重建共用此方法，確保兩種路徑結果一致。
 
-        # 查詢標準分鐘數
-        total_minutes = route_minutes_map.get(shift_code, 0)
+        Args:
+            shift_code: 原始班別代碼（如 R/0905G）
+            route_minutes_map: 勤務代碼到分鐘數映射
+
+        Returns:
+            tuple: (總分鐘數, 是否為R班出勤)
+        """
+        if not shift_code:
+            return 0, False
+
+        # 判斷是否為 R班
+        is_r_shift = self.is_holiday_work(shift_code)
+
+        # 提取勤務代碼（移除 R/ 等前綴）後查詢標準分鐘數
+        total_minutes = route_minutes_map.get(self._extract_shift_code(shift_code), 0)
 
         return total_minutes, is_r_shift
 
@@ -220,22 +295,8 @@ class DrivingStatsCalculator:
         if not shift_type:
             return ""
 
-        code = shift_type.strip()
-
-        # 移除 R/ 或 R(...)/  前綴
-        if code.startswith("R/"):
-            code = code[2:]
-        elif code.startswith("R("):
-            # 找到 )/ 並移除
-            idx = code.find(")/")
-            if idx != -1:
-                code = code[idx + 2:]
-
-        # 移除 (+N) 後綴
-        if "(" in code:
-            code = code.split("(")[0]
-
-        return code.strip().upper()
+        # 移除 R/、R(...)/ 前綴與 (+N) 後綴（結果由班別代碼登錄表快取）
+        return get_shift_code_info(shift_type).duty_code
 
     # ============================================================
     # 季度累計統計
@@ -293,7 +354,7 @@ class DrivingStatsCalculator:
         stats = self.db.query(
             func.sum(DrivingDailyStats.total_minutes).label("total_minutes"),
             func.sum(
-                func.case(
+                case(
                     (DrivingDailyStats.is_holiday_work == True, DrivingDailyStats.total_minutes),
                     else_=0
                 )
@@ -302,18 +363,43 @@ class DrivingStatsCalculator:
         ).filter(
             and_(
                 DrivingDailyStats.employee_id == employee_id,
-                DrivingDailyStats.record_date >= start_date,
-                DrivingDailyStats.record_date <= end_date
+                in_period(DrivingDailyStats.record_date, year, quarter=quarter)
             )
         ).first()
 
-        total_minutes = stats.total_minutes or 0
-        holiday_work_minutes = stats.holiday_work_minutes or 0
-        work_days = stats.work_days or 0
-
         # 責任事件次數
         incident_count = self.count_incidents_for_quarter(employee_id, year, quarter)
 
+        return self._build_quarter_stats(
+            employee_id=employee_id,
+            year=year,
+            quarter=quarter,
+            start_date=start_date,
+            end_date=end_date,
+            total_minutes=stats.total_minutes or 0,
+            holiday_work_minutes=stats.holiday_work_minutes or 0,
+            work_days=stats.work_days or 0,
+            incident_count=incident_count
+        )
+
+    def _build_quarter_stats(
+        self,
+        employee_id: int,
+        year: int,
+        quarter: int,
+        start_date: date,
+        end_date: date,
+        total_minutes: int,
+        holiday_work_minutes: int,
+        work_days: int,
+        incident_count: int
+    ) -> dict:
+        """
+        組合員工季度統計資料
+
+        Returns:
+            dict: 季度統計資料
+        """
         return {
             "employee_id": employee_id,
             "year": year,
@@ -351,20 +437,57 @@ class DrivingStatsCalculator:
         """
         start_date, end_date = self.get_quarter_dates(year, quarter)
 
-        # 查詢部門員工
-        employee_query = self.db.query(Employee).filter(
+        # 一次查詢部門員工與季度累計時數（查詢次數不隨人數增加）
+        employee_query = self.db.query(
+            Employee.id,
+            Employee.employee_id,
+            Employee.employee_name,
+            func.coalesce(func.sum(DrivingDailyStats.total_minutes), 0).label("total_minutes"),
+            func.coalesce(func.sum(
+                case(
+                    (DrivingDailyStats.is_holiday_work == True, DrivingDailyStats.total_minutes),
+                    else_=0
+                )
+            ), 0).label("holiday_work_minutes"),
+            func.count(DrivingDailyStats.id).label("work_days")
+        ).outerjoin(
+            DrivingDailyStats,
+            and_(
+                DrivingDailyStats.employee_id == Employee.id,
+                in_period(DrivingDailyStats.record_date, year, quarter=quarter)
+            )
+        ).filter(
             Employee.current_department == department
         )
         if not include_resigned:
             employee_query = employee_query.filter(Employee.is_resigned == False)
 
-        employees = employee_query.all()
+        employee_stats = employee_query.group_by(
+            Employee.id,
+            Employee.employee_id,
+            Employee.employee_name
+        ).all()
+
+        # 責任事件次數（單一分組查詢）
+        incident_counts = self.count_incidents_for_quarter_by_department(
+            department, year, quarter
+        )
 
         results = []
-        for employee in employees:
-            stats = self.get_quarter_stats(employee.id, year, quarter)
-            stats["employee_name"] = employee.employee_name
-            stats["employee_code"] = employee.employee_id
+        for stat in employee_stats:
+            stats = self._build_quarter_stats(
+                employee_id=stat.id,
+                year=year,
+                quarter=quarter,
+                start_date=start_date,
+                end_date=end_date,
+                total_minutes=stat.total_minutes,
+                holiday_work_minutes=stat.holiday_work_minutes,
+                work_days=stat.work_days,
+                incident_count=incident_counts.get(stat.id, 0)
+            )
+            stats["employee_name"] = stat.employee_name
+            stats["employee_code"] = stat.employee_id
             stats["department"] = department
             results.append(stats)
 
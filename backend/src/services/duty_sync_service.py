@@ -11,11 +11,13 @@ from typing import Optional
 from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
+from src.models.driving_daily_stats import DrivingDailyStats
 from src.models.employee import Employee
 from src.constants import Department
 from src.models.schedule import Schedule
 from src.services.driving_stats_calculator import DrivingStatsCalculator
 from src.services.route_standard_time_service import RouteStandardTimeService
+from src.utils.db_bulk import DEFAULT_CHUNK_SIZE, upsert_rows
 
 
 class DutySyncServiceError(Exception):
@@ -67,8 +69,9 @@ class DutySyncService:
         route_minutes_map = self.route_service.get_minutes_map(department)
 
         # 查詢該部門該日期的所有班表
-        schedules = self.db.query(Schedule).join(
-            Employee, Schedule.employee_id == Employee.id
+        # schedules.employee_id 為員工編號，需以 employees.employee_id 關聯取得主鍵
+        rows = self.db.query(Schedule, Employee.id).join(
+            Employee, Schedule.employee_id == Employee.employee_id
         ).filter(
             and_(
                 Employee.current_department == department,
@@ -81,18 +84,16 @@ class DutySyncService:
         skipped = 0
         errors = []
 
-        for schedule in schedules:
+        for schedule, employee_pk in rows:
             try:
-                # 計算駕駛分鐘數
-                total_minutes, is_holiday_work = self.stats_calculator.calculate_daily_minutes(
-                    employee_id=schedule.employee_id,
-                    record_date=target_date,
-                    route_minutes_map=route_minutes_map
+                # 計算駕駛分鐘數（使用同步時推導的勤務代碼與 R班旗標）
+                total_minutes, is_holiday_work = self.stats_calculator.resolve_schedule_minutes(
+                    schedule, route_minutes_map
                 )
 
                 # 儲存統計資料
                 self.stats_calculator.save_daily_stats(
-                    employee_id=schedule.employee_id,
+                    employee_id=employee_pk,
                     department=department,
                     record_date=target_date,
                     total_minutes=total_minutes,
@@ -117,7 +118,8 @@ class DutySyncService:
         self,
         department: str,
         start_date: date,
-        end_date: date
+        end_date: date,
+        bulk: bool = False
     ) -> dict:
         """
         同步指定部門指定日期範圍的駕駛時數
@@ -126,10 +128,14 @@ class DutySyncService:
             department: 部門
             start_date: 起始日期
             end_date: 結束日期
+            bulk: 是否使用批次重建模式（適用於季度回補）
 
         Returns:
             dict: 同步結果統計
         """
+        if bulk:
+            return self.rebuild_daily_stats_for_date_range(department, start_date, end_date)
+
         total_processed = 0
         total_skipped = 0
         all_errors = []
@@ -154,6 +160,90 @@ class DutySyncService:
             "errors": all_errors
         }
 
+    def rebuild_daily_stats_for_date_range(
+        self,
+        department: str,
+        start_date: date,
+        end_date: date,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> dict:
+        """
+        批次重建指定部門指定日期範圍的駕駛時數
+
+        與逐日逐筆的 sync_daily_stats_for_date_range 結果相同，但以集合操作執行：
+        1. 一次查詢勤務標準時間
+        2. 一次查詢整段期間的班表
+        3. 以班表預先推導的勤務代碼查詢分鐘數
+        4. 以多列 UPSERT 寫入 driving_daily_stats（單一 Transaction）
+
+        Args:
+            department: 部門
+            start_date: 起始日期
+            end_date: 結束日期
+            chunk_size: 每條 UPSERT 語句的列數
+
+        Returns:
+            dict: 同步結果統計（格式同 sync_daily_stats_for_date_range）
+        """
+        route_minutes_map = self.route_service.get_minutes_map(department)
+
+        rows = self.db.query(
+            Employee.id,
+            Schedule.schedule_date,
+            Schedule.shift_code,
+            Schedule.is_r_shift,
+            Schedule.driving_minutes_code
+        ).join(
+            Employee, Schedule.employee_id == Employee.employee_id
+        ).filter(
+            and_(
+                Employee.current_department == department,
+                Schedule.schedule_date >= start_date,
+                Schedule.schedule_date <= end_date,
+                Employee.is_resigned == False
+            )
+        ).all()
+
+        stats_rows = []
+        for row in rows:
+            total_minutes, is_holiday_work = self.stats_calculator.resolve_schedule_minutes(
+                row, route_minutes_map
+            )
+            stats_rows.append({
+                "employee_id": row.id,
+                "department": department,
+                "record_date": row.schedule_date,
+                "total_minutes": total_minutes,
+                "is_holiday_work": is_holiday_work,
+                "incident_count": 0,  # 責任事件待 US8 整合
+            })
+
+        errors = []
+        try:
+            processed = upsert_rows(
+                self.db,
+                DrivingDailyStats.__table__,
+                stats_rows,
+                conflict_columns=["employee_id", "record_date"],
+                update_columns=["department", "total_minutes", "is_holiday_work", "incident_count"],
+                chunk_size=chunk_size
+            )
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            processed = 0
+            errors.append(f"批次寫入失敗: {str(e)}")
+
+        return {
+            "department": department,
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "days_processed": (end_date - start_date).days + 1 if end_date >= start_date else 0,
+            "total_processed": processed,
+            "total_skipped": 0,
+            "errors": errors
+        }
+
     def sync_all_departments_for_date(self, target_date: date) -> dict:
         """
         同步所有部門指定日期的駕駛時數
@@ -197,8 +287,6 @@ class DutySyncService:
         Returns:
             list[date]: 尚未處理的日期列表
         """
-        from src.models.driving_daily_stats import DrivingDailyStats
-
         # 查詢已處理的日期
         processed_dates = set(
             row.record_date for row in
@@ -233,8 +321,6 @@ class DutySyncService:
         Returns:
             dict: 同步狀態
         """
-        from src.models.driving_daily_stats import DrivingDailyStats
-
         # 計算月份日期範圍
         start_date = date(year, month, 1)
         if month == 12:
@@ -3,16 +3,31 @@ EmployeeExportService 員工批次匯出服務
 對應 tasks.md T049: 實作批次匯出服務
 
 提供 Excel 批次匯出員工資料功能。
+匯出以串流方式進行（yield_per 分批查詢、openpyxl 唯寫工作表），記憶體用量不隨員工數增加。
 """
 
+import csv
 import io
-from typing import BinaryIO, Optional
+import tempfile
+from typing import BinaryIO, Iterator, Optional
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.models.employee import Employee
 from src.constants import Department
 from src.services.employee_service import EmployeeService
+from src.utils.db_bulk import chunked
+
+
+# 每批自資料庫取回的筆數
+EXPORT_CHUNK_SIZE = 500
+
+# Excel 暫存檔超過此大小改寫入磁碟（bytes）
+STREAM_SPOOL_SIZE = 4 * 1024 * 1024
+
+# Excel 每次輸出的片段大小（bytes）
+STREAM_READ_SIZE = 64 * 1024
 
 
 class EmployeeExportService:
@@ -45,47 +60,80 @@ class EmployeeExportService:
         self.db = db
         self._employee_service = EmployeeService(db)
 
-    def export_to_excel(
+    def iter_export_rows(
         self,
         department: Optional[str] = None,
         include_resigned: bool = False,
         search: Optional[str] = None
-    ) -> BinaryIO:
+    ) -> Iterator[list]:
         """
-        匯出員工資料為 Excel
+        逐列產生匯出資料
+
+        僅查詢匯出欄位，並以 yield_per 分批取回（MySQL 使用伺服器端游標），
+        不論員工數量，記憶體中最多僅保留一批資料。
 
         Args:
             department: 篩選部門（選填）
             include_resigned: 是否包含離職員工
             search: 搜尋關鍵字（選填）
 
-        Returns:
-            BinaryIO: Excel 檔案二進位串流
+        Yields:
+            list: 依 EXPORT_COLUMNS 順序的欄位值
+        """
+        columns = [getattr(Employee, col["key"]) for col in self.EXPORT_COLUMNS]
+        result = self.db.execute(
+            select(*columns)
+            .where(*EmployeeService.filter_conditions(include_resigned, department, search))
+            .order_by(Employee.employee_id)
+            .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+        )
+
+        for row in result:
+            values = []
+            for col_def, value in zip(self.EXPORT_COLUMNS, row):
+                # 特殊處理
+                if col_def["key"] == "is_resigned":
+                    value = "離職" if value else "在職"
+                values.append(value)
+            yield values
+
+    def stream_excel(
+        self,
+        department: Optional[str] = None,
+        include_resigned: bool = False,
+        search: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """
+        以串流方式匯出員工資料為 Excel
+
+        使用 openpyxl 唯寫工作表：資料列直接寫入暫存檔，不在記憶體中建立儲存格；
+        xlsx 為 zip 格式，需寫完全部資料列後才能輸出，完成後分段讀出暫存檔。
+
+        Args:
+            department: 篩選部門（選填）
+            include_resigned: 是否包含離職員工
+            search: 搜尋關鍵字（選填）
+
+        Yields:
+            bytes: Excel 檔案內容片段
         """
         try:
             import openpyxl
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
             from openpyxl.utils import get_column_letter
         except ImportError:
             raise RuntimeError("需要安裝 openpyxl 套件才能匯出 Excel")
 
-        # 取得員工資料
-        employees = self._employee_service.list_all(
-            department=department,
-            include_resigned=include_resigned,
-            search=search,
-            limit=10000
-        )
-
-        # 建立工作簿
-        workbook = openpyxl.Workbook()
-        sheet = workbook.active
-        sheet.title = "員工資料"
+        # 建立唯寫工作簿
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet(title="員工資料")
 
         # 設定標題樣式
         header_font = Font(bold=True, color="FFFFFF")
         header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
         header_alignment = Alignment(horizontal="center", vertical="center")
+        cell_alignment = Alignment(vertical="center")
         thin_border = Border(
             left=Side(style="thin"),
             right=Side(style="thin"),
@@ -93,38 +141,97 @@ class EmployeeExportService:
             bottom=Side(style="thin")
         )
 
-        # 寫入標題行
+        # 欄位寬度與凍結標題行須在寫入資料前設定
         for col_idx, col_def in enumerate(self.EXPORT_COLUMNS, start=1):
-            cell = sheet.cell(row=1, column=col_idx, value=col_def["header"])
+            sheet.column_dimensions[get_column_letter(col_idx)].width = col_def["width"]
+        sheet.freeze_panes = "A2"
+
+        # 寫入標題行
+        header_row = []
+        for col_def in self.EXPORT_COLUMNS:
+            cell = WriteOnlyCell(sheet, value=col_def["header"])
             cell.font = header_font
             cell.fill = header_fill
             cell.alignment = header_alignment
             cell.border = thin_border
-
-            # 設定欄位寬度
-            sheet.column_dimensions[get_column_letter(col_idx)].width = col_def["width"]
+            header_row.append(cell)
+        sheet.append(header_row)
 
         # 寫入資料行
-        cell_alignment = Alignment(vertical="center")
+        for values in self.iter_export_rows(department, include_resigned, search):
+            row = []
+            for value in values:
+                cell = WriteOnlyCell(sheet, value=value)
+                cell.alignment = cell_alignment
+                cell.border = thin_border
+                row.append(cell)
+            sheet.append(row)
 
-        for row_idx, employee in enumerate(employees, start=2):
-            for col_idx, col_def in enumerate(self.EXPORT_COLUMNS, start=1):
-                value = getattr(employee, col_def["key"], "")
+        # 寫入暫存檔（超過門檻才落地），再分段輸出
+        with tempfile.SpooledTemporaryFile(max_size=STREAM_SPOOL_SIZE) as output:
+            workbook.save(output)
+            output.seek(0)
+            while chunk := output.read(STREAM_READ_SIZE):
+                yield chunk
 
-                # 特殊處理
-                if col_def["key"] == "is_resigned":
-                    value = "離職" if value else "在職"
+    def stream_csv(
+        self,
+        department: Optional[str] = None,
+        include_resigned: bool = False,
+        search: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        以串流方式匯出員工資料為 CSV
 
-                cell = sheet.cell(row=row_idx, column=col_idx, value=value)
-                cell.alignment = cell_alignment
-                cell.border = thin_border
+        標題行立即輸出，之後每批資料列輸出一次。
 
-        # 凍結標題行
-        sheet.freeze_panes = "A2"
+        Args:
+            department: 篩選部門（選填）
+            include_resigned: 是否包含離職員工
+            search: 搜尋關鍵字（選填）
 
-        # 儲存到記憶體
+        Yields:
+            str: CSV 內容片段
+        """
+        output = io.StringIO()
+        writer = csv.writer(output)
+
+        def _flush() -> str:
+            content = output.getvalue()
+            output.seek(0)
+            output.truncate()
+            return content
+
+        # 寫入標題行
+        writer.writerow([col["header"] for col in self.EXPORT_COLUMNS])
+        yield _flush()
+
+        # 寫入資料行
+        rows = self.iter_export_rows(department, include_resigned, search)
+        for batch in chunked(rows, EXPORT_CHUNK_SIZE):
+            writer.writerows([value or "" for value in values] for values in batch)
+            yield _flush()
+
+    def export_to_excel(
+        self,
+        department: Optional[str] = None,
+        include_resigned: bool = False,
+        search: Optional[str] = None
+    ) -> BinaryIO:
+        """
+        匯出員工資料為 Excel
+
+        Args:
+            department: 篩選部門（選填）
+            include_resigned: 是否包含離職員工
+            search: 搜尋關鍵字（選填）
+
+        Returns:
+            BinaryIO: Excel 檔案二進位串流
+        """
         output = io.BytesIO()
-        workbook.save(output)
+        for chunk in self.stream_excel(department, include_resigned, search):
+            output.write(chunk)
         output.seek(0)
 
         return output
@@ -146,39 +253,7 @@ class EmployeeExportService:
         Returns:
             str: CSV 內容
         """
-        import csv
-        import io
-
-        # 取得員工資料
-        employees = self._employee_service.list_all(
-            department=department,
-            include_resigned=include_resigned,
-            search=search,
-            limit=10000
-        )
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # 寫入標題行
-        headers = [col["header"] for col in self.EXPORT_COLUMNS]
-        writer.writerow(headers)
-
-        # 寫入資料行
-        for employee in employees:
-            row = []
-            for col_def in self.EXPORT_COLUMNS:
-                value = getattr(employee, col_def["key"], "")
-
-                # 特殊處理
-                if col_def["key"] == "is_resigned":
-                    value = "離職" if value else "在職"
-
-                row.append(value or "")
-
-            writer.writerow(row)
-
-        return output.getvalue()
+        return "".join(self.stream_csv(department, include_resigned, search))
 
     def export_template(self) -> BinaryIO:
         """
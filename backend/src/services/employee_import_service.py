@@ -3,19 +3,30 @@ EmployeeImportService 員工批次匯入服務
 對應 tasks.md T048: 實作批次匯入服務
 
 提供 Excel 批次匯入員工資料功能。
+以唯讀模式單次掃描檔案，重複檢查以 IN 查詢一次完成，寫入使用多列 INSERT。
 """
 
-import io
 from dataclasses import dataclass, field
-from typing import BinaryIO, Optional
+from typing import BinaryIO, Iterator, Optional
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from src.services.employee_service import (
-    DuplicateEmployeeError,
-    EmployeeService,
-    InvalidEmployeeIdError,
-)
+from src.models.employee import Employee
+from src.utils.db_bulk import chunked, insert_rows
+from src.utils.employee_parser import EmployeeIdParser
+
+
+# 重複檢查每次 IN 查詢的員工編號數（一般匯入檔案僅需一次查詢）
+DUPLICATE_CHECK_CHUNK_SIZE = 5000
+
+
+class ImportFileError(Exception):
+    """匯入檔案格式錯誤（整份檔案無法處理）"""
+
+    def __init__(self, message: str, row: int = 0):
+        super().__init__(message)
+        self.row = row
 
 
 @dataclass
@@ -73,7 +84,6 @@ class EmployeeImportService:
             db: SQLAlchemy Session
         """
         self.db = db
-        self._employee_service = EmployeeService(db)
 
     def import_from_excel(
         self,
@@ -84,6 +94,9 @@ class EmployeeImportService:
         """
         從 Excel 檔案匯入員工
 
+        與 validate_excel 共用同一次掃描，通過驗證的資料以多列 INSERT 分批寫入，
+        全部成功才提交。
+
         Args:
             file: Excel 檔案（二進位串流）
             skip_duplicates: 是否跳過重複的員工編號
@@ -92,198 +105,172 @@ class EmployeeImportService:
         Returns:
             ImportResult: 匯入結果
         """
+        result, accepted = self._scan(file, skip_duplicates)
+        if not accepted:
+            return result
+
         try:
-            import openpyxl
-        except ImportError:
+            insert_rows(self.db, Employee.__table__, [data for _, data in accepted])
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
             return ImportResult(
                 success=False,
-                errors=[{"row": 0, "error": "需要安裝 openpyxl 套件才能匯入 Excel"}]
+                total_rows=result.total_rows,
+                errors=[{"row": 0, "error": f"寫入員工資料失敗：{str(e)}"}]
             )
 
-        result = ImportResult(success=True)
+        result.imported_count = len(accepted)
+        result.imported_ids = [data["employee_id"] for _, data in accepted]
+        return result
 
-        try:
-            # 讀取 Excel
-            workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
-            sheet = workbook.active
+    def validate_excel(self, file: BinaryIO, skip_duplicates: bool = True) -> ImportResult:
+        """
+        驗證 Excel 檔案格式（不實際匯入）
 
-            if sheet is None:
-                return ImportResult(
-                    success=False,
-                    errors=[{"row": 0, "error": "Excel 檔案沒有工作表"}]
-                )
+        與匯入相同的掃描與重複檢查，回報結果但不寫入資料庫。
 
-            rows = list(sheet.iter_rows(values_only=True))
+        Args:
+            file: Excel 檔案
+            skip_duplicates: 重複的員工編號視為跳過（False 時視為錯誤）
 
-            if len(rows) < 2:
-                return ImportResult(
-                    success=False,
-                    errors=[{"row": 0, "error": "Excel 檔案至少需要標題行和一筆資料"}]
-                )
+        Returns:
+            ImportResult: 驗證結果
+        """
+        result, _ = self._scan(file, skip_duplicates)
+        return result
 
-            # 解析標題行
-            header_row = rows[0]
-            column_indices = self._parse_header(header_row)
+    def _scan(
+        self,
+        file: BinaryIO,
+        skip_duplicates: bool
+    ) -> tuple[ImportResult, list[tuple[int, dict]]]:
+        """
+        單次掃描 Excel 並檢查重複
 
-            # 檢查必要欄位
-            missing_columns = [
-                col for col in self.REQUIRED_COLUMNS
-                if col not in column_indices
-            ]
-            if missing_columns:
-                return ImportResult(
-                    success=False,
-                    errors=[{
-                        "row": 1,
-                        "error": f"缺少必要欄位：{', '.join(missing_columns)}"
-                    }]
-                )
+        以唯讀模式逐行讀取與驗證，不保留整份工作表；
+        通過驗證的員工編號再以 IN 查詢一次比對資料庫。
 
-            result.total_rows = len(rows) - 1  # 不含標題行
+        Args:
+            file: Excel 檔案
+            skip_duplicates: 是否跳過重複的員工編號
 
-            # 處理資料行（使用批次模式提升效能）
-            for row_idx, row in enumerate(rows[1:], start=2):
-                validation = self._validate_row(row, column_indices, row_idx)
+        Returns:
+            tuple: (匯入結果, 可寫入的 (行號, 欄位字典) 列表)
+        """
+        result = ImportResult(success=True)
+        accepted: list[tuple[int, dict]] = []
 
-                if not validation.valid:
+        try:
+            for validation in self._iter_validated_rows(file):
+                result.total_rows += 1
+                if validation.valid:
+                    accepted.append((validation.row_number, validation.data))
+                else:
                     result.error_count += 1
                     result.errors.append({
-                        "row": row_idx,
+                        "row": validation.row_number,
                         "error": validation.error
                     })
-                    continue
-
-                # 嘗試建立員工（auto_commit=False 避免每筆都 commit）
-                try:
-                    employee = self._employee_service.create(
-                        employee_id=validation.data["employee_id"],
-                        employee_name=validation.data["employee_name"],
-                        current_department=validation.data["current_department"],
-                        phone=validation.data.get("phone"),
-                        email=validation.data.get("email"),
-                        emergency_contact=validation.data.get("emergency_contact"),
-                        emergency_phone=validation.data.get("emergency_phone"),
-                        auto_commit=False  # 批次模式：延遲 commit
-                    )
-                    result.imported_count += 1
-                    result.imported_ids.append(employee.employee_id)
-
-                except DuplicateEmployeeError:
-                    if skip_duplicates:
-                        result.skipped_count += 1
-                    else:
-                        result.error_count += 1
-                        result.errors.append({
-                            "row": row_idx,
-                            "error": f"員工編號已存在：{validation.data['employee_id']}"
-                        })
-
-                except InvalidEmployeeIdError as e:
-                    result.error_count += 1
-                    result.errors.append({
-                        "row": row_idx,
-                        "error": str(e)
-                    })
-
-                except Exception as e:
-                    result.error_count += 1
-                    result.errors.append({
-                        "row": row_idx,
-                        "error": f"建立員工失敗：{str(e)}"
-                    })
-
-            # 批次提交所有變更（效能優化：單次 commit）
-            if result.imported_count > 0:
-                self._employee_service.commit()
-
-            # 設定整體結果
-            result.success = result.error_count == 0
-
+        except ImportFileError as e:
+            return ImportResult(success=False, errors=[{"row": e.row, "error": str(e)}]), []
         except Exception as e:
             return ImportResult(
                 success=False,
                 errors=[{"row": 0, "error": f"讀取 Excel 失敗：{str(e)}"}]
-            )
+            ), []
 
-        return result
+        if result.total_rows == 0:
+            return ImportResult(
+                success=False,
+                errors=[{"row": 0, "error": "Excel 檔案至少需要標題行和一筆資料"}]
+            ), []
+
+        # 重複檢查：資料庫已存在，或檔案中較早出現
+        existing = self._existing_employee_ids([data["employee_id"] for _, data in accepted])
+        seen: set[str] = set()
+        unique: list[tuple[int, dict]] = []
+        for row_number, data in accepted:
+            employee_id = data["employee_id"]
+            if employee_id in existing or employee_id in seen:
+                if skip_duplicates:
+                    result.skipped_count += 1
+                else:
+                    result.error_count += 1
+                    result.errors.append({
+                        "row": row_number,
+                        "error": f"員工編號已存在：{employee_id}"
+                    })
+                continue
+            seen.add(employee_id)
+            unique.append((row_number, data))
 
-    def validate_excel(self, file: BinaryIO) -> ImportResult:
+        result.errors.sort(key=lambda error: error["row"])
+        result.success = result.error_count == 0
+        return result, unique
+
+    def _iter_validated_rows(self, file: BinaryIO) -> Iterator[RowValidationResult]:
         """
-        驗證 Excel 檔案格式（不實際匯入）
+        以唯讀模式逐行讀取並驗證資料行
 
         Args:
             file: Excel 檔案
 
-        Returns:
-            ImportResult: 驗證結果
+        Yields:
+            RowValidationResult: 每一資料行的驗證結果
+
+        Raises:
+            ImportFileError: 缺少 openpyxl、工作表或必要欄位
         """
         try:
             import openpyxl
         except ImportError:
-            return ImportResult(
-                success=False,
-                errors=[{"row": 0, "error": "需要安裝 openpyxl 套件"}]
-            )
-
-        result = ImportResult(success=True)
+            raise ImportFileError("需要安裝 openpyxl 套件才能匯入 Excel")
 
+        workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
         try:
-            workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
             sheet = workbook.active
-
             if sheet is None:
-                return ImportResult(
-                    success=False,
-                    errors=[{"row": 0, "error": "Excel 檔案沒有工作表"}]
-                )
+                raise ImportFileError("Excel 檔案沒有工作表")
 
-            rows = list(sheet.iter_rows(values_only=True))
+            rows = sheet.iter_rows(values_only=True)
+            header_row = next(rows, None)
+            if header_row is None:
+                raise ImportFileError("Excel 檔案至少需要標題行和一筆資料")
 
-            if len(rows) < 2:
-                return ImportResult(
-                    success=False,
-                    errors=[{"row": 0, "error": "Excel 檔案至少需要標題行和一筆資料"}]
-                )
-
-            # 解析標題行
-            header_row = rows[0]
+            # 解析標題行並檢查必要欄位
             column_indices = self._parse_header(header_row)
-
-            # 檢查必要欄位
             missing_columns = [
                 col for col in self.REQUIRED_COLUMNS
                 if col not in column_indices
             ]
             if missing_columns:
-                return ImportResult(
-                    success=False,
-                    errors=[{
-                        "row": 1,
-                        "error": f"缺少必要欄位：{', '.join(missing_columns)}"
-                    }]
+                raise ImportFileError(
+                    f"缺少必要欄位：{', '.join(missing_columns)}",
+                    row=1
                 )
 
-            result.total_rows = len(rows) - 1
-
-            # 驗證每一行
-            for row_idx, row in enumerate(rows[1:], start=2):
-                validation = self._validate_row(row, column_indices, row_idx)
-                if not validation.valid:
-                    result.error_count += 1
-                    result.errors.append({
-                        "row": row_idx,
-                        "error": validation.error
-                    })
+            for row_idx, row in enumerate(rows, start=2):
+                yield self._validate_row(row, column_indices, row_idx)
+        finally:
+            workbook.close()
 
-            result.success = result.error_count == 0
+    def _existing_employee_ids(self, employee_ids: list[str]) -> set[str]:
+        """
+        查詢資料庫中已存在的員工編號
 
-        except Exception as e:
-            return ImportResult(
-                success=False,
-                errors=[{"row": 0, "error": f"讀取 Excel 失敗：{str(e)}"}]
-            )
+        Args:
+            employee_ids: 員工編號列表
 
-        return result
+        Returns:
+            set[str]: 已存在的員工編號
+        """
+        existing: set[str] = set()
+        for chunk in chunked(set(employee_ids), DUPLICATE_CHECK_CHUNK_SIZE):
+            existing.update(self.db.execute(
+                select(Employee.employee_id).where(Employee.employee_id.in_(chunk))
+            ).scalars())
+        return existing
 
     def get_template_columns(self) -> list[dict]:
         """
@@ -377,7 +364,7 @@ class EmployeeImportService:
             row_number: 行號
 
         Returns:
-            RowValidationResult: 驗證結果
+            RowValidationResult: 驗證結果（通過時 data 為可直接寫入的欄位字典）
         """
         data = {}
 
@@ -406,8 +393,27 @@ class EmployeeImportService:
                 error=f"無效的部門：{data['current_department']}，應為 淡海 或 安坑"
             )
 
+        # 驗證並解析員工編號（入職年月由編號解析）
+        parse_result = EmployeeIdParser.parse(data["employee_id"])
+        if not parse_result.valid:
+            return RowValidationResult(
+                valid=False,
+                row_number=row_number,
+                error=parse_result.error
+            )
+
         return RowValidationResult(
             valid=True,
             row_number=row_number,
-            data=data
+            data={
+                "employee_id": parse_result.employee_id,
+                "employee_name": data["employee_name"],
+                "current_department": data["current_department"],
+                "hire_year_month": parse_result.hire_year_month,
+                "phone": data.get("phone"),
+                "email": data.get("email"),
+                "emergency_contact": data.get("emergency_contact"),
+                "emergency_phone": data.get("emergency_phone"),
+                "is_resigned": False,
+            }
         )
@@ -257,47 +257,70 @@ class EmployeeService:
     # 查詢操作
     # ============================================================
 
-    def list_all(
-        self,
+    @staticmethod
+    def filter_conditions(
         include_resigned: bool = False,
         department: Optional[str] = None,
-        search: Optional[str] = None,
-        skip: int = 0,
-        limit: int = 100
-    ) -> list[Employee]:
+        search: Optional[str] = None
+    ) -> list:
         """
-        列出員工
+        建立員工列表篩選條件（list_all、count 與匯出共用）
 
         Args:
             include_resigned: 是否包含離職員工
             department: 篩選部門
             search: 搜尋關鍵字（員工編號或姓名）
-            skip: 跳過筆數
-            limit: 限制筆數
 
         Returns:
-            list[Employee]: 員工列表
+            list: SQLAlchemy 篩選條件
         """
-        query = self.db.query(Employee)
+        conditions = []
 
         # 篩選離職狀態
         if not include_resigned:
-            query = query.filter(Employee.is_resigned == False)
+            conditions.append(Employee.is_resigned == False)
 
         # 篩選部門
         if department:
-            query = query.filter(Employee.current_department == department)
+            conditions.append(Employee.current_department == department)
 
         # 搜尋
         if search:
             search_pattern = f"%{search}%"
-            query = query.filter(
+            conditions.append(
                 or_(
                     Employee.employee_id.like(search_pattern),
                     Employee.employee_name.like(search_pattern)
                 )
             )
 
+        return conditions
+
+    def list_all(
+        self,
+        include_resigned: bool = False,
+        department: Optional[str] = None,
+        search: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> list[Employee]:
+        """
+        列出員工
+
+        Args:
+            include_resigned: 是否包含離職員工
+            department: 篩選部門
+            search: 搜尋關鍵字（員工編號或姓名）
+            skip: 跳過筆數
+            limit: 限制筆數
+
+        Returns:
+            list[Employee]: 員工列表
+        """
+        query = self.db.query(Employee).filter(
+            *self.filter_conditions(include_resigned, department, search)
+        )
+
         # 排序與分頁
         query = query.order_by(Employee.employee_id)
         query = query.offset(skip).limit(limit)
@@ -321,22 +344,9 @@ class EmployeeService:
         Returns:
             int: 員工數量
         """
-        query = self.db.query(Employee)
-
-        if not include_resigned:
-            query = query.filter(Employee.is_resigned == False)
-
-        if department:
-            query = query.filter(Employee.current_department == department)
-
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
-                or_(
-                    Employee.employee_id.like(search_pattern),
-                    Employee.employee_name.like(search_pattern)
-                )
-            )
+        query = self.db.query(Employee).filter(
+            *self.filter_conditions(include_resigned, department, search)
+        )
 
         return query.count()
 
@@ -7,20 +7,24 @@ Google Sheets 讀取服務
 - 讀取指定試算表的資料
 - 支援讀取特定分頁
 - 唯讀權限操作
+- 依 Drive 檔案版本快取試算表內容，未變動時略過下載
 """
 
 import base64
 import json
 import socket
+import threading
 from dataclasses import dataclass, field
-from typing import Optional, List, Any, Dict
+from typing import Callable, Optional, List, Any, Dict
 
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import httplib2
 
 from src.config.settings import get_settings
+from src.services.sheet_content_cache import SheetContentCache, get_sheet_content_cache
 from src.utils.logger import logger
 
 
@@ -28,8 +32,14 @@ from src.utils.logger import logger
 API_TIMEOUT_SECONDS = 30
 API_NUM_RETRIES = 2
 
-# Google Sheets 權限範圍
-SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
+# Google Sheets 權限範圍（Drive 中繼資料僅用於取得檔案版本）
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets.readonly",
+    "https://www.googleapis.com/auth/drive.metadata.readonly",
+]
+
+# 快取分頁列表使用的範圍鍵
+SHEET_TITLES_RANGE_KEY = "__sheet_titles__"
 
 
 @dataclass
@@ -57,6 +67,15 @@ class ReadResult:
     error: Optional[str] = None
     row_count: int = 0
     column_count: int = 0
+    revision: Optional[str] = None
+    from_cache: bool = False
+
+
+@dataclass
+class FileRevision:
+    """Drive 檔案版本"""
+    version: str
+    modified_time: Optional[str] = None
 
 
 class GoogleSheetsReader:
@@ -67,10 +86,30 @@ class GoogleSheetsReader:
     僅使用唯讀權限，確保資料安全。
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        http_factory: Optional[Callable[[service_account.Credentials], Any]] = None,
+        content_cache: Optional[SheetContentCache] = None
+    ):
+        """
+        初始化讀取器
+
+        Args:
+            http_factory: 由憑證建立 HTTP 傳輸物件的函數（預設為 AuthorizedHttp，
+                離線測試時可替換為假的 Sheets 傳輸）
+            content_cache: 試算表內容快取（預設依 GOOGLE_SHEETS_CONTENT_CACHE_ENABLED
+                使用共用快取）
+        """
         self._settings = get_settings()
+        if content_cache is None and self._settings.google_sheets_content_cache_enabled:
+            content_cache = get_sheet_content_cache()
+        self._content_cache = content_cache
         # Gemini Review Fix: 使用 Dict 確保 Python 3.8 相容性
         self._credentials_cache: Dict[str, service_account.Credentials] = {}
+        self._credentials_lock = threading.Lock()
+        self._http_factory = http_factory or self._authorized_http
+        # httplib2.Http 非執行緒安全，API 服務物件以「執行緒 × 憑證」快取
+        self._local = threading.local()
 
     def _decode_credentials(self, base64_json: str) -> dict:
         """
@@ -104,32 +143,121 @@ class GoogleSheetsReader:
         """
         # 使用憑證快取避免重複解碼
         cache_key = hash(base64_json)
-        if cache_key in self._credentials_cache:
-            return self._credentials_cache[cache_key]
+        with self._credentials_lock:
+            if cache_key in self._credentials_cache:
+                return self._credentials_cache[cache_key]
+
+            credentials_dict = self._decode_credentials(base64_json)
+            credentials = service_account.Credentials.from_service_account_info(
+                credentials_dict,
+                scopes=SCOPES
+            )
 
-        credentials_dict = self._decode_credentials(base64_json)
-        credentials = service_account.Credentials.from_service_account_info(
-            credentials_dict,
-            scopes=SCOPES
-        )
+            self._credentials_cache[cache_key] = credentials
+            return credentials
+
+    @staticmethod
+    def _authorized_http(credentials: service_account.Credentials) -> AuthorizedHttp:
+        """
+        建立附帶憑證的 HTTP 傳輸物件
 
-        self._credentials_cache[cache_key] = credentials
-        return credentials
+        Args:
+            credentials: Google 憑證
 
-    def _build_service(self, credentials: service_account.Credentials) -> Any:
+        Returns:
+            AuthorizedHttp: 已授權的 HTTP 物件
         """
-        建立 Sheets API 服務
+        return AuthorizedHttp(credentials, http=httplib2.Http(timeout=API_TIMEOUT_SECONDS))
+
+    def _build_service(
+        self,
+        credentials: service_account.Credentials,
+        api: str = "sheets",
+        version: str = "v4"
+    ) -> Any:
+        """
+        建立 Google API 服務（預設為 Sheets API）
 
         Gemini Review Fix: 加入返回類型 hint
 
+        注意：googleapiclient 不允許同時傳入 credentials 與 http，
+        因此以 AuthorizedHttp 包裝憑證後僅傳入 http。
+
         Args:
             credentials: Google 憑證
+            api: API 名稱（sheets, drive）
+            version: API 版本
+
+        Returns:
+            Any: Google API 服務物件（Resource 類型無公開定義）
+        """
+        return build(api, version, http=self._http_factory(credentials), cache_discovery=False)
+
+    def _get_service(self, base64_json: str, api: str = "sheets") -> Any:
+        """
+        取得目前執行緒可用的 Google API 服務（依憑證與 API 快取）
+
+        服務物件綁定的 httplib2.Http 不可跨執行緒共用，
+        因此每個執行緒各自保留一份，同一執行緒重複讀取時沿用既有連線。
+
+        Args:
+            base64_json: Base64 編碼的 Service Account JSON
+            api: API 名稱（sheets: Sheets v4, drive: Drive v3）
+
+        Returns:
+            Any: Google API 服務物件
+        """
+        services = getattr(self._local, "services", None)
+        if services is None:
+            services = self._local.services = {}
+
+        cache_key = (hash(base64_json), api)
+        service = services.get(cache_key)
+        if service is None:
+            version = "v3" if api == "drive" else "v4"
+            service = self._build_service(self._get_credentials(base64_json), api, version)
+            services[cache_key] = service
+        return service
+
+    def get_file_revision(
+        self,
+        base64_json: str,
+        spreadsheet_id: str
+    ) -> Optional[FileRevision]:
+        """
+        取得試算表的 Drive 檔案版本
+
+        Drive 的 version 在檔案內容任何變動後都會遞增，
+        可用來判斷快取的試算表內容是否仍有效。
+
+        Args:
+            base64_json: Base64 編碼的 Service Account JSON
+            spreadsheet_id: 試算表 ID
 
         Returns:
-            Any: Google Sheets API 服務物件（Resource 類型無公開定義）
+            FileRevision: 檔案版本（無法取得時為 None，呼叫端應直接下載）
         """
-        http = httplib2.Http(timeout=API_TIMEOUT_SECONDS)
-        return build("sheets", "v4", credentials=credentials, http=http)
+        try:
+            service = self._get_service(base64_json, api="drive")
+
+            metadata = service.files().get(
+                fileId=spreadsheet_id,
+                fields="version,modifiedTime",
+                supportsAllDrives=True
+            ).execute(num_retries=API_NUM_RETRIES)
+
+            return FileRevision(
+                version=str(metadata["version"]),
+                modified_time=metadata.get("modifiedTime")
+            )
+
+        except Exception as e:
+            logger.warning(
+                "無法取得試算表版本，略過內容快取",
+                spreadsheet_id=spreadsheet_id,
+                error=str(e)
+            )
+            return None
 
     def get_spreadsheet_info(
         self,
@@ -150,8 +278,7 @@ class GoogleSheetsReader:
             ValueError: 讀取失敗
         """
         try:
-            credentials = self._get_credentials(base64_json)
-            service = self._build_service(credentials)
+            service = self._get_service(base64_json)
 
             spreadsheet = service.spreadsheets().get(
                 spreadsheetId=spreadsheet_id,
@@ -207,8 +334,7 @@ class GoogleSheetsReader:
             ReadResult: 讀取結果
         """
         try:
-            credentials = self._get_credentials(base64_json)
-            service = self._build_service(credentials)
+            service = self._get_service(base64_json)
 
             # 建立範圍字串
             if sheet_name and range_notation:
@@ -273,122 +399,367 @@ class GoogleSheetsReader:
             )
             return ReadResult(success=False, error=error_msg)
 
-    def read_multiple_sheets(
+    def batch_read(
         self,
         base64_json: str,
         spreadsheet_id: str,
-        sheet_names: List[str]
+        ranges: List[str],
+        value_render_option: Optional[str] = None,
+        revision: Optional[FileRevision] = None
     ) -> Dict[str, ReadResult]:
         """
-        批次讀取多個分頁
+        以單一請求讀取多個分頁或範圍（values.batchGet）
+
+        預設使用 FORMATTED_VALUE（儲存格顯示值，班表代碼「0905」不會變成數字）；
+        指定 UNFORMATTED_VALUE 時日期時間仍以格式化字串返回，避免變成序列數字。
+
+        提供 revision 時先查內容快取，僅下載版本不符或未快取的範圍。
 
         Args:
             base64_json: Base64 編碼的 Service Account JSON
             spreadsheet_id: 試算表 ID
-            sheet_names: 分頁名稱列表
+            ranges: A1 範圍列表（如 "'2026-01'"、"'2026-01'!A1:AG200"）
+            value_render_option: FORMATTED_VALUE / UNFORMATTED_VALUE / FORMULA
+                （預設使用 GOOGLE_SHEETS_VALUE_RENDER_OPTION）
+            revision: 試算表目前的 Drive 檔案版本（由 get_file_revision 取得）
 
         Returns:
-            dict: 分頁名稱 -> 讀取結果
+            dict: 範圍 -> 讀取結果（整批失敗時每個範圍皆為失敗結果）
         """
-        results = {}
-        for sheet_name in sheet_names:
-            results[sheet_name] = self.read_sheet(
-                base64_json=base64_json,
-                spreadsheet_id=spreadsheet_id,
-                sheet_name=sheet_name
+        if not ranges:
+            return {}
+
+        value_render_option = value_render_option or self._settings.google_sheets_value_render_option
+
+        if revision is None or self._content_cache is None:
+            return self._batch_get(base64_json, spreadsheet_id, ranges, value_render_option)
+
+        results: Dict[str, ReadResult] = {}
+        missing = []
+        for range_str in ranges:
+            values = self._content_cache.get(
+                spreadsheet_id, f"{range_str}|{value_render_option}", revision.version
             )
-        return results
+            if values is None:
+                missing.append(range_str)
+            else:
+                results[range_str] = ReadResult(
+                    success=True,
+                    data=values,
+                    row_count=len(values),
+                    column_count=max(len(row) for row in values) if values else 0,
+                    revision=revision.version,
+                    from_cache=True
+                )
 
-    def read_schedule_sheet(
+        if missing:
+            fetched = self._batch_get(base64_json, spreadsheet_id, missing, value_render_option)
+            for range_str, result in fetched.items():
+                if result.success:
+                    result.revision = revision.version
+                    self._content_cache.put(
+                        spreadsheet_id,
+                        f"{range_str}|{value_render_option}",
+                        revision.version,
+                        result.data,
+                        modified_time=revision.modified_time
+                    )
+                results[range_str] = result
+
+        logger.debug(
+            "Google Sheets 內容快取",
+            spreadsheet_id=spreadsheet_id,
+            revision=revision.version,
+            cached=len(ranges) - len(missing),
+            fetched=len(missing)
+        )
+
+        return {range_str: results[range_str] for range_str in ranges}
+
+    def _batch_get(
         self,
-        department: str,
-        year: int,
-        month: int
-    ) -> ReadResult:
+        base64_json: str,
+        spreadsheet_id: str,
+        ranges: List[str],
+        value_render_option: str
+    ) -> Dict[str, ReadResult]:
         """
-        讀取指定部門的班表分頁
+        呼叫 values.batchGet 下載範圍資料（不經過快取）
 
         Args:
-            department: 部門（'淡海' 或 '安坑'）
-            year: 年份
-            month: 月份
+            base64_json: Base64 編碼的 Service Account JSON
+            spreadsheet_id: 試算表 ID
+            ranges: A1 範圍列表
+            value_render_option: 儲存格值輸出格式
 
         Returns:
-            ReadResult: 讀取結果
+            dict: 範圍 -> 讀取結果
         """
-        # 取得部門憑證與試算表 ID
-        if department == "淡海":
-            base64_json = self._settings.tanhae_google_service_account_json
-            spreadsheet_id = self._settings.tanhae_google_sheets_id_schedule
-        else:
-            base64_json = self._settings.anping_google_service_account_json
-            spreadsheet_id = self._settings.anping_google_sheets_id_schedule
+        try:
+            service = self._get_service(base64_json)
 
-        if not base64_json:
-            return ReadResult(
-                success=False,
-                error=f"{department} 部門的 Service Account 憑證未設定"
+            response = service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges,
+                majorDimension="ROWS",
+                valueRenderOption=value_render_option,
+                dateTimeRenderOption="FORMATTED_STRING"
+            ).execute(num_retries=API_NUM_RETRIES)
+
+            # valueRanges 順序與請求的 ranges 相同（回應中的 range 會被正規化，不能當作鍵）
+            results = {}
+            for range_str, value_range in zip(ranges, response.get("valueRanges", [])):
+                values = value_range.get("values", [])
+                results[range_str] = ReadResult(
+                    success=True,
+                    data=values,
+                    row_count=len(values),
+                    column_count=max(len(row) for row in values) if values else 0
+                )
+
+            logger.info(
+                "Google Sheets 批次讀取成功",
+                spreadsheet_id=spreadsheet_id,
+                range_count=len(ranges),
+                row_count=sum(r.row_count for r in results.values())
             )
 
-        if not spreadsheet_id:
-            return ReadResult(
-                success=False,
-                error=f"{department} 部門的班表試算表 ID 未設定"
+            return results
+
+        except HttpError as e:
+            status = e.resp.status
+            if status == 403:
+                error_msg = "權限不足：請確認憑證有存取此試算表的權限"
+            elif status == 404:
+                error_msg = "試算表不存在"
+            elif status == 400:
+                error_msg = f"範圍無效（分頁可能不存在）: {str(e)}"
+            else:
+                error_msg = f"API 錯誤 ({status}): {str(e)}"
+
+        except socket.timeout:
+            error_msg = f"連線逾時（超過 {API_TIMEOUT_SECONDS} 秒）"
+
+        except Exception as e:
+            error_msg = f"讀取失敗: {str(e)}"
+
+        logger.error(
+            "Google Sheets 批次讀取失敗",
+            spreadsheet_id=spreadsheet_id,
+            ranges=ranges,
+            error=error_msg
+        )
+        return {range_str: ReadResult(success=False, error=error_msg) for range_str in ranges}
+
+    def read_multiple_sheets(
+        self,
+        base64_json: str,
+        spreadsheet_id: str,
+        sheet_names: List[str],
+        revision: Optional[FileRevision] = None
+    ) -> Dict[str, ReadResult]:
+        """
+        批次讀取多個分頁（單一 batchGet 請求）
+
+        Args:
+            base64_json: Base64 編碼的 Service Account JSON
+            spreadsheet_id: 試算表 ID
+            sheet_names: 分頁名稱列表
+            revision: 試算表目前的 Drive 檔案版本（提供時使用內容快取）
+
+        Returns:
+            dict: 分頁名稱 -> 讀取結果
+        """
+        results = self.batch_read(
+            base64_json=base64_json,
+            spreadsheet_id=spreadsheet_id,
+            ranges=[f"'{name}'" for name in sheet_names],
+            revision=revision
+        )
+        return {name: results[f"'{name}'"] for name in sheet_names}
+
+    def _get_schedule_source(self, department: str) -> tuple[str, str]:
+        """
+        取得部門的班表憑證與試算表 ID
+
+        Args:
+            department: 部門（'淡海' 或 '安坑'）
+
+        Returns:
+            tuple: (Base64 憑證, 試算表 ID)
+        """
+        if department == "淡海":
+            return (
+                self._settings.tanhae_google_service_account_json,
+                self._settings.tanhae_google_sheets_id_schedule
             )
+        return (
+            self._settings.anping_google_service_account_json,
+            self._settings.anping_google_sheets_id_schedule
+        )
 
-        # 班表分頁名稱格式：YYYY-MM 或 YYYYMM
-        # 嘗試多種可能的分頁名稱格式
-        possible_sheet_names = [
+    @staticmethod
+    def _schedule_sheet_names(year: int, month: int) -> List[str]:
+        """班表分頁名稱格式：YYYY-MM、YYYYMM、YYYY年M月、M月（依優先順序）"""
+        return [
             f"{year}-{month:02d}",
             f"{year}{month:02d}",
             f"{year}年{month}月",
             f"{month}月",
         ]
 
+    def _list_sheet_titles(
+        self,
+        base64_json: str,
+        spreadsheet_id: str,
+        revision: Optional[FileRevision] = None
+    ) -> List[str]:
+        """
+        取得試算表的分頁名稱列表（提供 revision 時使用內容快取）
+
+        Args:
+            base64_json: Base64 編碼的 Service Account JSON
+            spreadsheet_id: 試算表 ID
+            revision: 試算表目前的 Drive 檔案版本
+
+        Returns:
+            list: 分頁名稱
+
+        Raises:
+            ValueError: 讀取失敗
+        """
+        if revision is not None and self._content_cache is not None:
+            cached = self._content_cache.get(spreadsheet_id, SHEET_TITLES_RANGE_KEY, revision.version)
+            if cached is not None:
+                return [row[0] for row in cached]
+
+        spreadsheet_info = self.get_spreadsheet_info(base64_json, spreadsheet_id)
+        titles = [s.title for s in spreadsheet_info.sheets]
+
+        if revision is not None and self._content_cache is not None:
+            self._content_cache.put(
+                spreadsheet_id,
+                SHEET_TITLES_RANGE_KEY,
+                revision.version,
+                [[title] for title in titles],
+                modified_time=revision.modified_time
+            )
+
+        return titles
+
+    def get_content_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        取得試算表內容快取統計
+
+        Returns:
+            dict: 快取統計（未啟用快取時為 None）
+        """
+        if self._content_cache is None:
+            return None
+        return self._content_cache.get_stats()
+
+    def read_schedule_months(
+        self,
+        department: str,
+        periods: List[tuple[int, int]]
+    ) -> Dict[tuple[int, int], ReadResult]:
+        """
+        讀取指定部門多個月份的班表分頁
+
+        先以一次請求取得分頁列表，再以一次 batchGet 讀取所有月份，
+        不論月份數量皆只需兩次 API 往返。啟用內容快取時會先查詢
+        Drive 檔案版本，試算表未變動則分頁列表與資料皆直接取自快取。
+
+        Args:
+            department: 部門（'淡海' 或 '安坑'）
+            periods: (年份, 月份) 列表
+
+        Returns:
+            dict: (年份, 月份) -> 讀取結果
+        """
+        base64_json, spreadsheet_id = self._get_schedule_source(department)
+
+        if not base64_json:
+            error = f"{department} 部門的 Service Account 憑證未設定"
+            return {period: ReadResult(success=False, error=error) for period in periods}
+
+        if not spreadsheet_id:
+            error = f"{department} 部門的班表試算表 ID 未設定"
+            return {period: ReadResult(success=False, error=error) for period in periods}
+
+        revision = None
+        if self._content_cache is not None:
+            revision = self.get_file_revision(base64_json, spreadsheet_id)
+
         # 先取得試算表資訊，確認分頁名稱
         try:
-            spreadsheet_info = self.get_spreadsheet_info(base64_json, spreadsheet_id)
-            available_sheets = [s.title for s in spreadsheet_info.sheets]
+            available_sheets = self._list_sheet_titles(base64_json, spreadsheet_id, revision)
+        except ValueError as e:
+            return {period: ReadResult(success=False, error=str(e)) for period in periods}
 
-            logger.debug(
-                "班表試算表分頁列表",
-                department=department,
-                sheets=available_sheets
-            )
+        logger.debug(
+            "班表試算表分頁列表",
+            department=department,
+            sheets=available_sheets
+        )
 
+        results: Dict[tuple[int, int], ReadResult] = {}
+        sheet_names: Dict[tuple[int, int], str] = {}
+        for year, month in periods:
             # 找到匹配的分頁
-            sheet_name = None
-            for name in possible_sheet_names:
-                if name in available_sheets:
-                    sheet_name = name
-                    break
-
-            if not sheet_name:
-                return ReadResult(
+            sheet_name = next(
+                (name for name in self._schedule_sheet_names(year, month) if name in available_sheets),
+                None
+            )
+            if sheet_name:
+                sheet_names[(year, month)] = sheet_name
+            else:
+                results[(year, month)] = ReadResult(
                     success=False,
                     error=f"找不到 {year} 年 {month} 月的班表分頁。可用分頁：{', '.join(available_sheets)}"
                 )
 
+        if sheet_names:
             logger.info(
                 "讀取班表分頁",
                 department=department,
-                year=year,
-                month=month,
-                sheet_name=sheet_name
+                sheet_names=list(sheet_names.values())
             )
 
-            return self.read_sheet(
+            batch = self.read_multiple_sheets(
                 base64_json=base64_json,
                 spreadsheet_id=spreadsheet_id,
-                sheet_name=sheet_name
+                sheet_names=list(dict.fromkeys(sheet_names.values())),
+                revision=revision
             )
+            for period, sheet_name in sheet_names.items():
+                results[period] = batch[sheet_name]
 
-        except ValueError as e:
-            return ReadResult(success=False, error=str(e))
+        return {period: results[period] for period in periods}
+
+    def read_schedule_sheet(
+        self,
+        department: str,
+        year: int,
+        month: int
+    ) -> ReadResult:
+        """
+        讀取指定部門的班表分頁
+
+        Args:
+            department: 部門（'淡海' 或 '安坑'）
+            year: 年份
+            month: 月份
+
+        Returns:
+            ReadResult: 讀取結果
+        """
+        return self.read_schedule_months(department, [(year, month)])[(year, month)]
 
 
 # 單例實例
 _reader_instance: Optional[GoogleSheetsReader] = None
+_background_reader_instance: Optional[GoogleSheetsReader] = None
 
 
 def get_google_sheets_reader() -> GoogleSheetsReader:
@@ -397,3 +768,20 @@ def get_google_sheets_reader() -> GoogleSheetsReader:
     if _reader_instance is None:
         _reader_instance = GoogleSheetsReader()
     return _reader_instance
+
+
+def get_background_sheets_reader() -> GoogleSheetsReader:
+    """
+    取得背景作業（班表同步）使用的 Google Sheets 讀取器實例（單例）
+
+    與共用讀取器使用同一份內容快取（記憶體項目與統計共用），
+    快取的資料庫存取改用 BackgroundSessionLocal，不佔用 API 請求的連線池。
+    """
+    global _background_reader_instance
+    if _background_reader_instance is None:
+        content_cache = None
+        if get_settings().google_sheets_content_cache_enabled:
+            from src.config.database import BackgroundSessionLocal
+            content_cache = get_sheet_content_cache().using(BackgroundSessionLocal)
+        _background_reader_instance = GoogleSheetsReader(content_cache=content_cache)
+    return _background_reader_instance
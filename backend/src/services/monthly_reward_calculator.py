@@ -8,16 +8,28 @@
 包含 +M02（行車零違規）和 +M03（全項目零違規）的判定。
 """
 
+from collections import defaultdict
 from datetime import date, datetime
 from typing import Any, Optional
 
-from sqlalchemy import and_, extract, func, select
+from sqlalchemy import and_, func, select, update
 from sqlalchemy.orm import Session
 
 from ..models.assessment_record import AssessmentRecord
 from ..models.assessment_standard import AssessmentStandard
 from ..models.employee import Employee
 from ..models.monthly_reward import MonthlyReward
+from ..utils.db_bulk import chunked, insert_rows
+from ..utils.period_filter import in_period
+from .score_ledger_service import ScoreLedgerService
+
+
+# 月度獎勵項目（考核代碼 -> (分數, 說明)）
+REWARD_ITEMS = {
+    "+M01": (3.0, "全勤獎勵"),
+    "+M02": (1.0, "行車零違規獎勵"),
+    "+M03": (2.0, "全項目零違規獎勵"),
+}
 
 
 class MonthlyRewardCalculatorService:
@@ -40,6 +52,7 @@ class MonthlyRewardCalculatorService:
             db: 資料庫 Session
         """
         self.db = db
+        self.score_ledger = ScoreLedgerService(db)
 
     def calculate_employee_month(
         self,
@@ -142,7 +155,9 @@ class MonthlyRewardCalculatorService:
     def calculate_month_batch(
         self,
         year: int,
-        month: int
+        month: int,
+        bulk: bool = True,
+        employee_ids: Optional[list[int]] = None
     ) -> dict[str, Any]:
         """
         批次計算所有員工的月度獎勵
@@ -150,13 +165,19 @@ class MonthlyRewardCalculatorService:
         Args:
             year: 年度
             month: 月份
+            bulk: 是否使用集合式批次計算（False 時逐人呼叫 calculate_employee_month）
+            employee_ids: 僅計算指定員工（含已離職，同 calculate_employee_month）；
+                None 表示所有在職員工
 
         Returns:
             計算結果統計
         """
-        # 取得所有在職員工
+        if bulk:
+            return self._calculate_month_bulk(year, month, employee_ids)
+
+        # 取得所有在職員工（或指定員工）
         employees = self.db.execute(
-            select(Employee).where(Employee.is_resigned == False)
+            select(Employee).where(self._employee_filter(employee_ids))
         ).scalars().all()
 
         result = {
@@ -190,6 +211,250 @@ class MonthlyRewardCalculatorService:
 
         return result
 
+    def _calculate_month_bulk(
+        self,
+        year: int,
+        month: int,
+        employee_ids: Optional[list[int]] = None
+    ) -> dict[str, Any]:
+        """
+        集合式批次計算所有員工的月度獎勵
+
+        扣分類別、既有獎勵、既有獎勵考核記錄各以一次查詢載入，
+        於記憶體判定 +M02/+M03 後，以多列 INSERT 與批次 UPDATE 寫入，
+        員工年度帳本與分數以 ScoreLedgerService.apply_deltas 批次更新。
+        判定與撤銷規則同 calculate_employee_month（不含全勤，+M01 視為不符合）。
+
+        Args:
+            year: 年度
+            month: 月份
+            employee_ids: 僅計算指定員工（None 表示所有在職員工）
+
+        Returns:
+            計算結果統計（格式同逐人計算）
+        """
+        # 送出尚未寫入的變更，確保以下查詢看得到
+        self.db.flush()
+
+        year_month = f"{year:04d}-{month:02d}"
+        record_date = date(year, month, 1)
+
+        employees = self.db.execute(
+            select(Employee.id, Employee.employee_name).where(self._employee_filter(employee_ids))
+        ).all()
+
+        categories_by_employee = self._get_month_deduction_categories_by_employee(
+            year, month, employee_ids
+        )
+        reward_stmt = select(MonthlyReward).where(MonthlyReward.year_month == year_month)
+        if employee_ids is not None:
+            reward_stmt = reward_stmt.where(MonthlyReward.employee_id.in_(employee_ids))
+        existing_rewards = {
+            reward.employee_id: reward
+            for reward in self.db.execute(reward_stmt).scalars()
+        }
+        reward_record_ids = self._get_month_reward_record_ids(year, month, employee_ids)
+
+        result = {
+            "year": year,
+            "month": month,
+            "total_employees": len(employees),
+            "driving_zero_count": 0,  # +M02
+            "all_zero_count": 0,  # +M03
+            "no_reward_count": 0,
+            "rewards": []
+        }
+
+        new_rewards: list[dict] = []
+        new_records: list[dict] = []
+        revoked_ids: list[int] = []
+        score_deltas: dict[int, float] = defaultdict(float)
+        record_deltas: dict[int, int] = defaultdict(int)
+
+        for employee in employees:
+            deduction_categories = categories_by_employee.get(employee.id, set())
+
+            eligible = {
+                "+M01": False,  # 全勤由差勤系統處理
+                "+M02": not any(cat in ['R', 'S'] for cat in deduction_categories),
+                "+M03": len(deduction_categories) == 0,
+            }
+            total = sum(REWARD_ITEMS[code][0] for code, ok in eligible.items() if ok)
+
+            existing = existing_rewards.get(employee.id)
+            if existing is None:
+                to_grant = [code for code, ok in eligible.items() if ok]
+                to_revoke = []
+                if total > 0:
+                    new_rewards.append({
+                        "employee_id": employee.id,
+                        "year_month": year_month,
+                        "full_attendance": False,
+                        "driving_zero_violation": eligible["+M02"],
+                        "all_zero_violation": eligible["+M03"],
+                        "total_points": total,
+                    })
+            elif total > 0 or existing.has_any_reward:
+                previous = {
+                    "+M01": existing.full_attendance,
+                    "+M02": existing.driving_zero_violation,
+                    "+M03": existing.all_zero_violation,
+                }
+                to_grant = [code for code in REWARD_ITEMS if eligible[code] and not previous[code]]
+                to_revoke = [code for code in REWARD_ITEMS if previous[code] and not eligible[code]]
+
+                existing.full_attendance = False
+                existing.driving_zero_violation = eligible["+M02"]
+                existing.all_zero_violation = eligible["+M03"]
+                existing.total_points = total
+            else:
+                to_grant, to_revoke = [], []
+
+            # P1 修正：撤銷不再符合的獎勵、補發新符合的獎勵
+            for code in to_revoke:
+                ids = reward_record_ids.get((employee.id, code), [])
+                revoked_ids.extend(ids)
+                score_deltas[employee.id] -= REWARD_ITEMS[code][0] * len(ids)
+                record_deltas[employee.id] -= len(ids)
+
+            for code in to_grant:
+                if reward_record_ids.get((employee.id, code)):
+                    continue
+                points, label = REWARD_ITEMS[code]
+                new_records.append({
+                    "employee_id": employee.id,
+                    "standard_code": code,
+                    "record_date": record_date,
+                    "description": f"{year}年{month}月 {label}",
+                    "base_points": points,
+                    "responsibility_coefficient": 1.0,
+                    "actual_points": points,
+                    "cumulative_multiplier": 1.0,
+                    "final_points": points,
+                })
+                score_deltas[employee.id] += points
+                record_deltas[employee.id] += 1
+
+            if total == 0:
+                result["no_reward_count"] += 1
+                continue
+
+            if eligible["+M02"]:
+                result["driving_zero_count"] += 1
+            if eligible["+M03"]:
+                result["all_zero_count"] += 1
+
+            result["rewards"].append({
+                "employee_id": employee.id,
+                "employee_name": employee.employee_name,
+                "driving_zero_violation": eligible["+M02"],
+                "all_zero_violation": eligible["+M03"],
+                "total_points": total
+            })
+
+        # 批次寫入
+        insert_rows(self.db, MonthlyReward.__table__, new_rewards)
+        insert_rows(self.db, AssessmentRecord.__table__, new_records)
+
+        revoked_at = datetime.now()
+        for chunk in chunked(revoked_ids):
+            self.db.execute(
+                update(AssessmentRecord)
+                .where(AssessmentRecord.id.in_(chunk))
+                .values(is_deleted=True, deleted_at=revoked_at)
+            )
+
+        self.score_ledger.apply_deltas(year, score_deltas, record_deltas)
+
+        return result
+
+    def _employee_filter(self, employee_ids: Optional[list[int]] = None):
+        """
+        批次計算的員工範圍條件
+
+        Args:
+            employee_ids: 指定員工（None 表示所有在職員工）
+
+        Returns:
+            Employee 篩選條件
+        """
+        if employee_ids is None:
+            return Employee.is_resigned == False
+        return Employee.id.in_(employee_ids)
+
+    def _get_month_deduction_categories_by_employee(
+        self,
+        year: int,
+        month: int,
+        employee_ids: Optional[list[int]] = None
+    ) -> dict[int, set[str]]:
+        """
+        一次取得所有在職員工當月有扣分的類別
+
+        Args:
+            year: 年度
+            month: 月份
+            employee_ids: 指定員工（None 表示所有在職員工）
+
+        Returns:
+            員工 ID -> 有扣分的類別集合（無扣分的員工不在結果中）
+        """
+        stmt = (
+            select(AssessmentRecord.employee_id, AssessmentStandard.category)
+            .distinct()
+            .join(AssessmentStandard, AssessmentRecord.standard_code == AssessmentStandard.code)
+            .where(
+                and_(
+                    AssessmentRecord.employee_id.in_(
+                        select(Employee.id).where(self._employee_filter(employee_ids))
+                    ),
+                    AssessmentRecord.is_deleted == False,
+                    in_period(AssessmentRecord.record_date, year, month=month),
+                    AssessmentStandard.base_points < 0  # 僅查扣分項目
+                )
+            )
+        )
+
+        categories: dict[int, set[str]] = defaultdict(set)
+        for employee_id, category in self.db.execute(stmt):
+            categories[employee_id].add(category)
+        return categories
+
+    def _get_month_reward_record_ids(
+        self,
+        year: int,
+        month: int,
+        employee_ids: Optional[list[int]] = None
+    ) -> dict[tuple[int, str], list[int]]:
+        """
+        一次取得當月未刪除的月度獎勵考核記錄
+
+        Args:
+            year: 年度
+            month: 月份
+            employee_ids: 指定員工（None 表示所有員工）
+
+        Returns:
+            (員工 ID, 考核代碼) -> 考核記錄 ID 列表
+        """
+        conditions = [
+            AssessmentRecord.standard_code.in_(list(REWARD_ITEMS)),
+            AssessmentRecord.is_deleted == False,
+            in_period(AssessmentRecord.record_date, year, month=month)
+        ]
+        if employee_ids is not None:
+            conditions.append(AssessmentRecord.employee_id.in_(employee_ids))
+
+        rows = self.db.execute(
+            select(AssessmentRecord.id, AssessmentRecord.employee_id, AssessmentRecord.standard_code)
+            .where(and_(*conditions))
+        )
+
+        record_ids: dict[tuple[int, str], list[int]] = defaultdict(list)
+        for record_id, employee_id, code in rows:
+            record_ids[(employee_id, code)].append(record_id)
+        return record_ids
+
     def get_month_rewards(
         self,
         year: int,
@@ -267,8 +532,7 @@ class MonthlyRewardCalculatorService:
                 and_(
                     AssessmentRecord.employee_id == employee_id,
                     AssessmentRecord.is_deleted == False,
-                    extract('year', AssessmentRecord.record_date) == year,
-                    extract('month', AssessmentRecord.record_date) == month,
+                    in_period(AssessmentRecord.record_date, year, month=month),
                     AssessmentStandard.base_points < 0  # 僅查扣分項目
                 )
             )
@@ -310,8 +574,7 @@ class MonthlyRewardCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.standard_code == '+M01',
-                        extract('year', AssessmentRecord.record_date) == year,
-                        extract('month', AssessmentRecord.record_date) == month,
+                        in_period(AssessmentRecord.record_date, year, month=month),
                         AssessmentRecord.is_deleted == False
                     )
                 )
@@ -332,11 +595,8 @@ class MonthlyRewardCalculatorService:
                 self.db.add(record)
                 records.append(record)
 
-                # 更新員工分數
-                employee = self.db.execute(
-                    select(Employee).where(Employee.id == employee_id)
-                ).scalar_one()
-                employee.current_score += 3.0
+                # 更新員工年度帳本與分數
+                self.score_ledger.add_points(employee_id, year, 3.0, records=1)
 
         # 檢查是否已有該月的 +M02 記錄
         if driving_zero:
@@ -345,8 +605,7 @@ class MonthlyRewardCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.standard_code == '+M02',
-                        extract('year', AssessmentRecord.record_date) == year,
-                        extract('month', AssessmentRecord.record_date) == month,
+                        in_period(AssessmentRecord.record_date, year, month=month),
                         AssessmentRecord.is_deleted == False
                     )
                 )
@@ -367,11 +626,8 @@ class MonthlyRewardCalculatorService:
                 self.db.add(record)
                 records.append(record)
 
-                # 更新員工分數
-                employee = self.db.execute(
-                    select(Employee).where(Employee.id == employee_id)
-                ).scalar_one()
-                employee.current_score += 1.0
+                # 更新員工年度帳本與分數
+                self.score_ledger.add_points(employee_id, year, 1.0, records=1)
 
         # 檢查是否已有該月的 +M03 記錄
         if all_zero:
@@ -380,8 +636,7 @@ class MonthlyRewardCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.standard_code == '+M03',
-                        extract('year', AssessmentRecord.record_date) == year,
-                        extract('month', AssessmentRecord.record_date) == month,
+                        in_period(AssessmentRecord.record_date, year, month=month),
                         AssessmentRecord.is_deleted == False
                     )
                 )
@@ -402,11 +657,8 @@ class MonthlyRewardCalculatorService:
                 self.db.add(record)
                 records.append(record)
 
-                # 更新員工分數
-                employee = self.db.execute(
-                    select(Employee).where(Employee.id == employee_id)
-                ).scalar_one()
-                employee.current_score += 2.0
+                # 更新員工年度帳本與分數
+                self.score_ledger.add_points(employee_id, year, 2.0, records=1)
 
         return records
 
@@ -429,6 +681,7 @@ class MonthlyRewardCalculatorService:
             existing_reward: 現有的月度獎勵記錄
         """
         points_to_deduct = 0.0
+        records_revoked = 0
 
         # 撤銷 +M01（全勤）
         if existing_reward.full_attendance:
@@ -437,8 +690,7 @@ class MonthlyRewardCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.standard_code == '+M01',
-                        extract('year', AssessmentRecord.record_date) == year,
-                        extract('month', AssessmentRecord.record_date) == month,
+                        in_period(AssessmentRecord.record_date, year, month=month),
                         AssessmentRecord.is_deleted == False
                     )
                 )
@@ -448,6 +700,7 @@ class MonthlyRewardCalculatorService:
                 m01_record.is_deleted = True
                 m01_record.deleted_at = datetime.now()
                 points_to_deduct += 3.0
+                records_revoked += 1
 
         # 撤銷 +M02
         if existing_reward.driving_zero_violation:
@@ -456,8 +709,7 @@ class MonthlyRewardCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.standard_code == '+M02',
-                        extract('year', AssessmentRecord.record_date) == year,
-                        extract('month', AssessmentRecord.record_date) == month,
+                        in_period(AssessmentRecord.record_date, year, month=month),
                         AssessmentRecord.is_deleted == False
                     )
                 )
@@ -467,6 +719,7 @@ class MonthlyRewardCalculatorService:
                 m02_record.is_deleted = True
                 m02_record.deleted_at = datetime.now()
                 points_to_deduct += 1.0
+                records_revoked += 1
 
         # 撤銷 +M03
         if existing_reward.all_zero_violation:
@@ -475,8 +728,7 @@ class MonthlyRewardCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.standard_code == '+M03',
-                        extract('year', AssessmentRecord.record_date) == year,
-                        extract('month', AssessmentRecord.record_date) == month,
+                        in_period(AssessmentRecord.record_date, year, month=month),
                         AssessmentRecord.is_deleted == False
                     )
                 )
@@ -486,13 +738,13 @@ class MonthlyRewardCalculatorService:
                 m03_record.is_deleted = True
                 m03_record.deleted_at = datetime.now()
                 points_to_deduct += 2.0
+                records_revoked += 1
 
-        # 更新員工分數
+        # 更新員工年度帳本與分數
         if points_to_deduct > 0:
-            employee = self.db.execute(
-                select(Employee).where(Employee.id == employee_id)
-            ).scalar_one()
-            employee.current_score -= points_to_deduct
+            self.score_ledger.add_points(
+                employee_id, year, -points_to_deduct, records=-records_revoked
+            )
 
     def _sync_reward_records(
         self,
@@ -532,8 +784,7 @@ class MonthlyRewardCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.standard_code == '+M01',
-                        extract('year', AssessmentRecord.record_date) == year,
-                        extract('month', AssessmentRecord.record_date) == month,
+                        in_period(AssessmentRecord.record_date, year, month=month),
                         AssessmentRecord.is_deleted == False
                     )
                 )
@@ -542,10 +793,8 @@ class MonthlyRewardCalculatorService:
             if m01_record:
                 m01_record.is_deleted = True
                 m01_record.deleted_at = datetime.now()
-                employee = self.db.execute(
-                    select(Employee).where(Employee.id == employee_id)
-                ).scalar_one()
-                employee.current_score -= 3.0
+                # 更新員工年度帳本與分數
+                self.score_ledger.add_points(employee_id, year, -3.0, records=-1)
 
         elif not old_full_attendance and new_full_attendance:
             # 補發 +M01
@@ -554,8 +803,7 @@ class MonthlyRewardCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.standard_code == '+M01',
-                        extract('year', AssessmentRecord.record_date) == year,
-                        extract('month', AssessmentRecord.record_date) == month,
+                        in_period(AssessmentRecord.record_date, year, month=month),
                         AssessmentRecord.is_deleted == False
                     )
                 )
@@ -574,10 +822,8 @@ class MonthlyRewardCalculatorService:
                     final_points=3.0
                 )
                 self.db.add(record)
-                employee = self.db.execute(
-                    select(Employee).where(Employee.id == employee_id)
-                ).scalar_one()
-                employee.current_score += 3.0
+                # 更新員工年度帳本與分數
+                self.score_ledger.add_points(employee_id, year, 3.0, records=1)
 
         # 處理 +M02
         if old_driving_zero and not new_driving_zero:
@@ -587,8 +833,7 @@ class MonthlyRewardCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.standard_code == '+M02',
-                        extract('year', AssessmentRecord.record_date) == year,
-                        extract('month', AssessmentRecord.record_date) == month,
+                        in_period(AssessmentRecord.record_date, year, month=month),
                         AssessmentRecord.is_deleted == False
                     )
                 )
@@ -597,10 +842,8 @@ class MonthlyRewardCalculatorService:
             if m02_record:
                 m02_record.is_deleted = True
                 m02_record.deleted_at = datetime.now()
-                employee = self.db.execute(
-                    select(Employee).where(Employee.id == employee_id)
-                ).scalar_one()
-                employee.current_score -= 1.0
+                # 更新員工年度帳本與分數
+                self.score_ledger.add_points(employee_id, year, -1.0, records=-1)
 
         elif not old_driving_zero and new_driving_zero:
             # 補發 +M02
@@ -609,8 +852,7 @@ class MonthlyRewardCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.standard_code == '+M02',
-                        extract('year', AssessmentRecord.record_date) == year,
-                        extract('month', AssessmentRecord.record_date) == month,
+                        in_period(AssessmentRecord.record_date, year, month=month),
                         AssessmentRecord.is_deleted == False
                     )
                 )
@@ -629,10 +871,8 @@ class MonthlyRewardCalculatorService:
                     final_points=1.0
                 )
                 self.db.add(record)
-                employee = self.db.execute(
-                    select(Employee).where(Employee.id == employee_id)
-                ).scalar_one()
-                employee.current_score += 1.0
+                # 更新員工年度帳本與分數
+                self.score_ledger.add_points(employee_id, year, 1.0, records=1)
 
         # 處理 +M03
         if old_all_zero and not new_all_zero:
@@ -642,8 +882,7 @@ class MonthlyRewardCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.standard_code == '+M03',
-                        extract('year', AssessmentRecord.record_date) == year,
-                        extract('month', AssessmentRecord.record_date) == month,
+                        in_period(AssessmentRecord.record_date, year, month=month),
                         AssessmentRecord.is_deleted == False
                     )
                 )
@@ -652,10 +891,8 @@ class MonthlyRewardCalculatorService:
             if m03_record:
                 m03_record.is_deleted = True
                 m03_record.deleted_at = datetime.now()
-                employee = self.db.execute(
-                    select(Employee).where(Employee.id == employee_id)
-                ).scalar_one()
-                employee.current_score -= 2.0
+                # 更新員工年度帳本與分數
+                self.score_ledger.add_points(employee_id, year, -2.0, records=-1)
 
         elif not old_all_zero and new_all_zero:
             # 補發 +M03
@@ -664,8 +901,7 @@ class MonthlyRewardCalculatorService:
                     and_(
                         AssessmentRecord.employee_id == employee_id,
                         AssessmentRecord.standard_code == '+M03',
-                        extract('year', AssessmentRecord.record_date) == year,
-                        extract('month', AssessmentRecord.record_date) == month,
+                        in_period(AssessmentRecord.record_date, year, month=month),
                         AssessmentRecord.is_deleted == False
                     )
                 )
@@ -684,10 +920,8 @@ class MonthlyRewardCalculatorService:
                     final_points=2.0
                 )
                 self.db.add(record)
-                employee = self.db.execute(
-                    select(Employee).where(Employee.id == employee_id)
-                ).scalar_one()
-                employee.current_score += 2.0
+                # 更新員工年度帳本與分數
+                self.score_ledger.add_points(employee_id, year, 2.0, records=1)
 
     def preview_month_calculation(
         self,
@@ -715,10 +949,10 @@ class MonthlyRewardCalculatorService:
             "preview": []
         }
 
+        categories_by_employee = self._get_month_deduction_categories_by_employee(year, month)
+
         for employee in employees:
-            deduction_categories = self._get_month_deduction_categories(
-                employee.id, year, month
-            )
+            deduction_categories = categories_by_employee.get(employee.id, set())
 
             driving_zero = not any(cat in ['R', 'S'] for cat in deduction_categories)
             all_zero = len(deduction_categories) == 0
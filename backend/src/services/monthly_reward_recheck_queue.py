@@ -0,0 +1,300 @@
+"""
+月度獎勵重算佇列服務
+對應 spec.md: User Story 9 - 考核系統
+
+考核記錄建立、刪除、還原時不再同步執行 calculate_employee_month，
+改為登記 (員工, 年, 月) 至 monthly_reward_rechecks（重複登記合併為一筆），
+由背景排程批次取出，依 (年, 月) 分組後以月度獎勵集合式計算處理。
+
+功能：
+- enqueue / enqueue_many: 登記待重算員工月份（與考核記錄變更同一 Transaction）
+- drain: 取出一批並重算（先標記取出時間，重算成功後與結果同一 Transaction 刪除，
+  重算失敗或行程中斷時佇列項目保留並可再次取出）
+- drain_all: 持續處理至佇列清空
+- get_status: 佇列長度、最舊待處理延遲與處理統計
+"""
+
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from ..config.settings import get_settings
+from ..models.monthly_reward_recheck import MonthlyRewardRecheck
+from ..utils.db_bulk import chunked, upsert_rows
+from ..utils.logger import logger
+
+
+# 處理統計（行程內累計，供同步任務 API 查詢）
+_stats_lock = threading.Lock()
+_stats: dict[str, Any] = {
+    "total_runs": 0,
+    "total_drained": 0,
+    "total_failures": 0,
+    "last_run_at": None,
+    "last_drained": 0,
+    "last_duration_ms": None,
+    "last_lag_seconds": None,
+    "last_error": None,
+}
+
+
+def _record_run(
+    drained: int,
+    duration_ms: float,
+    lag_seconds: Optional[float],
+    error: Optional[str] = None
+) -> None:
+    """記錄一次處理結果"""
+    with _stats_lock:
+        _stats["total_runs"] += 1
+        _stats["last_run_at"] = datetime.now().isoformat()
+        _stats["last_duration_ms"] = round(duration_ms, 1)
+        _stats["last_lag_seconds"] = lag_seconds
+        if error is None:
+            _stats["total_drained"] += drained
+            _stats["last_drained"] = drained
+            _stats["last_error"] = None
+        else:
+            _stats["total_failures"] += 1
+            _stats["last_drained"] = 0
+            _stats["last_error"] = error
+
+
+class MonthlyRewardRecheckQueue:
+    """
+    月度獎勵重算佇列
+
+    以資料表保存待重算的員工月份，與考核記錄變更一同提交，
+    行程重啟或多個 worker 並存時不會遺失或重複處理。
+    """
+
+    def __init__(self, db: Session):
+        """
+        初始化服務
+
+        Args:
+            db: 資料庫 Session
+        """
+        self.db = db
+
+    def enqueue(self, employee_id: int, year: int, month: int) -> None:
+        """
+        登記單一員工月份待重算（不提交，由外層控制 Transaction）
+
+        Args:
+            employee_id: 員工 ID
+            year: 年度
+            month: 月份
+        """
+        self.enqueue_many([(employee_id, year, month)])
+
+    def enqueue_many(self, keys: Iterable[tuple[int, int, int]]) -> int:
+        """
+        登記多個員工月份待重算（不提交，由外層控制 Transaction）
+
+        已在佇列中的員工月份保留首次登記時間；若正在處理中則清除取出標記，
+        使處理完成後仍保留於佇列並再次重算（避免遺漏處理期間提交的變更）。
+
+        Args:
+            keys: (員工 ID, 年度, 月份) 列表
+
+        Returns:
+            登記的員工月份數（已去重）
+        """
+        enqueued_at = datetime.now()
+        return self._upsert([
+            {
+                "employee_id": employee_id,
+                "year": year,
+                "month": month,
+                "enqueued_at": enqueued_at,
+                "claimed_at": None,
+            }
+            for employee_id, year, month in sorted(set(keys))
+        ])
+
+    def drain(self, batch_size: Optional[int] = None) -> dict[str, Any]:
+        """
+        取出最早登記的一批員工月份並重算月度獎勵
+
+        1. 鎖定待處理（或取出逾時）的項目，標記取出時間後提交
+        2. 依 (年, 月) 分組呼叫 calculate_month_batch(employee_ids=...)，
+           於同一 Transaction 刪除仍帶有本次取出標記的項目後提交
+        處理期間再次登記的員工月份取出標記已被清除，不會刪除，下一批再重算；
+        重算失敗時清除取出標記（保留原登記時間）並拋出例外；
+        行程在提交前中斷時，項目於 monthly_reward_recheck_claim_timeout_seconds 後可再次取出。
+
+        Args:
+            batch_size: 每批員工月份數（預設使用系統設定）
+
+        Returns:
+            處理結果（drained: 處理的員工月份數, months: 涉及的年月數）
+        """
+        # 延遲 import 避免 circular import
+        from .monthly_reward_calculator import MonthlyRewardCalculatorService
+
+        settings = get_settings()
+        batch_size = batch_size or settings.monthly_reward_recheck_batch_size
+        started = time.perf_counter()
+        # DATETIME 欄位僅精確到秒，取出標記不含微秒以便比對
+        claimed_at = datetime.now().replace(microsecond=0)
+        claim_expired_before = claimed_at - timedelta(seconds=settings.monthly_reward_recheck_claim_timeout_seconds)
+
+        rows = self.db.execute(
+            select(
+                MonthlyRewardRecheck.id,
+                MonthlyRewardRecheck.employee_id,
+                MonthlyRewardRecheck.year,
+                MonthlyRewardRecheck.month,
+                MonthlyRewardRecheck.enqueued_at
+            )
+            .where(or_(
+                MonthlyRewardRecheck.claimed_at.is_(None),
+                MonthlyRewardRecheck.claimed_at < claim_expired_before
+            ))
+            .order_by(MonthlyRewardRecheck.enqueued_at, MonthlyRewardRecheck.id)
+            .limit(batch_size)
+            .with_for_update()
+        ).all()
+
+        if not rows:
+            self.db.commit()
+            return {"drained": 0, "months": 0}
+
+        ids = [row.id for row in rows]
+        self._set_claimed_at(ids, claimed_at)
+        self.db.commit()
+
+        lag_seconds = round((datetime.now() - min(row.enqueued_at for row in rows)).total_seconds(), 1)
+        employees_by_month: dict[tuple[int, int], list[int]] = defaultdict(list)
+        for row in rows:
+            employees_by_month[(row.year, row.month)].append(row.employee_id)
+
+        try:
+            calculator = MonthlyRewardCalculatorService(self.db)
+            for (year, month), employee_ids in sorted(employees_by_month.items()):
+                calculator.calculate_month_batch(year, month, employee_ids=sorted(employee_ids))
+            for chunk in chunked(ids):
+                self.db.execute(
+                    delete(MonthlyRewardRecheck)
+                    .where(
+                        MonthlyRewardRecheck.id.in_(chunk),
+                        MonthlyRewardRecheck.claimed_at == claimed_at
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            self._set_claimed_at(ids, None, claimed_at=claimed_at)
+            self.db.commit()
+            _record_run(0, (time.perf_counter() - started) * 1000, lag_seconds, error=str(e))
+            logger.error("月度獎勵重算失敗，佇列項目保留待重試", count=len(rows), error=str(e))
+            raise
+
+        _record_run(len(rows), (time.perf_counter() - started) * 1000, lag_seconds)
+        return {"drained": len(rows), "months": len(employees_by_month)}
+
+    def drain_all(
+        self,
+        batch_size: Optional[int] = None,
+        max_batches: int = 100
+    ) -> dict[str, Any]:
+        """
+        持續處理佇列至清空（或達到批次上限）
+
+        Args:
+            batch_size: 每批員工月份數（預設使用系統設定）
+            max_batches: 單次執行最多處理批數
+
+        Returns:
+            處理結果（drained: 處理的員工月份數, batches: 處理批數）
+        """
+        batch_size = batch_size or get_settings().monthly_reward_recheck_batch_size
+        drained = 0
+        batches = 0
+
+        while batches < max_batches:
+            result = self.drain(batch_size)
+            if not result["drained"]:
+                break
+            drained += result["drained"]
+            batches += 1
+            if result["drained"] < batch_size:
+                break
+
+        return {"drained": drained, "batches": batches}
+
+    def get_status(self) -> dict[str, Any]:
+        """
+        取得佇列狀態與處理統計
+
+        Returns:
+            pending: 待處理員工月份數（含處理中）
+            claimed: 處理中（已取出尚未完成）的員工月份數
+            oldest_enqueued_at / lag_seconds: 最舊待處理項目的登記時間與已等待秒數
+            其餘為本行程的處理統計
+        """
+        pending, claimed, oldest = self.db.execute(
+            select(
+                func.count(MonthlyRewardRecheck.id),
+                func.count(MonthlyRewardRecheck.claimed_at),
+                func.min(MonthlyRewardRecheck.enqueued_at)
+            )
+        ).one()
+
+        with _stats_lock:
+            stats = dict(_stats)
+
+        return {
+            "pending": pending,
+            "claimed": claimed,
+            "oldest_enqueued_at": oldest.isoformat() if oldest else None,
+            "lag_seconds": round((datetime.now() - oldest).total_seconds(), 1) if oldest else 0.0,
+            **stats,
+        }
+
+    def _upsert(self, rows: list[dict[str, Any]]) -> int:
+        """
+        寫入佇列項目（衝突時僅清除取出標記，保留首次登記時間）
+
+        Args:
+            rows: 佇列項目欄位字典列表
+
+        Returns:
+            寫入筆數
+        """
+        return upsert_rows(
+            self.db,
+            MonthlyRewardRecheck.__table__,
+            rows,
+            conflict_columns=("employee_id", "year", "month"),
+            update_columns=("claimed_at",)
+        )
+
+    def _set_claimed_at(
+        self,
+        ids: list[int],
+        value: Optional[datetime],
+        claimed_at: Optional[datetime] = None
+    ) -> None:
+        """
+        設定佇列項目的取出標記（不提交）
+
+        Args:
+            ids: 佇列項目 ID 列表
+            value: 新的取出時間（None 表示釋放）
+            claimed_at: 僅更新仍帶有此取出標記的項目（None 表示不限）
+        """
+        for chunk in chunked(ids):
+            stmt = update(MonthlyRewardRecheck).where(MonthlyRewardRecheck.id.in_(chunk))
+            if claimed_at is not None:
+                stmt = stmt.where(MonthlyRewardRecheck.claimed_at == claimed_at)
+            self.db.execute(
+                stmt.values(claimed_at=value).execution_options(synchronize_session=False)
+            )
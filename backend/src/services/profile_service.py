@@ -723,9 +723,8 @@ class ProfileService:
             raise EmployeeNotFoundError(f"員工 ID {employee_id} 不存在")
 
         # 2. 驗證考核標準存在
-        standard_service = AssessmentStandardService(self.db)
-        standard = standard_service.get_by_code(assessment_code)
-        if not standard or not standard.is_active:
+        standard = AssessmentStandardService(self.db).get_snapshot().get_active(assessment_code)
+        if not standard:
             raise ValueError(f"考核標準 '{assessment_code}' 不存在或未啟用")
 
         # 3. R02-R05 需要責任判定資料
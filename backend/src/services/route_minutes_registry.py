@@ -0,0 +1,87 @@
+"""
+勤務分鐘數登錄表
+
+功能：
+- 各部門的勤務代碼 -> 標準分鐘數映射常駐記憶體，勤務表同步逐日計算時不需重複查詢
+- 以版本號失效：勤務標準時間新增、更新、停用、恢復、批次匯入提交後遞增版本，
+  下次取用時重新載入
+- 啟動時預先載入所有部門
+
+映射僅包含啟用中的勤務代碼，回傳唯讀映射供多個執行緒共用。
+"""
+
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..constants import Department
+from ..models.route_standard_time import RouteStandardTime
+from ..utils.versioned_cache import VersionedCache, singleton
+
+
+def _load_minutes(db: Session, department: str) -> Mapping[str, int]:
+    """由資料庫載入部門啟用中的勤務分鐘數映射（一次查詢）"""
+    rows = db.execute(
+        select(RouteStandardTime.route_code, RouteStandardTime.standard_minutes)
+        .where(
+            RouteStandardTime.department == department,
+            RouteStandardTime.is_active == True
+        )
+    ).all()
+    return MappingProxyType({code: standard_minutes for code, standard_minutes in rows})
+
+
+class RouteMinutesRegistry(VersionedCache[str, Mapping[str, int]]):
+    """
+    勤務分鐘數登錄表
+
+    部門映射的版本與登錄表版本不一致時，以呼叫端的 Session 重新載入（一次查詢）。
+    """
+
+    def __init__(self):
+        super().__init__(_load_minutes)
+
+    def minutes_map(self, db: Session, department: str) -> Mapping[str, int]:
+        """
+        取得部門最新的勤務分鐘數映射（過期時重新載入）
+
+        Args:
+            db: 資料庫 Session（僅在需要重新載入時使用）
+            department: 部門
+
+        Returns:
+            Mapping[str, int]: 唯讀的 {route_code: standard_minutes}
+        """
+        return self.get(db, department)
+
+    def warm_up(self, db: Session, departments: Optional[Iterable[str]] = None) -> dict[str, int]:
+        """
+        預先載入部門映射（啟動時呼叫）
+
+        Args:
+            db: 資料庫 Session
+            departments: 部門列表（預設所有部門）
+
+        Returns:
+            dict: 部門 -> 勤務代碼數
+        """
+        departments = departments or [department.value for department in Department]
+        return {department: len(self.load(db, department)) for department in departments}
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        取得登錄表統計
+
+        Returns:
+            dict: version, departments（部門 -> loaded_version, size）, loads, hits, misses, hit_rate
+        """
+        stats = super().get_stats()
+        return {"version": stats.pop("version"), "departments": stats.pop("entries"), **stats}
+
+
+@singleton
+def get_route_minutes_registry() -> RouteMinutesRegistry:
+    """取得勤務分鐘數登錄表實例（單例）"""
+    return RouteMinutesRegistry()
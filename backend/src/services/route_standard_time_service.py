@@ -3,16 +3,19 @@ RouteStandardTimeService 勤務標準時間管理服務
 對應 tasks.md T105: 實作勤務標準時間管理服務
 
 提供勤務標準時間的 CRUD 操作、Excel 匯入驗證等功能。
+所有變更提交後遞增勤務分鐘數登錄表版本，使快取的分鐘數映射失效。
 """
 
-from typing import Optional
+from typing import Mapping, Optional
 
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.constants import Department
 from src.models.route_standard_time import RouteStandardTime
+from src.services.route_minutes_registry import get_route_minutes_registry
+from src.utils.db_bulk import DEFAULT_CHUNK_SIZE, upsert_rows
 
 
 class RouteStandardTimeServiceError(Exception):
@@ -106,7 +109,7 @@ class RouteStandardTimeService:
                 existing.standard_minutes = standard_minutes
                 existing.description = description
                 existing.is_active = True
-                self.db.commit()
+                self._commit_changes()
                 self.db.refresh(existing)
                 return existing
 
@@ -122,7 +125,7 @@ class RouteStandardTimeService:
 
         try:
             self.db.add(route)
-            self.db.commit()
+            self._commit_changes()
             self.db.refresh(route)
             return route
         except IntegrityError:
@@ -192,7 +195,7 @@ class RouteStandardTimeService:
         if description is not None:
             route.description = description
 
-        self.db.commit()
+        self._commit_changes()
         self.db.refresh(route)
         return route
 
@@ -216,7 +219,7 @@ class RouteStandardTimeService:
             raise RouteNotFoundError(f"勤務標準時間 ID {id} 不存在")
 
         route.is_active = False
-        self.db.commit()
+        self._commit_changes()
         self.db.refresh(route)
         return route
 
@@ -238,7 +241,7 @@ class RouteStandardTimeService:
             raise RouteNotFoundError(f"勤務標準時間 ID {id} 不存在")
 
         route.is_active = True
-        self.db.commit()
+        self._commit_changes()
         self.db.refresh(route)
         return route
 
@@ -322,18 +325,19 @@ class RouteStandardTimeService:
             limit=10000
         )
 
-    def get_minutes_map(self, department: str) -> dict[str, int]:
+    def get_minutes_map(self, department: str) -> Mapping[str, int]:
         """
         取得部門的勤務代碼到分鐘數映射
 
+        由勤務分鐘數登錄表提供，僅在勤務標準時間變更後的首次取用時查詢資料庫。
+
         Args:
             department: 部門
 
         Returns:
-            dict: {route_code: standard_minutes}
+            Mapping: 唯讀的 {route_code: standard_minutes}（僅啟用中的勤務代碼）
         """
-        routes = self.list_by_department(department)
-        return {route.route_code: route.standard_minutes for route in routes}
+        return get_route_minutes_registry().minutes_map(self.db, department)
 
     # ============================================================
     # Excel 匯入
@@ -385,6 +389,7 @@ class RouteStandardTimeService:
 
             # 資料正規化
             valid_rows.append({
+                "row": i,
                 "route_code": str(row["route_code"]).strip().upper(),
                 "route_name": str(row["route_name"]).strip(),
                 "standard_minutes": minutes,
@@ -397,70 +402,104 @@ class RouteStandardTimeService:
         self,
         rows: list[dict],
         department: str,
-        update_existing: bool = True
+        update_existing: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
     ) -> dict:
         """
         批次匯入勤務標準時間
 
+        以一次查詢取得部門既有的勤務代碼，逐列判定新增 / 更新 / 略過後，
+        以多列 UPSERT 分批寫入並單次提交。同一檔案中重複的勤務代碼以第一筆為準。
+
         Args:
-            rows: 已驗證的資料列表
+            rows: 已驗證的資料列表（validate_import_data 的輸出）
             department: 目標部門
-            update_existing: 是否更新已存在的資料
+            update_existing: 是否更新已存在的資料（含重新啟用已停用的資料）
+            chunk_size: 每批寫入列數
 
         Returns:
-            dict: 匯入結果統計
+            dict: 匯入結果統計與逐列結果（results: row, route_code, action）
+
+        Raises:
+            RouteStandardTimeServiceError: 部門無效
         """
-        created = 0
-        updated = 0
-        skipped = 0
-        errors = []
+        self._validate_department(department)
 
-        for row in rows:
-            try:
-                existing = self.get_by_code(
-                    department,
-                    row["route_code"],
-                    include_inactive=True
-                )
+        existing_codes = set(self.db.execute(
+            select(RouteStandardTime.route_code)
+            .where(RouteStandardTime.department == department)
+        ).scalars())
 
-                if existing:
-                    if update_existing:
-                        existing.route_name = row["route_name"]
-                        existing.standard_minutes = row["standard_minutes"]
-                        existing.description = row["description"]
-                        existing.is_active = True
-                        updated += 1
-                    else:
-                        skipped += 1
-                else:
-                    route = RouteStandardTime(
-                        department=department,
-                        route_code=row["route_code"],
-                        route_name=row["route_name"],
-                        standard_minutes=row["standard_minutes"],
-                        description=row["description"],
-                        is_active=True
-                    )
-                    self.db.add(route)
-                    created += 1
-
-            except Exception as e:
-                errors.append(f"勤務代碼 '{row['route_code']}': {str(e)}")
+        results = []
+        to_write = []
+        seen: set[str] = set()
 
-        self.db.commit()
+        for index, row in enumerate(rows, start=2):
+            code = row["route_code"]
+            outcome = {"row": row.get("row", index), "route_code": code}
+
+            if code in seen:
+                results.append({**outcome, "action": "skipped", "reason": "檔案中勤務代碼重複"})
+                continue
+            seen.add(code)
+
+            if code in existing_codes:
+                if not update_existing:
+                    results.append({**outcome, "action": "skipped", "reason": "勤務代碼已存在"})
+                    continue
+                results.append({**outcome, "action": "updated"})
+            else:
+                results.append({**outcome, "action": "created"})
+
+            to_write.append({
+                "department": department,
+                "route_code": code,
+                "route_name": row["route_name"],
+                "standard_minutes": row["standard_minutes"],
+                "description": row["description"],
+                "is_active": True,
+            })
 
+        try:
+            upsert_rows(
+                self.db,
+                RouteStandardTime.__table__,
+                to_write,
+                conflict_columns=["department", "route_code"],
+                update_columns=["route_name", "standard_minutes", "description", "is_active"],
+                chunk_size=chunk_size
+            )
+            self._commit_changes()
+        except Exception as e:
+            self.db.rollback()
+            return {
+                "created": 0,
+                "updated": 0,
+                "skipped": len(rows),
+                "errors": [f"寫入勤務標準時間失敗：{str(e)}"],
+                "total": len(rows),
+                "results": [],
+            }
+
+        actions = [result["action"] for result in results]
         return {
-            "created": created,
-            "updated": updated,
-            "skipped": skipped,
-            "errors": errors,
-            "total": len(rows)
+            "created": actions.count("created"),
+            "updated": actions.count("updated"),
+            "skipped": actions.count("skipped"),
+            "errors": [],
+            "total": len(rows),
+            "results": results,
         }
 
     # ============================================================
     # 輔助方法
     # ============================================================
 
+    def _commit_changes(self) -> None:
+        """提交變更並使勤務分鐘數登錄表失效"""
+        self.db.commit()
+        get_route_minutes_registry().invalidate()
+
     def _validate_department(self, department: str) -> None:
         """驗證部門名稱"""
         valid_departments = [Department.DANHAI.value, Department.ANKENG.value]
@@ -15,6 +15,15 @@ from datetime import date
 from typing import Optional, List, Any
 from calendar import monthrange
 
+from src.services.shift_code_registry import (
+    LEAVE_PATTERNS,
+    OVERTIME_PATTERN,
+    R_SHIFT_PATTERN,
+    SHIFT_CODE_PATTERN,
+    SHIFT_TIME_MAP,
+    get_shift_code_info,
+    normalize_shift_cell,
+)
 from src.utils.logger import logger
 
 
@@ -54,46 +63,17 @@ class ScheduleParser:
     將其轉換為結構化的班別記錄。
     """
 
-    # 班別時間對照表（班別代碼 -> (開始時間, 結束時間)）
-    SHIFT_TIME_MAP = {
-        # 早班系列
-        "0500G": ("05:00", "13:30"),
-        "0530G": ("05:30", "14:00"),
-        "0600G": ("06:00", "14:30"),
-        "0630G": ("06:30", "15:00"),
-        "0700G": ("07:00", "15:30"),
-        "0730G": ("07:30", "16:00"),
-        "0800G": ("08:00", "16:30"),
-        # 中班系列
-        "0900G": ("09:00", "17:30"),
-        "0930G": ("09:30", "18:00"),
-        "1000G": ("10:00", "18:30"),
-        "1100G": ("11:00", "19:30"),
-        "1200G": ("12:00", "20:30"),
-        "1300G": ("13:00", "21:30"),
-        # 晚班系列
-        "1400G": ("14:00", "22:30"),
-        "1500G": ("15:00", "23:30"),
-        "1600G": ("16:00", "00:30"),
-        "1700G": ("17:00", "01:30"),
-        "1800G": ("18:00", "02:30"),
-    }
-
-    # 休假類型
-    LEAVE_PATTERNS = ["(假)", "(特)", "(公)", "(婚)", "(喪)", "(病)", "(事)"]
+    # 班別規則定義於 shift_code_registry，此處保留類別屬性供既有程式參照
+    SHIFT_TIME_MAP = SHIFT_TIME_MAP
+    LEAVE_PATTERNS = LEAVE_PATTERNS
 
     # Gemini Review Fix: 員工編號正則更彈性
     # 支援格式：1011M0095, 0912F0001, A123, 員工001 等
     EMPLOYEE_ID_PATTERN = re.compile(r"^[A-Za-z0-9\u4e00-\u9fff]+$")
 
-    # 班別代碼正則
-    SHIFT_CODE_PATTERN = re.compile(r"^(\d{4})([GDAR]?)$")
-
-    # R班正則（R/0905G, R(國)/0905G）
-    R_SHIFT_PATTERN = re.compile(r"^R(\(國\))?/(.+)$")
-
-    # 延長工時正則（+1, +2, +3, +4）
-    OVERTIME_PATTERN = re.compile(r"\(\+(\d)\)")
+    SHIFT_CODE_PATTERN = SHIFT_CODE_PATTERN
+    R_SHIFT_PATTERN = R_SHIFT_PATTERN
+    OVERTIME_PATTERN = OVERTIME_PATTERN
 
     def __init__(self):
         pass
@@ -108,35 +88,7 @@ class ScheduleParser:
         Returns:
             str: 班別類型（早班/中班/晚班/R班/休假/其他）
         """
-        # 檢查休假
-        for leave in self.LEAVE_PATTERNS:
-            if leave in shift_code:
-                return "休假"
-
-        # 檢查 R班
-        if shift_code.startswith("R/") or shift_code.startswith("R("):
-            return "R班"
-
-        # 解析時間判斷早中晚班
-        match = self.SHIFT_CODE_PATTERN.match(shift_code.replace("R/", "").replace("R(國)/", ""))
-        if match:
-            time_str = match.group(1)
-            hour = int(time_str[:2])
-
-            if 5 <= hour < 9:
-                return "早班"
-            elif 9 <= hour < 14:
-                return "中班"
-            elif 14 <= hour < 24:
-                return "晚班"
-
-        # 其他特殊班別
-        special_codes = ["站", "訓", "借", "支", "測"]
-        for code in special_codes:
-            if code in shift_code:
-                return "其他"
-
-        return "其他"
+        return get_shift_code_info(shift_code).shift_type
 
     def _parse_shift_time(self, shift_code: str) -> tuple[Optional[str], Optional[str]]:
         """
@@ -148,39 +100,8 @@ class ScheduleParser:
         Returns:
             tuple: (開始時間, 結束時間)
         """
-        # 移除 R/ 前綴
-        clean_code = shift_code
-        if clean_code.startswith("R/"):
-            clean_code = clean_code[2:]
-        elif clean_code.startswith("R(國)/"):
-            clean_code = clean_code[5:]
-
-        # 移除延長工時標記
-        clean_code = self.OVERTIME_PATTERN.sub("", clean_code)
-
-        # 查詢時間對照表
-        if clean_code in self.SHIFT_TIME_MAP:
-            return self.SHIFT_TIME_MAP[clean_code]
-
-        # 嘗試從代碼解析
-        match = self.SHIFT_CODE_PATTERN.match(clean_code)
-        if match:
-            time_str = match.group(1)
-            try:
-                hour = int(time_str[:2])
-                minute = int(time_str[2:])
-                start_time = f"{hour:02d}:{minute:02d}"
-                # 預設工時 8.5 小時
-                end_hour = (hour + 8) % 24
-                end_minute = (minute + 30) % 60
-                if minute + 30 >= 60:
-                    end_hour = (end_hour + 1) % 24
-                end_time = f"{end_hour:02d}:{end_minute:02d}"
-                return (start_time, end_time)
-            except (ValueError, IndexError):
-                pass
-
-        return (None, None)
+        info = get_shift_code_info(shift_code)
+        return (info.start_time, info.end_time)
 
     def _parse_overtime(self, shift_code: str) -> Optional[int]:
         """
@@ -192,10 +113,7 @@ class ScheduleParser:
         Returns:
             int: 延長工時小時數，無則返回 None
         """
-        match = self.OVERTIME_PATTERN.search(shift_code)
-        if match:
-            return int(match.group(1))
-        return None
+        return get_shift_code_info(shift_code).overtime_hours
 
     def _find_header_row(self, data: List[List[Any]]) -> int:
         """
@@ -346,31 +264,27 @@ class ScheduleParser:
                 if col_idx >= len(row):
                     continue
 
-                shift_code = str(row[col_idx]).strip()
+                shift_code = normalize_shift_cell(row[col_idx]).strip()
                 if not shift_code or shift_code == "":
                     continue
 
                 try:
                     schedule_date = date(year, month, day)
 
-                    # 解析班別資訊
-                    shift_type = self._classify_shift_type(shift_code)
-                    start_time, end_time = self._parse_shift_time(shift_code)
-                    overtime_hours = self._parse_overtime(shift_code)
-                    is_r_shift = shift_code.startswith("R/") or shift_code.startswith("R(")
-                    is_leave = any(leave in shift_code for leave in self.LEAVE_PATTERNS)
+                    # 解析班別資訊（經由共用的班別代碼登錄表快取）
+                    info = get_shift_code_info(shift_code)
 
                     parsed_shift = ParsedShift(
                         employee_id=employee_id,
                         employee_name=employee_name,
                         schedule_date=schedule_date,
                         shift_code=shift_code,
-                        shift_type=shift_type,
-                        start_time=start_time,
-                        end_time=end_time,
-                        overtime_hours=overtime_hours,
-                        is_r_shift=is_r_shift,
-                        is_leave=is_leave
+                        shift_type=info.shift_type,
+                        start_time=info.start_time,
+                        end_time=info.end_time,
+                        overtime_hours=info.overtime_hours,
+                        is_r_shift=info.is_r_shift,
+                        is_leave=info.is_leave
                     )
 
                     result.shifts.append(parsed_shift)
@@ -407,18 +321,16 @@ class ScheduleParser:
         Returns:
             dict: 解析結果
         """
-        shift_type = self._classify_shift_type(shift_code)
-        start_time, end_time = self._parse_shift_time(shift_code)
-        overtime_hours = self._parse_overtime(shift_code)
+        info = get_shift_code_info(shift_code)
 
         return {
             "shift_code": shift_code,
-            "shift_type": shift_type,
-            "start_time": start_time,
-            "end_time": end_time,
-            "overtime_hours": overtime_hours,
-            "is_r_shift": shift_code.startswith("R/") or shift_code.startswith("R("),
-            "is_leave": any(leave in shift_code for leave in self.LEAVE_PATTERNS)
+            "shift_type": info.shift_type,
+            "start_time": info.start_time,
+            "end_time": info.end_time,
+            "overtime_hours": info.overtime_hours,
+            "is_r_shift": info.is_r_shift,
+            "is_leave": info.is_leave
         }
 
 
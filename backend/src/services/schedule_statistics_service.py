@@ -0,0 +1,244 @@
+"""
+班表統計服務
+
+功能：
+- 以單次掃描的條件聚合計算部門月份班表統計（總筆數、員工數、班別分佈、R班、休假、延長工時）
+- 短效快取：以 (部門, 年, 月, 最近完成的同步批次) 為鍵，新批次完成即自然失效；
+  班表同步提交後亦會主動清除該部門月份的快取
+"""
+
+import threading
+import time
+from typing import Any, Optional
+
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.orm import Session
+
+from src.config.settings import get_settings
+from src.models.schedule import Schedule, SyncTask
+from src.utils.period_filter import in_period
+
+
+CacheKey = tuple[str, int, int, Optional[str]]
+
+
+class ScheduleStatisticsCache:
+    """
+    班表統計快取（行程內，部署為單一 worker）
+
+    項目超過存活秒數即視為過期；存活秒數為 0 時停用快取。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[CacheKey, tuple[float, dict[str, Any]]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: CacheKey, ttl_seconds: int) -> Optional[dict[str, Any]]:
+        """
+        取得未過期的統計結果
+
+        Args:
+            key: (部門, 年, 月, 同步批次 ID)
+            ttl_seconds: 存活秒數
+
+        Returns:
+            統計結果（未命中時回傳 None）
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl_seconds:
+                self._hits += 1
+                return dict(entry[1])
+            self._misses += 1
+            return None
+
+    def set(self, key: CacheKey, value: dict[str, Any]) -> None:
+        """
+        寫入統計結果（同部門月份的舊批次項目一併移除）
+
+        Args:
+            key: (部門, 年, 月, 同步批次 ID)
+            value: 統計結果
+        """
+        with self._lock:
+            for stale in [k for k in self._entries if k[:3] == key[:3]]:
+                del self._entries[stale]
+            self._entries[key] = (time.monotonic(), dict(value))
+
+    def invalidate(
+        self,
+        department: Optional[str] = None,
+        year: Optional[int] = None,
+        month: Optional[int] = None
+    ) -> int:
+        """
+        清除快取（未指定條件時清除全部）
+
+        Args:
+            department: 部門
+            year: 年份
+            month: 月份
+
+        Returns:
+            清除的項目數
+        """
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if (department is None or key[0] == department)
+                and (year is None or key[1] == year)
+                and (month is None or key[2] == month)
+            ]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        取得快取統計
+
+        Returns:
+            dict: hits, misses, hit_rate, size, ttl_seconds
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else None,
+                "size": len(self._entries),
+                "ttl_seconds": get_settings().schedule_statistics_cache_ttl_seconds,
+            }
+
+
+# 單例實例
+_cache_instance: Optional[ScheduleStatisticsCache] = None
+
+
+def get_schedule_statistics_cache() -> ScheduleStatisticsCache:
+    """取得班表統計快取實例（單例）"""
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = ScheduleStatisticsCache()
+    return _cache_instance
+
+
+class ScheduleStatisticsService:
+    """
+    班表統計服務
+    """
+
+    def __init__(self, db: Session):
+        """
+        初始化服務
+
+        Args:
+            db: 資料庫 Session
+        """
+        self.db = db
+
+    def get_month_statistics(
+        self,
+        department: str,
+        year: int,
+        month: int,
+        use_cache: bool = True
+    ) -> dict[str, Any]:
+        """
+        取得部門月份的班表統計
+
+        快取命中時僅查詢一次最近完成的同步批次 ID。
+
+        Args:
+            department: 部門
+            year: 年份
+            month: 月份
+            use_cache: 是否使用快取
+
+        Returns:
+            dict: department, year, month, total_records, employee_count,
+                  shift_type_distribution, r_shift_count, leave_count, overtime_count
+        """
+        ttl_seconds = get_settings().schedule_statistics_cache_ttl_seconds
+        if not use_cache or ttl_seconds <= 0:
+            return self._aggregate(department, year, month)
+
+        cache = get_schedule_statistics_cache()
+        key = (department, year, month, self._latest_batch_id(department, year, month))
+        cached = cache.get(key, ttl_seconds)
+        if cached is not None:
+            return cached
+
+        result = self._aggregate(department, year, month)
+        cache.set(key, result)
+        return result
+
+    def _latest_batch_id(self, department: str, year: int, month: int) -> Optional[str]:
+        """
+        取得部門月份最近一次完成的班表同步批次 ID
+
+        試算表未變動而略過的批次（sync_mode="skipped"）未寫入班表，不列入。
+        """
+        return self.db.execute(
+            select(SyncTask.batch_id)
+            .where(
+                SyncTask.task_type == "schedule_sync",
+                SyncTask.department == department,
+                SyncTask.target_year == year,
+                SyncTask.target_month == month,
+                SyncTask.status == "completed",
+                or_(SyncTask.sync_mode.is_(None), SyncTask.sync_mode != "skipped")
+            )
+            .order_by(SyncTask.completed_at.desc())
+            .limit(1)
+        ).scalar()
+
+    def _aggregate(self, department: str, year: int, month: int) -> dict[str, Any]:
+        """
+        單次掃描計算統計
+
+        以 (班別類型, 員工) 分組並以條件聚合計數，員工數由分組結果去重。
+        R班數依同步時寫入的 is_r_shift 旗標計算（R/、R( 開頭或包含「R班」），
+        與舊版僅比對 shift_code LIKE 'R/%' 不同，R(國)/ 假日出勤亦計入。
+        """
+        rows = self.db.execute(
+            select(
+                Schedule.shift_type,
+                Schedule.employee_id,
+                func.count(Schedule.id),
+                func.sum(case((Schedule.is_r_shift == True, 1), else_=0)),
+                func.sum(case((Schedule.is_leave == True, 1), else_=0)),
+                func.sum(case((Schedule.overtime_hours > 0, 1), else_=0))
+            )
+            .where(
+                Schedule.department == department,
+                in_period(Schedule.schedule_date, year, month=month)
+            )
+            .group_by(Schedule.shift_type, Schedule.employee_id)
+        ).all()
+
+        distribution: dict[str, int] = {}
+        employees = set()
+        total_records = r_shift_count = leave_count = overtime_count = 0
+        for shift_type, employee_id, count, r_shifts, leaves, overtimes in rows:
+            label = shift_type or "未分類"
+            distribution[label] = distribution.get(label, 0) + count
+            employees.add(employee_id)
+            total_records += count
+            r_shift_count += r_shifts or 0
+            leave_count += leaves or 0
+            overtime_count += overtimes or 0
+
+        return {
+            "department": department,
+            "year": year,
+            "month": month,
+            "total_records": total_records,
+            "employee_count": len(employees),
+            "shift_type_distribution": distribution,
+            "r_shift_count": r_shift_count,
+            "leave_count": leave_count,
+            "overtime_count": overtime_count,
+        }
@@ -7,6 +7,7 @@
 - 解析班表並寫入資料庫
 - 處理同步錯誤與重試
 - 記錄同步歷史
+- 寫入時一併推導班別旗標（R班、國定假日、休假、勤務代碼），並回填舊資料
 
 Gemini Review Fix:
 - 交易原子性：刪除與寫入在同一 Transaction 中
@@ -14,23 +15,121 @@ Gemini Review Fix:
 - 詳細錯誤日誌：輸出 stack trace
 """
 
+import hashlib
 import json
+import time
 import traceback
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from typing import Optional, List, Literal, Dict, Any
 
-from sqlalchemy import delete, and_
+from sqlalchemy import bindparam, delete, and_, insert, select, update
 from sqlalchemy.orm import Session
 
-from src.config.database import get_db
+from src.config.database import BackgroundSessionLocal, get_db
+from src.config.settings import get_settings
 from src.models.schedule import Schedule, SyncTask
 from src.constants import Department
-from src.services.google_sheets_reader import GoogleSheetsReader, get_google_sheets_reader
+from src.services.google_sheets_reader import GoogleSheetsReader, ReadResult, get_background_sheets_reader
 from src.services.schedule_parser import ScheduleParser, get_schedule_parser, ParsedShift
+from src.services.schedule_statistics_service import get_schedule_statistics_cache
+from src.services.shift_code_registry import get_shift_code_info
+from src.utils.db_bulk import DEFAULT_CHUNK_SIZE, chunked, update_rows
 from src.utils.logger import logger
 
 
+# 差異同步比對的內容欄位（不含同步批次等中繼資料）
+FINGERPRINT_FIELDS = (
+    "employee_name",
+    "shift_code",
+    "shift_type",
+    "start_time",
+    "end_time",
+    "overtime_hours",
+    "is_r_shift",
+    "is_national_holiday",
+    "is_leave",
+    "driving_minutes_code",
+)
+
+SyncMode = Literal["full", "incremental"]
+
+
+def schedule_fingerprint(values: Dict[str, Any]) -> str:
+    """
+    計算單筆班表內容指紋
+
+    Args:
+        values: 至少包含 FINGERPRINT_FIELDS 的欄位字典
+
+    Returns:
+        str: SHA-1 十六進位字串
+    """
+    payload = "\x1f".join(
+        "" if values.get(name) is None else str(values.get(name))
+        for name in FINGERPRINT_FIELDS
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def schedule_shift_flags(shift_code: Optional[str]) -> Dict[str, Any]:
+    """
+    由班別代碼推導 schedules 的班別旗標欄位
+
+    規則與行車時數計算相同（R班出勤含 R/、R( 開頭或含「R班」），
+    讓統計與行車時數只需以索引欄位篩選，不必於讀取時解析 shift_code。
+
+    Args:
+        shift_code: 原始班別代碼
+
+    Returns:
+        dict: is_r_shift, is_national_holiday, is_leave, driving_minutes_code
+    """
+    info = get_shift_code_info(shift_code or "")
+    return {
+        "is_r_shift": info.is_holiday_work,
+        "is_national_holiday": info.is_national_holiday,
+        "is_leave": info.is_leave,
+        "driving_minutes_code": info.duty_code,
+    }
+
+
+def backfill_schedule_flags(db: Session, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    回填尚未推導班別旗標的班表（driving_minutes_code 為 NULL）
+
+    每批查詢一次、以多列 UPDATE 寫入一次並提交（避免單一 Transaction 過大），
+    直到沒有待回填的資料。
+
+    Args:
+        db: 資料庫會話
+        chunk_size: 每批列數
+
+    Returns:
+        int: 回填筆數
+    """
+    backfilled = 0
+    while True:
+        rows = db.execute(
+            select(Schedule.id, Schedule.shift_code)
+            .where(Schedule.driving_minutes_code.is_(None))
+            .order_by(Schedule.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            return backfilled
+
+        update_rows(
+            db,
+            Schedule.__table__,
+            [{"id": row_id, **schedule_shift_flags(shift_code)} for row_id, shift_code in rows],
+            chunk_size=chunk_size
+        )
+        db.commit()
+        backfilled += len(rows)
+
+
 class ScheduleSyncService:
     """
     班表同步服務
@@ -43,10 +142,26 @@ class ScheduleSyncService:
     def __init__(
         self,
         sheets_reader: Optional[GoogleSheetsReader] = None,
-        parser: Optional[ScheduleParser] = None
+        parser: Optional[ScheduleParser] = None,
+        chunk_size: Optional[int] = None
     ):
-        self._reader = sheets_reader or get_google_sheets_reader()
+        # 讀取於背景執行緒進行，內容快取的資料庫存取使用背景連線池
+        self._reader = sheets_reader or get_background_sheets_reader()
         self._parser = parser or get_schedule_parser()
+        # 多列 INSERT 每批列數（預設取自 SCHEDULE_SYNC_CHUNK_SIZE）
+        self._chunk_size = chunk_size or get_settings().schedule_sync_chunk_size
+        # 試算表讀取執行緒池（長駐，讓各執行緒的 Sheets 服務快取可跨次同步沿用）
+        self._fetch_pool: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _get_month_range(year: int, month: int) -> tuple[date, date]:
+        """取得月份的半開區間 [start, end)"""
+        start_date = date(year, month, 1)
+        if month == 12:
+            end_date = date(year + 1, 1, 1)
+        else:
+            end_date = date(year, month + 1, 1)
+        return start_date, end_date
 
     def create_sync_task(
         self,
@@ -113,6 +228,8 @@ class ScheduleSyncService:
         success_count: Optional[int] = None,
         error_count: Optional[int] = None,
         error_details: Optional[List[str]] = None,
+        rows_per_second: Optional[float] = None,
+        change_counts: Optional[Dict[str, Any]] = None,
         commit: bool = True
     ):
         """
@@ -126,6 +243,8 @@ class ScheduleSyncService:
             success_count: 成功數量
             error_count: 錯誤數量
             error_details: 錯誤詳情
+            rows_per_second: 寫入吞吐量（列/秒）
+            change_counts: 同步模式與差異筆數（sync_mode, inserted, updated, deleted, unchanged）
             commit: 是否提交（Gemini Review Fix: 支援外部控制 commit）
         """
         task.status = status
@@ -138,6 +257,14 @@ class ScheduleSyncService:
             task.error_count = error_count
         if error_details is not None:
             task.error_details = json.dumps(error_details, ensure_ascii=False)
+        if rows_per_second is not None:
+            task.rows_per_second = rows_per_second
+        if change_counts is not None:
+            task.sync_mode = change_counts.get("sync_mode")
+            task.inserted_count = change_counts.get("inserted")
+            task.updated_count = change_counts.get("updated")
+            task.deleted_count = change_counts.get("deleted")
+            task.unchanged_count = change_counts.get("unchanged")
 
         if status == "running":
             task.started_at = datetime.now()
@@ -168,11 +295,7 @@ class ScheduleSyncService:
         Returns:
             int: 刪除的記錄數
         """
-        start_date = date(year, month, 1)
-        if month == 12:
-            end_date = date(year + 1, 1, 1)
-        else:
-            end_date = date(year, month + 1, 1)
+        start_date, end_date = self._get_month_range(year, month)
 
         result = db.execute(
             delete(Schedule).where(
@@ -195,13 +318,51 @@ class ScheduleSyncService:
         )
         return deleted_count
 
+    def _build_schedule_row(
+        self,
+        shift: ParsedShift,
+        department: str,
+        batch_id: str,
+        sync_source: str,
+        synced_at: datetime
+    ) -> dict:
+        """
+        將解析後的班別轉換為 schedules 資料列
+
+        Args:
+            shift: 解析後的班別
+            department: 部門
+            batch_id: 批次 ID
+            sync_source: 同步來源
+            synced_at: 同步時間
+
+        Returns:
+            dict: 欄位字典
+        """
+        return {
+            "employee_id": shift.employee_id,
+            "employee_name": shift.employee_name,
+            "department": department,
+            "schedule_date": shift.schedule_date,
+            "shift_code": shift.shift_code,
+            "shift_type": shift.shift_type,
+            "start_time": shift.start_time,
+            "end_time": shift.end_time,
+            "overtime_hours": shift.overtime_hours,
+            **schedule_shift_flags(shift.shift_code),
+            "sync_source": sync_source,
+            "sync_batch_id": batch_id,
+            "synced_at": synced_at,
+        }
+
     def _insert_schedules(
         self,
         db: Session,
         shifts: List[ParsedShift],
         department: str,
         batch_id: str,
-        sync_source: str
+        sync_source: str,
+        chunk_size: Optional[int] = None
     ) -> tuple[int, int, List[str]]:
         """
         批次寫入班表資料（不提交，由外層控制 Transaction）
@@ -211,12 +372,16 @@ class ScheduleSyncService:
         - 簡化為純 INSERT（因為已先刪除舊資料）
         - 增加詳細錯誤日誌
 
+        以 Core 多列 INSERT 分批寫入，每批在獨立 SAVEPOINT 中執行；
+        某一批失敗時僅回滾該批並改為逐筆寫入，以保留逐筆錯誤訊息。
+
         Args:
             db: 資料庫會話
             shifts: 解析後的班別列表
             department: 部門
             batch_id: 批次 ID
             sync_source: 同步來源
+            chunk_size: 每批列數（預設使用服務設定）
 
         Returns:
             tuple: (成功數, 錯誤數, 錯誤訊息列表)
@@ -226,48 +391,342 @@ class ScheduleSyncService:
         errors = []
 
         synced_at = datetime.now()
+        table = Schedule.__table__
+
+        for chunk in chunked(shifts, chunk_size or self._chunk_size):
+            rows = [
+                self._build_schedule_row(shift, department, batch_id, sync_source, synced_at)
+                for shift in chunk
+            ]
 
-        for shift in shifts:
             try:
-                schedule = Schedule(
-                    employee_id=shift.employee_id,
-                    employee_name=shift.employee_name,
-                    department=department,
-                    schedule_date=shift.schedule_date,
-                    shift_code=shift.shift_code,
-                    shift_type=shift.shift_type,
-                    start_time=shift.start_time,
-                    end_time=shift.end_time,
-                    overtime_hours=shift.overtime_hours,
-                    sync_source=sync_source,
-                    sync_batch_id=batch_id,
-                    synced_at=synced_at
-                )
-                db.add(schedule)
-                success_count += 1
+                with db.begin_nested():
+                    db.execute(insert(table).values(rows))
+                success_count += len(rows)
+                continue
 
             except Exception as e:
-                error_count += 1
-                error_msg = f"員工 {shift.employee_id} 日期 {shift.schedule_date}: {str(e)}"
-                errors.append(error_msg)
-                # Gemini Review Fix: 輸出詳細 stack trace
-                logger.error(
-                    "班表寫入失敗",
-                    employee_id=shift.employee_id,
-                    schedule_date=str(shift.schedule_date),
-                    error=str(e),
-                    traceback=traceback.format_exc()
+                logger.warning(
+                    "班表批次寫入失敗，改為逐筆寫入",
+                    batch_id=batch_id,
+                    chunk_rows=len(rows),
+                    error=str(e)
                 )
 
+            # 逐筆寫入（僅針對失敗的批次）
+            for shift, row in zip(chunk, rows):
+                try:
+                    with db.begin_nested():
+                        db.execute(insert(table).values(row))
+                    success_count += 1
+
+                except Exception as e:
+                    error_count += 1
+                    error_msg = f"員工 {shift.employee_id} 日期 {shift.schedule_date}: {str(e)}"
+                    errors.append(error_msg)
+                    # Gemini Review Fix: 輸出詳細 stack trace
+                    logger.error(
+                        "班表寫入失敗",
+                        employee_id=shift.employee_id,
+                        schedule_date=str(shift.schedule_date),
+                        error=str(e),
+                        traceback=traceback.format_exc()
+                    )
+
         # Gemini Review Fix: 不在此處 commit，由外層統一管理
         return (success_count, error_count, errors)
 
-    def execute_sync(
+    def _apply_full_sync(
+        self,
+        db: Session,
+        shifts: List[ParsedShift],
+        department: str,
+        year: int,
+        month: int,
+        batch_id: str,
+        sync_source: str
+    ) -> Dict[str, Any]:
+        """
+        完整同步：刪除整個部門月份後重新寫入（不提交）
+
+        Returns:
+            dict: success_count, error_count, errors 與差異筆數
+        """
+        deleted = self._delete_existing_schedules(db, department, year, month)
+        success_count, error_count, errors = self._insert_schedules(
+            db=db,
+            shifts=shifts,
+            department=department,
+            batch_id=batch_id,
+            sync_source=sync_source
+        )
+        return {
+            "sync_mode": "full",
+            "success_count": success_count,
+            "error_count": error_count,
+            "errors": errors,
+            "inserted": success_count,
+            "updated": 0,
+            "deleted": deleted,
+            "unchanged": 0,
+        }
+
+    def _apply_incremental_sync(
         self,
+        db: Session,
+        shifts: List[ParsedShift],
+        department: str,
+        year: int,
+        month: int,
         batch_id: str,
+        sync_source: str
+    ) -> Dict[str, Any]:
+        """
+        差異同步：僅寫入內容有變動的班表（不提交）
+
+        以 (employee_id, schedule_date) 為鍵，比對試算表與資料庫的內容指紋：
+        - 試算表有、資料庫無 → INSERT
+        - 兩邊皆有但指紋不同 → UPDATE
+        - 資料庫有、試算表無 → DELETE
+        - 指紋相同 → 不寫入
+
+        Returns:
+            dict: success_count, error_count, errors 與差異筆數
+        """
+        start_date, end_date = self._get_month_range(year, month)
+
+        existing_rows = db.execute(
+            select(
+                Schedule.id,
+                Schedule.employee_id,
+                Schedule.schedule_date,
+                *[getattr(Schedule, name) for name in FINGERPRINT_FIELDS]
+            ).where(
+                and_(
+                    Schedule.department == department,
+                    Schedule.schedule_date >= start_date,
+                    Schedule.schedule_date < end_date
+                )
+            )
+        ).mappings().all()
+
+        existing = {
+            (row["employee_id"], row["schedule_date"]): (row["id"], schedule_fingerprint(row))
+            for row in existing_rows
+        }
+
+        synced_at = datetime.now()
+        errors: List[str] = []
+        seen: set = set()
+        to_insert: List[ParsedShift] = []
+        to_update: List[dict] = []
+        unchanged = 0
+
+        for shift in shifts:
+            key = (shift.employee_id, shift.schedule_date)
+            if key in seen:
+                errors.append(f"員工 {shift.employee_id} 日期 {shift.schedule_date}: 班表重複，已忽略")
+                continue
+            seen.add(key)
+
+            current = existing.get(key)
+            if current is None:
+                to_insert.append(shift)
+                continue
+
+            row = self._build_schedule_row(shift, department, batch_id, sync_source, synced_at)
+            if current[1] == schedule_fingerprint(row):
+                unchanged += 1
+                continue
+
+            row["_id"] = current[0]
+            to_update.append(row)
+
+        to_delete = [row_id for key, (row_id, _) in existing.items() if key not in seen]
+
+        # 刪除
+        for chunk in chunked(to_delete, self._chunk_size):
+            db.execute(delete(Schedule).where(Schedule.id.in_(chunk)))
+
+        # 更新（executemany）
+        if to_update:
+            table = Schedule.__table__
+            update_columns = [name for name in to_update[0] if name not in ("_id", "employee_id", "schedule_date")]
+            stmt = update(table).where(table.c.id == bindparam("_id")).values(
+                {name: bindparam(name) for name in update_columns}
+            )
+            for chunk in chunked(to_update, self._chunk_size):
+                db.execute(stmt, chunk)
+
+        # 新增（多列 INSERT，失敗批次逐筆回退）
+        inserted, error_count, insert_errors = self._insert_schedules(
+            db=db,
+            shifts=to_insert,
+            department=department,
+            batch_id=batch_id,
+            sync_source=sync_source
+        )
+
+        logger.info(
+            "班表差異比對完成（未提交）",
+            department=department,
+            year=year,
+            month=month,
+            inserted=inserted,
+            updated=len(to_update),
+            deleted=len(to_delete),
+            unchanged=unchanged
+        )
+
+        return {
+            "sync_mode": "incremental",
+            "success_count": inserted + len(to_update),
+            "error_count": error_count + (len(shifts) - len(seen)),
+            "errors": errors + insert_errors,
+            "inserted": inserted,
+            "updated": len(to_update),
+            "deleted": len(to_delete),
+            "unchanged": unchanged,
+        }
+
+    def _get_fetch_pool(self) -> ThreadPoolExecutor:
+        """取得試算表讀取執行緒池（延遲建立）"""
+        if self._fetch_pool is None:
+            self._fetch_pool = ThreadPoolExecutor(
+                max_workers=get_settings().google_sheets_max_workers,
+                thread_name_prefix="sheets-fetch"
+            )
+        return self._fetch_pool
+
+    def _is_revision_synced(
+        self,
+        db: Session,
+        department: str,
+        year: int,
+        month: int,
+        revision: Optional[str]
+    ) -> bool:
+        """
+        檢查試算表版本是否已完整同步過
+
+        以同部門同月份最近一次完成的同步任務為準，
+        該次同步須無錯誤且記錄的試算表版本相同。
+
+        Args:
+            db: 資料庫會話
+            department: 部門
+            year: 年份
+            month: 月份
+            revision: 試算表目前的 Drive 檔案版本
+
+        Returns:
+            bool: 是否可略過本次同步
+        """
+        if not revision:
+            return False
+
+        last_task = db.execute(
+            select(SyncTask.source_revision, SyncTask.error_count)
+            .where(
+                SyncTask.task_type == "schedule_sync",
+                SyncTask.department == department,
+                SyncTask.target_year == year,
+                SyncTask.target_month == month,
+                SyncTask.status == "completed"
+            )
+            .order_by(SyncTask.completed_at.desc())
+            .limit(1)
+        ).first()
+
+        return (
+            last_task is not None
+            and last_task.source_revision == revision
+            and not last_task.error_count
+        )
+
+    def fetch_department_sheets(
+        self,
+        departments: List[str],
+        year: int,
+        month: int
+    ) -> Dict[str, ReadResult]:
+        """
+        並行讀取多個部門的班表試算表
+
+        讀取在有上限的執行緒池中同時進行，總耗時接近最慢的部門，
+        而非各部門耗時總和。
+
+        Args:
+            departments: 部門列表
+            year: 年份
+            month: 月份
+
+        Returns:
+            dict: 部門 -> 讀取結果
+        """
+        pool = self._get_fetch_pool()
+        futures = {
+            department: pool.submit(
+                self._reader.read_schedule_sheet,
+                department=department,
+                year=year,
+                month=month
+            )
+            for department in departments
+        }
+
+        results = {}
+        for department, future in futures.items():
+            try:
+                results[department] = future.result()
+            except Exception as e:
+                logger.error("班表試算表讀取例外", department=department, error=str(e))
+                results[department] = ReadResult(success=False, error=f"讀取失敗: {str(e)}")
+        return results
+
+    def fetch_schedule_data(
+        self,
         department: str,
         year: int,
         month: int
+    ) -> List[List[Any]]:
+        """
+        讀取指定部門月份的班表原始資料（供差勤加分處理使用）
+
+        Args:
+            department: 部門
+            year: 年份
+            month: 月份
+
+        Returns:
+            list: 試算表原始資料（讀取失敗時為空列表）
+        """
+        read_result = self._reader.read_schedule_sheet(
+            department=department,
+            year=year,
+            month=month
+        )
+
+        if not read_result.success:
+            logger.warning(
+                "班表資料讀取失敗",
+                department=department,
+                year=year,
+                month=month,
+                error=read_result.error
+            )
+            return []
+
+        return read_result.data or []
+
+    def execute_sync(
+        self,
+        batch_id: str,
+        department: str,
+        year: int,
+        month: int,
+        mode: Optional[SyncMode] = None,
+        read_result: Optional[ReadResult] = None
     ) -> Dict[str, Any]:
         """
         執行同步任務（Gemini Review Fix: 拆分出來的執行方法，支援背景呼叫）
@@ -279,11 +738,15 @@ class ScheduleSyncService:
             department: 部門
             year: 年份
             month: 月份
+            mode: 同步模式（full/incremental，預設使用 SCHEDULE_SYNC_MODE）
+            read_result: 預先讀取的試算表資料（由 fetch_department_sheets 提供時略過讀取）
 
         Returns:
             dict: 同步結果
         """
-        db_session = next(get_db())
+        mode = mode or get_settings().schedule_sync_mode
+        # 背景執行：使用背景任務連線池，不佔用 API 請求的連線
+        db_session = BackgroundSessionLocal()
 
         try:
             # 取得任務記錄
@@ -310,12 +773,13 @@ class ScheduleSyncService:
                 month=month
             )
 
-            # 1. 讀取 Google Sheets
-            read_result = self._reader.read_schedule_sheet(
-                department=department,
-                year=year,
-                month=month
-            )
+            # 1. 讀取 Google Sheets（已預先並行讀取時直接使用）
+            if read_result is None:
+                read_result = self._reader.read_schedule_sheet(
+                    department=department,
+                    year=year,
+                    month=month
+                )
 
             if not read_result.success:
                 self._update_task_status(
@@ -331,6 +795,44 @@ class ScheduleSyncService:
                     "month": month
                 }
 
+            task.source_revision = read_result.revision
+
+            # 試算表自上次成功同步後未變動：略過解析與寫入
+            # 以 sync_mode="skipped" 記錄，統計快取鍵忽略此批次（班表未變動）
+            if mode == "incremental" and self._is_revision_synced(
+                db_session, department, year, month, read_result.revision
+            ):
+                self._update_task_status(
+                    db_session, task, "completed",
+                    total_rows=0,
+                    success_count=0,
+                    error_count=0,
+                    change_counts={
+                        "sync_mode": "skipped", "inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0
+                    }
+                )
+                logger.info(
+                    "班表試算表未變動，略過同步",
+                    batch_id=batch_id,
+                    department=department,
+                    year=year,
+                    month=month,
+                    revision=read_result.revision
+                )
+                return {
+                    "success": True,
+                    "batch_id": batch_id,
+                    "department": department,
+                    "year": year,
+                    "month": month,
+                    "total_rows": 0,
+                    "success_count": 0,
+                    "error_count": 0,
+                    "sync_mode": mode,
+                    "skipped": True,
+                    "source_revision": read_result.revision
+                }
+
             # 2. 解析班表資料
             parse_result = self._parser.parse(
                 data=read_result.data,
@@ -359,27 +861,45 @@ class ScheduleSyncService:
             # Gemini Review Fix: 交易原子性 - 刪除與寫入在同一 Transaction
             # ============================================================
             try:
-                # 3. 刪除現有資料（不 commit）
-                self._delete_existing_schedules(db_session, department, year, month)
-
-                # 4. 寫入新資料（不 commit）
+                # 3-4. 完整同步：刪除後重寫；差異同步：僅寫入變動（皆不 commit）
                 sync_source = f"{department}_schedule_{year}{month:02d}"
-                success_count, error_count, errors = self._insert_schedules(
+                apply_sync = (
+                    self._apply_incremental_sync if mode == "incremental"
+                    else self._apply_full_sync
+                )
+                write_started = time.perf_counter()
+                changes = apply_sync(
                     db=db_session,
                     shifts=parse_result.shifts,
                     department=department,
+                    year=year,
+                    month=month,
                     batch_id=batch_id,
                     sync_source=sync_source
                 )
+                success_count = changes["success_count"]
+                error_count = changes["error_count"]
+                errors = changes["errors"]
 
                 # 5. 統一提交 Transaction
                 db_session.commit()
+                get_schedule_statistics_cache().invalidate(department, year, month)
+                write_seconds = time.perf_counter() - write_started
+                # 吞吐量僅計入實際寫入的列（未變動的列不寫入）
+                written = changes["inserted"] + changes["updated"] + changes["deleted"]
+                rows_per_second = round(written / write_seconds, 1) if write_seconds > 0 else None
 
                 logger.info(
                     "班表同步 Transaction 提交成功",
                     batch_id=batch_id,
+                    sync_mode=mode,
                     success_count=success_count,
-                    error_count=error_count
+                    error_count=error_count,
+                    inserted=changes["inserted"],
+                    updated=changes["updated"],
+                    deleted=changes["deleted"],
+                    unchanged=changes["unchanged"],
+                    rows_per_second=rows_per_second
                 )
 
             except Exception as e:
@@ -416,7 +936,9 @@ class ScheduleSyncService:
                 total_rows=len(parse_result.shifts),
                 success_count=success_count,
                 error_count=error_count,
-                error_details=all_errors if all_errors else None
+                error_details=all_errors if all_errors else None,
+                rows_per_second=rows_per_second,
+                change_counts=changes
             )
 
             logger.info(
@@ -438,6 +960,12 @@ class ScheduleSyncService:
                 "total_rows": len(parse_result.shifts),
                 "success_count": success_count,
                 "error_count": error_count,
+                "rows_per_second": rows_per_second,
+                "sync_mode": mode,
+                "inserted": changes["inserted"],
+                "updated": changes["updated"],
+                "deleted": changes["deleted"],
+                "unchanged": changes["unchanged"],
                 "warnings": parse_result.warnings[:10] if parse_result.warnings else []
             }
 
@@ -484,7 +1012,8 @@ class ScheduleSyncService:
         month: int,
         triggered_by: str = "manual",
         triggered_by_user: Optional[str] = None,
-        db: Optional[Session] = None
+        db: Optional[Session] = None,
+        mode: Optional[SyncMode] = None
     ) -> dict:
         """
         同步指定部門的班表（同步執行版本，適用於定時任務）
@@ -496,6 +1025,7 @@ class ScheduleSyncService:
             triggered_by: 觸發方式（auto/manual）
             triggered_by_user: 觸發使用者
             db: 資料庫會話（可選）
+            mode: 同步模式（full/incremental）
 
         Returns:
             dict: 同步結果
@@ -516,7 +1046,8 @@ class ScheduleSyncService:
             batch_id=batch_id,
             department=department,
             year=year,
-            month=month
+            month=month,
+            mode=mode
         )
 
     def sync_all_departments(
@@ -538,21 +1069,32 @@ class ScheduleSyncService:
         Returns:
             dict: 同步結果
         """
-        results = {
-            "淡海": self.sync_department(
-                department="淡海",
+        departments = [Department.DANHAI.value, Department.ANKENG.value]
+
+        batch_ids = {
+            department: self.create_sync_task(
+                task_type="schedule_sync",
+                department=department,
                 year=year,
                 month=month,
                 triggered_by=triggered_by,
                 triggered_by_user=triggered_by_user
-            ),
-            "安坑": self.sync_department(
-                department="安坑",
+            )
+            for department in departments
+        }
+
+        # 並行讀取所有部門試算表，再依序寫入資料庫
+        read_results = self.fetch_department_sheets(departments, year, month)
+
+        results = {
+            department: self.execute_sync(
+                batch_id=batch_ids[department],
+                department=department,
                 year=year,
                 month=month,
-                triggered_by=triggered_by,
-                triggered_by_user=triggered_by_user
+                read_result=read_results[department]
             )
+            for department in departments
         }
 
         overall_success = all(r["success"] for r in results.values())
@@ -601,6 +1143,13 @@ class ScheduleSyncService:
                 "success_count": task.success_count,
                 "error_count": task.error_count,
                 "progress": task.progress_percentage,
+                "rows_per_second": task.rows_per_second,
+                "sync_mode": task.sync_mode,
+                "inserted_count": task.inserted_count,
+                "updated_count": task.updated_count,
+                "deleted_count": task.deleted_count,
+                "unchanged_count": task.unchanged_count,
+                "source_revision": task.source_revision,
                 "started_at": task.started_at.isoformat() if task.started_at else None,
                 "completed_at": task.completed_at.isoformat() if task.completed_at else None,
                 "error_details": json.loads(task.error_details) if task.error_details else None
@@ -649,6 +1198,13 @@ class ScheduleSyncService:
                     "total_rows": task.total_rows,
                     "success_count": task.success_count,
                     "error_count": task.error_count,
+                    "rows_per_second": task.rows_per_second,
+                    "sync_mode": task.sync_mode,
+                    "inserted_count": task.inserted_count,
+                    "updated_count": task.updated_count,
+                    "deleted_count": task.deleted_count,
+                    "unchanged_count": task.unchanged_count,
+                    "source_revision": task.source_revision,
                     "triggered_by": task.triggered_by,
                     "created_at": task.created_at.isoformat() if task.created_at else None,
                     "completed_at": task.completed_at.isoformat() if task.completed_at else None
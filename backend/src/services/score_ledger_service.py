@@ -0,0 +1,297 @@
+"""
+員工分數帳本服務
+對應 spec.md: User Story 9 - 考核系統
+
+維護 employee_score_ledgers（每位員工每年度 final_points 總和），
+考核記錄變動時以增量方式同步更新帳本與 employees.current_score，
+總分查詢只需讀取帳本，不必加總全部歷史考核記錄。
+
+增量寫入皆由資料庫計算（UPSERT 累加、SET current_score = current_score + :d），
+同一員工年度同時寫入不會遺失更新，首次建立帳本也不會因唯一鍵衝突失敗。
+
+功能：
+- add_points: 單一員工年度增量更新（帳本 + 員工總分）
+- apply_deltas: 多位員工年度增量批次更新（帳本 + 員工總分）
+- get_total_points / get_score: 由帳本取得員工總分
+- reconcile: 以一次分組查詢比對帳本與考核記錄，可選擇修正帳本
+"""
+
+from collections import defaultdict
+from typing import Any, Optional
+
+from sqlalchemy import Float, Integer, cast, extract, func, literal, null, or_, select, union_all, update
+from sqlalchemy.orm import Session
+
+from ..models.assessment_record import AssessmentRecord
+from ..models.employee import Employee
+from ..models.employee_score_ledger import EmployeeScoreLedger
+from ..utils.db_bulk import chunked, insert_rows, update_rows, upsert_rows
+from ..utils.period_filter import in_period
+
+
+# 員工起始分數
+BASE_SCORE = 80.0
+
+# 帳本與考核記錄比對的浮點數容許誤差
+POINTS_TOLERANCE = 1e-6
+
+
+class ScoreLedgerService:
+    """
+    員工分數帳本服務
+
+    帳本以 (員工, 年度) 為單位保存 final_points 總和與記錄筆數，
+    員工總分 = 80 + 該員工所有年度帳本 total_points 總和。
+    """
+
+    def __init__(self, db: Session):
+        """
+        初始化服務
+
+        Args:
+            db: 資料庫 Session
+        """
+        self.db = db
+
+    def add_points(
+        self,
+        employee_id: int,
+        year: int,
+        points: float,
+        records: int = 0
+    ) -> int:
+        """
+        增量更新員工年度帳本與員工總分
+
+        Args:
+            employee_id: 員工 ID
+            year: 考核記錄所屬年度
+            points: final_points 變動
+            records: 考核記錄筆數變動（新增 +1、刪除 -1、分數調整 0）
+
+        Returns:
+            更新的帳本筆數
+        """
+        return self.apply_deltas(year, {employee_id: points}, {employee_id: records})
+
+    def apply_deltas(
+        self,
+        year: int,
+        point_deltas: dict[int, float],
+        record_deltas: Optional[dict[int, int]] = None
+    ) -> int:
+        """
+        批次增量更新多位員工同一年度的帳本與員工總分
+
+        帳本以多列 UPSERT 寫入：不存在時以變動值建立，已存在時累加
+        （total_points = total_points + 變動值），不需先讀取現值；
+        員工總分以相同增減值合併為一條 UPDATE ... SET current_score = current_score + 變動值。
+        員工依 ID 排序寫入，同時更新多位員工時鎖定順序一致。
+
+        Args:
+            year: 考核記錄所屬年度
+            point_deltas: 員工 ID -> final_points 變動
+            record_deltas: 員工 ID -> 考核記錄筆數變動
+
+        Returns:
+            更新的帳本筆數
+        """
+        record_deltas = record_deltas or {}
+        # Session 未啟用 autoflush，先送出尚未寫入的變更
+        self.db.flush()
+
+        employee_ids = sorted(
+            employee_id
+            for employee_id in point_deltas.keys() | record_deltas.keys()
+            if point_deltas.get(employee_id) or record_deltas.get(employee_id)
+        )
+        if not employee_ids:
+            return 0
+
+        upsert_rows(
+            self.db,
+            EmployeeScoreLedger.__table__,
+            [
+                {
+                    "employee_id": employee_id,
+                    "year": year,
+                    "total_points": point_deltas.get(employee_id, 0.0),
+                    "record_count": record_deltas.get(employee_id, 0),
+                }
+                for employee_id in employee_ids
+            ],
+            conflict_columns=("employee_id", "year"),
+            update_columns=(),
+            increment_columns=("total_points", "record_count")
+        )
+
+        employees_by_delta: dict[float, list[int]] = defaultdict(list)
+        for employee_id in employee_ids:
+            delta = point_deltas.get(employee_id)
+            if delta:
+                employees_by_delta[delta].append(employee_id)
+
+        for delta, ids in employees_by_delta.items():
+            for chunk in chunked(ids):
+                self.db.execute(
+                    update(Employee)
+                    .where(Employee.id.in_(chunk))
+                    .values(current_score=Employee.current_score + delta)
+                    .execution_options(synchronize_session=False)
+                )
+
+        # 以 Core 語句寫入，已載入的帳本與員工總分需重新讀取
+        updated = set(employee_ids)
+        for obj in list(self.db.identity_map.values()):
+            if isinstance(obj, EmployeeScoreLedger):
+                self.db.expire(obj)
+            elif isinstance(obj, Employee) and obj.id in updated:
+                self.db.expire(obj, ["current_score"])
+
+        return len(employee_ids)
+
+    def get_total_points(self, employee_id: int) -> float:
+        """
+        取得員工所有年度帳本 total_points 總和
+
+        Args:
+            employee_id: 員工 ID
+
+        Returns:
+            final_points 總和
+        """
+        # Session 未啟用 autoflush，先送出帳本變更
+        self.db.flush()
+
+        total = self.db.execute(
+            select(func.coalesce(func.sum(EmployeeScoreLedger.total_points), 0)).where(
+                EmployeeScoreLedger.employee_id == employee_id
+            )
+        ).scalar_one()
+        return float(total)
+
+    def get_score(self, employee_id: int) -> float:
+        """
+        由帳本取得員工應有總分（80 + 所有年度 total_points）
+
+        Args:
+            employee_id: 員工 ID
+
+        Returns:
+            應有總分
+        """
+        return BASE_SCORE + self.get_total_points(employee_id)
+
+    def reconcile(
+        self,
+        year: Optional[int] = None,
+        fix: bool = False
+    ) -> dict[str, Any]:
+        """
+        比對帳本與考核記錄
+
+        以考核記錄與帳本 UNION ALL 後依 (員工, 年度) 分組，
+        一次查詢找出 total_points 或 record_count 不一致的帳本。
+
+        Args:
+            year: 年度（None 表示所有年度）
+            fix: 是否以考核記錄為準修正帳本（不修改 employees.current_score）
+
+        Returns:
+            比對結果（mismatches 為不一致的 (員工, 年度) 明細）
+        """
+        # Session 未啟用 autoflush，先送出尚未寫入的變更
+        self.db.flush()
+
+        record_year = cast(extract('year', AssessmentRecord.record_date), Integer)
+        records = select(
+            AssessmentRecord.employee_id.label("employee_id"),
+            record_year.label("year"),
+            AssessmentRecord.final_points.label("record_points"),
+            literal(1, Integer).label("record_count"),
+            literal(0.0, Float).label("ledger_points"),
+            literal(0, Integer).label("ledger_count"),
+            cast(null(), Integer).label("ledger_id")
+        ).where(AssessmentRecord.is_deleted == False)
+
+        ledgers = select(
+            EmployeeScoreLedger.employee_id,
+            EmployeeScoreLedger.year,
+            literal(0.0, Float),
+            literal(0, Integer),
+            EmployeeScoreLedger.total_points,
+            EmployeeScoreLedger.record_count,
+            EmployeeScoreLedger.id
+        )
+
+        if year is not None:
+            records = records.where(in_period(AssessmentRecord.record_date, year))
+            ledgers = ledgers.where(EmployeeScoreLedger.year == year)
+
+        combined = union_all(records, ledgers).subquery()
+        record_points = func.sum(combined.c.record_points)
+        ledger_points = func.sum(combined.c.ledger_points)
+        record_count = func.sum(combined.c.record_count)
+        ledger_count = func.sum(combined.c.ledger_count)
+
+        rows = self.db.execute(
+            select(
+                combined.c.employee_id,
+                combined.c.year,
+                record_points.label("record_points"),
+                ledger_points.label("ledger_points"),
+                record_count.label("record_count"),
+                ledger_count.label("ledger_count"),
+                func.max(combined.c.ledger_id).label("ledger_id")
+            )
+            .group_by(combined.c.employee_id, combined.c.year)
+            .having(
+                or_(
+                    func.abs(record_points - ledger_points) > POINTS_TOLERANCE,
+                    record_count != ledger_count
+                )
+            )
+            .order_by(combined.c.employee_id, combined.c.year)
+        ).all()
+
+        mismatches = [
+            {
+                "employee_id": row.employee_id,
+                "year": int(row.year),
+                "ledger_id": row.ledger_id,
+                "ledger_points": float(row.ledger_points),
+                "record_points": float(row.record_points),
+                "ledger_count": int(row.ledger_count),
+                "record_count": int(row.record_count),
+            }
+            for row in rows
+        ]
+
+        if fix:
+            insert_rows(self.db, EmployeeScoreLedger.__table__, [
+                {
+                    "employee_id": m["employee_id"],
+                    "year": m["year"],
+                    "total_points": m["record_points"],
+                    "record_count": m["record_count"],
+                }
+                for m in mismatches if m["ledger_id"] is None
+            ])
+            update_rows(self.db, EmployeeScoreLedger.__table__, [
+                {
+                    "id": m["ledger_id"],
+                    "total_points": m["record_points"],
+                    "record_count": m["record_count"],
+                }
+                for m in mismatches if m["ledger_id"] is not None
+            ])
+            # 以 Core 語句寫入，已載入的帳本物件需重新讀取
+            self.db.expire_all()
+
+        return {
+            "year": year,
+            "is_consistent": not mismatches,
+            "mismatch_count": len(mismatches),
+            "fixed": fix,
+            "mismatches": mismatches,
+        }
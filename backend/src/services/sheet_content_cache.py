@@ -0,0 +1,270 @@
+"""
+試算表內容快取服務
+
+功能：
+- 以 (試算表 ID, 範圍) 快取最近一次讀取的資料與 Drive 檔案版本
+- 檔案版本未變動時直接返回快取，略過下載
+- 快取寫入資料庫（sheet_content_cache），伺服器重啟後仍有效
+- 提供命中 / 未命中統計供連線狀態 API 查詢
+- using: 依呼叫端指定資料庫 Session 來源（例如班表同步改用背景連線池），
+  記憶體快取與統計共用
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from src.config.settings import get_settings
+from src.models.sheet_content_cache import SheetContentCache as SheetContentCacheRecord
+from src.utils.db_bulk import upsert_rows
+from src.utils.logger import logger
+
+
+# 記憶體中保留的範圍數上限（超過時淘汰最久未使用者）
+MAX_MEMORY_ENTRIES = 64
+
+
+@dataclass
+class CachedRange:
+    """快取的範圍資料"""
+    revision: str
+    values: List[List[Any]]
+    modified_time: Optional[str] = None
+
+
+class SheetContentCache:
+    """
+    試算表內容快取
+
+    先查記憶體，未命中再查資料庫；版本不同視為未命中。
+    資料庫存取失敗時僅記錄警告並退回記憶體快取，不影響讀取流程。
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        persist: bool = True
+    ):
+        """
+        初始化快取
+
+        Args:
+            session_factory: 建立資料庫 Session 的函數（預設為 SyncSessionLocal）
+            persist: 是否寫入資料庫
+        """
+        self._session_factory = session_factory
+        self._persist = persist
+        self._entries: "OrderedDict[Tuple[str, str], CachedRange]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 統計以字典保存，供 using() 建立的快取共用
+        self._counts = {"hits": 0, "misses": 0, "persisted_hits": 0, "stores": 0}
+
+    def using(self, session_factory: Callable[[], Session]) -> "SheetContentCache":
+        """
+        建立使用指定 Session 來源的快取（記憶體項目、鎖與統計與本快取共用）
+
+        Args:
+            session_factory: 建立資料庫 Session 的函數
+
+        Returns:
+            SheetContentCache: 共用狀態的快取
+        """
+        cache = copy.copy(self)
+        cache._session_factory = session_factory
+        return cache
+
+    def _open_session(self) -> Session:
+        """開啟資料庫 Session（延遲匯入，避免模組載入時建立連線設定）"""
+        if self._session_factory is None:
+            from src.config.database import SyncSessionLocal
+            self._session_factory = SyncSessionLocal
+        return self._session_factory()
+
+    def _remember(self, key: Tuple[str, str], entry: CachedRange) -> None:
+        """寫入記憶體快取（呼叫端需持有鎖）"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > MAX_MEMORY_ENTRIES:
+            self._entries.popitem(last=False)
+
+    def _load(self, spreadsheet_id: str, range_key: str) -> Optional[CachedRange]:
+        """從資料庫載入快取"""
+        db = self._open_session()
+        try:
+            record = db.execute(
+                select(SheetContentCacheRecord).where(
+                    SheetContentCacheRecord.spreadsheet_id == spreadsheet_id,
+                    SheetContentCacheRecord.range_key == range_key
+                )
+            ).scalar_one_or_none()
+            if record is None:
+                return None
+            return CachedRange(
+                revision=record.revision,
+                values=record.cell_values,
+                modified_time=record.modified_time
+            )
+        finally:
+            db.close()
+
+    def get(
+        self,
+        spreadsheet_id: str,
+        range_key: str,
+        revision: str
+    ) -> Optional[List[List[Any]]]:
+        """
+        取得快取資料
+
+        Args:
+            spreadsheet_id: 試算表 ID
+            range_key: 讀取範圍
+            revision: 目前的 Drive 檔案版本
+
+        Returns:
+            list: 版本相符時返回快取資料，否則為 None
+        """
+        key = (spreadsheet_id, range_key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        from_database = False
+        if entry is None and self._persist:
+            try:
+                entry = self._load(spreadsheet_id, range_key)
+                from_database = entry is not None
+            except Exception as e:
+                logger.warning("試算表內容快取載入失敗", range_key=range_key, error=str(e))
+
+        with self._lock:
+            if entry is None or entry.revision != revision:
+                self._counts["misses"] += 1
+                return None
+
+            self._counts["hits"] += 1
+            if from_database:
+                self._counts["persisted_hits"] += 1
+            self._remember(key, entry)
+            return entry.values
+
+    def put(
+        self,
+        spreadsheet_id: str,
+        range_key: str,
+        revision: str,
+        values: List[List[Any]],
+        modified_time: Optional[str] = None
+    ) -> None:
+        """
+        儲存快取資料
+
+        Args:
+            spreadsheet_id: 試算表 ID
+            range_key: 讀取範圍
+            revision: 讀取時的 Drive 檔案版本
+            values: 範圍資料
+            modified_time: 讀取時的 Drive 檔案修改時間
+        """
+        with self._lock:
+            self._remember(
+                (spreadsheet_id, range_key),
+                CachedRange(revision=revision, values=values, modified_time=modified_time)
+            )
+            self._counts["stores"] += 1
+
+        if not self._persist:
+            return
+
+        db = self._open_session()
+        try:
+            upsert_rows(
+                db,
+                SheetContentCacheRecord.__table__,
+                [{
+                    "spreadsheet_id": spreadsheet_id,
+                    "range_key": range_key,
+                    "revision": revision,
+                    "modified_time": modified_time,
+                    "cell_values": values,
+                    "fetched_at": datetime.now(timezone.utc),
+                }],
+                conflict_columns=["spreadsheet_id", "range_key"],
+                update_columns=["revision", "modified_time", "cell_values", "fetched_at"]
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning("試算表內容快取寫入失敗", range_key=range_key, error=str(e))
+        finally:
+            db.close()
+
+    def invalidate(self, spreadsheet_id: Optional[str] = None) -> None:
+        """
+        清除快取
+
+        Args:
+            spreadsheet_id: 試算表 ID（空表示清除全部）
+        """
+        with self._lock:
+            if spreadsheet_id is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == spreadsheet_id]:
+                    del self._entries[key]
+
+        if not self._persist:
+            return
+
+        db = self._open_session()
+        try:
+            statement = delete(SheetContentCacheRecord)
+            if spreadsheet_id is not None:
+                statement = statement.where(SheetContentCacheRecord.spreadsheet_id == spreadsheet_id)
+            db.execute(statement)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning("試算表內容快取清除失敗", error=str(e))
+        finally:
+            db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        取得快取統計
+
+        Returns:
+            dict: hits, misses, hit_rate, persisted_hits, stores, entries
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            lookups = counts["hits"] + counts["misses"]
+            return {
+                "hits": counts["hits"],
+                "misses": counts["misses"],
+                "hit_rate": round(counts["hits"] / lookups, 3) if lookups else None,
+                "persisted_hits": counts["persisted_hits"],
+                "stores": counts["stores"],
+                "entries": len(self._entries),
+                "persist": self._persist,
+            }
+
+
+# 單例實例
+_cache_instance: Optional[SheetContentCache] = None
+
+
+def get_sheet_content_cache() -> SheetContentCache:
+    """取得試算表內容快取實例（單例）"""
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = SheetContentCache(
+            persist=get_settings().google_sheets_content_cache_persist
+        )
+    return _cache_instance
@@ -0,0 +1,326 @@
+"""
+班別代碼分類登錄表
+
+功能：
+- 一次推導班別字串的所有衍生資訊（班別類型、時間、延長工時、R班、請假、勤務代碼）
+- 以有上限的 LRU 快取，相同字串在同一程序內只推導一次
+- 供班表解析、差勤判定（全勤 / R班 / 延長工時）與行車時數計算共用
+
+數字儲存格（以 UNFORMATTED_VALUE 讀取時的 905、905.0）先正規化為班別字串「0905」。
+
+各欄位保留原本使用端的判定規則（例如班表解析只認半形括號，
+差勤判定會先正規化全形括號與空白），因此同一字串在不同用途的結果可能不同。
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from src.constants.attendance import (
+    LEAVE_PATTERNS as ATTENDANCE_LEAVE_PATTERNS,
+    NATIONAL_HOLIDAY_PATTERN,
+    OVERTIME_PATTERN as ATTENDANCE_OVERTIME_PATTERN,
+    R_SHIFT_PATTERN as ATTENDANCE_R_SHIFT_PATTERN,
+)
+
+
+# 快取的不同班別字串數上限（一個月約數百種）
+MAX_CACHED_CODES = 4096
+
+
+# ============================================================
+# 班表解析規則（ScheduleParser）
+# ============================================================
+
+# 班別時間對照表（班別代碼 -> (開始時間, 結束時間)）
+SHIFT_TIME_MAP = {
+    # 早班系列
+    "0500G": ("05:00", "13:30"),
+    "0530G": ("05:30", "14:00"),
+    "0600G": ("06:00", "14:30"),
+    "0630G": ("06:30", "15:00"),
+    "0700G": ("07:00", "15:30"),
+    "0730G": ("07:30", "16:00"),
+    "0800G": ("08:00", "16:30"),
+    # 中班系列
+    "0900G": ("09:00", "17:30"),
+    "0930G": ("09:30", "18:00"),
+    "1000G": ("10:00", "18:30"),
+    "1100G": ("11:00", "19:30"),
+    "1200G": ("12:00", "20:30"),
+    "1300G": ("13:00", "21:30"),
+    # 晚班系列
+    "1400G": ("14:00", "22:30"),
+    "1500G": ("15:00", "23:30"),
+    "1600G": ("16:00", "00:30"),
+    "1700G": ("17:00", "01:30"),
+    "1800G": ("18:00", "02:30"),
+}
+
+# 休假類型
+LEAVE_PATTERNS = ["(假)", "(特)", "(公)", "(婚)", "(喪)", "(病)", "(事)"]
+
+# 班別代碼正則
+SHIFT_CODE_PATTERN = re.compile(r"^(\d{4})([GDAR]?)$")
+
+# R班正則（R/0905G, R(國)/0905G）
+R_SHIFT_PATTERN = re.compile(r"^R(\(國\))?/(.+)$")
+
+# 延長工時正則（+1, +2, +3, +4）
+OVERTIME_PATTERN = re.compile(r"\(\+(\d)\)")
+
+# ============================================================
+# 差勤判定規則（Attendance*Detector）
+# ============================================================
+
+_attendance_r_shift_regex = re.compile(ATTENDANCE_R_SHIFT_PATTERN, re.IGNORECASE)
+_national_holiday_regex = re.compile(NATIONAL_HOLIDAY_PATTERN, re.IGNORECASE)
+_attendance_leave_regex = re.compile("|".join(ATTENDANCE_LEAVE_PATTERNS))
+_attendance_overtime_regex = re.compile(ATTENDANCE_OVERTIME_PATTERN)
+_whitespace_regex = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class ShiftCodeInfo:
+    """
+    班別字串的衍生資訊
+
+    Attributes:
+        raw: 原始字串
+        shift_type: 班別分類（早班/中班/晚班/R班/休假/其他）
+        start_time: 開始時間
+        end_time: 結束時間
+        overtime_hours: 延長工時（班表解析規則，僅半形括號）
+        is_r_shift: 是否為 R班（班表解析規則）
+        is_leave: 是否為休假（班表解析規則）
+        attendance_text: 差勤判定用正規化文字（移除所有空白）
+        is_attendance_r_shift: 是否為 R班（差勤判定規則）
+        is_national_holiday: 是否為國定假日 R班
+        has_attendance_leave: 是否含請假標記（差勤判定規則，含全形括號）
+        overtime_text: 延長工時判定用正規化文字（全形轉半形）
+        attendance_overtime_hours: 延長工時（差勤判定規則，含全形括號）
+        duty_code: 勤務代碼（移除 R 前綴與延長工時後綴，供行車時數查詢）
+        is_holiday_work: 是否為 R班出勤（行車時數規則）
+    """
+    raw: str
+    shift_type: str
+    start_time: Optional[str]
+    end_time: Optional[str]
+    overtime_hours: Optional[int]
+    is_r_shift: bool
+    is_leave: bool
+    attendance_text: str
+    is_attendance_r_shift: bool
+    is_national_holiday: bool
+    has_attendance_leave: bool
+    overtime_text: str
+    attendance_overtime_hours: Optional[int]
+    duty_code: str
+    is_holiday_work: bool
+
+
+def _classify_shift_type(shift_code: str) -> str:
+    """分類班別類型（早班/中班/晚班/R班/休假/其他）"""
+    # 檢查休假
+    for leave in LEAVE_PATTERNS:
+        if leave in shift_code:
+            return "休假"
+
+    # 檢查 R班
+    if shift_code.startswith("R/") or shift_code.startswith("R("):
+        return "R班"
+
+    # 解析時間判斷早中晚班
+    match = SHIFT_CODE_PATTERN.match(shift_code.replace("R/", "").replace("R(國)/", ""))
+    if match:
+        hour = int(match.group(1)[:2])
+
+        if 5 <= hour < 9:
+            return "早班"
+        elif 9 <= hour < 14:
+            return "中班"
+        elif 14 <= hour < 24:
+            return "晚班"
+
+    # 其他特殊班別（站、訓、借、支、測）
+    return "其他"
+
+
+def _parse_shift_time(shift_code: str) -> tuple[Optional[str], Optional[str]]:
+    """解析班別的開始和結束時間"""
+    # 移除 R/ 前綴
+    clean_code = shift_code
+    if clean_code.startswith("R/"):
+        clean_code = clean_code[2:]
+    elif clean_code.startswith("R(國)/"):
+        clean_code = clean_code[5:]
+
+    # 移除延長工時標記
+    clean_code = OVERTIME_PATTERN.sub("", clean_code)
+
+    # 查詢時間對照表
+    if clean_code in SHIFT_TIME_MAP:
+        return SHIFT_TIME_MAP[clean_code]
+
+    # 嘗試從代碼解析（預設工時 8.5 小時）
+    match = SHIFT_CODE_PATTERN.match(clean_code)
+    if match:
+        time_str = match.group(1)
+        hour = int(time_str[:2])
+        minute = int(time_str[2:])
+        start_time = f"{hour:02d}:{minute:02d}"
+        end_hour = (hour + 8) % 24
+        end_minute = (minute + 30) % 60
+        if minute + 30 >= 60:
+            end_hour = (end_hour + 1) % 24
+        return (start_time, f"{end_hour:02d}:{end_minute:02d}")
+
+    return (None, None)
+
+
+def _extract_duty_code(shift_code: str) -> str:
+    """提取勤務代碼（R/0905G → 0905G, 0905G(+2) → 0905G）"""
+    code = shift_code.strip()
+
+    # 移除 R/ 或 R(...)/ 前綴
+    if code.startswith("R/"):
+        code = code[2:]
+    elif code.startswith("R("):
+        idx = code.find(")/")
+        if idx != -1:
+            code = code[idx + 2:]
+
+    # 移除 (+N) 後綴
+    if "(" in code:
+        code = code.split("(")[0]
+
+    return code.strip().upper()
+
+
+def _is_holiday_work(shift_code: str) -> bool:
+    """判斷是否為 R班出勤（R/、R( 開頭或包含「R班」）"""
+    shift_upper = shift_code.strip().upper()
+    return shift_upper.startswith("R/") or shift_upper.startswith("R(") or "R班" in shift_code
+
+
+def normalize_shift_cell(value: Any) -> str:
+    """
+    將班表儲存格值轉為班別字串
+
+    數字儲存格（整數或整數值的浮點數）轉為整數字串，
+    可解讀為 HHMM 時間者補足 4 位（905 -> "0905"）；其他值直接轉為字串。
+
+    Args:
+        value: 儲存格值
+
+    Returns:
+        str: 班別字串（未去除前後空白）
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        if 0 < value < 2400 and value % 100 < 60:
+            return f"{value:04d}"
+        return str(value)
+    return str(value)
+
+
+def describe_shift_code(raw: str) -> ShiftCodeInfo:
+    """
+    推導班別字串的所有衍生資訊（不經過快取）
+
+    Args:
+        raw: 班別字串
+
+    Returns:
+        ShiftCodeInfo: 衍生資訊
+    """
+    start_time, end_time = _parse_shift_time(raw)
+    overtime_match = OVERTIME_PATTERN.search(raw)
+
+    attendance_text = _whitespace_regex.sub("", raw.strip())
+    leave_text = attendance_text.replace("（", "(").replace("）", ")")
+    overtime_text = raw.strip().replace("（", "(").replace("）", ")").replace("＋", "+")
+    attendance_overtime_match = _attendance_overtime_regex.search(overtime_text)
+
+    return ShiftCodeInfo(
+        raw=raw,
+        shift_type=_classify_shift_type(raw),
+        start_time=start_time,
+        end_time=end_time,
+        overtime_hours=int(overtime_match.group(1)) if overtime_match else None,
+        is_r_shift=raw.startswith("R/") or raw.startswith("R("),
+        is_leave=any(leave in raw for leave in LEAVE_PATTERNS),
+        attendance_text=attendance_text,
+        is_attendance_r_shift=bool(_attendance_r_shift_regex.match(attendance_text)),
+        is_national_holiday=bool(_national_holiday_regex.match(attendance_text)),
+        has_attendance_leave=bool(_attendance_leave_regex.search(leave_text)),
+        overtime_text=overtime_text,
+        attendance_overtime_hours=int(attendance_overtime_match.group(1)) if attendance_overtime_match else None,
+        duty_code=_extract_duty_code(raw),
+        is_holiday_work=_is_holiday_work(raw),
+    )
+
+
+class ShiftCodeRegistry:
+    """
+    班別代碼登錄表
+
+    以 LRU 快取 describe_shift_code 的結果，並提供命中統計。
+    """
+
+    def __init__(self, maxsize: int = MAX_CACHED_CODES):
+        self._lookup = lru_cache(maxsize=maxsize)(describe_shift_code)
+
+    def get(self, raw: Any) -> ShiftCodeInfo:
+        """
+        取得班別字串的衍生資訊
+
+        Args:
+            raw: 班別字串（非字串值先以 normalize_shift_cell 轉為字串）
+
+        Returns:
+            ShiftCodeInfo: 衍生資訊
+        """
+        return self._lookup(raw if isinstance(raw, str) else normalize_shift_cell(raw))
+
+    def clear(self) -> None:
+        """清除快取與統計"""
+        self._lookup.cache_clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        取得快取統計
+
+        Returns:
+            dict: hits, misses, hit_rate, size, maxsize
+        """
+        info = self._lookup.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": round(info.hits / lookups, 3) if lookups else None,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+        }
+
+
+# 單例實例
+_registry_instance: Optional[ShiftCodeRegistry] = None
+
+
+def get_shift_code_registry() -> ShiftCodeRegistry:
+    """取得班別代碼登錄表實例（單例）"""
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = ShiftCodeRegistry()
+    return _registry_instance
+
+
+def get_shift_code_info(raw: Any) -> ShiftCodeInfo:
+    """取得班別字串的衍生資訊（使用共用登錄表）"""
+    return get_shift_code_registry().get(raw)
@@ -0,0 +1,196 @@
+"""
+系統設定快取
+
+功能：
+- 以部門為單位載入不可變快照（部門設定 + global 設定，一次查詢），
+  get_value / get_department_config 等讀取不需查詢資料庫
+- 部門設定優先於 global 設定；部門設定值為 None 時採用 global（與 get_value 規則相同）
+- 快照依內容計算 ETag，供設定 API 條件式 GET 使用
+- 失效：SystemSettingService 寫入提交後遞增版本；另以存活秒數涵蓋其他程序的寫入
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from ..config.settings import get_settings
+from ..models.system_setting import DepartmentScope, SystemSetting
+from ..utils.versioned_cache import VersionedCache, singleton
+
+
+# 可快取的部門範圍（API 傳入的其他部門名稱每次皆查詢，避免快取項目無上限成長）
+CACHEABLE_SCOPES = frozenset([None, *(scope.value for scope in DepartmentScope)])
+
+
+@dataclass(frozen=True)
+class SettingEntry:
+    """
+    系統設定快照項目（與 Session 無關，可跨執行緒共用）
+
+    Attributes:
+        value: 設定值
+        department: 設定所屬部門範圍（部門或 global）
+        description: 設定說明
+    """
+    value: Optional[str]
+    department: Optional[str]
+    description: Optional[str]
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """
+    部門系統設定快照
+
+    Attributes:
+        department: 部門範圍（None 表示未指定部門的設定）
+        entries: 鍵名 -> 設定項目（已套用部門優先規則）
+        etag: 依內容計算的 ETag
+    """
+    department: Optional[str]
+    entries: Mapping[str, SettingEntry] = field(default_factory=dict)
+    etag: str = ""
+
+    def get_value(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """取得設定值（不存在或值為 None 時回傳預設值）"""
+        entry = self.entries.get(key)
+        if entry is None or entry.value is None:
+            return default
+        return entry.value
+
+    def as_config(self) -> dict[str, dict]:
+        """
+        轉換為部門配置字典（get_department_config 格式）
+
+        Returns:
+            dict: 鍵名 -> {value, department, description}
+        """
+        return {
+            key: {
+                "value": entry.value,
+                "department": entry.department,
+                "description": entry.description,
+            }
+            for key, entry in self.entries.items()
+        }
+
+
+def build_snapshot(
+    department: Optional[str],
+    rows: list[tuple[str, Optional[str], Optional[str], Optional[str]]]
+) -> SettingsSnapshot:
+    """
+    由設定資料列建立快照
+
+    Args:
+        department: 部門範圍
+        rows: (key, value, department, description) 列表
+
+    Returns:
+        SettingsSnapshot: 快照
+    """
+    global_scope = DepartmentScope.GLOBAL.value
+    entries: dict[str, SettingEntry] = {}
+
+    # global 先寫入，再由部門設定覆蓋（部門設定值為 None 時保留 global）
+    for key, value, row_department, description in sorted(
+        rows, key=lambda row: (row[2] != global_scope, row[0])
+    ):
+        entry = SettingEntry(value=value, department=row_department, description=description)
+        existing = entries.get(key)
+        if existing is None or value is not None or existing.value is None:
+            entries[key] = entry
+
+    entries = dict(sorted(entries.items()))
+    digest = hashlib.sha256(json.dumps(
+        [department, [(key, entry.value, entry.department, entry.description) for key, entry in entries.items()]],
+        ensure_ascii=False
+    ).encode("utf-8")).hexdigest()[:32]
+
+    return SettingsSnapshot(
+        department=department,
+        entries=MappingProxyType(entries),
+        etag=f'"{digest}"',
+    )
+
+
+def _load_snapshot(db: Session, department: Optional[str]) -> SettingsSnapshot:
+    """由資料庫載入部門設定與 global 設定（一次查詢）"""
+    scope = (
+        SystemSetting.department.is_(None)
+        if department is None
+        else SystemSetting.department == department
+    )
+    rows = db.execute(
+        select(
+            SystemSetting.key,
+            SystemSetting.value,
+            SystemSetting.department,
+            SystemSetting.description
+        )
+        .where(or_(scope, SystemSetting.department == DepartmentScope.GLOBAL.value))
+    ).all()
+    return build_snapshot(department, [tuple(row) for row in rows])
+
+
+def _ttl_seconds() -> int:
+    """快照存活秒數"""
+    return get_settings().system_settings_cache_ttl_seconds
+
+
+class SystemSettingCache(VersionedCache[Optional[str], SettingsSnapshot]):
+    """
+    系統設定快取（讀取穿透）
+
+    快照版本與快取版本不一致或超過存活秒數時，以呼叫端的 Session 重新載入。
+    存活秒數為 0 時停用快取（每次讀取皆查詢資料庫）。
+    """
+
+    def __init__(self):
+        super().__init__(
+            _load_snapshot,
+            size=lambda snapshot: len(snapshot.entries),
+            ttl_seconds=_ttl_seconds,
+            cacheable=CACHEABLE_SCOPES.__contains__,
+        )
+
+    def snapshot(self, db: Session, department: Optional[str]) -> SettingsSnapshot:
+        """
+        取得部門最新快照（過期時重新載入）
+
+        Args:
+            db: 資料庫 Session（僅在需要重新載入時使用）
+            department: 部門範圍（淡海、安坑、global 或 None）
+
+        Returns:
+            SettingsSnapshot: 快照
+        """
+        return self.get(db, department)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        取得快取統計
+
+        Returns:
+            dict: version, departments（部門 -> loaded_version, size）, loads, hits, misses,
+                  hit_rate, ttl_seconds
+        """
+        stats = super().get_stats()
+        departments = {department or "none": entry for department, entry in stats.pop("entries").items()}
+        return {
+            "version": stats.pop("version"),
+            "departments": departments,
+            **stats,
+            "ttl_seconds": _ttl_seconds(),
+        }
+
+
+@singleton
+def get_system_setting_cache() -> SystemSettingCache:
+    """取得系統設定快取實例（單例）"""
+    return SystemSettingCache()
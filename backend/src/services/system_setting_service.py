@@ -1,6 +1,8 @@
 """
 SystemSettingService 系統設定服務
 對應 tasks.md T036: 實作 SystemSettingService
+
+設定值讀取由系統設定快取（部門快照）提供，所有寫入提交後使快取失效。
 """
 
 from typing import Optional
@@ -10,6 +12,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.models.system_setting import DepartmentScope, SettingKeys, SystemSetting
+from src.services.system_setting_cache import SettingsSnapshot, get_system_setting_cache
 
 
 class SystemSettingServiceError(Exception):
@@ -78,7 +81,7 @@ class SystemSettingService:
 
         try:
             self.db.add(setting)
-            self.db.commit()
+            self._commit_changes()
             self.db.refresh(setting)
             return setting
         except IntegrityError:
@@ -139,6 +142,8 @@ class SystemSettingService:
         2. global 設定
         3. 預設值
 
+        由系統設定快取提供，快照有效期間不查詢資料庫。
+
         Args:
             key: 設定鍵名
             department: 部門範圍
@@ -147,18 +152,7 @@ class SystemSettingService:
         Returns:
             設定值或預設值
         """
-        # 先查詢指定部門
-        setting = self.get_by_key(key, department)
-        if setting and setting.value is not None:
-            return setting.value
-
-        # 再查詢 global
-        if department != DepartmentScope.GLOBAL.value:
-            setting = self.get_by_key(key, DepartmentScope.GLOBAL.value)
-            if setting and setting.value is not None:
-                return setting.value
-
-        return default
+        return self.get_snapshot(department).get_value(key, default)
 
     def update(
         self,
@@ -189,7 +183,7 @@ class SystemSettingService:
         if description is not None:
             setting.description = description
 
-        self.db.commit()
+        self._commit_changes()
         self.db.refresh(setting)
         return setting
 
@@ -219,7 +213,7 @@ class SystemSettingService:
                 setting.value = value
             if description is not None:
                 setting.description = description
-            self.db.commit()
+            self._commit_changes()
             self.db.refresh(setting)
             return setting
         else:
@@ -243,7 +237,7 @@ class SystemSettingService:
             raise SettingNotFoundError(f"設定 ID {setting_id} 不存在")
 
         self.db.delete(setting)
-        self.db.commit()
+        self._commit_changes()
         return True
 
     # ============================================================
@@ -376,20 +370,33 @@ class SystemSettingService:
         """
         取得部門完整配置
 
+        部門設定優先於同鍵名的 global 設定。
+
         Args:
             department: 部門名稱
 
         Returns:
             dict: 部門配置字典
         """
-        settings = self.list_by_department(department, include_global=True)
+        return self.get_snapshot(department).as_config()
+
+    def get_snapshot(self, department: Optional[str] = None) -> SettingsSnapshot:
+        """
+        取得部門系統設定快照（部門設定 + global 設定）
+
+        Args:
+            department: 部門範圍（淡海、安坑、global 或 None）
 
-        config = {}
-        for setting in settings:
-            config[setting.key] = {
-                "value": setting.value,
-                "department": setting.department,
-                "description": setting.description
-            }
+        Returns:
+            SettingsSnapshot: 不可變快照
+        """
+        return get_system_setting_cache().snapshot(self.db, department)
 
-        return config
+    # ============================================================
+    # 輔助方法
+    # ============================================================
+
+    def _commit_changes(self) -> None:
+        """提交變更並使系統設定快取失效"""
+        self.db.commit()
+        get_system_setting_cache().invalidate()
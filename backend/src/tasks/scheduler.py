@@ -8,6 +8,7 @@
 - 註冊班表同步定時任務（每日凌晨 2:00）
 - 註冊勤務表同步定時任務（每日凌晨 2:30）
 - 註冊駕駛競賽排名計算任務（每季首日凌晨 3:00）
+- 註冊月度獎勵重算佇列處理任務（固定間隔）
 - 提供任務管理介面
 """
 
@@ -17,6 +18,7 @@ from typing import Optional, List
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.executors.pool import ThreadPoolExecutor
 from pytz import timezone as pytz_timezone
 
@@ -35,6 +37,7 @@ class TaskScheduler:
     - 班表同步（每日凌晨 2:00）
     - 勤務表同步（每日凌晨 2:30）
     - 駕駛競賽排名計算（每季首日凌晨 3:00，季度制）
+    - 月度獎勵重算佇列處理（每 monthly_reward_recheck_interval_seconds 秒）
     """
 
     def __init__(self):
@@ -88,10 +91,10 @@ class TaskScheduler:
     def _get_db_context(self):
         """
         提供給排程任務使用的資料庫 Context Manager
-        確保 Session 正確開啟與關閉
+        確保 Session 正確開啟與關閉（使用背景任務連線池）
         """
-        from src.config.database import SyncSessionLocal
-        db = SyncSessionLocal()
+        from src.config.database import BackgroundSessionLocal
+        db = BackgroundSessionLocal()
         try:
             yield db
         except Exception as e:
@@ -135,6 +138,18 @@ class TaskScheduler:
         )
         logger.info("已註冊定時任務: competition_ranking_quarterly (每季首日 03:00)")
 
+        # 註冊月度獎勵重算佇列處理任務（考核記錄變更後延遲合併重算）
+        if self._settings.monthly_reward_recheck_deferred:
+            interval = self._settings.monthly_reward_recheck_interval_seconds
+            self._scheduler.add_job(
+                func=self.run_monthly_reward_recheck,
+                trigger=IntervalTrigger(seconds=interval),
+                id="monthly_reward_recheck",
+                name="月度獎勵重算佇列處理",
+                replace_existing=True
+            )
+            logger.info(f"已註冊定時任務: monthly_reward_recheck (每 {interval} 秒)")
+
     def _schedule_sync_job(self):
         """
         班表同步任務
@@ -271,6 +286,28 @@ class TaskScheduler:
         except Exception as e:
             logger.error("定時駕駛競賽排名計算例外", error=str(e))
 
+    def run_monthly_reward_recheck(self):
+        """
+        月度獎勵重算佇列處理任務
+
+        取出考核記錄變更登記的員工月份，依 (年, 月) 分組批次重算月度獎勵。
+        """
+        try:
+            from src.services.monthly_reward_recheck_queue import MonthlyRewardRecheckQueue
+
+            with self._get_db_context() as db:
+                result = MonthlyRewardRecheckQueue(db).drain_all()
+
+            if result["drained"]:
+                logger.info(
+                    "月度獎勵重算佇列處理完成",
+                    drained=result["drained"],
+                    batches=result["batches"]
+                )
+
+        except Exception as e:
+            logger.error("月度獎勵重算佇列處理例外", error=str(e))
+
     def start(self):
         """
         啟動排程器
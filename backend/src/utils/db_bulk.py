@@ -0,0 +1,188 @@
+"""
+批次 SQL 工具
+
+提供以 SQLAlchemy Core 執行的多列 INSERT / UPSERT 工具，
+避免 ORM 逐筆 add/flush 造成大量 TiDB 往返。
+
+功能：
+- chunked: 將資料切分為固定大小的批次
+- insert_rows: 多列 INSERT（multi-VALUES）
+- update_rows: 多列 UPDATE（SET col = CASE key WHEN ... END）
+- upsert_rows: 多列 UPSERT（MySQL/TiDB: ON DUPLICATE KEY UPDATE，
+  SQLite: ON CONFLICT DO UPDATE，供單元測試使用）
+"""
+
+from typing import Any, Iterable, Iterator, Sequence
+
+from sqlalchemy import Table, case, func, insert, update
+from sqlalchemy.orm import Session
+
+# 預設批次大小（避免單一語句超過 TiDB max_allowed_packet）
+DEFAULT_CHUNK_SIZE = 500
+
+
+def chunked(items: Iterable[Any], size: int = DEFAULT_CHUNK_SIZE) -> Iterator[list]:
+    """
+    將資料切分為固定大小的批次
+
+    Args:
+        items: 任意可迭代資料
+        size: 批次大小
+
+    Yields:
+        list: 每批資料
+    """
+    if size <= 0:
+        raise ValueError("批次大小必須大於 0")
+
+    batch: list = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def insert_rows(
+    db: Session,
+    table: Table,
+    rows: Sequence[dict],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """
+    多列 INSERT（不提交，由外層控制 Transaction）
+
+    每個批次產生一條 INSERT ... VALUES (...), (...) 語句。
+
+    Args:
+        db: 資料庫會話
+        table: 目標資料表（如 Schedule.__table__）
+        rows: 欄位字典列表
+        chunk_size: 每批列數
+
+    Returns:
+        int: 寫入列數
+    """
+    inserted = 0
+    for chunk in chunked(rows, chunk_size):
+        db.execute(insert(table).values(chunk))
+        inserted += len(chunk)
+    return inserted
+
+
+def update_rows(
+    db: Session,
+    table: Table,
+    rows: Sequence[dict],
+    key_column: str = "id",
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """
+    多列 UPDATE（不提交，由外層控制 Transaction）
+
+    每個批次產生一條
+    UPDATE ... SET col = CASE key WHEN ... THEN ... END WHERE key IN (...)
+    語句，讓每列寫入不同值而不需逐列往返。同一批次的欄位以第一列為準。
+
+    Args:
+        db: 資料庫會話
+        table: 目標資料表
+        rows: 欄位字典列表（須包含 key_column）
+        key_column: 用來比對資料列的鍵欄位
+        chunk_size: 每批列數
+
+    Returns:
+        int: 處理列數
+    """
+    key = table.c[key_column]
+
+    updated = 0
+    for chunk in chunked(rows, chunk_size):
+        columns = [col for col in chunk[0] if col != key_column]
+        values = {
+            col: case(
+                {row[key_column]: row[col] for row in chunk},
+                value=key,
+                else_=table.c[col]
+            )
+            for col in columns
+        }
+        db.execute(
+            update(table)
+            .where(key.in_([row[key_column] for row in chunk]))
+            .values(values)
+        )
+        updated += len(chunk)
+    return updated
+
+
+def upsert_rows(
+    db: Session,
+    table: Table,
+    rows: Sequence[dict],
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    increment_columns: Sequence[str] = ()
+) -> int:
+    """
+    多列 UPSERT（不提交，由外層控制 Transaction）
+
+    依資料庫方言產生對應語法：
+    - MySQL / TiDB: INSERT ... ON DUPLICATE KEY UPDATE
+    - SQLite / PostgreSQL: INSERT ... ON CONFLICT (...) DO UPDATE
+
+    若資料表有 updated_at 欄位，衝突更新時會一併刷新。
+    increment_columns 於衝突時以「現值 + 新值」更新，由資料庫在同一語句內完成，
+    多個 Transaction 同時累加同一列不會遺失更新。
+
+    Args:
+        db: 資料庫會話
+        table: 目標資料表
+        rows: 欄位字典列表
+        conflict_columns: 唯一鍵欄位（MySQL 依資料表唯一約束判斷，僅供其他方言使用）
+        update_columns: 衝突時要更新的欄位
+        chunk_size: 每批列數
+        increment_columns: 衝突時要累加的欄位
+
+    Returns:
+        int: 處理列數
+    """
+    dialect = db.get_bind().dialect.name
+    touch_updated_at = "updated_at" in table.c and "updated_at" not in update_columns
+
+    written = 0
+    for chunk in chunked(rows, chunk_size):
+        if dialect == "mysql":
+            from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+            stmt = mysql_insert(table).values(chunk)
+            set_ = {col: stmt.inserted[col] for col in update_columns}
+            set_.update({col: table.c[col] + stmt.inserted[col] for col in increment_columns})
+            if touch_updated_at:
+                set_["updated_at"] = func.now()
+            stmt = stmt.on_duplicate_key_update(set_)
+        elif dialect in ("sqlite", "postgresql"):
+            if dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+            stmt = dialect_insert(table).values(chunk)
+            set_ = {col: stmt.excluded[col] for col in update_columns}
+            set_.update({col: table.c[col] + stmt.excluded[col] for col in increment_columns})
+            if touch_updated_at:
+                set_["updated_at"] = func.now()
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(conflict_columns),
+                set_=set_
+            )
+        else:
+            raise NotImplementedError(f"不支援的資料庫方言: {dialect}")
+
+        db.execute(stmt)
+        written += len(chunk)
+
+    return written
@@ -0,0 +1,82 @@
+"""
+期間篩選工具
+
+將年度 / 季度 / 月份轉換為半開區間 [起始日, 下期起始日) 的日期範圍條件。
+
+extract('year', column) == year 會對每一列套用函數，使
+(employee_id, record_date) 這類複合索引只能比對 employee_id，
+TiDB 需掃描該員工所有歷史記錄；改用日期範圍後可直接做索引範圍掃描。
+
+功能：
+- period_bounds: 取得期間的起訖日期（結束日不含）
+- in_period: 產生 column >= 起始日 AND column < 結束日 的條件
+"""
+
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import and_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def period_bounds(
+    year: int,
+    quarter: Optional[int] = None,
+    month: Optional[int] = None
+) -> tuple[date, date]:
+    """
+    取得期間的半開區間日期範圍
+
+    Args:
+        year: 年度
+        quarter: 季度 (1-4)，與 month 擇一
+        month: 月份 (1-12)，與 quarter 擇一
+
+    Returns:
+        tuple: (起始日, 下期起始日)
+
+    Raises:
+        ValueError: 同時指定季度與月份，或季度 / 月份超出範圍
+    """
+    if quarter is not None and month is not None:
+        raise ValueError("quarter 與 month 不可同時指定")
+
+    if quarter is not None:
+        if not 1 <= quarter <= 4:
+            raise ValueError(f"季度必須介於 1-4：{quarter}")
+        start_month, months = (quarter - 1) * 3 + 1, 3
+    elif month is not None:
+        if not 1 <= month <= 12:
+            raise ValueError(f"月份必須介於 1-12：{month}")
+        start_month, months = month, 1
+    else:
+        start_month, months = 1, 12
+
+    end_year, end_month = divmod(start_month - 1 + months, 12)
+    return date(year, start_month, 1), date(year + end_year, end_month + 1, 1)
+
+
+def in_period(
+    column,
+    year: int,
+    quarter: Optional[int] = None,
+    month: Optional[int] = None
+) -> ColumnElement[bool]:
+    """
+    產生可使用索引的期間篩選條件
+
+    範例：
+        in_period(AssessmentRecord.record_date, 2026, month=3)
+        → record_date >= '2026-03-01' AND record_date < '2026-04-01'
+
+    Args:
+        column: 日期欄位
+        year: 年度
+        quarter: 季度 (1-4)
+        month: 月份 (1-12)
+
+    Returns:
+        ColumnElement: 篩選條件
+    """
+    start_date, end_date = period_bounds(year, quarter=quarter, month=month)
+    return and_(column >= start_date, column < end_date)
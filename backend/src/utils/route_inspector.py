@@ -0,0 +1,126 @@
+"""
+路由 Event Loop 安全檢查
+
+使用同步 Session（Depends(get_db)）的路由必須宣告為 def，
+FastAPI 才會放入 ThreadPool 執行；宣告為 async def 時，pymysql 的阻塞 I/O
+會直接在 Event Loop 上執行，單一慢查詢即會拖住所有並行請求。
+
+功能：
+- find_blocking_async_routes: 找出以 async def 宣告且依賴同步 Session 的路由
+- report_blocking_async_routes: 啟動時記錄警告
+- offloads_blocking_io: 標記已自行以 run_in_threadpool 執行資料庫操作的 async 路由
+  （例如需 await 非同步 HTTP 呼叫的 OAuth 端點），檢查時略過
+"""
+
+import inspect
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, TypeVar
+
+from fastapi import FastAPI
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+
+from src.utils.logger import logger
+
+
+F = TypeVar("F", bound=Callable)
+
+# 標記屬性名稱
+_OFFLOADS_ATTR = "__offloads_blocking_io__"
+
+
+@dataclass(frozen=True)
+class BlockingRoute:
+    """
+    阻塞 Event Loop 的路由
+
+    Attributes:
+        path: 路由路徑
+        methods: HTTP 方法
+        endpoint: 處理函數（module.qualname）
+    """
+    path: str
+    methods: tuple[str, ...]
+    endpoint: str
+
+    def __str__(self) -> str:
+        return f"{','.join(self.methods)} {self.path} ({self.endpoint})"
+
+
+def offloads_blocking_io(func: F) -> F:
+    """
+    標記 async 路由已自行將同步 Session 操作放入 ThreadPool
+
+    僅用於必須 await 非同步 I/O 的路由；其餘路由應直接宣告為 def。
+    """
+    setattr(func, _OFFLOADS_ATTR, True)
+    return func
+
+
+def _default_blocking_dependencies() -> tuple[Callable, ...]:
+    """預設的同步資源依賴（延遲匯入，避免匯入時建立資料庫引擎）"""
+    from src.config.database import get_db
+
+    return (get_db,)
+
+
+def _depends_on(dependant: Dependant, calls: tuple[Callable, ...]) -> bool:
+    """依賴樹中是否包含指定的依賴函數"""
+    return any(
+        sub.call in calls or _depends_on(sub, calls)
+        for sub in dependant.dependencies
+    )
+
+
+def find_blocking_async_routes(
+    app: FastAPI,
+    blocking_dependencies: Optional[Iterable[Callable]] = None
+) -> list[BlockingRoute]:
+    """
+    找出以 async def 宣告且依賴同步資源的路由
+
+    Args:
+        app: FastAPI 應用程式
+        blocking_dependencies: 視為阻塞的依賴函數（預設 get_db）
+
+    Returns:
+        list[BlockingRoute]: 阻塞 Event Loop 的路由
+    """
+    calls = tuple(blocking_dependencies or _default_blocking_dependencies())
+    offenders = []
+
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+
+        endpoint = route.endpoint
+        if not inspect.iscoroutinefunction(endpoint) or getattr(endpoint, _OFFLOADS_ATTR, False):
+            continue
+
+        if _depends_on(route.dependant, calls):
+            offenders.append(BlockingRoute(
+                path=route.path,
+                methods=tuple(sorted(route.methods or ())),
+                endpoint=f"{endpoint.__module__}.{endpoint.__qualname__}"
+            ))
+
+    return offenders
+
+
+def report_blocking_async_routes(app: FastAPI) -> list[BlockingRoute]:
+    """
+    啟動時檢查並記錄阻塞 Event Loop 的路由
+
+    Args:
+        app: FastAPI 應用程式
+
+    Returns:
+        list[BlockingRoute]: 阻塞 Event Loop 的路由
+    """
+    offenders = find_blocking_async_routes(app)
+    for route in offenders:
+        logger.warning(
+            "async 路由使用同步 Session，會阻塞 Event Loop（請改為 def）",
+            route=str(route)
+        )
+    return offenders
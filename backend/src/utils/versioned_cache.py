@@ -0,0 +1,192 @@
+"""
+版本號失效的行程內快取
+
+登錄表類快取（考核標準、勤務分鐘數、系統設定）共用的載入與失效規則：
+- 依鍵保存載入結果，取用時版本一致（且未超過存活秒數）即直接回傳，不查詢資料庫
+- 資料變更提交後呼叫 invalidate() 遞增版本，下次取用時以呼叫端的 Session 重新載入
+- 載入期間若版本再次遞增，結果仍標記為載入前的版本，下次取用時會重新載入
+
+版本號僅在本程序內有效（部署為單一 worker），其他程序的寫入需以存活秒數涵蓋。
+
+功能：
+- VersionedCache: 版本號失效的讀取穿透快取
+- singleton: 將實例建立函數轉為單例取得函數
+"""
+
+import functools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+
+from sqlalchemy.orm import Session
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CacheEntry(Generic[V]):
+    """
+    快取項目
+
+    Attributes:
+        version: 載入時的快取版本
+        loaded_at: 載入時間（time.monotonic）
+        value: 載入結果（與 Session 無關，可跨執行緒共用）
+    """
+    version: int
+    loaded_at: float
+    value: V
+
+
+class VersionedCache(Generic[K, V]):
+    """
+    版本號失效的讀取穿透快取
+
+    Args:
+        loader: 載入函數 (db, key) -> value（一次查詢）
+        size: 計算項目大小的函數（統計用）
+        ttl_seconds: 取得存活秒數的函數（None 表示不過期；回傳 0 時停用快取）
+        cacheable: 判斷鍵是否保存的函數（None 表示全部保存）
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[Session, K], V],
+        size: Callable[[V], int] = len,
+        ttl_seconds: Optional[Callable[[], float]] = None,
+        cacheable: Optional[Callable[[K], bool]] = None
+    ):
+        self._loader = loader
+        self._size = size
+        self._ttl_seconds = ttl_seconds
+        self._cacheable = cacheable
+        self._lock = threading.Lock()
+        self._version = 0
+        self._entries: dict[K, CacheEntry[V]] = {}
+        self._counts = {"loads": 0, "hits": 0, "misses": 0}
+
+    @property
+    def version(self) -> int:
+        """目前版本"""
+        return self._version
+
+    def get(self, db: Session, key: K = None) -> V:
+        """
+        取得最新的載入結果（過期時重新載入）
+
+        Args:
+            db: 資料庫 Session（僅在需要重新載入時使用）
+            key: 快取鍵
+
+        Returns:
+            載入結果
+        """
+        value = self.current(key)
+        counter = "hits" if value is not None else "misses"
+        with self._lock:
+            self._counts[counter] += 1
+
+        if value is not None:
+            return value
+        return self.load(db, key)
+
+    def current(self, key: K = None) -> Optional[V]:
+        """
+        取得目前的載入結果（未載入或已過期時回傳 None，不查詢資料庫）
+
+        Args:
+            key: 快取鍵
+
+        Returns:
+            載入結果或 None
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.version != self._version:
+            return None
+        if self._ttl_seconds is not None and time.monotonic() - entry.loaded_at >= self._ttl_seconds():
+            return None
+        return entry.value
+
+    def load(self, db: Session, key: K = None) -> V:
+        """
+        由資料庫載入並保存結果
+
+        Args:
+            db: 資料庫 Session
+            key: 快取鍵
+
+        Returns:
+            載入結果
+        """
+        version = self._version
+        value = self._loader(db, key)
+
+        with self._lock:
+            self._counts["loads"] += 1
+            entry = self._entries.get(key)
+            if (self._cacheable is None or self._cacheable(key)) and (entry is None or entry.version <= version):
+                self._entries[key] = CacheEntry(version=version, loaded_at=time.monotonic(), value=value)
+        return value
+
+    def invalidate(self) -> int:
+        """
+        遞增版本，使所有項目失效（應於資料變更提交後呼叫）
+
+        Returns:
+            新版本號
+        """
+        with self._lock:
+            self._version += 1
+            return self._version
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        取得快取統計
+
+        Returns:
+            dict: version, entries（鍵 -> loaded_version, size）, loads, hits, misses, hit_rate
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            entries = list(self._entries.items())
+
+        lookups = counts["hits"] + counts["misses"]
+        return {
+            "version": self._version,
+            "entries": {
+                key: {"loaded_version": entry.version, "size": self._size(entry.value)}
+                for key, entry in entries
+            },
+            "loads": counts["loads"],
+            "hits": counts["hits"],
+            "misses": counts["misses"],
+            "hit_rate": round(counts["hits"] / lookups, 3) if lookups else None,
+        }
+
+
+def singleton(factory: Callable[[], T]) -> Callable[[], T]:
+    """
+    將實例建立函數轉為單例取得函數（首次呼叫時建立）
+
+    Args:
+        factory: 實例建立函數
+
+    Returns:
+        單例取得函數
+    """
+    lock = threading.Lock()
+    instance: list[T] = []
+
+    @functools.wraps(factory)
+    def _get() -> T:
+        if not instance:
+            with lock:
+                if not instance:
+                    instance.append(factory())
+        return instance[0]
+
+    return _get
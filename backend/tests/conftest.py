@@ -55,6 +55,22 @@ def sample_service_account():
     }
 
 
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """
+    每個測試使用獨立的資料庫，使行程內的登錄表與快取失效
+    """
+    from src.services.assessment_standard_registry import get_assessment_standard_registry
+    from src.services.route_minutes_registry import get_route_minutes_registry
+    from src.services.schedule_statistics_service import get_schedule_statistics_cache
+    from src.services.system_setting_cache import get_system_setting_cache
+
+    get_assessment_standard_registry().invalidate()
+    get_route_minutes_registry().invalidate()
+    get_system_setting_cache().invalidate()
+    get_schedule_statistics_cache().invalidate()
+
+
 @pytest.fixture
 def db_session():
     """
@@ -85,6 +101,77 @@ def db_session():
     session.close()
 
 
+@pytest.fixture
+def make_session():
+    """
+    建立獨立的 SQLite 記憶體資料庫
+
+    make_session(seed) 建立資料表並以 seed(session) 寫入測試資料，
+    回傳 (session, seed 的回傳值)；測試結束時關閉所有 session。
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from src.models.base import Base
+
+    sessions = []
+
+    def _make(seed):
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine, autocommit=False, autoflush=False)()
+        sessions.append(session)
+        return session, seed(session)
+
+    yield _make
+
+    for session in sessions:
+        engine = session.get_bind()
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def capture_statements(request):
+    """
+    記錄 SQL 語句
+
+    capture_statements(kind, table, bind, parameters) 回傳之後執行且符合條件的語句列表：
+    - kind: 語句類型（首個關鍵字，可傳 tuple；None 表示不限），預設 "SELECT"
+    - table: 僅記錄涉及該資料表的語句
+    - bind: 監聽的 Engine 或 Session，預設為 db_session
+    - parameters: 為 True 時記錄 (語句, 參數)
+    """
+    import re
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    listeners = []
+
+    def _capture(kind="SELECT", table=None, bind=None, parameters=False):
+        if bind is None:
+            bind = request.getfixturevalue("db_session")
+        engine = bind.get_bind() if isinstance(bind, Session) else bind
+        kinds = (kind,) if isinstance(kind, str) else kind
+        table_pattern = re.compile(rf"\b{re.escape(table)}\b") if table else None
+        statements = []
+
+        def _before_execute(conn, cursor, statement, params, context, executemany):
+            if kinds is not None and not statement.lstrip().upper().startswith(kinds):
+                return
+            if table_pattern is not None and not table_pattern.search(statement):
+                return
+            statements.append((statement, params) if parameters else statement)
+
+        event.listen(engine, "before_cursor_execute", _before_execute)
+        listeners.append((engine, _before_execute))
+        return statements
+
+    yield _capture
+
+    for engine, listener in listeners:
+        event.remove(engine, "before_cursor_execute", listener)
+
+
 @pytest.fixture
 def client(db_session):
     """
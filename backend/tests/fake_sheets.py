@@ -0,0 +1,180 @@
+"""
+離線 Google Sheets 傳輸
+
+模擬 Sheets API v4 的 HTTP 回應，供單元測試與效能基準測試使用，
+不需網路連線或真實的 Service Account。
+
+支援的請求：
+- GET spreadsheets/{id}                  → 試算表與分頁資訊
+- GET spreadsheets/{id}/values/{range}   → 單一範圍資料
+- GET spreadsheets/{id}/values:batchGet  → 多個範圍資料
+- GET drive/v3/files/{id}                → 檔案版本（version, modifiedTime）
+"""
+
+import base64
+import json
+import random
+import threading
+import time
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, unquote, urlparse
+
+import httplib2
+
+
+def make_service_account_json() -> str:
+    """
+    產生測試用 Service Account JSON（Base64 編碼，含可解析的 RSA 私鑰）
+    """
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    ).decode("utf-8")
+
+    info = {
+        "type": "service_account",
+        "project_id": "fake-project",
+        "private_key_id": "fake-key",
+        "private_key": pem,
+        "client_email": "fake@fake-project.iam.gserviceaccount.com",
+        "client_id": "0",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    }
+    return base64.b64encode(json.dumps(info).encode("utf-8")).decode("ascii")
+
+
+def make_schedule_grid(employee_count: int, days: int = 31, seed: int = 0) -> List[List[Any]]:
+    """
+    產生合成的月班表分頁資料
+
+    包含標題列、表頭列與員工列；班別涵蓋一般班、R班、國定假日 R班、
+    延長工時、各類休假、特殊班別、空白與前後空白，並隨機截短部分列。
+
+    Args:
+        employee_count: 員工數
+        days: 日期欄位數
+        seed: 亂數種子
+
+    Returns:
+        list: 試算表資料（二維陣列）
+    """
+    rng = random.Random(seed)
+    base_codes = [f"{hour:02d}{minute:02d}{suffix}"
+                  for hour in range(5, 24) for minute in (0, 5, 30, 35) for suffix in ("G", "D", "")]
+    codes = (
+        base_codes
+        + [f"R/{code}" for code in base_codes[::4]]
+        + [f"R(國)/{code}" for code in base_codes[::8]]
+        + [f"{code}(+{hours})" for code in base_codes[::6] for hours in (1, 2)]
+        + ["(假)", "(特)", "(公)", "(病)", "(事)", "站", "訓", "借", "支", "0600G(假)"]
+    )
+
+    rows: List[List[Any]] = [["2026年1月 班表"], ["編號", "姓名"] + [str(day) for day in range(1, days + 1)]]
+    for i in range(employee_count):
+        cells: List[Any] = []
+        for _ in range(days):
+            roll = rng.random()
+            if roll < 0.1:
+                cells.append("")
+            elif roll < 0.12:
+                cells.append(f" {rng.choice(codes)} ")
+            else:
+                cells.append(rng.choice(codes))
+        if i % 50 == 7:
+            cells = cells[:rng.randrange(days)]
+        rows.append([f"1140M{i:04d}", f"員工{i}"] + cells)
+        if i % 100 == 42:
+            rows.append([])
+            rows.append(["", "備註"])
+    return rows
+
+
+class FakeSheetsHttp:
+    """
+    假的 httplib2.Http，依試算表內容回應 Sheets API 請求
+
+    Args:
+        spreadsheets: {spreadsheet_id: {sheet_title: [[cell, ...], ...]}}
+        latency: 每個請求模擬的網路延遲（秒）
+    """
+
+    def __init__(self, spreadsheets: Dict[str, Dict[str, List[List[Any]]]], latency: float = 0.0):
+        self.spreadsheets = spreadsheets
+        self.latency = latency
+        self.requests: List[str] = []
+        self.versions: Dict[str, int] = {spreadsheet_id: 1 for spreadsheet_id in spreadsheets}
+        self._lock = threading.Lock()
+
+    def update_sheet(self, spreadsheet_id: str, title: str, rows: List[List[Any]]) -> None:
+        """修改分頁內容並遞增檔案版本"""
+        self.spreadsheets[spreadsheet_id][title] = rows
+        self.versions[spreadsheet_id] += 1
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=5, connection_type=None):
+        with self._lock:
+            self.requests.append(uri)
+        if self.latency:
+            time.sleep(self.latency)
+
+        parsed = urlparse(uri)
+        query = parse_qs(parsed.query)
+
+        if "/drive/v3/files/" in parsed.path:
+            file_id = unquote(parsed.path.split("/drive/v3/files/", 1)[-1])
+            if file_id not in self.versions:
+                return self._response(404, {"error": {"code": 404, "message": "not found"}})
+            return self._response(200, {
+                "version": str(self.versions[file_id]),
+                "modifiedTime": f"2026-01-01T00:00:{self.versions[file_id]:02d}.000Z",
+            })
+
+        path = parsed.path.split("/v4/spreadsheets/", 1)[-1]
+
+        spreadsheet_id, _, rest = path.partition("/")
+        sheets = self.spreadsheets.get(unquote(spreadsheet_id))
+        if sheets is None:
+            return self._response(404, {"error": {"code": 404, "message": "not found"}})
+
+        if not rest:
+            payload = {
+                "properties": {"title": spreadsheet_id},
+                "sheets": [
+                    {"properties": {
+                        "sheetId": index,
+                        "title": title,
+                        "gridProperties": {"rowCount": len(rows), "columnCount": max(map(len, rows), default=0)},
+                    }}
+                    for index, (title, rows) in enumerate(sheets.items())
+                ],
+            }
+            return self._response(200, payload)
+
+        if rest == "values:batchGet":
+            return self._response(200, {
+                "spreadsheetId": spreadsheet_id,
+                "valueRanges": [
+                    self._value_range(sheets, range_str, query)
+                    for range_str in query.get("ranges", [])
+                ],
+            })
+
+        if rest.startswith("values/"):
+            range_str = unquote(rest[len("values/"):])
+            return self._response(200, self._value_range(sheets, range_str, query))
+
+        return self._response(400, {"error": {"code": 400, "message": f"unsupported: {rest}"}})
+
+    def _value_range(self, sheets: dict, range_str: str, query: dict) -> dict:
+        title = range_str.split("!", 1)[0].strip("'")
+        rows = sheets.get(title, [])
+        return {"range": range_str, "majorDimension": "ROWS", "values": rows}
+
+    @staticmethod
+    def _response(status: int, payload: dict):
+        return httplib2.Response({"status": status, "content-type": "application/json"}), \
+            json.dumps(payload, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,201 @@
+"""
+AssessmentRecalculatorService 單元測試
+
+驗證年度集合式批次重算與逐人重算的寫入資料相同，以及 dry-run 差異報告。
+"""
+
+from datetime import date
+
+import pytest
+
+from src.models.assessment_record import AssessmentRecord
+from src.models.assessment_standard import AssessmentStandard
+from src.models.cumulative_counter import CumulativeCounter
+from src.models.employee import Employee
+from src.services.assessment_recalculator import AssessmentRecalculatorService
+from src.services.score_ledger_service import ScoreLedgerService
+
+
+YEAR = 2026
+
+
+def _record(employee_id, code, points, record_date, coefficient=None, count=None,
+            multiplier=1.0, is_deleted=False):
+    """建立考核記錄（累計欄位刻意保留錯誤值以驗證重算）"""
+    return AssessmentRecord(
+        employee_id=employee_id,
+        standard_code=code,
+        record_date=record_date,
+        base_points=points,
+        responsibility_coefficient=coefficient,
+        actual_points=points,
+        cumulative_count=count,
+        cumulative_multiplier=multiplier,
+        final_points=points * multiplier,
+        is_deleted=is_deleted,
+    )
+
+
+def _seed(db):
+    """建立各種重算情境"""
+    db.add_all([
+        AssessmentStandard(code=code, category=category, name=code, base_points=points,
+                           has_cumulative=cumulative)
+        for code, category, points, cumulative in [
+            ("D01", "D", -1.0, True), ("W01", "W", -2.0, True),
+            ("R01", "R", 0.0, False), ("R02", "R", -1.0, True), ("R03", "R", -2.0, True),
+            ("+M02", "+M", 1.0, False),
+        ]
+    ])
+    employees = [
+        Employee(
+            employee_id=f"1140M{i:04d}",
+            employee_name=f"員工{i}",
+            current_department="淡海",
+            hire_year_month="2020-01",
+        )
+        for i in range(5)
+    ]
+    db.add_all(employees)
+    db.flush()
+    ids = [employee.id for employee in employees]
+
+    db.add_all([
+        # 0: 三次 D 類，累計次數全為 1 → 第 2、3 次需加倍
+        _record(ids[0], "D01", -1.0, date(YEAR, 3, 1), count=1),
+        _record(ids[0], "D01", -1.0, date(YEAR, 1, 5), count=1),
+        _record(ids[0], "D01", -1.0, date(YEAR, 2, 9), count=1),
+        # 1: R02/R03 合併累計，R01 不累計，含責任係數
+        _record(ids[1], "R02", -1.0, date(YEAR, 4, 1), coefficient=0.5, count=1),
+        _record(ids[1], "R03", -2.0, date(YEAR, 5, 1), count=1),
+        _record(ids[1], "R01", 0.0, date(YEAR, 5, 2)),
+        # 2: 中間一筆已刪除 → 後續記錄遞補
+        _record(ids[2], "W01", -2.0, date(YEAR, 1, 1), count=1),
+        _record(ids[2], "W01", -2.0, date(YEAR, 2, 1), count=2, multiplier=1.5, is_deleted=True),
+        _record(ids[2], "W01", -2.0, date(YEAR, 3, 1), count=3, multiplier=2.0),
+        # 3: 前一年度記錄不在重算範圍，但計入總分
+        _record(ids[3], "D01", -1.0, date(YEAR - 1, 12, 31), count=5, multiplier=3.0),
+        _record(ids[3], "D01", -1.0, date(YEAR, 1, 1), count=2, multiplier=1.5),
+        # 4: 已正確的記錄與獎勵
+        _record(ids[4], "D01", -1.0, date(YEAR, 6, 1), count=1),
+        _record(ids[4], "+M02", 1.0, date(YEAR, 6, 1)),
+    ])
+    db.add(CumulativeCounter(employee_id=ids[0], year=YEAR, category="D", count=1))
+    db.add(CumulativeCounter(employee_id=ids[4], year=YEAR, category="D", count=1))
+    db.commit()
+    # 由既有記錄回填員工分數帳本（同 scripts/migrate_database.py）
+    ScoreLedgerService(db).reconcile(fix=True)
+    db.commit()
+    return ids
+
+
+def _snapshot(db):
+    """取得寫入後的資料狀態"""
+    records = sorted(
+        (r.id, r.cumulative_count, r.cumulative_multiplier, r.actual_points, r.final_points)
+        for r in db.query(AssessmentRecord).all()
+    )
+    counters = sorted(
+        (c.employee_id, c.year, c.category, c.count)
+        for c in db.query(CumulativeCounter).all()
+    )
+    scores = sorted((e.id, e.current_score) for e in db.query(Employee).all())
+    return records, counters, scores
+
+
+class TestRecalculateYearBulk:
+    """年度集合式批次重算測試"""
+
+    def test_bulk_matches_per_employee(self, make_session):
+        """測試：集合式重算的寫入資料與逐人重算相同"""
+        legacy_db, _ = make_session(_seed)
+        bulk_db, _ = make_session(_seed)
+
+        legacy = AssessmentRecalculatorService(legacy_db).recalculate_year_for_all_employees(YEAR, bulk=False)
+        legacy_db.commit()
+        bulk = AssessmentRecalculatorService(bulk_db).recalculate_year_for_all_employees(YEAR)
+        bulk_db.commit()
+
+        assert {key: bulk[key] for key in legacy} == legacy
+        assert _snapshot(bulk_db) == _snapshot(legacy_db)
+
+    def test_dry_run_reports_diffs_without_writing(self, make_session):
+        """測試：dry-run 回報差異但不寫入"""
+        db, _ = make_session(_seed)
+        before = _snapshot(db)
+
+        result = AssessmentRecalculatorService(db).recalculate_year_for_all_employees(YEAR, dry_run=True)
+        db.commit()
+
+        assert result["dry_run"] is True
+        assert _snapshot(db) == before
+
+        changes = result["changes"]
+        d_counts = sorted(
+            (change["before"]["cumulative_count"], change["after"]["cumulative_count"])
+            for change in changes["records"]
+            if change["category"] == "D" and change["after"]["cumulative_count"] > 1
+        )
+        assert d_counts == [(1, 2), (1, 3)]
+        assert all(change["category"] != "R01" for change in changes["records"])
+        assert {(c["category"], c["before"], c["after"]) for c in changes["counters"]} >= {
+            ("D", 1, 3), ("R", None, 2), ("W", None, 2)
+        }
+        # 員工 4 記錄與總分皆正確，不應出現在差異中
+        ids = [row.id for row in db.query(Employee.id).order_by(Employee.id)]
+        assert {c["employee_id"] for c in changes["scores"]} == set(ids[:4])
+        assert {c["employee_id"]: c["after"] for c in changes["scores"]}[ids[3]] == pytest.approx(76.0)
+
+    def test_dry_run_matches_applied_result(self, make_session):
+        """測試：dry-run 預估的總分與實際寫入相同"""
+        preview_db, _ = make_session(_seed)
+        apply_db, _ = make_session(_seed)
+
+        preview = AssessmentRecalculatorService(preview_db).recalculate_year_for_all_employees(YEAR, dry_run=True)
+        AssessmentRecalculatorService(apply_db).recalculate_year_for_all_employees(YEAR)
+        apply_db.commit()
+
+        scores = dict(_snapshot(apply_db)[2])
+        for change in preview["changes"]["scores"]:
+            assert scores[change["employee_id"]] == pytest.approx(change["after"])
+
+    def test_rerun_has_no_changes(self, make_session):
+        """測試：重算後再次執行無差異"""
+        db, _ = make_session(_seed)
+        service = AssessmentRecalculatorService(db)
+
+        service.recalculate_year_for_all_employees(YEAR)
+        db.commit()
+        second = service.recalculate_year_for_all_employees(YEAR, dry_run=True)
+
+        assert second["changes"] == {"records": [], "counters": [], "scores": []}
+
+    def test_stale_counter_is_reset(self, make_session):
+        """測試：已無有效記錄的計數器歸零"""
+        db, _ = make_session(_seed)
+        employee_id = db.query(Employee.id).order_by(Employee.id).first()[0]
+        db.add(CumulativeCounter(employee_id=employee_id, year=YEAR, category="S", count=2))
+        db.commit()
+
+        AssessmentRecalculatorService(db).recalculate_year_for_all_employees(YEAR)
+        db.commit()
+
+        counter = db.query(CumulativeCounter).filter_by(employee_id=employee_id, category="S").one()
+        assert counter.count == 0
+
+    def test_dry_run_requires_bulk(self, make_session):
+        """測試：逐人重算不支援 dry-run"""
+        db, _ = make_session(_seed)
+
+        with pytest.raises(ValueError):
+            AssessmentRecalculatorService(db).recalculate_year_for_all_employees(YEAR, bulk=False, dry_run=True)
+
+    def test_query_count_is_constant(self, make_session, capture_statements):
+        """測試：查詢次數不隨員工數增加"""
+        db, _ = make_session(_seed)
+        selects = capture_statements(bind=db)
+
+        AssessmentRecalculatorService(db).recalculate_year_for_all_employees(YEAR, dry_run=True)
+
+        # 可累計記錄、計數器、員工總分
+        assert len(selects) == 3
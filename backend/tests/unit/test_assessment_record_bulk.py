@@ -0,0 +1,169 @@
+"""
+AssessmentRecordService.create_bulk 單元測試
+
+驗證批次建立與逐筆建立的寫入資料相同、月度獎勵重算依員工月份去重登記，
+以及查詢次數不隨筆數增加。
+"""
+
+from datetime import date
+
+import pytest
+
+from src.models.assessment_record import AssessmentRecord
+from src.models.assessment_standard import AssessmentStandard
+from src.models.cumulative_counter import CumulativeCounter
+from src.models.employee import Employee
+from src.models.fault_responsibility import FaultResponsibilityAssessment
+from src.models.monthly_reward_recheck import MonthlyRewardRecheck
+from src.services.assessment_record_service import AssessmentRecordService
+from src.services.assessment_standard_service import AssessmentStandardService
+from src.services.monthly_reward_recheck_queue import MonthlyRewardRecheckQueue
+from src.services.score_ledger_service import ScoreLedgerService
+
+
+YEAR = 2026
+
+FAULT_DATA = {
+    "delay_seconds": 120,
+    "checklist_results": {"awareness_delay": True, "report_delay": True},
+}
+
+
+def _seed(db):
+    """建立考核標準、員工與既有累計次數"""
+    db.add_all([
+        AssessmentStandard(code=code, category=category, name=code, base_points=points,
+                           has_cumulative=cumulative)
+        for code, category, points, cumulative in [
+            ("D01", "D", -1.0, True), ("S01", "S", -2.0, True),
+            ("R02", "R", -1.0, True), ("R03", "R", -2.0, True),
+            ("+M02", "+M", 1.0, False), ("+M03", "+M", 2.0, False), ("+A01", "+A", 1.0, False),
+        ]
+    ])
+    employees = [
+        Employee(
+            employee_id=f"1140M{i:04d}",
+            employee_name=f"員工{i}",
+            current_department="淡海",
+            hire_year_month="2020-01",
+        )
+        for i in range(3)
+    ]
+    db.add_all(employees)
+    db.flush()
+    ids = [employee.id for employee in employees]
+
+    # 員工 0 今年已有一次 D 類
+    db.add(AssessmentRecord(
+        employee_id=ids[0], standard_code="D01", record_date=date(YEAR, 1, 3),
+        base_points=-1.0, actual_points=-1.0, cumulative_count=1,
+        cumulative_multiplier=1.0, final_points=-1.0,
+    ))
+    db.add(CumulativeCounter(employee_id=ids[0], year=YEAR, category="D", count=1))
+    db.commit()
+    ScoreLedgerService(db).reconcile(fix=True)
+    db.commit()
+    return ids
+
+
+def _items(ids):
+    """跨員工、年度、類別的批次資料（含同月多筆扣分）"""
+    return [
+        {"employee_id": ids[0], "standard_code": "D01", "record_date": date(YEAR, 2, 1)},
+        {"employee_id": ids[0], "standard_code": "D01", "record_date": date(YEAR, 2, 8)},
+        {"employee_id": ids[0], "standard_code": "S01", "record_date": date(YEAR, 2, 9)},
+        {"employee_id": ids[1], "standard_code": "R02", "record_date": date(YEAR, 3, 1),
+         "fault_responsibility_data": FAULT_DATA},
+        {"employee_id": ids[1], "standard_code": "R03", "record_date": date(YEAR, 3, 2)},
+        {"employee_id": ids[1], "standard_code": "D01", "record_date": date(YEAR - 1, 12, 30),
+         "description": "回溯建檔"},
+        {"employee_id": ids[2], "standard_code": "+A01", "record_date": date(YEAR, 4, 1)},
+        {"employee_id": ids[2], "standard_code": "S01", "record_date": date(YEAR, 4, 2)},
+    ]
+
+
+def _snapshot(db):
+    """取得有效資料狀態（不含自動產生的 ID）"""
+    records = sorted(
+        (r.employee_id, r.standard_code, r.record_date, r.description, r.responsibility_coefficient,
+         r.cumulative_count, r.cumulative_multiplier, r.final_points)
+        for r in db.query(AssessmentRecord).filter_by(is_deleted=False).all()
+    )
+    counters = sorted(
+        (c.employee_id, c.year, c.category, c.count)
+        for c in db.query(CumulativeCounter).all()
+    )
+    scores = sorted((e.id, e.current_score) for e in db.query(Employee).all())
+    faults = db.query(FaultResponsibilityAssessment).count()
+    rechecks = sorted((q.employee_id, q.year, q.month) for q in db.query(MonthlyRewardRecheck).all())
+    return records, counters, scores, faults, rechecks
+
+
+class TestCreateBulk:
+    """批次建立考核記錄測試"""
+
+    def test_bulk_matches_sequential_create(self, make_session):
+        """測試：批次建立與逐筆建立的寫入資料相同"""
+        sequential_db, ids = make_session(_seed)
+        bulk_db, _ = make_session(_seed)
+
+        service = AssessmentRecordService(sequential_db)
+        for item in _items(ids):
+            service.create(**item)
+        sequential_db.commit()
+
+        result = AssessmentRecordService(bulk_db).create_bulk(_items(ids))
+        bulk_db.commit()
+
+        assert result["created"] == 8
+        assert [r["cumulative_count"] for r in result["records"]] == [2, 3, 1, 1, 2, 1, None, 1]
+        assert _snapshot(bulk_db) == _snapshot(sequential_db)
+        assert ScoreLedgerService(bulk_db).reconcile()["is_consistent"]
+
+        # 處理月度獎勵重算佇列後仍一致
+        MonthlyRewardRecheckQueue(sequential_db).drain_all()
+        MonthlyRewardRecheckQueue(bulk_db).drain_all()
+        assert _snapshot(bulk_db) == _snapshot(sequential_db)
+
+    def test_monthly_reward_checks_are_deduplicated(self, make_session):
+        """測試：月度獎勵重算每位員工每月僅登記一次"""
+        db, ids = make_session(_seed)
+
+        result = AssessmentRecordService(db).create_bulk(_items(ids))
+        db.commit()
+
+        assert _snapshot(db)[4] == [
+            (ids[0], YEAR, 2), (ids[1], YEAR - 1, 12), (ids[1], YEAR, 3), (ids[2], YEAR, 4)
+        ]
+        assert result["monthly_reward_checks"] == 4
+
+    def test_invalid_standard_writes_nothing(self, make_session):
+        """測試：任一筆考核標準無效時不寫入任何記錄"""
+        db, ids = make_session(_seed)
+        items = _items(ids) + [
+            {"employee_id": ids[0], "standard_code": "X99", "record_date": date(YEAR, 5, 1)}
+        ]
+
+        with pytest.raises(ValueError, match="X99"):
+            AssessmentRecordService(db).create_bulk(items)
+
+        assert db.query(AssessmentRecord).count() == 1
+
+    def test_query_count_is_constant(self, make_session, capture_statements):
+        """測試：查詢次數不隨筆數增加"""
+        db, ids = make_session(_seed)
+        items = [
+            {"employee_id": employee_id, "standard_code": code, "record_date": date(YEAR, 6, day)}
+            for day in range(1, 21)
+            for employee_id in ids
+            for code in ("D01", "+A01")
+        ]
+        AssessmentStandardService(db).get_snapshot()
+        selects = capture_statements(bind=db)
+        inserts = capture_statements(kind="INSERT", table="assessment_records", bind=db)
+
+        AssessmentRecordService(db).create_bulk(items)
+
+        # 員工、計數器（考核標準取自登錄表快照，帳本以 UPSERT 累加）
+        assert len(selects) == 2
+        assert len(inserts) == 1
@@ -0,0 +1,116 @@
+"""
+AssessmentStandardRegistry 單元測試
+
+驗證登錄表快照的查詢結構、版本失效重新載入，
+以及考核記錄建立時不查詢考核標準。
+"""
+
+from datetime import date
+
+import pytest
+
+from src.models.assessment_standard import AssessmentStandard
+from src.models.employee import Employee
+from src.services.assessment_record_service import AssessmentRecordService
+from src.services.assessment_standard_registry import get_assessment_standard_registry
+from src.services.assessment_standard_service import AssessmentStandardService
+
+
+@pytest.fixture
+def standards(db_session):
+    """建立考核標準與員工"""
+    db_session.add_all([
+        AssessmentStandard(code=code, category=category, name=name, base_points=points,
+                           has_cumulative=cumulative, is_active=active)
+        for code, category, name, points, cumulative, active in [
+            ("D01", "D", "遲到", -1.0, True, True),
+            ("D02", "D", "遲到但不影響勤務", 0.0, False, True),
+            ("R02", "R", "人為疏失", -1.0, True, True),
+            ("+A01", "+A", "加分", 1.0, False, True),
+            ("O09", "O", "已停用", -1.0, True, False),
+        ]
+    ])
+    db_session.add(Employee(
+        employee_id="1140M0001",
+        employee_name="測試員工",
+        current_department="淡海",
+        hire_year_month="2020-01",
+    ))
+    db_session.commit()
+
+
+class TestSnapshot:
+    """快照查詢結構測試"""
+
+    def test_lookup_structures(self, db_session, standards):
+        """測試：代碼、類別、累計加重與扣分項目查詢"""
+        snapshot = AssessmentStandardService(db_session).get_snapshot()
+
+        assert snapshot.get("D01").name == "遲到"
+        assert snapshot.get("O09") is not None
+        assert snapshot.get_active("O09") is None
+        assert snapshot.get_active("X99") is None
+        assert snapshot.codes_in_category("D") == {"D01", "D02"}
+        assert snapshot.cumulative_codes == {"D01", "R02", "O09"}
+        assert snapshot.deduction_codes == {"D01", "R02", "O09"}
+
+    def test_invalidate_reloads(self, db_session, standards, capture_statements):
+        """測試：版本遞增後下次取用重新載入"""
+        registry = get_assessment_standard_registry()
+        service = AssessmentStandardService(db_session)
+        selects = capture_statements(table="assessment_standards")
+
+        service.get_snapshot()
+        service.get_snapshot()
+        assert len(selects) == 1
+
+        service.toggle_active(service.get_by_code("O09").id)
+        db_session.commit()
+        registry.invalidate()
+        selects.clear()
+
+        assert service.get_snapshot().get_active("O09") is not None
+        assert len(selects) == 1
+        assert registry.get_stats()["loaded_version"] == registry.version
+
+    def test_bump_during_load_keeps_snapshot_stale(self, db_session, standards, monkeypatch):
+        """測試：載入期間版本遞增，快照仍視為過期"""
+        registry = get_assessment_standard_registry()
+        load = registry._loader
+
+        def _load_and_bump(db, key):
+            snapshot = load(db, key)
+            registry.invalidate()
+            return snapshot
+
+        monkeypatch.setattr(registry, "_loader", _load_and_bump)
+        registry.load(db_session)
+
+        assert registry.current() is None
+
+
+class TestHotPath:
+    """熱路徑測試"""
+
+    def test_create_takes_no_standard_queries(self, db_session, standards, capture_statements):
+        """測試：快照載入後建立考核記錄不查詢考核標準"""
+        employee_id = db_session.query(Employee.id).scalar()
+        service = AssessmentRecordService(db_session)
+        service.standard_service.get_snapshot()
+        selects = capture_statements(table="assessment_standards")
+
+        record = service.create(employee_id, "D01", date(2026, 3, 1))
+        service.create_bulk([
+            {"employee_id": employee_id, "standard_code": "D01", "record_date": date(2026, 3, 2)},
+            {"employee_id": employee_id, "standard_code": "+A01", "record_date": date(2026, 3, 3)},
+        ])
+
+        assert record.final_points == -1.0
+        assert selects == []
+
+    def test_inactive_standard_rejected(self, db_session, standards):
+        """測試：已停用的考核標準無法建立記錄"""
+        employee_id = db_session.query(Employee.id).scalar()
+
+        with pytest.raises(ValueError, match="O09"):
+            AssessmentRecordService(db_session).create(employee_id, "O09", date(2026, 3, 1))
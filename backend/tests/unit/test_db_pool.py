@@ -0,0 +1,72 @@
+"""
+InstrumentedQueuePool 單元測試
+
+驗證取得連線次數、等待時間與逾時次數的統計。
+"""
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from src.config.db_pool import InstrumentedQueuePool
+
+
+@pytest.fixture
+def make_engine(tmp_path):
+    """建立使用 InstrumentedQueuePool 的 SQLite 檔案引擎"""
+    engines = []
+
+    def _make(**pool_kwargs):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            **pool_kwargs
+        )
+        engines.append(engine)
+        return engine
+
+    yield _make
+    for engine in engines:
+        engine.dispose()
+
+
+class TestPoolStats:
+    """連線池統計測試"""
+
+    def test_initial_stats(self, make_engine):
+        """測試：尚未取得連線時無等待統計"""
+        stats = make_engine(pool_size=2, max_overflow=1).pool.get_stats()
+
+        assert stats["pool_size"] == 2
+        assert stats["max_overflow"] == 1
+        assert stats["checkouts"] == 0
+        assert stats["overflow"] == 0
+        assert stats["avg_wait_ms"] is None
+
+    def test_checkouts_counted(self, make_engine):
+        """測試：重複使用連線時僅建立一次實體連線"""
+        engine = make_engine(pool_size=2, max_overflow=0)
+
+        for _ in range(3):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        stats = engine.pool.get_stats()
+        assert stats["checkouts"] == 3
+        assert stats["connects"] == 1
+        assert stats["checked_out"] == 0
+        assert stats["checked_in"] == 1
+        assert stats["max_wait_ms"] >= stats["avg_wait_ms"] >= 0
+
+    def test_timeout_counted(self, make_engine):
+        """測試：連線池耗盡逾時計入 timeouts"""
+        engine = make_engine(pool_size=1, max_overflow=0, pool_timeout=0.05)
+
+        with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+            stats = engine.pool.get_stats()
+            assert stats["checked_out"] == 1
+
+        assert stats["timeouts"] == 1
+        assert stats["checkouts"] == 1
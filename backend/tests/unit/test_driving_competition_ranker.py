@@ -0,0 +1,148 @@
+"""
+DrivingCompetitionRanker 單元測試
+
+驗證季度排名與部門季度統計以分組查詢計算責任事件，查詢次數不隨人數增加。
+"""
+
+from datetime import date
+
+import pytest
+
+from src.models.assessment_record import AssessmentRecord
+from src.models.assessment_standard import AssessmentStandard
+from src.models.driving_competition import DrivingCompetition
+from src.models.driving_daily_stats import DrivingDailyStats
+from src.models.employee import Employee
+from src.services.driving_competition_ranker import DrivingCompetitionRanker
+from src.services.driving_stats_calculator import DrivingStatsCalculator
+
+
+def _seed_department(db_session, department: str, headcount: int, code_prefix: str):
+    """建立部門員工、每日時數與考核記錄（第 i 位員工有 i % 3 次責任事件）"""
+    employees = [
+        Employee(
+            employee_id=f"{code_prefix}{i:04d}",
+            employee_name=f"員工{i}",
+            current_department=department,
+            hire_year_month="2020-01",
+            is_resigned=(i == headcount - 1),
+        )
+        for i in range(headcount)
+    ]
+    db_session.add_all(employees)
+    db_session.flush()
+
+    for i, employee in enumerate(employees):
+        db_session.add_all([
+            DrivingDailyStats(
+                employee_id=employee.id,
+                department=department,
+                record_date=date(2026, 1, day),
+                total_minutes=400 + i,
+                is_holiday_work=(day == 1),
+                incident_count=0,
+            )
+            for day in (1, 2, 3)
+        ])
+        records = [("S01", -2.0, date(2026, 2, 1))] * (i % 3)
+        # 不計入的記錄：非 S/R 類、非扣分、已刪除、季度外
+        records += [
+            ("D01", -1.0, date(2026, 2, 1)),
+            ("R01", 1.0, date(2026, 2, 1)),
+            ("R01", -1.0, date(2026, 4, 1)),
+        ]
+        for code, points, record_date in records:
+            db_session.add(AssessmentRecord(
+                employee_id=employee.id,
+                standard_code=code,
+                record_date=record_date,
+                base_points=points,
+                actual_points=points,
+                cumulative_multiplier=1.0,
+                final_points=points,
+            ))
+        db_session.add(AssessmentRecord(
+            employee_id=employee.id,
+            standard_code="R01",
+            record_date=date(2026, 3, 1),
+            base_points=-1.0,
+            actual_points=-1.0,
+            cumulative_multiplier=1.0,
+            final_points=-1.0,
+            is_deleted=True,
+        ))
+
+    db_session.commit()
+    return employees
+
+
+@pytest.fixture
+def seeded(db_session):
+    db_session.add_all([
+        AssessmentStandard(code=code, category=code[0], name=code, base_points=-1.0)
+        for code in ("S01", "R01", "D01")
+    ])
+    db_session.commit()
+
+    return {
+        "淡海": _seed_department(db_session, "淡海", 12, "D"),
+        "安坑": _seed_department(db_session, "安坑", 4, "A"),
+    }
+
+
+class TestGroupedIncidentCounts:
+    """分組責任事件統計測試"""
+
+    def test_matches_per_employee_counts(self, db_session, seeded):
+        """測試：分組結果與逐人統計相同"""
+        calculator = DrivingStatsCalculator(db_session)
+
+        counts = calculator.count_incidents_for_quarter_by_department("淡海", 2026, 1)
+
+        for employee in seeded["淡海"]:
+            expected = calculator.count_incidents_for_quarter(employee.id, 2026, 1)
+            assert counts.get(employee.id, 0) == expected
+        assert set(counts) <= {employee.id for employee in seeded["淡海"]}
+
+    def test_department_stats_match_single_employee_stats(self, db_session, seeded, capture_statements):
+        """測試：部門季度統計與單一員工統計相同，且查詢次數固定"""
+        calculator = DrivingStatsCalculator(db_session)
+        selects = capture_statements()
+
+        results = calculator.get_quarter_stats_by_department("淡海", 2026, 1)
+
+        assert len(selects) == 2
+        assert len(results) == 11  # 不含離職員工
+        for stats in results:
+            single = calculator.get_quarter_stats(stats["employee_id"], 2026, 1)
+            assert {k: stats[k] for k in single} == single
+
+
+class TestRankingQueries:
+    """排名計算查詢次數測試"""
+
+    def test_ranking_query_count_is_independent_of_headcount(self, db_session, seeded, capture_statements):
+        """測試：部門排名的查詢次數不隨人數增加"""
+        ranker = DrivingCompetitionRanker(db_session)
+        selects = capture_statements()
+
+        result = ranker.calculate_quarterly_ranking(2026, 1)
+
+        assert result["errors"] == []
+        # 每個部門：時數彙總、責任事件、既有記錄各一次
+        assert len(selects) == 6
+
+        incidents = {
+            entry["employee_id"]: entry["incident_count"]
+            for entry in result["departments"]["淡海"]["rankings"]
+        }
+        assert incidents == {employee.id: i % 3 for i, employee in enumerate(seeded["淡海"])}
+
+    def test_rerun_updates_existing_records(self, db_session, seeded):
+        """測試：重新計算時更新既有記錄而非新增"""
+        ranker = DrivingCompetitionRanker(db_session)
+
+        ranker.calculate_quarterly_ranking(2026, 1)
+        ranker.calculate_quarterly_ranking(2026, 1)
+
+        assert db_session.query(DrivingCompetition).count() == 16
@@ -0,0 +1,128 @@
+"""
+DutySyncService 單元測試
+
+驗證批次重建模式與逐筆同步模式的結果一致，
+以及使用班表預先推導欄位與由班別代碼推導的結果一致。
+"""
+
+import pytest
+from datetime import date
+
+from src.models.driving_daily_stats import DrivingDailyStats
+from src.models.employee import Employee
+from src.models.route_standard_time import RouteStandardTime
+from src.models.schedule import Schedule
+from src.services.duty_sync_service import DutySyncService
+
+
+SHIFT_CODES = ["0905G", "R/0905G", "R(國)/1425G", "1425G(+2)", "(假)", "休"]
+
+
+@pytest.fixture
+def duty_data(db_session):
+    """建立測試用員工、勤務標準時間與班表"""
+    employees = []
+    for i in range(3):
+        employee = Employee(
+            employee_id=f"1140M000{i}",
+            employee_name=f"測試員工{i}",
+            current_department="淡海",
+            hire_year_month="2020-01",
+            is_resigned=False
+        )
+        db_session.add(employee)
+        employees.append(employee)
+
+    db_session.add_all([
+        RouteStandardTime(department="淡海", route_code="0905G", route_name="早班", standard_minutes=300),
+        RouteStandardTime(department="淡海", route_code="1425G", route_name="晚班", standard_minutes=420),
+    ])
+
+    for i, employee in enumerate(employees):
+        for day in range(1, 7):
+            db_session.add(Schedule(
+                employee_id=employee.employee_id,
+                employee_name=employee.employee_name,
+                department="淡海",
+                schedule_date=date(2026, 1, day),
+                shift_code=SHIFT_CODES[(i + day) % len(SHIFT_CODES)]
+            ))
+
+    db_session.commit()
+    return employees
+
+
+def _snapshot(db_session) -> dict:
+    return {
+        (s.employee_id, s.record_date): (s.department, s.total_minutes, s.is_holiday_work)
+        for s in db_session.query(DrivingDailyStats).all()
+    }
+
+
+class TestDutySyncBulkRebuild:
+    """批次重建測試"""
+
+    def test_bulk_matches_row_path(self, db_session, duty_data):
+        """測試：批次重建與逐筆同步結果一致"""
+        service = DutySyncService(db_session)
+
+        row_result = service.sync_daily_stats_for_date_range("淡海", date(2026, 1, 1), date(2026, 1, 6))
+        row_snapshot = _snapshot(db_session)
+
+        db_session.query(DrivingDailyStats).delete()
+        db_session.commit()
+
+        bulk_result = service.sync_daily_stats_for_date_range(
+            "淡海", date(2026, 1, 1), date(2026, 1, 6), bulk=True
+        )
+
+        assert set(bulk_result.keys()) == set(row_result.keys())
+        assert bulk_result["total_processed"] == row_result["total_processed"] == 18
+        assert bulk_result["errors"] == []
+        assert _snapshot(db_session) == row_snapshot
+
+    def test_bulk_rebuild_is_idempotent(self, db_session, duty_data):
+        """測試：重複執行批次重建會更新而非重複寫入"""
+        service = DutySyncService(db_session)
+
+        service.rebuild_daily_stats_for_date_range("淡海", date(2026, 1, 1), date(2026, 1, 6))
+        first = _snapshot(db_session)
+        service.rebuild_daily_stats_for_date_range("淡海", date(2026, 1, 1), date(2026, 1, 6), chunk_size=4)
+
+        assert _snapshot(db_session) == first
+        assert db_session.query(DrivingDailyStats).count() == 18
+
+    def test_r_shift_minutes_use_route_code(self, db_session, duty_data):
+        """測試：R班以去除前綴後的勤務代碼計算分鐘數"""
+        service = DutySyncService(db_session)
+        service.rebuild_daily_stats_for_date_range("淡海", date(2026, 1, 1), date(2026, 1, 6))
+
+        stats = {
+            (row.record_date, row.total_minutes, row.is_holiday_work)
+            for row in db_session.query(DrivingDailyStats).filter(
+                DrivingDailyStats.employee_id == duty_data[0].id
+            )
+        }
+        # 員工 0 第 1 日 -> R/0905G，第 2 日 -> R(國)/1425G
+        assert (date(2026, 1, 1), 300, True) in stats
+        assert (date(2026, 1, 2), 420, True) in stats
+
+    def test_precomputed_flags_match_shift_code_path(self, db_session, duty_data):
+        """測試：回填班別旗標後結果與由班別代碼推導相同"""
+        # 延遲匯入：避免收集階段即以未設定的環境變數建立 Settings 快取
+        from src.services.schedule_sync_service import backfill_schedule_flags
+
+        service = DutySyncService(db_session)
+        service.rebuild_daily_stats_for_date_range("淡海", date(2026, 1, 1), date(2026, 1, 6))
+        derived = _snapshot(db_session)
+
+        assert backfill_schedule_flags(db_session) == 18
+        db_session.query(DrivingDailyStats).delete()
+        db_session.commit()
+
+        service.sync_daily_stats_for_date_range("淡海", date(2026, 1, 1), date(2026, 1, 6))
+        row_snapshot = _snapshot(db_session)
+        service.rebuild_daily_stats_for_date_range("淡海", date(2026, 1, 1), date(2026, 1, 6))
+
+        assert row_snapshot == derived
+        assert _snapshot(db_session) == derived
@@ -0,0 +1,78 @@
+"""
+EmployeeExportService 串流匯出單元測試
+
+驗證 Excel 唯寫串流與 CSV 分批串流的內容與篩選條件。
+"""
+
+import csv
+import io
+
+import pytest
+
+from src.models.employee import Employee
+from src.services import employee_export_service
+from src.services.employee_export_service import EmployeeExportService
+
+
+@pytest.fixture
+def employees(db_session):
+    """建立在職與離職員工"""
+    db_session.add_all([
+        Employee(
+            employee_id=f"1140M{i:04d}",
+            employee_name=f"員工{i}",
+            current_department="淡海" if i % 2 else "安坑",
+            hire_year_month="2025-04",
+            is_resigned=(i == 5),
+        )
+        for i in range(1, 8)
+    ])
+    db_session.commit()
+
+
+class TestStreamExcel:
+    """Excel 串流匯出測試"""
+
+    def test_workbook_content(self, db_session, employees):
+        """測試：串流內容為完整工作簿，含標題行與所有在職員工"""
+        import openpyxl
+
+        content = b"".join(EmployeeExportService(db_session).stream_excel())
+        sheet = openpyxl.load_workbook(io.BytesIO(content)).active
+        rows = list(sheet.iter_rows(values_only=True))
+
+        assert sheet.title == "員工資料"
+        assert sheet.freeze_panes == "A2"
+        assert rows[0][:3] == ("員工編號", "姓名", "部門")
+        assert [row[0] for row in rows[1:]] == [
+            "1140M0001", "1140M0002", "1140M0003", "1140M0004", "1140M0006", "1140M0007"
+        ]
+        assert rows[1][-1] == "在職"
+
+    def test_export_to_excel_matches_stream(self, db_session, employees):
+        """測試：export_to_excel 回傳與串流相同的工作簿"""
+        import openpyxl
+
+        output = EmployeeExportService(db_session).export_to_excel(
+            department="淡海", include_resigned=True
+        )
+        rows = list(openpyxl.load_workbook(output).active.iter_rows(values_only=True))
+
+        assert [row[0] for row in rows[1:]] == ["1140M0001", "1140M0003", "1140M0005", "1140M0007"]
+        assert rows[3][-1] == "離職"
+
+
+class TestStreamCsv:
+    """CSV 串流匯出測試"""
+
+    def test_header_first_then_batches(self, db_session, employees, monkeypatch):
+        """測試：先輸出標題行，資料依批次輸出"""
+        monkeypatch.setattr(employee_export_service, "EXPORT_CHUNK_SIZE", 2)
+
+        chunks = list(EmployeeExportService(db_session).stream_csv(search="M000"))
+
+        assert next(csv.reader(io.StringIO(chunks[0])))[0] == "員工編號"
+        assert len(chunks) == 1 + 3
+        rows = list(csv.reader(io.StringIO("".join(chunks))))
+        assert len(rows) == 1 + 6
+        assert rows[1][4] == ""  # 未填電話輸出空字串
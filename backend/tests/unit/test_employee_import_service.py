@@ -0,0 +1,123 @@
+"""
+EmployeeImportService 單元測試
+
+驗證單次掃描的驗證結果、重複檢查（資料庫與檔案內），
+以及多列 INSERT 寫入的查詢次數。
+"""
+
+import io
+
+import pytest
+
+from src.models.employee import Employee
+from src.services.employee_import_service import EmployeeImportService
+
+
+def _make_workbook(rows: list[tuple]) -> io.BytesIO:
+    """建立匯入用 Excel 檔案"""
+    import openpyxl
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(("員工編號", "姓名", "部門", "電話"))
+    for row in rows:
+        sheet.append(row)
+
+    output = io.BytesIO()
+    workbook.save(output)
+    output.seek(0)
+    return output
+
+
+@pytest.fixture
+def existing_employee(db_session):
+    """建立已存在的員工"""
+    db_session.add(Employee(
+        employee_id="1101M0001",
+        employee_name="既有員工",
+        current_department="淡海",
+        hire_year_month="2025-04",
+    ))
+    db_session.commit()
+
+
+@pytest.fixture
+def import_file():
+    """含有效、重複與錯誤資料的匯入檔案"""
+    return _make_workbook([
+        ("1101M0001", "重複（資料庫）", "淡海", None),
+        ("1011m0095", "張三", "淡海", "0912345678"),
+        ("1101M0002", "李四", "台北", None),
+        ("ABC", "王五", "安坑", None),
+        ("1011M0095", "重複（檔案內）", "安坑", None),
+        ("1101M0003", "趙六", "安坑", None),
+    ])
+
+
+class TestImport:
+    """匯入測試"""
+
+    def test_import_skips_duplicates(self, db_session, existing_employee, import_file, capture_statements):
+        """測試：一次重複查詢與一次多列 INSERT 完成匯入"""
+        statements = capture_statements(kind=None, table="employees")
+        result = EmployeeImportService(db_session).import_from_excel(import_file)
+
+        assert result.total_rows == 6
+        assert result.imported_ids == ["1011M0095", "1101M0003"]
+        assert result.skipped_count == 2
+        assert [error["row"] for error in result.errors] == [4, 5]
+        assert not result.success
+        assert [s.split()[0].upper() for s in statements] == ["SELECT", "INSERT"]
+
+        employee = db_session.query(Employee).filter_by(employee_id="1011M0095").one()
+        assert employee.hire_year_month == "2021-11"
+        assert employee.phone == "0912345678"
+        assert db_session.query(Employee).count() == 3
+
+    def test_duplicates_as_errors(self, db_session, existing_employee, import_file):
+        """測試：不跳過重複時，重複列列為錯誤並依行號排序"""
+        result = EmployeeImportService(db_session).import_from_excel(
+            import_file, skip_duplicates=False
+        )
+
+        assert result.skipped_count == 0
+        assert [error["row"] for error in result.errors] == [2, 4, 5, 6]
+        assert result.imported_count == 2
+
+
+class TestValidate:
+    """驗證測試"""
+
+    def test_validate_does_not_write(self, db_session, existing_employee, import_file):
+        """測試：驗證結果與匯入相同但不寫入資料庫"""
+        result = EmployeeImportService(db_session).validate_excel(import_file)
+
+        assert result.total_rows == 6
+        assert result.error_count == 2
+        assert result.skipped_count == 2
+        assert result.imported_count == 0
+        assert db_session.query(Employee).count() == 1
+
+    def test_missing_required_column(self, db_session):
+        """測試：缺少必要欄位時回報標題行錯誤"""
+        import openpyxl
+
+        workbook = openpyxl.Workbook()
+        workbook.active.append(("員工編號", "姓名"))
+        workbook.active.append(("1101M0001", "張三"))
+        output = io.BytesIO()
+        workbook.save(output)
+        output.seek(0)
+
+        result = EmployeeImportService(db_session).validate_excel(output)
+
+        assert not result.success
+        assert result.errors[0]["row"] == 1
+        assert "current_department" in result.errors[0]["error"]
+
+    def test_header_only(self, db_session):
+        """測試：僅有標題行時回報錯誤"""
+        result = EmployeeImportService(db_session).validate_excel(_make_workbook([]))
+
+        assert not result.success
+        assert "至少需要標題行和一筆資料" in result.errors[0]["error"]
@@ -0,0 +1,211 @@
+"""
+GoogleSheetsReader 單元測試
+
+使用離線 Sheets 傳輸（tests/fake_sheets.py）驗證讀取、服務快取與內容快取。
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.models.sheet_content_cache import SheetContentCache  # noqa: F401  註冊資料表
+from tests.fake_sheets import FakeSheetsHttp, make_service_account_json
+
+
+SHEET_ROWS = [
+    ["編號", "姓名", "1", "2"],
+    ["1140M0001", "王小明", "0905G", "R/1425G"],
+]
+
+
+@pytest.fixture(scope="module")
+def service_account_json():
+    return make_service_account_json()
+
+
+@pytest.fixture
+def fake_http():
+    return FakeSheetsHttp({
+        "sheet-danhai": {"2026-01": SHEET_ROWS},
+        "sheet-ankeng": {"202601": SHEET_ROWS, "2026-02": SHEET_ROWS[:1]},
+    }, latency=0.2)
+
+
+def _make_reader(fake_http, service_account_json, content_cache=None):
+    from src.services.google_sheets_reader import GoogleSheetsReader
+
+    reader = GoogleSheetsReader(http_factory=lambda credentials: fake_http, content_cache=content_cache)
+    reader._content_cache = content_cache
+    reader._settings = reader._settings.model_copy(update={
+        "tanhae_google_service_account_json": service_account_json,
+        "tanhae_google_sheets_id_schedule": "sheet-danhai",
+        "anping_google_service_account_json": service_account_json,
+        "anping_google_sheets_id_schedule": "sheet-ankeng",
+    })
+    return reader
+
+
+@pytest.fixture
+def reader(fake_http, service_account_json):
+    """未啟用內容快取的讀取器"""
+    return _make_reader(fake_http, service_account_json)
+
+
+@pytest.fixture
+def cache_session_factory(db_session):
+    from sqlalchemy.orm import sessionmaker
+
+    return sessionmaker(bind=db_session.get_bind())
+
+
+@pytest.fixture
+def cached_reader(fake_http, service_account_json, cache_session_factory):
+    """啟用內容快取（寫入測試資料庫）的讀取器"""
+    from src.services.sheet_content_cache import SheetContentCache
+
+    return _make_reader(fake_http, service_account_json, SheetContentCache(cache_session_factory))
+
+
+class TestGoogleSheetsReader:
+    """讀取測試"""
+
+    def test_read_schedule_sheet(self, reader):
+        """測試：依年月找到分頁並讀取資料"""
+        result = reader.read_schedule_sheet("安坑", 2026, 1)
+
+        assert result.success
+        assert result.data == SHEET_ROWS
+        assert result.row_count == 2
+
+    def test_read_schedule_months_single_batch(self, reader, fake_http):
+        """測試：多個月份只需一次分頁資訊 + 一次 batchGet"""
+        results = reader.read_schedule_months("安坑", [(2026, 1), (2026, 2), (2026, 3)])
+
+        assert results[(2026, 1)].data == SHEET_ROWS
+        assert results[(2026, 2)].row_count == 1
+        assert not results[(2026, 3)].success
+        assert len(fake_http.requests) == 2
+        assert "values:batchGet" in fake_http.requests[1]
+        assert "valueRenderOption=FORMATTED_VALUE" in fake_http.requests[1]
+
+    def test_batch_read_invalid_spreadsheet(self, reader, service_account_json):
+        """測試：整批失敗時每個範圍都回傳失敗結果"""
+        results = reader.batch_read(service_account_json, "missing", ["'A'", "'B'"])
+
+        assert set(results) == {"'A'", "'B'"}
+        assert all(not result.success for result in results.values())
+
+    def test_service_cached_per_thread(self, reader, service_account_json):
+        """測試：同一執行緒沿用服務物件，不同執行緒各自建立"""
+        first = reader._get_service(service_account_json)
+        assert reader._get_service(service_account_json) is first
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(reader._get_service(service_account_json)))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not first
+
+
+class TestParallelFetch:
+    """並行讀取測試"""
+
+    def test_fetch_department_sheets_runs_concurrently(self, reader, fake_http):
+        """測試：兩個部門並行讀取，耗時接近單一部門"""
+        from unittest.mock import MagicMock
+        from src.services.schedule_sync_service import ScheduleSyncService
+
+        service = ScheduleSyncService(sheets_reader=reader, parser=MagicMock(), chunk_size=100)
+
+        # 第一次讀取會建立各執行緒的服務物件
+        service.fetch_department_sheets(["淡海", "安坑"], 2026, 1)
+
+        started = time.perf_counter()
+        results = service.fetch_department_sheets(["淡海", "安坑"], 2026, 1)
+        elapsed = time.perf_counter() - started
+
+        assert all(result.success for result in results.values())
+        # 每個部門 2 個請求（分頁資訊 + 資料），循序執行約需 0.8 秒
+        assert len(fake_http.requests) == 8
+        assert elapsed < 0.7
+
+
+class TestContentCache:
+    """試算表內容快取測試"""
+
+    def test_unchanged_sheet_skips_download(self, cached_reader, fake_http):
+        """測試：檔案版本未變動時只查詢版本，不重新下載"""
+        first = cached_reader.read_schedule_sheet("安坑", 2026, 1)
+        fake_http.requests.clear()
+
+        second = cached_reader.read_schedule_sheet("安坑", 2026, 1)
+
+        assert not first.from_cache
+        assert second.from_cache
+        assert second.data == SHEET_ROWS
+        assert len(fake_http.requests) == 1
+        assert "/drive/v3/files/" in fake_http.requests[0]
+
+        stats = cached_reader.get_content_cache_stats()
+        assert stats["hits"] == 2          # 分頁列表 + 資料
+        assert stats["misses"] == 2
+
+    def test_modified_sheet_is_downloaded_again(self, cached_reader, fake_http):
+        """測試：檔案版本變動後重新下載"""
+        cached_reader.read_schedule_sheet("安坑", 2026, 1)
+        fake_http.update_sheet("sheet-ankeng", "202601", SHEET_ROWS[:1])
+
+        result = cached_reader.read_schedule_sheet("安坑", 2026, 1)
+
+        assert not result.from_cache
+        assert result.data == SHEET_ROWS[:1]
+        assert result.revision == "2"
+
+    def test_cache_survives_restart(
+        self, cached_reader, fake_http, service_account_json, cache_session_factory
+    ):
+        """測試：新的快取實例可從資料庫載入先前的內容"""
+        from src.services.sheet_content_cache import SheetContentCache
+
+        cached_reader.read_schedule_sheet("安坑", 2026, 1)
+        fake_http.requests.clear()
+
+        restarted = _make_reader(
+            fake_http, service_account_json, SheetContentCache(cache_session_factory)
+        )
+        result = restarted.read_schedule_sheet("安坑", 2026, 1)
+
+        assert result.from_cache
+        assert len(fake_http.requests) == 1
+        assert restarted.get_content_cache_stats()["persisted_hits"] == 2
+
+    def test_using_other_session_factory_shares_entries_and_stats(self, cache_session_factory):
+        """測試：指定 Session 來源的快取共用記憶體項目與統計，資料庫存取改用指定來源"""
+        from src.services.sheet_content_cache import SheetContentCache
+
+        opened = []
+
+        def background_session_factory():
+            opened.append(True)
+            return cache_session_factory()
+
+        cache = SheetContentCache(cache_session_factory)
+        background = cache.using(background_session_factory)
+
+        background.put("sheet-ankeng", "'202601'", "1", SHEET_ROWS)
+
+        assert opened
+        assert cache.get("sheet-ankeng", "'202601'", "1") == SHEET_ROWS
+        assert background.get_stats() == cache.get_stats()
+        assert cache.get_stats()["stores"] == 1
+
+    def test_schedule_sync_uses_background_sessions(self):
+        """測試：班表同步的內容快取使用背景連線池"""
+        from src.config.database import BackgroundSessionLocal
+        from src.services.schedule_sync_service import ScheduleSyncService
+
+        reader = ScheduleSyncService()._reader
+
+        assert reader._content_cache._session_factory is BackgroundSessionLocal
@@ -0,0 +1,147 @@
+"""
+MonthlyRewardCalculatorService 單元測試
+
+驗證集合式批次計算與逐人計算的結果與寫入資料相同。
+"""
+
+from datetime import date
+
+from src.models.assessment_record import AssessmentRecord
+from src.models.assessment_standard import AssessmentStandard
+from src.models.employee import Employee
+from src.models.monthly_reward import MonthlyReward
+from src.services.monthly_reward_calculator import MonthlyRewardCalculatorService
+
+
+YEAR, MONTH = 2026, 3
+
+
+def _record(employee_id, code, points, record_date=date(YEAR, MONTH, 10), is_deleted=False):
+    return AssessmentRecord(
+        employee_id=employee_id,
+        standard_code=code,
+        record_date=record_date,
+        base_points=points,
+        actual_points=points,
+        cumulative_multiplier=1.0,
+        final_points=points,
+        is_deleted=is_deleted,
+    )
+
+
+def _reward(employee_id, m01=False, m02=False, m03=False):
+    return MonthlyReward(
+        employee_id=employee_id,
+        year_month=f"{YEAR:04d}-{MONTH:02d}",
+        full_attendance=m01,
+        driving_zero_violation=m02,
+        all_zero_violation=m03,
+        total_points=3.0 * m01 + 1.0 * m02 + 2.0 * m03,
+    )
+
+
+def _seed(db):
+    """建立各種獎勵情境（每位員工一種情境）"""
+    db.add_all([
+        AssessmentStandard(code=code, category=category, name=code, base_points=points)
+        for code, category, points in [
+            ("D01", "D", -1.0), ("S01", "S", -2.0), ("R01", "R", -1.0),
+            ("+M01", "+M", 3.0), ("+M02", "+M", 1.0), ("+M03", "+M", 2.0),
+        ]
+    ])
+    employees = [
+        Employee(
+            employee_id=f"1140M{i:04d}",
+            employee_name=f"員工{i}",
+            current_department="淡海",
+            hire_year_month="2020-01",
+            is_resigned=(i == 6),
+        )
+        for i in range(10)
+    ]
+    db.add_all(employees)
+    db.flush()
+    ids = [employee.id for employee in employees]
+
+    db.add_all([
+        # 1: D 類扣分 → 僅 +M02
+        _record(ids[1], "D01", -1.0),
+        # 2: S 類扣分 → 無獎勵
+        _record(ids[2], "S01", -2.0),
+        # 3: 已發 +M02/+M03，回溯建檔 R 類扣分 → 全部撤銷
+        _reward(ids[3], m02=True, m03=True),
+        _record(ids[3], "+M02", 1.0, date(YEAR, MONTH, 1)),
+        _record(ids[3], "+M03", 2.0, date(YEAR, MONTH, 1)),
+        _record(ids[3], "R01", -1.0),
+        # 4: 已發 +M02，現在全項目零違規 → 補發 +M03
+        _reward(ids[4], m02=True),
+        _record(ids[4], "+M02", 1.0, date(YEAR, MONTH, 1)),
+        # 5: 已發 +M01 全勤 → 批次計算不含全勤，撤銷 +M01
+        _reward(ids[5], m01=True),
+        _record(ids[5], "+M01", 3.0, date(YEAR, MONTH, 1)),
+        # 6: 離職員工 → 不計算
+        _record(ids[6], "D01", -1.0),
+        # 7: 已刪除的扣分 → 不影響
+        _record(ids[7], "S01", -2.0, is_deleted=True),
+        # 8: 下個月的扣分 → 不影響
+        _record(ids[8], "S01", -2.0, date(YEAR, MONTH + 1, 1)),
+        # 9: 已有 +M02 考核記錄但無獎勵記錄 → 不重複建立
+        _record(ids[9], "+M02", 1.0, date(YEAR, MONTH, 1)),
+    ])
+    db.commit()
+
+
+def _snapshot(db):
+    """取得寫入後的資料狀態"""
+    rewards = sorted(
+        (r.employee_id, r.full_attendance, r.driving_zero_violation, r.all_zero_violation, r.total_points)
+        for r in db.query(MonthlyReward).all()
+    )
+    records = sorted(
+        (r.employee_id, r.standard_code, r.final_points, r.description)
+        for r in db.query(AssessmentRecord).filter(AssessmentRecord.is_deleted == False).all()
+    )
+    scores = sorted((e.id, e.current_score) for e in db.query(Employee).all())
+    return rewards, records, scores
+
+
+class TestMonthBatch:
+    """月度獎勵批次計算測試"""
+
+    def test_bulk_matches_per_employee(self, make_session):
+        """測試：集合式計算的結果與寫入資料與逐人計算相同"""
+        legacy_db, _ = make_session(_seed)
+        bulk_db, _ = make_session(_seed)
+
+        legacy = MonthlyRewardCalculatorService(legacy_db).calculate_month_batch(YEAR, MONTH, bulk=False)
+        legacy_db.commit()
+        bulk = MonthlyRewardCalculatorService(bulk_db).calculate_month_batch(YEAR, MONTH)
+        bulk_db.commit()
+
+        assert bulk == legacy
+        assert _snapshot(bulk_db) == _snapshot(legacy_db)
+        assert (bulk["driving_zero_count"], bulk["all_zero_count"], bulk["no_reward_count"]) == (7, 6, 2)
+
+    def test_bulk_rerun_is_idempotent(self, make_session):
+        """測試：重複執行不重複發放"""
+        db, _ = make_session(_seed)
+        service = MonthlyRewardCalculatorService(db)
+
+        first = service.calculate_month_batch(YEAR, MONTH)
+        db.commit()
+        state = _snapshot(db)
+        second = service.calculate_month_batch(YEAR, MONTH)
+        db.commit()
+
+        assert second == first
+        assert _snapshot(db) == state
+
+    def test_bulk_query_count_is_constant(self, make_session, capture_statements):
+        """測試：查詢次數不隨員工數增加"""
+        db, _ = make_session(_seed)
+        selects = capture_statements(bind=db)
+
+        MonthlyRewardCalculatorService(db).calculate_month_batch(YEAR, MONTH)
+
+        # 員工、扣分類別、既有獎勵、既有獎勵考核記錄（員工年度帳本以 UPSERT 累加，不需查詢）
+        assert len(selects) == 4
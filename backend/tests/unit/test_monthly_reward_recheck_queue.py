@@ -0,0 +1,214 @@
+"""
+MonthlyRewardRecheckQueue 單元測試
+
+驗證考核記錄變更只登記待重算員工月份（重複登記合併）、
+批次處理結果與同步逐筆重算相同，以及重算完成前佇列項目不會遺失。
+"""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.config.settings import get_settings
+from src.models.assessment_record import AssessmentRecord
+from src.models.assessment_standard import AssessmentStandard
+from src.models.employee import Employee
+from src.models.monthly_reward import MonthlyReward
+from src.models.monthly_reward_recheck import MonthlyRewardRecheck
+from src.services.assessment_record_service import AssessmentRecordService
+from src.services.monthly_reward_calculator import MonthlyRewardCalculatorService
+from src.services.monthly_reward_recheck_queue import MonthlyRewardRecheckQueue
+
+
+YEAR = 2026
+
+
+def _seed(db):
+    """建立考核標準與員工"""
+    db.add_all([
+        AssessmentStandard(code=code, category=category, name=code, base_points=points,
+                           has_cumulative=cumulative)
+        for code, category, points, cumulative in [
+            ("D01", "D", -1.0, True), ("S01", "S", -2.0, True),
+            ("+M02", "+M", 1.0, False), ("+M03", "+M", 2.0, False),
+        ]
+    ])
+    employees = [
+        Employee(
+            employee_id=f"1140M{i:04d}",
+            employee_name=f"員工{i}",
+            current_department="淡海",
+            hire_year_month="2020-01",
+        )
+        for i in range(3)
+    ]
+    db.add_all(employees)
+    db.commit()
+    return [employee.id for employee in employees]
+
+
+def _edit(db, ids):
+    """同一員工月份多次建立、刪除、還原"""
+    service = AssessmentRecordService(db)
+    first = service.create(ids[0], "D01", date(YEAR, 3, 1))
+    service.create(ids[0], "S01", date(YEAR, 3, 2))
+    service.soft_delete(first.id)
+    service.restore(first.id)
+    service.create(ids[1], "D01", date(YEAR, 3, 5))
+    service.create(ids[1], "D01", date(YEAR, 4, 5))
+    db.commit()
+
+
+def _snapshot(db):
+    """取得有效考核記錄、月度獎勵與員工總分"""
+    records = sorted(
+        (r.employee_id, r.standard_code, r.record_date, r.final_points)
+        for r in db.query(AssessmentRecord).filter_by(is_deleted=False).all()
+    )
+    rewards = sorted(
+        (r.employee_id, r.year_month, r.driving_zero_violation, r.all_zero_violation, r.total_points)
+        for r in db.query(MonthlyReward).all()
+        if r.total_points
+    )
+    scores = sorted((e.id, e.current_score) for e in db.query(Employee).all())
+    return records, rewards, scores
+
+
+class TestEnqueue:
+    """登記待重算員工月份測試"""
+
+    def test_record_changes_enqueue_coalesced_keys(self, make_session):
+        """測試：同一員工月份的多次變更合併為一筆，且不同步重算"""
+        db, ids = make_session(_seed)
+
+        with patch.object(MonthlyRewardCalculatorService, "calculate_employee_month") as calculate:
+            _edit(db, ids)
+
+        calculate.assert_not_called()
+        assert sorted((q.employee_id, q.year, q.month) for q in db.query(MonthlyRewardRecheck)) == [
+            (ids[0], YEAR, 3), (ids[1], YEAR, 3), (ids[1], YEAR, 4)
+        ]
+
+    def test_reenqueue_keeps_first_enqueued_at(self, make_session):
+        """測試：重複登記保留首次登記時間"""
+        db, ids = make_session(_seed)
+        queue = MonthlyRewardRecheckQueue(db)
+        first = datetime(YEAR, 1, 1, 8, 0)
+
+        with patch("src.services.monthly_reward_recheck_queue.datetime") as mock_datetime:
+            mock_datetime.now.return_value = first
+            queue.enqueue(ids[0], YEAR, 3)
+        queue.enqueue(ids[0], YEAR, 3)
+        db.commit()
+
+        assert db.query(MonthlyRewardRecheck).one().enqueued_at == first
+
+
+class TestDrain:
+    """批次處理測試"""
+
+    def test_drain_matches_synchronous_recheck(self, make_session, monkeypatch):
+        """測試：佇列批次處理結果與同步逐筆重算相同"""
+        deferred_db, ids = make_session(_seed)
+        sync_db, _ = make_session(_seed)
+
+        _edit(deferred_db, ids)
+        result = MonthlyRewardRecheckQueue(deferred_db).drain_all(batch_size=2)
+
+        monkeypatch.setattr(get_settings(), "monthly_reward_recheck_deferred", False)
+        _edit(sync_db, ids)
+
+        assert result == {"drained": 3, "batches": 2}
+        assert deferred_db.query(MonthlyRewardRecheck).count() == 0
+        assert _snapshot(deferred_db) == _snapshot(sync_db)
+
+    def test_drain_only_touches_queued_employees(self, make_session):
+        """測試：僅重算佇列中的員工"""
+        db, ids = make_session(_seed)
+        _edit(db, ids)
+
+        MonthlyRewardRecheckQueue(db).drain_all()
+
+        rewarded = {reward.employee_id for reward in db.query(MonthlyReward)}
+        assert ids[2] not in rewarded
+
+    def test_failed_drain_keeps_queue(self, make_session):
+        """測試：重算失敗時保留佇列項目與原登記時間，並釋放取出標記"""
+        db, ids = make_session(_seed)
+        _edit(db, ids)
+        queue = MonthlyRewardRecheckQueue(db)
+        before = sorted((q.employee_id, q.year, q.month, q.enqueued_at) for q in db.query(MonthlyRewardRecheck))
+
+        with patch.object(MonthlyRewardCalculatorService, "calculate_month_batch", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                queue.drain()
+
+        after = sorted((q.employee_id, q.year, q.month, q.enqueued_at) for q in db.query(MonthlyRewardRecheck))
+        assert after == before
+        assert all(q.claimed_at is None for q in db.query(MonthlyRewardRecheck))
+        assert queue.get_status()["last_error"] == "boom"
+
+    def test_interrupted_drain_is_reclaimed_after_timeout(self, make_session):
+        """測試：重算中斷（行程終止）時佇列項目保留，取出逾時後再次處理"""
+        db, ids = make_session(_seed)
+        _edit(db, ids)
+        queue = MonthlyRewardRecheckQueue(db)
+
+        with patch.object(MonthlyRewardCalculatorService, "calculate_month_batch", side_effect=SystemExit):
+            with pytest.raises(SystemExit):
+                queue.drain()
+        db.rollback()
+
+        assert db.query(MonthlyRewardRecheck).count() == 3
+        assert queue.get_status()["claimed"] == 3
+        assert queue.drain() == {"drained": 0, "months": 0}
+
+        timeout = get_settings().monthly_reward_recheck_claim_timeout_seconds
+        db.query(MonthlyRewardRecheck).update(
+            {MonthlyRewardRecheck.claimed_at: datetime.now() - timedelta(seconds=timeout + 1)}
+        )
+        db.commit()
+
+        assert queue.drain_all()["drained"] == 3
+        assert db.query(MonthlyRewardRecheck).count() == 0
+
+    def test_reenqueue_during_drain_is_kept(self, make_session):
+        """測試：處理期間再次登記的員工月份於處理後保留，並維持首次登記時間"""
+        db, ids = make_session(_seed)
+        _edit(db, ids)
+        queue = MonthlyRewardRecheckQueue(db)
+        first = db.query(MonthlyRewardRecheck).filter_by(employee_id=ids[0]).one().enqueued_at
+        calculate = MonthlyRewardCalculatorService.calculate_month_batch
+
+        def reenqueue_then_calculate(calculator, year, month, employee_ids=None):
+            queue.enqueue(ids[0], YEAR, 3)
+            return calculate(calculator, year, month, employee_ids=employee_ids)
+
+        with patch.object(MonthlyRewardCalculatorService, "calculate_month_batch", reenqueue_then_calculate):
+            assert queue.drain()["drained"] == 3
+
+        remaining = db.query(MonthlyRewardRecheck).one()
+        assert (remaining.employee_id, remaining.year, remaining.month) == (ids[0], YEAR, 3)
+        assert remaining.enqueued_at == first
+        assert remaining.claimed_at is None
+
+    def test_status_reports_pending_and_lag(self, make_session):
+        """測試：狀態包含待處理數與等待秒數"""
+        db, ids = make_session(_seed)
+        queue = MonthlyRewardRecheckQueue(db)
+
+        with patch("src.services.monthly_reward_recheck_queue.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime.now() - timedelta(minutes=5)
+            queue.enqueue_many([(ids[0], YEAR, 3), (ids[0], YEAR, 3), (ids[1], YEAR, 3)])
+        db.commit()
+
+        status = queue.get_status()
+        assert status["pending"] == 2
+        assert status["lag_seconds"] >= 300
+
+        queue.drain()
+        status = queue.get_status()
+        assert status["pending"] == 0
+        assert status["last_drained"] == 2
+        assert status["last_lag_seconds"] >= 300
@@ -0,0 +1,125 @@
+"""
+期間篩選工具單元測試
+
+驗證 period_bounds 的日期範圍，並以 EXPLAIN QUERY PLAN 確認各服務的期間查詢
+使用 (employee_id, record_date) 索引做範圍掃描，而非只比對 employee_id。
+"""
+
+import re
+from datetime import date
+
+import pytest
+from sqlalchemy import extract, select
+
+from src.models.assessment_record import AssessmentRecord
+from src.models.employee import Employee
+from src.models.monthly_reward import MonthlyReward
+from src.services.assessment_recalculator import AssessmentRecalculatorService
+from src.services.assessment_record_service import AssessmentRecordService
+from src.services.cumulative_calculator import CumulativeCalculatorService
+from src.services.monthly_reward_calculator import MonthlyRewardCalculatorService
+from src.utils.period_filter import in_period, period_bounds
+
+
+# 以複合索引（employee_id 或 standard_code + record_date）做日期範圍掃描
+RANGE_SCAN = re.compile(r"USING (?:COVERING )?INDEX ix_assessment_records_\w+ \(\w+=\? AND record_date>\? AND record_date<\?\)")
+
+
+class TestPeriodBounds:
+    """期間日期範圍測試"""
+
+    @pytest.mark.parametrize("kwargs, expected", [
+        ({}, (date(2026, 1, 1), date(2027, 1, 1))),
+        ({"quarter": 1}, (date(2026, 1, 1), date(2026, 4, 1))),
+        ({"quarter": 4}, (date(2026, 10, 1), date(2027, 1, 1))),
+        ({"month": 2}, (date(2026, 2, 1), date(2026, 3, 1))),
+        ({"month": 12}, (date(2026, 12, 1), date(2027, 1, 1))),
+    ])
+    def test_half_open_bounds(self, kwargs, expected):
+        """測試：結束日為下期起始日（不含）"""
+        assert period_bounds(2026, **kwargs) == expected
+
+    @pytest.mark.parametrize("kwargs", [
+        {"quarter": 1, "month": 1},
+        {"quarter": 5},
+        {"month": 0},
+    ])
+    def test_invalid_period(self, kwargs):
+        """測試：無效的期間參數"""
+        with pytest.raises(ValueError):
+            period_bounds(2026, **kwargs)
+
+
+def _plan(db_session, statement, parameters) -> list[str]:
+    """取得 SQLite 查詢計畫"""
+    with db_session.get_bind().connect() as conn:
+        return [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+
+
+def _period_plans(db_session, statements) -> list[list[str]]:
+    """取得所有以 record_date 篩選考核記錄的查詢計畫"""
+    return [
+        _plan(db_session, statement, parameters)
+        for statement, parameters in statements
+        if "assessment_records.record_date >=" in statement
+    ]
+
+
+class TestIndexRangeScan:
+    """期間查詢索引使用測試"""
+
+    def test_extract_filter_only_matches_employee(self, db_session):
+        """測試：extract() 寫法無法使用 record_date 索引範圍（對照組）"""
+        stmt = select(AssessmentRecord.id).where(
+            AssessmentRecord.employee_id == 1,
+            extract('year', AssessmentRecord.record_date) == 2026
+        )
+        compiled = stmt.compile(db_session.get_bind())
+
+        plan = _plan(db_session, str(compiled), tuple(compiled.params.values()))
+
+        assert not any("record_date>?" in line for line in plan)
+
+    def test_in_period_uses_range_scan(self, db_session):
+        """測試：in_period 產生的條件使用索引範圍掃描"""
+        stmt = select(AssessmentRecord.id).where(
+            AssessmentRecord.employee_id == 1,
+            in_period(AssessmentRecord.record_date, 2026, quarter=2)
+        )
+        compiled = stmt.compile(db_session.get_bind())
+
+        plan = _plan(db_session, str(compiled), tuple(compiled.params.values()))
+
+        assert any(RANGE_SCAN.search(line) for line in plan)
+
+    def test_service_period_queries_use_range_scan(self, db_session, capture_statements):
+        """測試：重算、查詢與月度獎勵的期間查詢皆使用索引範圍掃描"""
+        employee = Employee(
+            employee_id="1140M0001",
+            employee_name="測試員工",
+            current_department="淡海",
+            hire_year_month="2020-01",
+        )
+        db_session.add(employee)
+        db_session.flush()
+        db_session.add(MonthlyReward(
+            employee_id=employee.id,
+            year_month="2026-03",
+            full_attendance=True,
+            total_points=3.0,
+        ))
+        db_session.commit()
+        selects = capture_statements(parameters=True)
+
+        AssessmentRecalculatorService(db_session).recalculate_cumulative_counts(employee.id, 2026, "D")
+        AssessmentRecalculatorService(db_session).recalculate_cumulative_counts(employee.id, 2026, "R")
+        CumulativeCalculatorService(db_session).recalculate_counts(employee.id, 2026, "W")
+        AssessmentRecordService(db_session).get_by_employee(employee.id, year=2026, month=3)
+        # 既有全勤獎勵 → 觸發 _sync_reward_records 的撤銷 / 補發查詢
+        MonthlyRewardCalculatorService(db_session).calculate_employee_month(employee.id, 2026, 3)
+
+        plans = _period_plans(db_session, selects)
+
+        assert len(plans) >= 7
+        for plan in plans:
+            assert any(RANGE_SCAN.search(line) for line in plan), plan
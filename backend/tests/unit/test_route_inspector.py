@@ -0,0 +1,68 @@
+"""
+路由 Event Loop 安全檢查單元測試
+
+驗證可找出使用同步 Session 的 async 路由（含間接依賴），
+並確保應用程式本身沒有這類路由。
+"""
+
+from fastapi import APIRouter, Depends, FastAPI
+
+
+def _fake_db():
+    yield None
+
+
+def _fake_user(db=Depends(_fake_db)):
+    return {"db": db}
+
+
+def _make_app():
+    from src.utils.route_inspector import offloads_blocking_io
+
+    router = APIRouter()
+
+    @router.get("/async-db")
+    async def async_db(db=Depends(_fake_db)):
+        return {}
+
+    @router.get("/async-indirect")
+    async def async_indirect(user=Depends(_fake_user)):
+        return {}
+
+    @router.get("/sync-db")
+    def sync_db(db=Depends(_fake_db)):
+        return {}
+
+    @router.get("/async-plain")
+    async def async_plain():
+        return {}
+
+    @router.get("/async-offloaded")
+    @offloads_blocking_io
+    async def async_offloaded(db=Depends(_fake_db)):
+        return {}
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+class TestFindBlockingAsyncRoutes:
+    """阻塞路由檢查測試"""
+
+    def test_detects_direct_and_indirect_dependencies(self):
+        """測試：僅回報直接或間接依賴同步 Session 且未標記的 async 路由"""
+        from src.utils.route_inspector import find_blocking_async_routes
+
+        offenders = find_blocking_async_routes(_make_app(), blocking_dependencies=[_fake_db])
+
+        assert sorted(route.path for route in offenders) == ["/async-db", "/async-indirect"]
+        assert offenders[0].methods == ("GET",)
+        assert offenders[0].endpoint.endswith("async_db")
+
+    def test_application_has_no_blocking_routes(self):
+        """測試：應用程式所有使用 get_db 的路由皆不會阻塞 Event Loop"""
+        from src.main import app
+        from src.utils.route_inspector import find_blocking_async_routes
+
+        assert [str(route) for route in find_blocking_async_routes(app)] == []
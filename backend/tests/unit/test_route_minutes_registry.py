@@ -0,0 +1,100 @@
+"""
+RouteMinutesRegistry 單元測試
+
+驗證部門映射快取、勤務標準時間變更後的版本失效，
+以及勤務表逐日同步只查詢一次勤務標準時間。
+"""
+
+from datetime import date
+
+import pytest
+
+from src.models.route_standard_time import RouteStandardTime
+from src.services.duty_sync_service import DutySyncService
+from src.services.route_minutes_registry import get_route_minutes_registry
+from src.services.route_standard_time_service import RouteStandardTimeService
+
+
+@pytest.fixture
+def routes(db_session):
+    """建立勤務標準時間（含停用）"""
+    db_session.add_all([
+        RouteStandardTime(department="淡海", route_code="0905G", route_name="早班",
+                          standard_minutes=300, is_active=True),
+        RouteStandardTime(department="淡海", route_code="1425G", route_name="午班",
+                          standard_minutes=280, is_active=False),
+        RouteStandardTime(department="安坑", route_code="0600G", route_name="安坑早班",
+                          standard_minutes=320, is_active=True),
+    ])
+    db_session.commit()
+
+
+class TestRegistry:
+    """登錄表快取測試"""
+
+    def test_cached_per_department(self, db_session, routes, capture_statements):
+        """測試：各部門僅查詢一次，僅含啟用中的代碼"""
+        service = RouteStandardTimeService(db_session)
+        before = get_route_minutes_registry().get_stats()
+        selects = capture_statements(table="route_standard_times")
+
+        assert dict(service.get_minutes_map("淡海")) == {"0905G": 300}
+        assert dict(service.get_minutes_map("淡海")) == {"0905G": 300}
+        assert dict(service.get_minutes_map("安坑")) == {"0600G": 320}
+        assert len(selects) == 2
+
+        stats = get_route_minutes_registry().get_stats()
+        assert stats["hits"] - before["hits"] == 1
+        assert stats["misses"] - before["misses"] == 2
+
+    def test_map_is_read_only(self, db_session, routes):
+        """測試：共用映射不可被呼叫端修改"""
+        minutes = RouteStandardTimeService(db_session).get_minutes_map("淡海")
+
+        with pytest.raises(TypeError):
+            minutes["0905G"] = 0
+
+    def test_changes_invalidate(self, db_session, routes):
+        """測試：新增、更新、停用、恢復、批次匯入後重新載入"""
+        service = RouteStandardTimeService(db_session)
+        service.get_minutes_map("淡海")
+
+        route = service.create("淡海", "0700G", "早早班", 290)
+        assert service.get_minutes_map("淡海")["0700G"] == 290
+
+        service.update(route.id, standard_minutes=295)
+        assert service.get_minutes_map("淡海")["0700G"] == 295
+
+        service.soft_delete(route.id)
+        assert "0700G" not in service.get_minutes_map("淡海")
+
+        service.restore(route.id)
+        assert "0700G" in service.get_minutes_map("淡海")
+
+        service.bulk_import([{
+            "route_code": "1425G", "route_name": "午班", "standard_minutes": 285, "description": None
+        }], "淡海")
+        assert service.get_minutes_map("淡海")["1425G"] == 285
+
+    def test_warm_up(self, db_session, routes, capture_statements):
+        """測試：預先載入所有部門後取用不查詢資料庫"""
+        registry = get_route_minutes_registry()
+
+        assert registry.warm_up(db_session) == {"淡海": 1, "安坑": 1}
+        selects = capture_statements(table="route_standard_times")
+
+        RouteStandardTimeService(db_session).get_minutes_map("安坑")
+        assert selects == []
+
+
+class TestDutySync:
+    """勤務表同步測試"""
+
+    def test_date_range_loads_routes_once(self, db_session, routes, capture_statements):
+        """測試：逐日同步多天僅查詢一次勤務標準時間"""
+        selects = capture_statements(table="route_standard_times")
+        DutySyncService(db_session).sync_daily_stats_for_date_range(
+            "淡海", date(2026, 1, 1), date(2026, 1, 10)
+        )
+
+        assert len(selects) == 1
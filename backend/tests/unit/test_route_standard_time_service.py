@@ -0,0 +1,94 @@
+"""
+RouteStandardTimeService 批次匯入單元測試
+
+驗證一次查詢既有代碼、多列 UPSERT 寫入與逐列結果。
+"""
+
+import pytest
+
+from src.models.route_standard_time import RouteStandardTime
+from src.services.route_standard_time_service import (
+    RouteStandardTimeService,
+    RouteStandardTimeServiceError,
+)
+
+
+@pytest.fixture
+def existing_routes(db_session):
+    """建立既有勤務標準時間（含停用與其他部門）"""
+    db_session.add_all([
+        RouteStandardTime(department="淡海", route_code="0905G", route_name="早班",
+                          standard_minutes=300, is_active=True),
+        RouteStandardTime(department="淡海", route_code="1425G", route_name="午班",
+                          standard_minutes=280, is_active=False),
+        RouteStandardTime(department="安坑", route_code="0600G", route_name="安坑早班",
+                          standard_minutes=320, is_active=True),
+    ])
+    db_session.commit()
+
+
+@pytest.fixture
+def import_rows(db_session):
+    """經驗證的匯入資料"""
+    service = RouteStandardTimeService(db_session)
+    valid_rows, errors = service.validate_import_data([
+        {"route_code": "0905g", "route_name": "早班（新）", "standard_minutes": 310},
+        {"route_code": "1425G", "route_name": "午班（新）", "standard_minutes": "290", "description": "重新啟用"},
+        {"route_code": "0600G", "route_name": "淡海早班", "standard_minutes": 330},
+        {"route_code": "0600G", "route_name": "重複", "standard_minutes": 1},
+    ], "淡海")
+    assert errors == []
+    return valid_rows
+
+
+def _minutes(db_session, department: str) -> dict[str, tuple[int, bool]]:
+    return {
+        route.route_code: (route.standard_minutes, route.is_active)
+        for route in db_session.query(RouteStandardTime).filter_by(department=department)
+    }
+
+
+class TestBulkImport:
+    """批次匯入測試"""
+
+    def test_upsert_with_row_outcomes(self, db_session, existing_routes, import_rows, capture_statements):
+        """測試：一次查詢 + 一次 UPSERT，逐列回報結果"""
+        statements = capture_statements(kind=None, table="route_standard_times")
+        result = RouteStandardTimeService(db_session).bulk_import(import_rows, "淡海")
+
+        assert [s.split()[0].upper() for s in statements] == ["SELECT", "INSERT"]
+        assert (result["created"], result["updated"], result["skipped"]) == (1, 2, 1)
+        assert [(r["row"], r["action"]) for r in result["results"]] == [
+            (2, "updated"), (3, "updated"), (4, "created"), (5, "skipped")
+        ]
+        assert _minutes(db_session, "淡海") == {
+            "0905G": (310, True), "1425G": (290, True), "0600G": (330, True)
+        }
+        assert _minutes(db_session, "安坑") == {"0600G": (320, True)}
+
+    def test_skip_existing(self, db_session, existing_routes, import_rows):
+        """測試：不更新既有資料時僅新增"""
+        result = RouteStandardTimeService(db_session).bulk_import(
+            import_rows, "淡海", update_existing=False
+        )
+
+        assert (result["created"], result["updated"], result["skipped"]) == (1, 0, 3)
+        assert _minutes(db_session, "淡海")["1425G"] == (280, False)
+
+    def test_chunked_writes(self, db_session, capture_statements):
+        """測試：依批次大小分批寫入"""
+        rows = [
+            {"route_code": f"R{i:03d}", "route_name": f"勤務{i}", "standard_minutes": i, "description": None}
+            for i in range(5)
+        ]
+        inserts = capture_statements(kind="INSERT", table="route_standard_times")
+
+        result = RouteStandardTimeService(db_session).bulk_import(rows, "安坑", chunk_size=2)
+
+        assert result["created"] == 5
+        assert len(inserts) == 3
+
+    def test_invalid_department(self, db_session, import_rows):
+        """測試：無效部門直接拒絕"""
+        with pytest.raises(RouteStandardTimeServiceError):
+            RouteStandardTimeService(db_session).bulk_import(import_rows, "台北")
@@ -0,0 +1,72 @@
+"""
+ScheduleParser 單元測試
+"""
+
+from datetime import date
+
+import pytest
+
+from src.services.schedule_parser import ScheduleParser
+from tests.fake_sheets import make_schedule_grid
+
+
+@pytest.fixture
+def parser():
+    return ScheduleParser()
+
+
+class TestParse:
+    """班表解析測試"""
+
+    def test_synthetic_sheet(self, parser):
+        """測試：合成班表每個非空儲存格皆解析為一筆班別"""
+        data = make_schedule_grid(300)
+        result = parser.parse(data, "淡海", 2026, 1)
+
+        assert result.success and len(result.shifts) > 8000
+        assert result.parsed_rows == 300
+        assert all(shift.shift_code == shift.shift_code.strip() for shift in result.shifts)
+
+    def test_short_month_and_odd_cells(self, parser):
+        """測試：二月（28 天）與非字串、空白儲存格"""
+        data = [
+            ["編號", "姓名", "1", "2", "3"],
+            ["1140M0001", "王小明"] + ["0905G"] * 31,
+            ["1140M0002"],
+            [" 1140M0003 ", None, 905, None, " R/1425G ", "", "(假)"],
+            ["", "無編號"],
+            [],
+        ]
+
+        result = parser.parse(data, "淡海", 2026, 2)
+
+        assert max(shift.schedule_date.day for shift in result.shifts) == 28
+        assert {shift.shift_code for shift in result.shifts} >= {"0905", "None", "R/1425G", "(假)"}
+        assert (result.parsed_rows, result.skipped_rows) == (3, 2)
+
+        r_shift = next(shift for shift in result.shifts if shift.shift_code == "R/1425G")
+        assert r_shift.employee_id == "1140M0003"
+        assert r_shift.schedule_date == date(2026, 2, 3)
+        assert r_shift.is_r_shift
+
+    def test_rows_without_shifts(self, parser):
+        """測試：員工列沒有任何班別時無結果"""
+        data = [["編號", "姓名", "1"], ["1140M0001", "王小明"]]
+
+        result = parser.parse(data, "淡海", 2026, 1)
+
+        assert result.shifts == []
+        assert result.parsed_rows == 1
+
+    def test_numeric_cells_match_formatted_codes(self, parser):
+        """測試：以 UNFORMATTED_VALUE 讀取的數字儲存格與格式化字串解析結果相同"""
+        formatted = [["編號", "姓名", "1", "2", "3"], ["1140M0001", "王小明", "0905", "0600", "1400"]]
+        numeric = [["編號", "姓名", "1", "2", "3"], ["1140M0001", "王小明", 905, 600.0, 1400]]
+
+        expected = parser.parse(formatted, "淡海", 2026, 1).shifts
+        actual = parser.parse(numeric, "淡海", 2026, 1).shifts
+
+        assert actual == expected
+        assert [shift.shift_code for shift in actual] == ["0905", "0600", "1400"]
+        assert actual[1].shift_type == "早班"
+        assert actual[1].start_time == "06:00"
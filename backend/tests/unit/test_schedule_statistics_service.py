@@ -0,0 +1,174 @@
+"""
+ScheduleStatisticsService 單元測試
+
+驗證單次掃描聚合結果與以相同旗標逐項查詢相同、R班數依 is_r_shift 旗標定義，
+以及統計快取在新同步批次完成或同步提交後失效（略過寫入的批次除外）。
+"""
+
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import func
+
+from src.models.schedule import Schedule, SyncTask
+from src.services.schedule_statistics_service import (
+    ScheduleStatisticsService,
+    get_schedule_statistics_cache,
+)
+
+
+SHIFT_CODES = ["0600G", "R/0905G", "R(國)/1425G(+2)", "(假)", "1425G(+1)", "站"]
+
+
+@pytest.fixture
+def schedules(db_session):
+    """建立兩個部門、兩個月份的班表"""
+    from src.services.schedule_sync_service import schedule_shift_flags
+    from src.services.shift_code_registry import get_shift_code_info
+
+    for offset, department in enumerate(("淡海", "安坑")):
+        for i in range(offset * 4, offset * 4 + 4):
+            for day in range(1, 8):
+                for month in (3, 4):
+                    code = SHIFT_CODES[(i + day) % len(SHIFT_CODES)]
+                    info = get_shift_code_info(code)
+                    db_session.add(Schedule(
+                        employee_id=f"1140M{i:04d}",
+                        department=department,
+                        schedule_date=date(2026, month, day),
+                        shift_code=code,
+                        shift_type=info.shift_type if day != 7 else None,
+                        overtime_hours=info.overtime_hours,
+                        **schedule_shift_flags(code)
+                    ))
+    db_session.commit()
+
+
+def _complete_sync(db_session, batch_id, sync_mode=None):
+    db_session.add(SyncTask(
+        batch_id=batch_id,
+        task_type="schedule_sync",
+        department="淡海",
+        target_year=2026,
+        target_month=3,
+        status="completed",
+        sync_mode=sync_mode,
+        completed_at=datetime.now()
+    ))
+    db_session.commit()
+
+
+def _per_query_statistics(db, department, year, month):
+    """逐項查詢（原實作）"""
+    base = db.query(Schedule).filter(
+        Schedule.department == department,
+        Schedule.schedule_date >= date(year, month, 1),
+        Schedule.schedule_date < date(year, month + 1, 1)
+    )
+    return {
+        "total_records": base.count(),
+        "employee_count": base.with_entities(func.count(func.distinct(Schedule.employee_id))).scalar(),
+        "shift_type_distribution": {
+            shift_type or "未分類": count
+            for shift_type, count in base.with_entities(
+                Schedule.shift_type, func.count(Schedule.id)
+            ).group_by(Schedule.shift_type)
+        },
+        "r_shift_count": base.filter(Schedule.is_r_shift == True).count(),
+        "leave_count": base.filter(Schedule.is_leave == True).count(),
+        "overtime_count": base.filter(Schedule.overtime_hours > 0).count(),
+    }
+
+
+class TestAggregate:
+    """單次掃描聚合測試"""
+
+    def test_matches_per_query_statistics(self, db_session, schedules, capture_statements):
+        """測試：單次掃描結果與逐項查詢相同"""
+        scans = capture_statements(table="schedules")
+        result = ScheduleStatisticsService(db_session).get_month_statistics("淡海", 2026, 3, use_cache=False)
+
+        assert len(scans) == 1
+        expected = _per_query_statistics(db_session, "淡海", 2026, 3)
+        assert {key: result[key] for key in expected} == expected
+        assert result["r_shift_count"] > 0 and result["overtime_count"] > 0
+        assert "未分類" in result["shift_type_distribution"]
+
+    def test_r_shift_count_follows_flag_definition(self, db_session):
+        """測試：R班數包含 R(國)/ 與含「R班」的代碼（舊版僅比對 R/ 開頭）"""
+        from src.services.schedule_sync_service import schedule_shift_flags
+
+        for day, code in enumerate(["R/0905G", "R(國)/1425G", "R班(支援)", "0600G"], start=1):
+            db_session.add(Schedule(
+                employee_id="1140M0001",
+                department="淡海",
+                schedule_date=date(2026, 3, day),
+                shift_code=code,
+                **schedule_shift_flags(code)
+            ))
+        db_session.commit()
+
+        result = ScheduleStatisticsService(db_session).get_month_statistics("淡海", 2026, 3, use_cache=False)
+
+        assert result["r_shift_count"] == 3
+        legacy = db_session.query(Schedule).filter(Schedule.shift_code.like("R/%")).count()
+        assert legacy == 1
+
+    def test_empty_month(self, db_session):
+        """測試：無班表時回傳零值"""
+        result = ScheduleStatisticsService(db_session).get_month_statistics("淡海", 2026, 3)
+
+        assert result["total_records"] == 0
+        assert result["employee_count"] == 0
+        assert result["shift_type_distribution"] == {}
+
+
+class TestCache:
+    """統計快取測試"""
+
+    def test_cache_hit_skips_scan(self, db_session, schedules, capture_statements):
+        """測試：同一同步批次下重複查詢不再掃描班表"""
+        scans = capture_statements(table="schedules")
+        service = ScheduleStatisticsService(db_session)
+        first = service.get_month_statistics("淡海", 2026, 3)
+        second = service.get_month_statistics("淡海", 2026, 3)
+
+        assert first == second
+        assert len(scans) == 1
+        assert get_schedule_statistics_cache().get_stats()["hits"] >= 1
+
+    def test_new_batch_invalidates(self, db_session, schedules, capture_statements):
+        """測試：新同步批次完成後重新計算"""
+        scans = capture_statements(table="schedules")
+        service = ScheduleStatisticsService(db_session)
+        _complete_sync(db_session, "batch-1")
+        service.get_month_statistics("淡海", 2026, 3)
+
+        db_session.query(Schedule).filter(Schedule.shift_code == "站").delete()
+        db_session.commit()
+        _complete_sync(db_session, "batch-2")
+
+        result = service.get_month_statistics("淡海", 2026, 3)
+        assert len(scans) == 2
+        assert result == service.get_month_statistics("淡海", 2026, 3, use_cache=False)
+
+    def test_skipped_batch_keeps_cache(self, db_session, schedules, capture_statements):
+        """測試：試算表未變動而略過的批次不使快取失效"""
+        scans = capture_statements(table="schedules")
+        service = ScheduleStatisticsService(db_session)
+        _complete_sync(db_session, "batch-1", sync_mode="incremental")
+        service.get_month_statistics("淡海", 2026, 3)
+
+        _complete_sync(db_session, "batch-2", sync_mode="skipped")
+        service.get_month_statistics("淡海", 2026, 3)
+
+        assert len(scans) == 1
+
+    def test_invalidate_by_month(self, db_session, schedules):
+        """測試：僅清除指定部門月份"""
+        service = ScheduleStatisticsService(db_session)
+        service.get_month_statistics("淡海", 2026, 3)
+        service.get_month_statistics("安坑", 2026, 3)
+
+        assert get_schedule_statistics_cache().invalidate("淡海", 2026, 3) == 1
+        assert get_schedule_statistics_cache().get_stats()["size"] == 1
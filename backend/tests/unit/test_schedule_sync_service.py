@@ -0,0 +1,247 @@
+"""
+ScheduleSyncService 單元測試
+
+測試班表多列 INSERT 寫入與失敗批次的逐筆回退。
+"""
+
+import pytest
+from datetime import date
+from unittest.mock import MagicMock
+
+from src.models.schedule import Schedule
+from src.services.schedule_parser import ParsedShift
+
+
+def _make_shifts(employee_count: int, days: int) -> list[ParsedShift]:
+    return [
+        ParsedShift(
+            employee_id=f"1140M{i:04d}",
+            employee_name=f"員工{i}",
+            schedule_date=date(2026, 1, day),
+            shift_code="0905G",
+            shift_type="中班",
+            start_time="09:05",
+            end_time="17:35"
+        )
+        for i in range(employee_count)
+        for day in range(1, days + 1)
+    ]
+
+
+@pytest.fixture
+def sync_service():
+    # 延遲匯入：避免收集階段即以未設定的環境變數建立 Settings 快取
+    from src.services.schedule_sync_service import ScheduleSyncService
+
+    return ScheduleSyncService(
+        sheets_reader=MagicMock(),
+        parser=MagicMock(),
+        chunk_size=4
+    )
+
+
+class TestInsertSchedules:
+    """班表寫入測試"""
+
+    def test_bulk_insert_all_rows(self, db_session, sync_service):
+        """測試：多列 INSERT 寫入所有班別"""
+        shifts = _make_shifts(3, 5)
+
+        success, errors, messages = sync_service._insert_schedules(
+            db_session, shifts, "淡海", "batch-1", "淡海_schedule_202601"
+        )
+        db_session.commit()
+
+        assert (success, errors, messages) == (15, 0, [])
+        assert db_session.query(Schedule).count() == 15
+        assert db_session.query(Schedule).filter(
+            Schedule.sync_batch_id == "batch-1"
+        ).count() == 15
+
+    def test_failed_chunk_falls_back_to_row_path(self, db_session, sync_service):
+        """測試：批次失敗時僅該批逐筆寫入並回報錯誤列"""
+        shifts = _make_shifts(2, 4)
+        # 重複的員工 + 日期違反唯一約束
+        shifts.insert(5, ParsedShift(
+            employee_id=shifts[4].employee_id,
+            employee_name=shifts[4].employee_name,
+            schedule_date=shifts[4].schedule_date,
+            shift_code="R/0905G"
+        ))
+
+        success, errors, messages = sync_service._insert_schedules(
+            db_session, shifts, "淡海", "batch-2", "淡海_schedule_202601"
+        )
+        db_session.commit()
+
+        assert success == 8
+        assert errors == 1
+        assert shifts[4].employee_id in messages[0]
+        assert db_session.query(Schedule).count() == 8
+
+
+class TestIncrementalSync:
+    """差異同步測試"""
+
+    def test_only_changed_rows_are_written(self, db_session, sync_service):
+        """測試：差異同步只新增、更新、刪除有變動的班表"""
+        first = _make_shifts(2, 5)
+        sync_service._apply_full_sync(db_session, first, "淡海", 2026, 1, "batch-1", "src")
+        db_session.commit()
+
+        second = _make_shifts(2, 5)
+        second[0].shift_code = "R/0905G"              # 更新
+        second[0].shift_type = "R班"
+        del second[3]                                 # 刪除
+        second.append(ParsedShift(                    # 新增
+            employee_id="1140M0099",
+            employee_name="新進員工",
+            schedule_date=date(2026, 1, 2),
+            shift_code="1425G"
+        ))
+
+        changes = sync_service._apply_incremental_sync(
+            db_session, second, "淡海", 2026, 1, "batch-2", "src"
+        )
+        db_session.commit()
+
+        assert (changes["inserted"], changes["updated"], changes["deleted"]) == (1, 1, 1)
+        assert changes["unchanged"] == 8
+        assert changes["success_count"] == 2          # 僅計入實際寫入的新增與更新
+        assert db_session.query(Schedule).count() == len(second)
+
+        # 未變動的列保留原批次，變動的列標記新批次
+        assert db_session.query(Schedule).filter(
+            Schedule.sync_batch_id == "batch-2"
+        ).count() == 2
+        updated = db_session.query(Schedule).filter(
+            Schedule.employee_id == second[0].employee_id,
+            Schedule.schedule_date == second[0].schedule_date
+        ).one()
+        assert updated.shift_code == "R/0905G"
+        assert updated.is_r_shift and updated.driving_minutes_code == "0905G"
+
+    def test_unchanged_sheet_writes_nothing(self, db_session, sync_service):
+        """測試：試算表未變動時不產生任何寫入"""
+        shifts = _make_shifts(3, 3)
+        sync_service._apply_full_sync(db_session, shifts, "淡海", 2026, 1, "batch-1", "src")
+        db_session.commit()
+
+        changes = sync_service._apply_incremental_sync(
+            db_session, _make_shifts(3, 3), "淡海", 2026, 1, "batch-2", "src"
+        )
+
+        assert (changes["inserted"], changes["updated"], changes["deleted"]) == (0, 0, 0)
+        assert changes["unchanged"] == 9
+        assert changes["success_count"] == 0
+
+
+class TestShiftFlags:
+    """班別旗標測試"""
+
+    def test_insert_populates_flags(self, db_session, sync_service):
+        """測試：寫入時推導 R班、國定假日、休假與勤務代碼"""
+        shifts = _make_shifts(1, 4)
+        for shift, code in zip(shifts, ["R/0905G", "R(國)/1425G(+2)", "(假)", "0905G"]):
+            shift.shift_code = code
+
+        sync_service._insert_schedules(db_session, shifts, "淡海", "batch-1", "src")
+        db_session.commit()
+
+        flags = [
+            (s.is_r_shift, s.is_national_holiday, s.is_leave, s.driving_minutes_code)
+            for s in db_session.query(Schedule).order_by(Schedule.schedule_date)
+        ]
+        assert flags == [
+            (True, False, False, "0905G"),
+            (True, True, False, "1425G"),
+            (False, False, True, ""),
+            (False, False, False, "0905G"),
+        ]
+
+    def test_backfill_matches_ingest(self, db_session, sync_service):
+        """測試：回填結果與同步寫入相同，且不重複回填"""
+        from src.services.schedule_sync_service import backfill_schedule_flags
+
+        shifts = _make_shifts(2, 3)
+        shifts[0].shift_code = "R/0905G"
+        shifts[1].shift_code = "(特)"
+        sync_service._insert_schedules(db_session, shifts, "淡海", "batch-1", "src")
+        db_session.commit()
+        expected = [
+            (s.id, s.is_r_shift, s.is_leave, s.driving_minutes_code)
+            for s in db_session.query(Schedule).order_by(Schedule.id)
+        ]
+
+        db_session.query(Schedule).update({
+            Schedule.is_r_shift: False,
+            Schedule.is_leave: False,
+            Schedule.driving_minutes_code: None,
+        })
+        db_session.commit()
+
+        assert backfill_schedule_flags(db_session, chunk_size=4) == 6
+        db_session.expire_all()
+        assert [
+            (s.id, s.is_r_shift, s.is_leave, s.driving_minutes_code)
+            for s in db_session.query(Schedule).order_by(Schedule.id)
+        ] == expected
+        assert backfill_schedule_flags(db_session) == 0
+
+
+class TestRevisionSkip:
+    """試算表版本略過同步測試"""
+
+    def _add_task(self, db_session, revision, error_count=0):
+        from datetime import datetime
+        from src.models.schedule import SyncTask
+
+        db_session.add(SyncTask(
+            batch_id=f"batch-{revision}-{error_count}",
+            task_type="schedule_sync",
+            department="淡海",
+            target_year=2026,
+            target_month=1,
+            status="completed",
+            error_count=error_count,
+            source_revision=revision,
+            completed_at=datetime.now(),
+            triggered_by="auto"
+        ))
+        db_session.commit()
+
+    def test_same_revision_is_skipped(self, db_session, sync_service):
+        """測試：上次成功同步的版本相同時可略過"""
+        self._add_task(db_session, "7")
+
+        assert sync_service._is_revision_synced(db_session, "淡海", 2026, 1, "7")
+        assert not sync_service._is_revision_synced(db_session, "淡海", 2026, 1, "8")
+        assert not sync_service._is_revision_synced(db_session, "淡海", 2026, 2, "7")
+        assert not sync_service._is_revision_synced(db_session, "淡海", 2026, 1, None)
+
+    def test_revision_with_errors_is_not_skipped(self, db_session, sync_service):
+        """測試：上次同步有錯誤時不略過"""
+        self._add_task(db_session, "7", error_count=3)
+
+        assert not sync_service._is_revision_synced(db_session, "淡海", 2026, 1, "7")
+
+    def test_skip_is_recorded_without_writes(self, db_session, sync_service, monkeypatch):
+        """測試：略過的同步以 skipped 模式完成，差異筆數皆為 0"""
+        from src.models.schedule import SyncTask
+        from src.services import schedule_sync_service as module
+        from src.services.google_sheets_reader import ReadResult
+
+        self._add_task(db_session, "7")
+        batch_id = sync_service.create_sync_task("schedule_sync", "淡海", 2026, 1, db=db_session)
+        monkeypatch.setattr(module, "BackgroundSessionLocal", lambda: db_session)
+
+        result = sync_service.execute_sync(
+            batch_id, "淡海", 2026, 1, mode="incremental",
+            read_result=ReadResult(success=True, revision="7")
+        )
+
+        assert result["skipped"]
+        sync_service._parser.parse.assert_not_called()
+        task = db_session.query(SyncTask).filter_by(batch_id=batch_id).one()
+        assert (task.status, task.sync_mode) == ("completed", "skipped")
+        assert (task.inserted_count, task.updated_count, task.deleted_count, task.unchanged_count) == (0, 0, 0, 0)
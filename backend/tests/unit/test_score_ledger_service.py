@@ -0,0 +1,221 @@
+"""
+ScoreLedgerService 單元測試
+
+驗證考核記錄建立、刪除、還原與月度獎勵計算後，員工年度帳本與考核記錄一致，
+增量寫入不會覆蓋其他 Session 的更新、分數驗證只讀取帳本，以及比對以一次分組查詢完成。
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+from src.models.assessment_record import AssessmentRecord
+from src.models.assessment_standard import AssessmentStandard
+from src.models.base import Base
+from src.models.employee import Employee
+from src.models.employee_score_ledger import EmployeeScoreLedger
+from src.services.assessment_recalculator import AssessmentRecalculatorService
+from src.services.assessment_record_service import AssessmentRecordService
+from src.services.monthly_reward_calculator import MonthlyRewardCalculatorService
+from src.services.score_ledger_service import ScoreLedgerService
+
+
+YEAR = 2026
+
+
+@pytest.fixture
+def employee(db_session):
+    """建立考核標準與員工"""
+    db_session.add_all([
+        AssessmentStandard(code=code, category=category, name=code, base_points=points,
+                           has_cumulative=cumulative)
+        for code, category, points, cumulative in [
+            ("D01", "D", -1.0, True), ("S01", "S", -2.0, True),
+            ("+M02", "+M", 1.0, False), ("+M03", "+M", 2.0, False),
+        ]
+    ])
+    employee = Employee(
+        employee_id="1140M0001",
+        employee_name="測試員工",
+        current_department="淡海",
+        hire_year_month="2020-01",
+    )
+    db_session.add(employee)
+    db_session.commit()
+    return employee
+
+
+def _ledger(db_session, employee_id, year=YEAR):
+    return db_session.query(EmployeeScoreLedger).filter_by(employee_id=employee_id, year=year).one()
+
+
+def _assert_consistent(db_session, employee_id):
+    """帳本與考核記錄一致，且員工總分 = 80 + 所有未刪除記錄 final_points"""
+    records = db_session.query(AssessmentRecord).filter_by(employee_id=employee_id, is_deleted=False).all()
+    ledger_service = ScoreLedgerService(db_session)
+
+    assert ledger_service.reconcile()["is_consistent"]
+    assert ledger_service.get_score(employee_id) == pytest.approx(80.0 + sum(r.final_points for r in records))
+    assert db_session.get(Employee, employee_id).current_score == pytest.approx(ledger_service.get_score(employee_id))
+
+
+class TestLedgerMaintenance:
+    """帳本同步更新測試（扣分記錄會連動月度獎勵）"""
+
+    def test_create_delete_restore_keep_ledger_consistent(self, db_session, employee):
+        """測試：建立、刪除、還原後帳本與考核記錄一致"""
+        service = AssessmentRecordService(db_session)
+
+        first = service.create(employee.id, "D01", date(YEAR, 1, 10))
+        second = service.create(employee.id, "D01", date(YEAR, 2, 10))
+        service.create(employee.id, "S01", date(YEAR - 1, 12, 1))
+        db_session.commit()
+
+        assert second.final_points == -1.5
+        _assert_consistent(db_session, employee.id)
+
+        # 刪除第一筆 → 第二筆遞補為第 1 次
+        service.soft_delete(first.id)
+        db_session.commit()
+
+        assert second.final_points == -1.0
+        _assert_consistent(db_session, employee.id)
+
+        service.restore(first.id)
+        db_session.commit()
+
+        assert second.final_points == -1.5
+        _assert_consistent(db_session, employee.id)
+        assert {ledger.year for ledger in db_session.query(EmployeeScoreLedger)} == {YEAR - 1, YEAR}
+
+    def test_monthly_reward_batch_updates_ledger(self, db_session, employee):
+        """測試：月度獎勵批次計算同步更新帳本"""
+        AssessmentRecordService(db_session).create(employee.id, "S01", date(YEAR, 3, 5))
+        db_session.commit()
+        before = _ledger(db_session, employee.id).record_count
+
+        MonthlyRewardCalculatorService(db_session).calculate_month_batch(YEAR, 4)
+        db_session.commit()
+
+        # 4 月零違規 → 發放 +M02、+M03
+        assert _ledger(db_session, employee.id).record_count == before + 2
+        _assert_consistent(db_session, employee.id)
+
+
+class TestReconcile:
+    """帳本比對測試"""
+
+    def test_reconcile_reports_and_fixes_mismatches(self, db_session, employee, capture_statements):
+        """測試：一次分組查詢找出不一致的帳本並修正"""
+        db_session.add(AssessmentRecord(
+            employee_id=employee.id, standard_code="D01", record_date=date(YEAR, 5, 1),
+            base_points=-1.0, actual_points=-1.0, cumulative_multiplier=1.0, final_points=-1.0,
+        ))
+        db_session.add(EmployeeScoreLedger(employee_id=employee.id, year=YEAR - 1, total_points=-4.0, record_count=2))
+        db_session.commit()
+        service = ScoreLedgerService(db_session)
+
+        selects = capture_statements()
+        result = service.reconcile()
+
+        assert len(selects) == 1
+        assert result["mismatch_count"] == 2
+        assert {(m["year"], m["ledger_points"], m["record_points"]) for m in result["mismatches"]} == {
+            (YEAR - 1, -4.0, 0.0), (YEAR, 0.0, -1.0)
+        }
+
+        service.reconcile(fix=True)
+        db_session.commit()
+
+        assert service.reconcile()["is_consistent"]
+        assert service.get_total_points(employee.id) == pytest.approx(-1.0)
+
+    def test_reconcile_single_year(self, db_session, employee):
+        """測試：指定年度只比對該年度"""
+        db_session.add(EmployeeScoreLedger(employee_id=employee.id, year=YEAR - 1, total_points=-4.0, record_count=2))
+        db_session.commit()
+
+        assert ScoreLedgerService(db_session).reconcile(year=YEAR)["is_consistent"]
+
+
+class TestConcurrentWrites:
+    """增量寫入測試"""
+
+    def test_stale_session_does_not_overwrite_other_updates(self, tmp_path):
+        """測試：其他 Session 已提交的增量不會被持有舊值的 Session 覆蓋"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'ledger.db'}")
+        Base.metadata.create_all(engine)
+        make_session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+        first, second = make_session(), make_session()
+        try:
+            employee = Employee(
+                employee_id="1140M0001", employee_name="測試員工",
+                current_department="淡海", hire_year_month="2020-01",
+            )
+            first.add(employee)
+            first.commit()
+            ScoreLedgerService(first).add_points(employee.id, YEAR, -1.0, records=1)
+            first.commit()
+
+            # first 持有已載入的帳本與員工
+            assert _ledger(first, employee.id).total_points == -1.0
+            assert first.get(Employee, employee.id).current_score == 79.0
+
+            ScoreLedgerService(second).add_points(employee.id, YEAR, -2.0, records=1)
+            second.commit()
+            ScoreLedgerService(first).add_points(employee.id, YEAR, 1.0, records=1)
+            first.commit()
+
+            ledger = _ledger(first, employee.id)
+            assert (ledger.total_points, ledger.record_count) == (-2.0, 3)
+            assert first.get(Employee, employee.id).current_score == 78.0
+            assert first.query(EmployeeScoreLedger).count() == 1
+        finally:
+            first.close()
+            second.close()
+            engine.dispose()
+
+    def test_first_write_creates_ledger_row(self, db_session, employee):
+        """測試：首次寫入以變動值建立帳本，同一 Transaction 再次寫入時累加"""
+        service = ScoreLedgerService(db_session)
+
+        service.add_points(employee.id, YEAR, -1.0, records=1)
+        service.apply_deltas(YEAR, {employee.id: 2.0}, {employee.id: 1})
+        db_session.commit()
+
+        ledger = _ledger(db_session, employee.id)
+        assert (ledger.total_points, ledger.record_count) == (1.0, 2)
+        assert db_session.get(Employee, employee.id).current_score == 81.0
+
+
+class TestScoreReads:
+    """總分驗證測試"""
+
+    def test_verify_employee_score_reads_ledger_only(self, db_session, employee, capture_statements):
+        """測試：驗證分數只讀取帳本，不掃描考核記錄"""
+        AssessmentRecordService(db_session).create(employee.id, "D01", date(YEAR, 1, 10))
+        db_session.commit()
+
+        selects = capture_statements()
+        result = AssessmentRecalculatorService(db_session).verify_employee_score(employee.id)
+
+        assert result["is_correct"]
+        assert result["expected_score"] == pytest.approx(ScoreLedgerService(db_session).get_score(employee.id))
+        assert not any("assessment_records" in statement for statement in selects)
+
+    def test_drift_from_records_is_left_to_reconcile(self, db_session, employee):
+        """測試：帳本與員工總分同時偏離考核記錄時，由帳本比對偵測"""
+        record = AssessmentRecordService(db_session).create(employee.id, "D01", date(YEAR, 1, 10))
+        db_session.commit()
+
+        # 直接修改考核記錄（未經帳本）
+        db_session.execute(
+            update(AssessmentRecord).where(AssessmentRecord.id == record.id).values(final_points=-3.0)
+        )
+        db_session.commit()
+
+        assert AssessmentRecalculatorService(db_session).verify_employee_score(employee.id)["is_correct"]
+        result = ScoreLedgerService(db_session).reconcile()
+        assert [(m["ledger_points"], m["record_points"]) for m in result["mismatches"]] == [(-1.0, -3.0)]
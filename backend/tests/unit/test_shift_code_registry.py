@@ -0,0 +1,91 @@
+"""
+ShiftCodeRegistry 單元測試
+
+驗證班別代碼登錄表的推導結果與快取行為。
+"""
+
+import pytest
+
+from src.services.shift_code_registry import ShiftCodeRegistry, describe_shift_code
+
+
+@pytest.fixture
+def registry():
+    return ShiftCodeRegistry(maxsize=8)
+
+
+class TestDescribeShiftCode:
+    """班別字串推導測試"""
+
+    def test_regular_shift(self):
+        """測試：一般班別的時間與分類"""
+        info = describe_shift_code("0600G")
+
+        assert info.shift_type == "早班"
+        assert (info.start_time, info.end_time) == ("06:00", "14:30")
+        assert info.overtime_hours is None
+        assert not info.is_r_shift and not info.is_holiday_work
+        assert info.duty_code == "0600G"
+
+    def test_r_shift_with_overtime(self):
+        """測試：國定假日 R班加延長工時"""
+        info = describe_shift_code("R(國)/0905G(+2)")
+
+        assert info.shift_type == "R班"
+        assert info.is_r_shift and info.is_attendance_r_shift
+        assert info.is_national_holiday
+        assert info.overtime_hours == 2
+        assert info.attendance_overtime_hours == 2
+        assert info.duty_code == "0905G"
+        assert info.is_holiday_work
+
+    def test_full_width_marks_follow_each_rule(self):
+        """測試：全形括號僅差勤判定規則會辨識，班表解析規則維持不變"""
+        overtime = describe_shift_code("0905G（＋3）")
+        leave = describe_shift_code("1425G（病）")
+
+        assert overtime.overtime_hours is None
+        assert overtime.attendance_overtime_hours == 3
+        assert not leave.is_leave
+        assert leave.has_attendance_leave
+
+    def test_attendance_text_strips_whitespace(self):
+        """測試：差勤判定文字移除所有空白（含大小寫不敏感的 R班判定）"""
+        info = describe_shift_code(" r / 0905g ")
+
+        assert info.attendance_text == "r/0905g"
+        assert info.is_attendance_r_shift
+        assert not info.is_r_shift
+
+
+class TestShiftCodeRegistry:
+    """登錄表快取測試"""
+
+    def test_repeated_codes_hit_cache(self, registry):
+        """測試：相同字串只推導一次"""
+        first = registry.get("0905G")
+        second = registry.get("0905G")
+
+        assert first is second
+        stats = registry.get_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_non_string_values_are_stringified(self, registry):
+        """測試：非字串值轉為字串後查詢，數字儲存格補足 4 位"""
+        assert registry.get(None).raw == "None"
+        assert registry.get(905) is registry.get(905.0) is registry.get("0905")
+        assert registry.get(905).duty_code == "0905"
+        assert registry.get(12345).raw == "12345"
+
+    def test_cache_is_bounded(self, registry):
+        """測試：快取筆數不超過上限"""
+        for hour in range(20):
+            registry.get(f"{hour:02d}00G")
+
+        assert registry.get_stats()["size"] == 8
+
+        registry.clear()
+        assert registry.get_stats() == {
+            "hits": 0, "misses": 0, "hit_rate": None, "size": 0, "maxsize": 8
+        }
@@ -0,0 +1,142 @@
+"""
+SystemSettingCache 單元測試
+
+驗證部門快照的優先規則、讀取不查詢資料庫、寫入後失效，
+以及設定快照 API 的 ETag 條件式 GET。
+"""
+
+import pytest
+
+from src.models.system_setting import SettingKeys, SystemSetting
+
+
+@pytest.fixture
+def settings_rows(db_session):
+    """建立部門與 global 設定"""
+    db_session.add_all([
+        SystemSetting(key=SettingKeys.GOOGLE_SHEETS_ID, value="global-sheet", department="global"),
+        SystemSetting(key=SettingKeys.GOOGLE_SHEETS_ID, value="danhai-sheet", department="淡海"),
+        SystemSetting(key=SettingKeys.GOOGLE_DRIVE_FOLDER_ID, value="global-folder", department="global"),
+        SystemSetting(key=SettingKeys.GOOGLE_DRIVE_FOLDER_ID, value=None, department="淡海"),
+        SystemSetting(key=SettingKeys.ASSESSMENT_ACCUMULATION_COEFFICIENT, value="0.8", department="global"),
+        SystemSetting(key=SettingKeys.SYNC_INTERVAL_MINUTES, value="30", department="安坑"),
+    ])
+    db_session.commit()
+
+
+@pytest.fixture
+def service(db_session):
+    """系統設定服務"""
+    from src.services.system_setting_service import SystemSettingService
+
+    return SystemSettingService(db_session)
+
+
+class TestSnapshot:
+    """部門快照測試"""
+
+    def test_department_overrides_global(self, service, settings_rows):
+        """測試：部門設定優先，值為 None 時採用 global"""
+        assert service.get_google_sheets_id("淡海") == "danhai-sheet"
+        assert service.get_google_sheets_id("安坑") == "global-sheet"
+        assert service.get_google_drive_folder_id("淡海") == "global-folder"
+        assert service.get_assessment_coefficient() == 0.8
+        assert service.get_value(SettingKeys.SYNC_INTERVAL_MINUTES, "淡海", default="60") == "60"
+
+        config = service.get_department_config("淡海")
+        assert config[SettingKeys.GOOGLE_SHEETS_ID]["department"] == "淡海"
+        assert config[SettingKeys.GOOGLE_DRIVE_FOLDER_ID]["value"] == "global-folder"
+        assert SettingKeys.SYNC_INTERVAL_MINUTES not in config
+
+    def test_reads_served_from_snapshot(self, service, settings_rows, capture_statements):
+        """測試：同部門重複讀取僅查詢一次"""
+        selects = capture_statements(table="system_settings")
+        for _ in range(3):
+            service.get_google_sheets_id("淡海")
+            service.get_google_drive_folder_id("淡海")
+            service.get_department_config("淡海")
+
+        assert len(selects) == 1
+
+    def test_writes_invalidate(self, service, settings_rows):
+        """測試：建立、更新、upsert、批次 upsert、刪除後重新載入"""
+        etag = service.get_snapshot("安坑").etag
+
+        created = service.create(SettingKeys.GOOGLE_SHEETS_ID, "ankeng-sheet", "安坑")
+        assert service.get_google_sheets_id("安坑") == "ankeng-sheet"
+        assert service.get_snapshot("安坑").etag != etag
+
+        service.update(created.id, value="ankeng-sheet-2")
+        assert service.get_google_sheets_id("安坑") == "ankeng-sheet-2"
+
+        service.upsert(SettingKeys.GOOGLE_SHEETS_ID, "ankeng-sheet-3", "安坑")
+        assert service.get_google_sheets_id("安坑") == "ankeng-sheet-3"
+
+        service.bulk_upsert([{"key": SettingKeys.GOOGLE_SHEETS_ID, "value": "ankeng-sheet-4", "department": "安坑"}])
+        assert service.get_google_sheets_id("安坑") == "ankeng-sheet-4"
+
+        service.delete(created.id)
+        assert service.get_google_sheets_id("安坑") == "global-sheet"
+
+    def test_zero_ttl_disables_cache(self, service, settings_rows, capture_statements, monkeypatch):
+        """測試：存活秒數為 0 時每次讀取皆查詢"""
+        from src.config.settings import get_settings
+
+        monkeypatch.setattr(get_settings(), "system_settings_cache_ttl_seconds", 0)
+        selects = capture_statements(table="system_settings")
+
+        service.get_google_sheets_id("淡海")
+        service.get_google_sheets_id("淡海")
+
+        assert len(selects) == 2
+
+
+class TestSnapshotEndpoint:
+    """設定快照 API 測試"""
+
+    @pytest.fixture
+    def get_bulk(self, db_session):
+        """直接呼叫設定快照路由函數"""
+        from fastapi import Response
+
+        from src.api.system_settings import get_settings_snapshot
+
+        def _get(department: str, if_none_match=None):
+            response = Response()
+            result = get_settings_snapshot(
+                response,
+                department=department,
+                if_none_match=if_none_match,
+                db=db_session,
+                current_user=None
+            )
+            return result if isinstance(result, Response) and result is not response else (response, result)
+
+        return _get
+
+    def test_conditional_get(self, get_bulk, service, settings_rows):
+        """測試：ETag 未變更回應 304，設定變更後回應新內容"""
+        response, body = get_bulk("淡海")
+        etag = response.headers["ETag"]
+
+        assert body.etag == etag
+        assert body.settings[SettingKeys.GOOGLE_SHEETS_ID]["value"] == "danhai-sheet"
+
+        not_modified = get_bulk("淡海", if_none_match=f'W/{etag}, "other"')
+        assert not_modified.status_code == 304
+        assert not_modified.headers["ETag"] == etag
+        assert not_modified.body == b""
+
+        service.upsert(SettingKeys.GOOGLE_SHEETS_ID, "danhai-sheet-2", "淡海")
+        response, body = get_bulk("淡海", if_none_match=etag)
+        assert response.headers["ETag"] != etag
+        assert body.settings[SettingKeys.GOOGLE_SHEETS_ID]["value"] == "danhai-sheet-2"
+
+    def test_invalid_department(self, get_bulk):
+        """測試：無效部門回應 400"""
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_bulk("台北")
+
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,75 @@
+"""
+VersionedCache 單元測試
+
+驗證命中與失效重新載入、載入期間版本遞增、存活秒數與不保存的鍵，
+以及單例取得函數。
+"""
+
+from src.utils.versioned_cache import VersionedCache, singleton
+
+
+def _make_cache(**kwargs):
+    """建立以呼叫次數為值的快取，回傳 (cache, 載入記錄)"""
+    loads = []
+
+    def _loader(db, key):
+        loads.append(key)
+        return [key] * len(loads)
+
+    return VersionedCache(_loader, **kwargs), loads
+
+
+class TestVersionedCache:
+    """版本號失效測試"""
+
+    def test_hits_until_invalidated(self):
+        """測試：版本不變時命中，遞增後重新載入"""
+        cache, loads = _make_cache()
+
+        assert cache.get(None, "a") == ["a"]
+        assert cache.get(None, "a") == ["a"]
+        cache.invalidate()
+        assert cache.get(None, "a") == ["a", "a"]
+
+        assert loads == ["a", "a"]
+        assert cache.get_stats() == {
+            "version": 1,
+            "entries": {"a": {"loaded_version": 1, "size": 2}},
+            "loads": 2,
+            "hits": 1,
+            "misses": 2,
+            "hit_rate": 0.333,
+        }
+
+    def test_bump_during_load_keeps_entry_stale(self):
+        """測試：載入期間版本遞增，結果仍視為過期"""
+        cache = None
+
+        def _loader(db, key):
+            cache.invalidate()
+            return key
+
+        cache = VersionedCache(_loader)
+        cache.load(None, "a")
+
+        assert cache.current("a") is None
+
+    def test_ttl_and_uncacheable_keys(self):
+        """測試：存活秒數為 0 或鍵不保存時每次皆載入"""
+        cache, loads = _make_cache(ttl_seconds=lambda: 0)
+        cache.get(None, "a")
+        cache.get(None, "a")
+        assert loads == ["a", "a"]
+
+        cache, loads = _make_cache(cacheable=lambda key: key != "b")
+        cache.get(None, "b")
+        cache.get(None, "b")
+        assert loads == ["b", "b"]
+        assert cache.get_stats()["entries"] == {}
+
+
+def test_singleton():
+    """測試：單例取得函數僅建立一次實例"""
+    get_instance = singleton(object)
+
+    assert get_instance() is get_instance()
@@ -0,0 +1,63 @@
+"""
+效能基準測試共用工具
+
+提供以 SQLite 建立的離線測試資料庫與計時輔助函數，
+讓各 bench_*.py 腳本可在沒有 TiDB 連線的環境下比較新舊實作。
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+# 添加 backend 目錄到 Python 路徑
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+# 基準測試不讀取真實環境設定
+os.environ.setdefault("API_SECRET_KEY", "benchmark-secret-key-minimum-32-characters")
+os.environ.setdefault("ENCRYPTION_KEY", "5dLk2n5Gp3fIUoZBDyirPRDoMzBvPkGD3jfPusFclEw=")
+
+
+def create_session(db_path: str = ":memory:"):
+    """
+    建立 SQLite 測試 Session 並建立所有資料表
+
+    Args:
+        db_path: SQLite 檔案路徑（預設記憶體資料庫）
+
+    Returns:
+        Session: SQLAlchemy Session
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    import src.models  # noqa: F401  註冊所有模型
+    from src.models.base import Base
+
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, autocommit=False, autoflush=False)()
+
+
+@contextmanager
+def timed(label: str, results: dict):
+    """
+    計時區塊，結果寫入 results[label]（秒）
+    """
+    start = time.perf_counter()
+    yield
+    results[label] = time.perf_counter() - start
+
+
+def print_results(title: str, results: dict, baseline: str):
+    """
+    輸出基準測試結果與相對於 baseline 的加速倍數
+    """
+    print(f"[*] {title}")
+    base = results.get(baseline)
+    for label, seconds in results.items():
+        speedup = f"  x{base / seconds:.1f}" if base and seconds and label != baseline else ""
+        print(f"  - {label:<30} {seconds * 1000:10.1f} ms{speedup}")
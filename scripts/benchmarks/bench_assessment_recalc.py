@@ -0,0 +1,100 @@
+"""
+年度考核重算效能基準測試
+
+比較 AssessmentRecalculatorService.recalculate_year_for_all_employees 逐人重算
+（bulk=False）與集合式批次重算（一次排序掃描 + 記憶體累計 + 多列 UPDATE）
+的執行時間，並確認兩者寫入的資料相同。
+
+用法：
+    python scripts/benchmarks/bench_assessment_recalc.py [員工數]
+"""
+
+import sys
+from datetime import date
+
+from _common import create_session, print_results, timed
+
+
+YEAR = 2026
+
+
+def seed(db, employee_count: int):
+    """建立測試資料（每位員工每類別數筆記錄，累計欄位皆未計算）"""
+    from src.models.assessment_record import AssessmentRecord
+    from src.models.assessment_standard import AssessmentStandard
+    from src.models.employee import Employee
+    from src.services.score_ledger_service import ScoreLedgerService
+
+    for code, category, points in [
+        ("D01", "D", -1.0), ("W01", "W", -2.0), ("R02", "R", -1.0), ("R03", "R", -2.0),
+    ]:
+        db.add(AssessmentStandard(code=code, category=category, name=code,
+                                  base_points=points, has_cumulative=True))
+
+    employees = [
+        Employee(employee_id=f"1140M{i:04d}", employee_name=f"員工{i}",
+                 current_department="淡海", hire_year_month="2020-01")
+        for i in range(employee_count)
+    ]
+    db.add_all(employees)
+    db.flush()
+
+    for i, employee in enumerate(employees):
+        for n, (code, points) in enumerate([("D01", -1.0), ("W01", -2.0), ("R02", -1.0), ("R03", -2.0)] * 2):
+            if (i + n) % 3 == 0:
+                continue
+            db.add(AssessmentRecord(employee_id=employee.id, standard_code=code,
+                                    record_date=date(YEAR, 1 + n, 1 + i % 28), base_points=points,
+                                    actual_points=points, cumulative_count=1,
+                                    cumulative_multiplier=1.0, final_points=points))
+    db.commit()
+
+    # 由既有記錄回填員工分數帳本（同 init_database）
+    ScoreLedgerService(db).reconcile(fix=True)
+    db.commit()
+
+
+def snapshot(db):
+    """取得重算後的資料狀態"""
+    from src.models.assessment_record import AssessmentRecord
+    from src.models.cumulative_counter import CumulativeCounter
+    from src.models.employee import Employee
+
+    return (
+        sorted((r.id, r.cumulative_count, r.final_points) for r in db.query(AssessmentRecord).all()),
+        sorted((c.employee_id, c.category, c.count) for c in db.query(CumulativeCounter).all()),
+        sorted((e.id, e.current_score) for e in db.query(Employee).all()),
+    )
+
+
+def main():
+    from src.services.assessment_recalculator import AssessmentRecalculatorService
+
+    employee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    results = {}
+    snapshots = {}
+    record_count = 0
+
+    for label, bulk in (("逐人重算（bulk=False）", False), ("集合式批次重算", True)):
+        db = create_session()
+        seed(db, employee_count)
+        service = AssessmentRecalculatorService(db)
+        with timed(label, results):
+            result = service.recalculate_year_for_all_employees(YEAR, bulk=bulk)
+            db.commit()
+        record_count = result["records_updated"]
+        snapshots[label] = snapshot(db)
+        db.close()
+
+    legacy, bulk = snapshots.values()
+    assert legacy == bulk, "集合式批次重算結果與逐人重算不一致"
+
+    print_results(
+        f"{employee_count} 位員工，{record_count} 筆可累計記錄",
+        results,
+        baseline="逐人重算（bulk=False）"
+    )
+
+
+if __name__ == "__main__":
+    main()
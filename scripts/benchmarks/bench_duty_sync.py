@@ -0,0 +1,67 @@
+"""
+勤務表同步效能基準測試
+
+比較 DutySyncService 逐日逐筆同步與批次重建模式
+（一次查詢班表 + 記憶體計算 + 多列 UPSERT）的執行時間。
+
+用法：
+    python scripts/benchmarks/bench_duty_sync.py [員工數] [天數]
+"""
+
+import sys
+from datetime import date, timedelta
+
+from _common import create_session, print_results, timed
+
+
+def seed(db, employee_count: int, days: int, start: date):
+    """建立測試資料"""
+    from src.models.employee import Employee
+    from src.models.route_standard_time import RouteStandardTime
+    from src.models.schedule import Schedule
+
+    codes = ["0905G", "1425G", "0600G", "R/0905G", "R(國)/1425G", "(假)"]
+    for code in set(c.split("/")[-1] for c in codes if "G" in c):
+        db.add(RouteStandardTime(department="淡海", route_code=code, route_name=code, standard_minutes=300))
+
+    for i in range(employee_count):
+        emp_code = f"1140M{i:04d}"
+        db.add(Employee(employee_id=emp_code, employee_name=f"員工{i}",
+                        current_department="淡海", hire_year_month="2020-01"))
+        for d in range(days):
+            db.add(Schedule(employee_id=emp_code, department="淡海",
+                            schedule_date=start + timedelta(days=d),
+                            shift_code=codes[(i + d) % len(codes)]))
+    db.commit()
+
+
+def main():
+    from src.models.driving_daily_stats import DrivingDailyStats
+    from src.services.duty_sync_service import DutySyncService
+
+    employee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 90
+    start = date(2026, 1, 1)
+    end = start + timedelta(days=days - 1)
+
+    db = create_session()
+    seed(db, employee_count, days, start)
+    service = DutySyncService(db)
+    results = {}
+
+    with timed("逐筆同步（現行）", results):
+        row = service.sync_daily_stats_for_date_range("淡海", start, end)
+
+    db.query(DrivingDailyStats).delete()
+    db.commit()
+
+    with timed("批次重建（bulk=True）", results):
+        bulk = service.sync_daily_stats_for_date_range("淡海", start, end, bulk=True)
+
+    assert row["total_processed"] == bulk["total_processed"]
+    print_results(f"{employee_count} 位員工 × {days} 天 = {bulk['total_processed']} 筆",
+                  results, baseline="逐筆同步（現行）")
+
+
+if __name__ == "__main__":
+    main()
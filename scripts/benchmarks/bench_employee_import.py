@@ -0,0 +1,65 @@
+"""
+員工批次匯入效能基準測試
+
+比較逐筆 EmployeeService.create（每筆查重 + flush）與
+EmployeeImportService 單次掃描（一次 IN 查重 + 多列 INSERT）的執行時間。
+
+用法：
+    python scripts/benchmarks/bench_employee_import.py [員工數]
+"""
+
+import io
+import sys
+
+from _common import create_session, print_results, timed
+
+
+def make_workbook(count: int) -> bytes:
+    """建立匯入用 Excel 檔案內容"""
+    import openpyxl
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(("員工編號", "姓名", "部門", "電話"))
+    for i in range(count):
+        sheet.append((f"1101M{i:04d}", f"員工{i}", "淡海" if i % 2 else "安坑", "0912345678"))
+
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+def import_row_by_row(db, content: bytes) -> int:
+    """逐筆建立（原實作）"""
+    import openpyxl
+    from src.services.employee_service import EmployeeService
+
+    service = EmployeeService(db)
+    rows = list(openpyxl.load_workbook(io.BytesIO(content), read_only=True).active.iter_rows(values_only=True))
+    for employee_id, name, department, phone in rows[1:]:
+        service.create(employee_id, name, department, phone=phone, auto_commit=False)
+    service.commit()
+    return len(rows) - 1
+
+
+def main():
+    from src.services.employee_import_service import EmployeeImportService
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    content = make_workbook(count)
+    results = {}
+
+    db = create_session()
+    with timed("逐筆建立（原實作）", results):
+        imported = import_row_by_row(db, content)
+
+    db = create_session()
+    with timed("單次掃描 + 多列 INSERT", results):
+        result = EmployeeImportService(db).import_from_excel(io.BytesIO(content))
+
+    assert imported == result.imported_count == count
+    print_results(f"匯入 {count} 位員工", results, baseline="逐筆建立（原實作）")
+
+
+if __name__ == "__main__":
+    main()
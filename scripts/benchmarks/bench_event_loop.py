@@ -0,0 +1,117 @@
+"""
+路由 Event Loop 阻塞效能基準測試
+
+以同步 Session 模擬 TiDB 查詢延遲（查詢後 time.sleep），在並行負載下比較：
+- async def 路由直接使用同步 Session（阻塞 Event Loop，現行寫法）
+- def 路由（FastAPI 放入 ThreadPool 執行）
+
+同時量測不使用資料庫的 /ping 延遲，呈現慢查詢對其他並行請求的影響。
+
+用法：
+    python scripts/benchmarks/bench_event_loop.py [每次查詢延遲秒數] [並行請求數]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _make_app(latency: float, blocking: bool, db_path: str, pool_size: int):
+    from fastapi import Depends, FastAPI
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import sessionmaker
+
+    # 與正式環境相同：每個請求使用獨立 Session（連線池足以容納所有並行請求）
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        pool_size=pool_size,
+        max_overflow=0,
+        connect_args={"check_same_thread": False}
+    )
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def slow_query(db):
+        db.execute(text("SELECT 1")).scalar()
+        time.sleep(latency)  # 模擬 TiDB 網路往返與查詢時間
+        return {}
+
+    app = FastAPI()
+
+    if blocking:
+        @app.get("/query")
+        async def query(db=Depends(get_db)):
+            return slow_query(db)
+    else:
+        @app.get("/query")
+        def query(db=Depends(get_db)):
+            return slow_query(db)
+
+    @app.get("/ping")
+    async def ping():
+        return {}
+
+    return app
+
+
+async def _run_load(app, concurrency: int) -> dict[str, list[float]]:
+    import httpx
+
+    latencies: dict[str, list[float]] = {"/query": [], "/ping": []}
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def _request(path: str, start: float):
+            response = await client.get(path)
+            response.raise_for_status()
+            latencies[path].append(time.perf_counter() - start)
+
+        # 預熱
+        await _request("/ping", time.perf_counter())
+        latencies["/ping"].clear()
+
+        # 所有請求視為同時抵達，延遲自同一起點計算
+        arrived = time.perf_counter()
+        await asyncio.gather(*[
+            _request("/query" if i % 2 == 0 else "/ping", arrived)
+            for i in range(concurrency * 2)
+        ])
+
+    return latencies
+
+
+def main():
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.05
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    print(f"[*] 並行 {concurrency} 個查詢 + {concurrency} 個 /ping，每次查詢延遲 {latency}s")
+    print(f"  {'路由寫法':<24} {'路徑':<8} {'p50 ms':>10} {'p99 ms':>10} {'平均 ms':>10}")
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench_event_loop.db")
+    for label, blocking in [("async def（現行）", True), ("def（ThreadPool）", False)]:
+        latencies = asyncio.run(_run_load(_make_app(latency, blocking, db_path, concurrency), concurrency))
+        for path, samples in latencies.items():
+            print(
+                f"  {label:<24} {path:<8} "
+                f"{_percentile(samples, 50) * 1000:10.1f} "
+                f"{_percentile(samples, 99) * 1000:10.1f} "
+                f"{statistics.mean(samples) * 1000:10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+月度獎勵批次計算效能基準測試
+
+比較 MonthlyRewardCalculatorService.calculate_month_batch 逐人計算
+（bulk=False）與集合式批次計算（一次查詢扣分類別 + 記憶體判定 + 批次寫入）
+的執行時間，並確認兩者結果相同。
+
+用法：
+    python scripts/benchmarks/bench_monthly_rewards.py [員工數]
+"""
+
+import sys
+from datetime import date
+
+from _common import create_session, print_results, timed
+
+
+YEAR, MONTH = 2026, 3
+
+
+def seed(db, employee_count: int):
+    """建立測試資料（約三分之一員工有扣分，部分員工已有上次計算的獎勵）"""
+    from src.models.assessment_record import AssessmentRecord
+    from src.models.assessment_standard import AssessmentStandard
+    from src.models.employee import Employee
+    from src.models.monthly_reward import MonthlyReward
+
+    for code, category, points in [
+        ("D01", "D", -1.0), ("S01", "S", -2.0),
+        ("+M02", "+M", 1.0), ("+M03", "+M", 2.0),
+    ]:
+        db.add(AssessmentStandard(code=code, category=category, name=code, base_points=points))
+
+    employees = [
+        Employee(employee_id=f"1140M{i:04d}", employee_name=f"員工{i}",
+                 current_department="淡海", hire_year_month="2020-01")
+        for i in range(employee_count)
+    ]
+    db.add_all(employees)
+    db.flush()
+
+    for i, employee in enumerate(employees):
+        if i % 3 == 1:
+            db.add(AssessmentRecord(employee_id=employee.id, standard_code="D01" if i % 2 else "S01",
+                                    record_date=date(YEAR, MONTH, 1 + i % 28), base_points=-1.0,
+                                    actual_points=-1.0, cumulative_multiplier=1.0, final_points=-1.0))
+        if i % 5 == 0:
+            db.add(MonthlyReward(employee_id=employee.id, year_month=f"{YEAR:04d}-{MONTH:02d}",
+                                 driving_zero_violation=True, total_points=1.0))
+            db.add(AssessmentRecord(employee_id=employee.id, standard_code="+M02",
+                                    record_date=date(YEAR, MONTH, 1), base_points=1.0,
+                                    actual_points=1.0, cumulative_multiplier=1.0, final_points=1.0))
+    db.commit()
+
+
+def main():
+    from src.services.monthly_reward_calculator import MonthlyRewardCalculatorService
+
+    employee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    results = {}
+    outputs = {}
+
+    for label, bulk in (("逐人計算（bulk=False）", False), ("集合式批次計算", True)):
+        db = create_session()
+        seed(db, employee_count)
+        service = MonthlyRewardCalculatorService(db)
+        with timed(label, results):
+            outputs[label] = service.calculate_month_batch(YEAR, MONTH, bulk=bulk)
+            db.commit()
+        db.close()
+
+    legacy, bulk = outputs.values()
+    assert legacy == bulk, "集合式批次計算結果與逐人計算不一致"
+
+    print_results(
+        f"{employee_count} 位員工，{len(bulk['rewards'])} 筆獎勵",
+        results,
+        baseline="逐人計算（bulk=False）"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+勤務標準時間批次匯入效能基準測試
+
+比較逐筆 get_by_code 查詢 + ORM 新增/更新（原實作）與
+一次查詢既有代碼 + 多列 UPSERT 的執行時間。一半代碼為既有資料（更新），一半為新增。
+
+用法：
+    python scripts/benchmarks/bench_route_import.py [勤務代碼數]
+"""
+
+import sys
+
+from _common import create_session, print_results, timed
+
+
+def seed(db, count: int):
+    """建立一半的既有勤務代碼"""
+    from src.models.route_standard_time import RouteStandardTime
+
+    db.add_all([
+        RouteStandardTime(department="淡海", route_code=f"R{i:05d}", route_name=f"勤務{i}",
+                          standard_minutes=300, is_active=True)
+        for i in range(0, count, 2)
+    ])
+    db.commit()
+
+
+def import_row_by_row(db, rows: list[dict], department: str) -> int:
+    """逐筆查詢與寫入（原實作）"""
+    from src.models.route_standard_time import RouteStandardTime
+    from src.services.route_standard_time_service import RouteStandardTimeService
+
+    service = RouteStandardTimeService(db)
+    for row in rows:
+        existing = service.get_by_code(department, row["route_code"], include_inactive=True)
+        if existing:
+            existing.route_name = row["route_name"]
+            existing.standard_minutes = row["standard_minutes"]
+            existing.description = row["description"]
+            existing.is_active = True
+        else:
+            db.add(RouteStandardTime(department=department, is_active=True,
+                                     **{k: v for k, v in row.items() if k != "row"}))
+    db.commit()
+    return len(rows)
+
+
+def main():
+    from src.services.route_standard_time_service import RouteStandardTimeService
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    raw_rows = [
+        {"route_code": f"R{i:05d}", "route_name": f"勤務{i}（新）", "standard_minutes": 310}
+        for i in range(count)
+    ]
+    results = {}
+
+    db = create_session()
+    seed(db, count)
+    rows, _ = RouteStandardTimeService(db).validate_import_data(raw_rows, "淡海")
+    with timed("逐筆查詢（原實作）", results):
+        import_row_by_row(db, rows, "淡海")
+
+    db = create_session()
+    seed(db, count)
+    with timed("一次查詢 + 多列 UPSERT", results):
+        result = RouteStandardTimeService(db).bulk_import(rows, "淡海")
+
+    assert result["created"] + result["updated"] == count
+    print_results(f"匯入 {count} 個勤務代碼（一半既有）", results, baseline="逐筆查詢（原實作）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+班表解析效能基準測試
+
+以合成的月班表（預設 500 名員工 × 31 日）量測 ScheduleParser.parse 的解析時間。
+
+用法：
+    python scripts/benchmarks/bench_schedule_parser.py [員工數] [重複次數]
+"""
+
+import sys
+
+from _common import print_results, timed
+
+
+def main():
+    from loguru import logger
+
+    from src.services.schedule_parser import ScheduleParser
+    from tests.fake_sheets import make_schedule_grid
+
+    logger.remove()
+
+    employee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    data = make_schedule_grid(employee_count)
+    parser = ScheduleParser()
+
+    shift_count = len(parser.parse(data, "淡海", 2026, 1).shifts)
+
+    results = {}
+    with timed("parse", results):
+        for _ in range(repeat):
+            parser.parse(data, "淡海", 2026, 1)
+    results["parse"] /= repeat
+
+    print_results(
+        f"{employee_count} 名員工，{shift_count} 筆班別（平均 {repeat} 次）",
+        results,
+        baseline="parse"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Google Sheets 並行讀取效能基準測試
+
+以離線 Sheets 傳輸（backend/tests/fake_sheets.py）模擬網路延遲，
+比較依序讀取各部門班表與 ScheduleSyncService.fetch_department_sheets 並行讀取。
+
+用法：
+    python scripts/benchmarks/bench_sheets_fetch.py [每請求延遲秒數]
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+from _common import print_results, timed
+
+
+def main():
+    from src.services.google_sheets_reader import GoogleSheetsReader
+    from src.services.schedule_sync_service import ScheduleSyncService
+    from tests.fake_sheets import FakeSheetsHttp, make_service_account_json
+
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.3
+    rows = [["編號", "姓名"] + [str(d) for d in range(1, 32)]]
+    rows += [[f"1140M{i:04d}", f"員工{i}"] + ["0905G"] * 31 for i in range(200)]
+
+    fake_http = FakeSheetsHttp({"danhai": {"2026-01": rows}, "ankeng": {"2026-01": rows}}, latency=latency)
+    credentials = make_service_account_json()
+
+    reader = GoogleSheetsReader(http_factory=lambda _: fake_http)
+    # 只比較讀取方式，不經過試算表內容快取
+    reader._content_cache = None
+    reader._settings = reader._settings.model_copy(update={
+        "tanhae_google_service_account_json": credentials,
+        "tanhae_google_sheets_id_schedule": "danhai",
+        "anping_google_service_account_json": credentials,
+        "anping_google_sheets_id_schedule": "ankeng",
+    })
+    service = ScheduleSyncService(sheets_reader=reader, parser=MagicMock(), chunk_size=500)
+    departments = ["淡海", "安坑"]
+
+    # 預熱：建立各執行緒的 Sheets 服務物件
+    service.fetch_department_sheets(departments, 2026, 1)
+    for department in departments:
+        reader.read_schedule_sheet(department, 2026, 1)
+
+    results = {}
+    with timed("依序讀取（現行）", results):
+        for department in departments:
+            reader.read_schedule_sheet(department, 2026, 1)
+
+    with timed("並行讀取", results):
+        service.fetch_department_sheets(departments, 2026, 1)
+
+    print_results(f"{len(departments)} 個部門，每請求延遲 {latency}s", results, baseline="依序讀取（現行）")
+
+
+if __name__ == "__main__":
+    main()
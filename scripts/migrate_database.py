@@ -0,0 +1,146 @@
+"""
+資料庫結構遷移腳本（升級部署後執行一次）
+
+create_all 只會建立缺少的資料表，不會修改已存在的資料表；
+應用程式啟動時僅執行 create_all，既有資料表新增的欄位、索引與衍生資料
+由本腳本補齊（使用背景連線池，不影響線上 API 請求）：
+
+1. 補齊既有資料表新增的欄位與索引（MIGRATION_COLUMNS）
+2. 員工分數帳本為空時，由既有考核記錄回填
+3. 回填既有班表的班別旗標（is_r_shift、is_leave、driving_minutes_code 等）
+
+可重複執行：已存在的欄位與索引會略過，帳本已有資料時不回填，
+班表旗標僅回填 driving_minutes_code 為 NULL 的資料。
+
+使用方式：
+    python scripts/migrate_database.py
+"""
+
+import sys
+import os
+
+# 添加專案根目錄到 Python 路徑
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from sqlalchemy import DDL, inspect
+from sqlalchemy.schema import CreateColumn
+
+import src.models  # noqa: F401  註冊所有模型
+import src.models.schedule  # noqa: F401  班表與同步任務模型未由 src.models 匯出
+import src.models.sheet_content_cache  # noqa: F401
+from src.config.database import BackgroundSessionLocal, background_engine
+from src.models.base import Base
+
+
+# 既有資料表新增的欄位（資料表 -> 欄位名稱）
+MIGRATION_COLUMNS = {
+    "schedules": ["is_r_shift", "is_national_holiday", "is_leave", "driving_minutes_code"],
+    "sync_tasks": [
+        "rows_per_second", "sync_mode", "inserted_count", "updated_count",
+        "deleted_count", "unchanged_count", "source_revision",
+    ],
+}
+
+
+def add_missing_columns() -> list[str]:
+    """
+    補齊 MIGRATION_COLUMNS 中尚未存在的欄位，並建立涉及這些欄位的索引
+
+    Returns:
+        list[str]: 已新增的欄位（table.column）
+    """
+    inspector = inspect(background_engine)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+
+    with background_engine.begin() as conn:
+        for table_name, column_names in MIGRATION_COLUMNS.items():
+            if table_name not in existing_tables:
+                continue
+
+            table = Base.metadata.tables[table_name]
+            existing_columns = {col["name"] for col in inspector.get_columns(table_name)}
+            for column_name in column_names:
+                if column_name in existing_columns:
+                    continue
+
+                column_ddl = str(CreateColumn(table.c[column_name]).compile(dialect=background_engine.dialect))
+                # %(fullname)s 由 SQLAlchemy 依方言加上識別字引號
+                conn.execute(DDL(
+                    "ALTER TABLE %(fullname)s ADD COLUMN " + column_ddl.replace("%", "%%")
+                ).against(table))
+                added.append(f"{table_name}.{column_name}")
+                print(f"  - 新增欄位: {table_name}.{column_name}")
+
+            for index in table.indexes:
+                if any(col.name in column_names for col in index.columns):
+                    index.create(conn, checkfirst=True)
+
+    return added
+
+
+def backfill_score_ledger() -> int:
+    """
+    員工分數帳本為空時，由既有考核記錄回填
+
+    Returns:
+        int: 回填的帳本筆數
+    """
+    from src.models.employee_score_ledger import EmployeeScoreLedger
+    from src.services.score_ledger_service import ScoreLedgerService
+
+    db = BackgroundSessionLocal()
+    try:
+        if db.query(EmployeeScoreLedger.id).first() is not None:
+            return 0
+
+        result = ScoreLedgerService(db).reconcile(fix=True)
+        db.commit()
+        return result["mismatch_count"]
+    finally:
+        db.close()
+
+
+def backfill_schedule_flags() -> int:
+    """
+    回填既有班表的班別旗標
+
+    Returns:
+        int: 回填的班表筆數
+    """
+    from src.services.schedule_sync_service import backfill_schedule_flags as backfill
+
+    db = BackgroundSessionLocal()
+    try:
+        return backfill(db)
+    finally:
+        db.close()
+
+
+def main():
+    """主程式"""
+    print("=" * 60)
+    print("司機員管理系統 - 資料庫結構遷移")
+    print("=" * 60)
+
+    print("\n[Step 1] 建立缺少的資料表")
+    Base.metadata.create_all(bind=background_engine)
+    print("[OK] 資料表檢查完成")
+
+    print("\n[Step 2] 補齊既有資料表新增的欄位與索引")
+    added = add_missing_columns()
+    print(f"[OK] 新增 {len(added)} 個欄位")
+
+    print("\n[Step 3] 回填員工分數帳本")
+    print(f"[OK] 回填 {backfill_score_ledger()} 筆帳本")
+
+    print("\n[Step 4] 回填班表班別旗標")
+    print(f"[OK] 回填 {backfill_schedule_flags()} 筆班表")
+
+    print("\n" + "=" * 60)
+    print("資料庫結構遷移完成！")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()